@@ -11,6 +11,7 @@ __version__ = "1.7.0"
 
 import socket  # noqa: F401 - re-exported so tests can patch ALiveMCP_Remote.socket
 import threading
+import time
 import traceback
 
 try:
@@ -20,8 +21,8 @@ except ImportError:
 
 from .constants import MAX_COMMANDS_PER_TICK, PORT
 from .liveapi_tools import LiveAPITools
+from .profiler import Profiler
 from .socket_server import SocketServerMixin
-from .tools.core.builtin import PARAM_ALIASES
 
 
 class ALiveMCP(SocketServerMixin):
@@ -47,6 +48,9 @@ class ALiveMCP(SocketServerMixin):
         self.tools = LiveAPITools(self.song, self.c_instance)
         self.tools._command_queue = None  # set after queue creation below
 
+        self.profiler = Profiler()
+        self.tools._profiler = self.profiler
+
         self.command_queue = queue.Queue()
         self.response_queues = {}
         self.request_counter = 0
@@ -67,30 +71,20 @@ class ALiveMCP(SocketServerMixin):
         """Log message to Ableton's Log.txt"""
         self.c_instance.log_message("[ALiveMCP] " + str(message))
 
-    def _process_command(self, command):
+    def _process_command(self, command, queue_wait=None):
         """
         Process a JSON command and return JSON response.
         THIS RUNS IN THE MAIN THREAD (called from update_display).
 
         Uses getattr-based dispatch: action names map directly to method names
         on self.tools, and all remaining command keys are passed as **kwargs.
+        Dispatch, PARAM_ALIASES and profiling live in
+        tools._dispatch_command (shared with scheduled commands); the queue
+        wait measured by update_display is passed through to the profiler.
+        Tool exceptions are logged and returned with their traceback.
         """
         try:
-            action = command.get("action", "")
-
-            method = getattr(self.tools, action, None)
-            if method is None:
-                return {
-                    "ok": False,
-                    "error": "Unknown action: " + action,
-                    "available_actions": self.tools.get_available_tools(),
-                }
-
-            params = {k: v for k, v in command.items() if k != "action"}
-            action_aliases = PARAM_ALIASES.get(action, {})
-            params = {action_aliases.get(k, k): v for k, v in params.items()}
-            return method(**params)
-
+            return self.tools._dispatch_command(command, queue_wait)
         except Exception as e:
             self.log("ERROR processing command: " + str(e))
             self.log(traceback.format_exc())
@@ -101,14 +95,17 @@ class ALiveMCP(SocketServerMixin):
         Called by Ableton Live on each tick to update displays.
         RUNS IN MAIN THREAD - safe to call LiveAPI here.
 
-        Processes commands from the queue to ensure thread safety.
+        Processes commands from the queue to ensure thread safety, then
+        resumes time-sliced background tasks within TASK_TICK_BUDGET_SECONDS.
         """
+        tick_started = time.perf_counter()
         commands_processed = 0
 
         while commands_processed < MAX_COMMANDS_PER_TICK:
             try:
                 request_id, command = self.command_queue.get_nowait()
-                response = self._process_command(command)
+                queue_wait = self.profiler.mark_dequeued(request_id)
+                response = self._process_command(command, queue_wait)
 
                 if request_id in self.response_queues:
                     self.response_queues[request_id].put(response)
@@ -121,6 +118,17 @@ class ALiveMCP(SocketServerMixin):
                 self.log("Error in update_display: " + str(e))
                 break
 
+        tasks_started = time.perf_counter()
+        task_steps = 0
+        try:
+            task_steps = self.tools._process_tasks()
+        except Exception as e:
+            self.log("Error running background tasks: " + str(e))
+
+        now = time.perf_counter()
+        tasks_seconds = now - tasks_started if task_steps else 0.0
+        self.profiler.record_tick(now - tick_started, commands_processed, tasks_seconds)
+
     def connect_script_instances(self, instanciated_scripts):
         """Required by Ableton's Remote Script API"""
         pass
@@ -142,6 +150,11 @@ class ALiveMCP(SocketServerMixin):
         self.log("Shutting down ALiveMCP Remote Script...")
         self.running = False
 
+        try:
+            self.tools.clear_pattern_index()
+        except Exception:
+            pass
+
         if self.socket_server:
             try:
                 self.socket_server.close()
@@ -17,3 +17,24 @@ RESPONSE_TIMEOUT_SECONDS = 25.0
 # Maximum commands processed per update_display() tick (~60 Hz).
 # Keeping this low prevents one busy client from starving the main thread.
 MAX_COMMANDS_PER_TICK = 5
+
+# Wall-clock budget per update_display() tick for resuming background tasks.
+# Live ticks at ~60 Hz (~16 ms); leaving most of the tick to Live keeps the UI
+# responsive while long walks (snapshots, bulk note reads) make steady progress.
+TASK_TICK_BUDGET_SECONDS = 0.004
+
+# Finished/cancelled/failed tasks kept for get_task_status before the oldest are dropped.
+MAX_FINISHED_TASKS = 32
+
+# Tick profiler (profiler.py).
+# A tick in which ALiveMCP (commands + background tasks) spends longer than this
+# is counted as an overrun: at ~60 Hz Live has ~16 ms per tick for everything.
+TICK_OVERRUN_SECONDS = 0.010
+
+# Commands slower than this are recorded in the slow-command ring buffer.
+SLOW_COMMAND_SECONDS = 0.005
+
+# Ring buffer sizes for slow commands / tick overruns, and the number of recent
+# durations per action kept for percentile estimates.
+SLOW_LOG_SIZE = 50
+PROFILE_SAMPLES_PER_ACTION = 256
@@ -19,6 +19,7 @@ from .tools.clips.clips_follow_actions import ClipsFollowActionsMixin
 from .tools.core.base import BaseMixin
 from .tools.core.builtin import BuiltinMixin
 from .tools.core.registry import AVAILABLE_TOOLS
+from .tools.core.task_tools import TasksMixin
 from .tools.devices.devices import DevicesMixin
 from .tools.devices.devices_ui import DevicesUIMixin
 from .tools.m4l.m4l import M4LMixin
@@ -35,6 +36,7 @@ from .tools.tracks.tracks_devices import TracksDevicesMixin
 class LiveAPITools(
     BaseMixin,
     BuiltinMixin,
+    TasksMixin,
     SessionTransportMixin,
     TracksMixin,
     TracksDevicesMixin,
@@ -59,16 +61,17 @@ class LiveAPITools(
     Comprehensive implementation of LiveAPI operations.
 
     Composed from domain-specific mixins:
-    - SessionTransportMixin: play/stop/record/tempo/transport/automation/metronome
+    - TasksMixin: time-sliced background tasks (status/cancel/list)
+    - SessionTransportMixin: play/stop/record/tempo/transport/automation/metronome/snapshot
     - TracksMixin: create/delete/arm/solo/mute/routing/groups/freeze/annotations
     - TracksDevicesMixin: enriched track device parameters with display values
     - ClipsMixin: create/delete/launch/stop/looping/color/fades/follow actions
-    - MidiMixin: add/remove/select notes, CC, program change
+    - MidiMixin: add/remove/select notes, CC, program change, pattern search index
     - DevicesMixin: add/remove/parameters/racks/chains/plugin windows
     - MixingMixin: sends/master/return/crossfader/groove/quantization
     - ScenesMixin: create/delete/launch/color
     - ArrangementMixin: project/arrangement/view/loop/locator/browser/color
-    - AutomationMixin: clip automation envelopes
+    - AutomationMixin: session and arrangement clip envelopes and parameter ramps
     - M4LMixin: Max for Live device/audio/sample/simpler operations
     - TakeLanesMixin: take lane operations (feature-gated by Live capabilities)
     - AppPropertiesMixin: application/version and miscellaneous property queries
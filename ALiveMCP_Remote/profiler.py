@@ -0,0 +1,193 @@
+"""
+Main-thread tick profiler for the ALiveMCP Remote Script.
+
+Records, entirely in memory:
+- per-action execution time of _process_command (perf_counter), kept as a
+  bounded sample window per action for p50/p95/p99 plus count/total/max
+- queue-wait time from enqueue (socket thread) to dequeue (main thread)
+- per-tick time spent in update_display, with overrun detection
+- ring buffers of the slowest recent commands, failed commands and tick
+  overruns
+
+Actions that do not exist on the tools object are counted under one
+"<unknown>" entry so client-supplied names cannot grow the per-action table;
+the offending name is kept only in the bounded error log.
+
+Enqueue timestamps are keyed by request_id (like response_queues) so the
+command_queue item shape stays (request_id, command).
+"""
+
+import time
+from collections import deque
+
+from .constants import (
+    PROFILE_SAMPLES_PER_ACTION,
+    SLOW_COMMAND_SECONDS,
+    SLOW_LOG_SIZE,
+    TICK_OVERRUN_SECONDS,
+)
+
+UNKNOWN_ACTION = "<unknown>"
+# Longest client-supplied action name kept in the error log.
+MAX_LOGGED_ACTION = 100
+
+
+def _ms(seconds):
+    return round(seconds * 1000.0, 3)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list (None when empty)."""
+    if not sorted_values:
+        return None
+    rank = int(round(pct / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
+
+
+class ActionStats:
+    """Running totals and a bounded window of recent durations for one action."""
+
+    def __init__(self, samples=PROFILE_SAMPLES_PER_ACTION):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.total_wait = 0.0
+        self.recent = deque(maxlen=samples)
+
+    def add(self, duration, queue_wait, ok):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.total_wait += queue_wait or 0.0
+        self.recent.append(duration)
+        if not ok:
+            self.errors += 1
+
+    def to_dict(self):
+        ordered = sorted(self.recent)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": _ms(self.total / self.count) if self.count else 0.0,
+            "p50_ms": _ms(percentile(ordered, 50) or 0.0),
+            "p95_ms": _ms(percentile(ordered, 95) or 0.0),
+            "p99_ms": _ms(percentile(ordered, 99) or 0.0),
+            "max_ms": _ms(self.max),
+            "mean_queue_wait_ms": _ms(self.total_wait / self.count) if self.count else 0.0,
+        }
+
+
+class Profiler:
+    """Collects command and tick timings for get_performance_stats."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self._enqueued = {}
+        self.reset()
+
+    def reset(self):
+        self.started = self.clock()
+        self.actions = {}
+        self.slow_commands = deque(maxlen=SLOW_LOG_SIZE)
+        self.error_commands = deque(maxlen=SLOW_LOG_SIZE)
+        self.overruns = deque(maxlen=SLOW_LOG_SIZE)
+        self.ticks = 0
+        self.busy_ticks = 0
+        self.overrun_count = 0
+        self.tick_total = 0.0
+        self.tick_max = 0.0
+        self.max_queue_wait = 0.0
+
+    # -- socket thread ---------------------------------------------------------
+
+    def mark_enqueued(self, request_id):
+        self._enqueued[request_id] = self.clock()
+
+    # -- main thread -----------------------------------------------------------
+
+    def mark_dequeued(self, request_id):
+        """Return the queue-wait time of ``request_id`` (None if it was not marked)."""
+        enqueued = self._enqueued.pop(request_id, None)
+        if enqueued is None:
+            return None
+        wait = self.clock() - enqueued
+        self.max_queue_wait = max(self.max_queue_wait, wait)
+        return wait
+
+    def record_command(self, action, duration, queue_wait=None, ok=True, params=None, known=True):
+        """Record one command; ``known=False`` files it under UNKNOWN_ACTION."""
+        key = action if known else UNKNOWN_ACTION
+        stats = self.actions.get(key)
+        if stats is None:
+            stats = self.actions[key] = ActionStats()
+        stats.add(duration, queue_wait, ok)
+
+        entry = {
+            "action": action[:MAX_LOGGED_ACTION],
+            "duration_ms": _ms(duration),
+            "queue_wait_ms": _ms(queue_wait) if queue_wait is not None else None,
+            "ok": ok,
+            "params": sorted(str(p) for p in params or []),
+            "time": time.time(),
+        }
+        if duration >= SLOW_COMMAND_SECONDS:
+            self.slow_commands.append(entry)
+        if not ok:
+            self.error_commands.append(entry)
+
+    def record_tick(self, duration, commands=0, task_seconds=0.0):
+        self.ticks += 1
+        if not commands and not task_seconds:
+            return
+        self.busy_ticks += 1
+        self.tick_total += duration
+        self.tick_max = max(self.tick_max, duration)
+        if duration > TICK_OVERRUN_SECONDS:
+            self.overrun_count += 1
+            self.overruns.append(
+                {
+                    "duration_ms": _ms(duration),
+                    "commands": commands,
+                    "task_ms": _ms(task_seconds),
+                    "time": time.time(),
+                }
+            )
+
+    # -- reporting -------------------------------------------------------------
+
+    def summary(self):
+        """Compact numbers for health_check."""
+        return {
+            "uptime_seconds": round(self.clock() - self.started, 3),
+            "commands": sum(s.count for s in self.actions.values()),
+            "ticks": self.ticks,
+            "busy_ticks": self.busy_ticks,
+            "tick_overruns": self.overrun_count,
+            "max_tick_ms": _ms(self.tick_max),
+            "max_queue_wait_ms": _ms(self.max_queue_wait),
+            "slow_commands": len(self.slow_commands),
+        }
+
+    def stats(self, action=None):
+        """Full report: summary, per-action histograms and ring buffers."""
+        actions = self.actions
+        if action is not None:
+            actions = {action: actions[action]} if action in actions else {}
+        report = self.summary()
+        report.update(
+            {
+                "mean_busy_tick_ms": (
+                    _ms(self.tick_total / self.busy_ticks) if self.busy_ticks else 0.0
+                ),
+                "thresholds_ms": {
+                    "tick_overrun": _ms(TICK_OVERRUN_SECONDS),
+                    "slow_command": _ms(SLOW_COMMAND_SECONDS),
+                },
+                "actions": {name: s.to_dict() for name, s in sorted(actions.items())},
+                "slow_command_log": list(self.slow_commands),
+                "error_command_log": list(self.error_commands),
+                "tick_overrun_log": list(self.overruns),
+            }
+        )
+        return report
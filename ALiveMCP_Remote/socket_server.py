@@ -19,7 +19,8 @@ class SocketServerMixin:
     """
     Manages the TCP socket server lifecycle and per-client I/O.
     Subclasses must provide: self.running, self.command_queue,
-    self.response_queues, self.request_counter, self.request_lock, self.log().
+    self.response_queues, self.request_counter, self.request_lock, self.profiler,
+    self.log().
     """
 
     def start_socket_server(self):
@@ -88,6 +89,7 @@ class SocketServerMixin:
 
                             try:
                                 command = json.loads(message)
+                                self.profiler.mark_enqueued(request_id)
                                 self.command_queue.put((request_id, command))
 
                                 try:
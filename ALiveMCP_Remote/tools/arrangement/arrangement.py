@@ -10,6 +10,7 @@ Locators (create/delete/list) and relative jumps → arrangement_locators.py
 Browser and color utilities → arrangement_browser.py
 """
 
+from ..core.pagination import paginate
 from .arrangement_browser import ArrangementBrowserMixin
 
 
@@ -156,26 +157,35 @@ class ArrangementMixin(ArrangementBrowserMixin):
     # ARRANGEMENT VIEW CLIPS
     # ========================================================================
 
-    def get_arrangement_clips(self, track_index):
+    def get_arrangement_clips(self, track_index, limit=None, cursor=None):
         """Get list of clips in arrangement view for a track
 
         See Also:
             Wiki: docs/wiki/tools/get_arrangement_clips.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the track in song.tracks.
+            limit: Optional maximum number of clips per page.
+            cursor: next_cursor from the previous page.
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "count", "clips"}, plus "total" and "next_cursor" when limit or cursor is given.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors (including stale cursors) are returned as
+            {"ok": False, "error": ...}."""
         try:
             track = self.song.tracks[track_index]
 
             if hasattr(track, "arrangement_clips"):
+                page, _, page_info = paginate(
+                    track.arrangement_clips,
+                    limit,
+                    cursor,
+                    key=lambda c: (str(c.name), float(c.start_time), float(c.end_time)),
+                )
                 clips_info = []
-                for clip in track.arrangement_clips:
+                for clip in page:
                     clip_data = {
                         "name": str(clip.name),
                         "start_time": float(clip.start_time),
@@ -184,7 +194,9 @@ class ArrangementMixin(ArrangementBrowserMixin):
                     }
                     clips_info.append(clip_data)
 
-                return {"ok": True, "count": len(clips_info), "clips": clips_info}
+                result = {"ok": True, "count": len(clips_info), "clips": clips_info}
+                result.update(page_info)
+                return result
             else:
                 return {"ok": False, "error": "Arrangement clips not available"}
         except Exception as e:
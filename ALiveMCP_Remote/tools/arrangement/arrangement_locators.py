@@ -5,6 +5,15 @@ Single responsibility: cue point (locator) creation, deletion, listing, and
 relative time-position jumps.
 """
 
+from ..core.pagination import paginate
+
+
+def _cue_key(cue):
+    return (
+        float(cue.time) if hasattr(cue, "time") else 0.0,
+        str(cue.name) if hasattr(cue, "name") else "",
+    )
+
 
 class ArrangementLocatorsMixin:
     # ========================================================================
@@ -72,24 +81,27 @@ class ArrangementLocatorsMixin:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    def get_locators(self):
+    def get_locators(self, limit=None, cursor=None):
         """Get all locators/cue points
 
         See Also:
             Wiki: docs/wiki/tools/get_locators.md
 
         Args:
-            TODO: describe parameters.
+            limit: Optional maximum number of locators per page.
+            cursor: next_cursor from the previous page.
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "locators", "count"}, plus "total" and "next_cursor" when limit or cursor is given.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors (including stale cursors) are returned as
+            {"ok": False, "error": ...}."""
         try:
             if hasattr(self.song, "cue_points"):
+                page, start, page_info = paginate(self.song.cue_points, limit, cursor, key=_cue_key)
                 locators = []
-                for i, cue in enumerate(self.song.cue_points):
+                for i, cue in enumerate(page, start):
                     locators.append(
                         {
                             "index": i,
@@ -97,7 +109,9 @@ class ArrangementLocatorsMixin:
                             "name": str(cue.name) if hasattr(cue, "name") else "",
                         }
                     )
-                return {"ok": True, "locators": locators, "count": len(locators)}
+                result = {"ok": True, "locators": locators, "count": len(locators)}
+                result.update(page_info)
+                return result
             else:
                 return {"ok": True, "locators": [], "count": 0}
         except Exception as e:
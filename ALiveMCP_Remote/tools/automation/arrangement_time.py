@@ -0,0 +1,74 @@
+"""
+Song-time helpers for automation on arrangement clips.
+
+Single responsibility: find the arrangement clips of a track that cover a
+song-time range, convert song beats to the clip-relative beats their
+automation envelopes use, and cut a curve into the part each clip covers.
+Live exposes no track-level arrangement automation lane to Remote Scripts,
+so the arrangement clip envelope tools work clip by clip. Nothing here talks to
+Live beyond reading clip positions.
+"""
+
+
+def clip_spans(track, start, end):
+    """[(n, clip, span_start, span_end)] for arrangement clips overlapping start..end.
+
+    ``n`` is the clip's position in track.arrangement_clips; the span is the
+    overlap in song beats.
+    """
+    spans = []
+    for n, clip in enumerate(getattr(track, "arrangement_clips", None) or []):
+        lo = max(float(start), float(clip.start_time))
+        hi = min(float(end), float(clip.end_time))
+        if lo < hi or (lo == hi and float(start) == float(end)):
+            spans.append((n, clip, lo, hi))
+    return spans
+
+
+def clip_time(clip, song_time):
+    """Clip-relative beat that plays at ``song_time`` (wraps inside a looped clip)."""
+    position = float(clip.start_marker) + float(song_time) - float(clip.start_time)
+    if clip.looping:
+        loop_start, loop_end = float(clip.loop_start), float(clip.loop_end)
+        if loop_end > loop_start and position >= loop_end:
+            position = loop_start + (position - loop_start) % (loop_end - loop_start)
+    return position
+
+
+def check_single_pass(clip, lo, hi):
+    """Raise ValueError when song beats lo..hi cross a loop wrap of ``clip``.
+
+    One clip-relative time would then stand for several song positions, so a
+    curve written there could not match the requested song-time curve.
+    """
+    if clip.looping and hi - lo > 1e-9:
+        if clip_time(clip, lo) + (hi - lo) > float(clip.loop_end) + 1e-9:
+            raise ValueError(
+                "Arrangement clip at "
+                + str(float(clip.start_time))
+                + " loops inside the range; write one loop pass at a time"
+            )
+
+
+def _value_at(times, values, t):
+    """Linear interpolation of the curve at ``t`` (held flat outside it)."""
+    if t <= times[0]:
+        return values[0]
+    for i in range(1, len(times)):
+        if t <= times[i]:
+            span = times[i] - times[i - 1]
+            ratio = (t - times[i - 1]) / span if span > 0 else 1.0
+            return values[i - 1] + ratio * (values[i] - values[i - 1])
+    return values[-1]
+
+
+def cut_curve(times, values, lo, hi):
+    """The part of the curve inside lo..hi, with interpolated points at both edges."""
+    lo, hi = max(lo, times[0]), min(hi, times[-1])
+    if lo > hi:
+        return [], []
+    inner = [(t, v) for t, v in zip(times, values) if lo < t < hi]
+    cut = [(lo, _value_at(times, values, lo))] + inner
+    if hi > lo:
+        cut.append((hi, _value_at(times, values, hi)))
+    return [t for t, _ in cut], [v for _, v in cut]
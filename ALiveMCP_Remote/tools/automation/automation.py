@@ -1,11 +1,24 @@
 """
-Clip automation envelope operations.
+Clip automation envelope operations (plus readback, curves, arrangement clip automation, ramps
+and LFO modulators).
 """
 
+from .automation_arrangement import AutomationArrangementMixin
+from .automation_curves import AutomationCurvesMixin
+from .automation_modulators import AutomationModulatorsMixin
+from .automation_ramps import AutomationRampsMixin
+from .automation_values import AutomationValuesMixin
 
-class AutomationMixin:
+
+class AutomationMixin(
+    AutomationValuesMixin,
+    AutomationCurvesMixin,
+    AutomationArrangementMixin,
+    AutomationRampsMixin,
+    AutomationModulatorsMixin,
+):
     # ========================================================================
-    # CLIP AUTOMATION ENVELOPES (6 tools)
+    # CLIP AUTOMATION ENVELOPES (5 tools)
     # ========================================================================
 
     def get_clip_automation_envelope(self, track_index, clip_index, device_index, param_index):
@@ -229,53 +242,3 @@ class AutomationMixin:
                 return {"ok": False, "error": "automation_envelope not available"}
         except Exception as e:
             return {"ok": False, "error": str(e)}
-
-    def get_automation_envelope_values(self, track_index, clip_index, device_index, param_index):
-        """Get all automation envelope values for a parameter
-
-        See Also:
-            Wiki: docs/wiki/tools/get_automation_envelope_values.md
-
-        Args:
-            TODO: describe parameters.
-
-        Returns:
-            TODO: describe return value.
-
-        Raises:
-            TODO: exceptions raised."""
-        try:
-            track = self.song.tracks[track_index]
-            clip_slot = track.clip_slots[clip_index]
-
-            if not clip_slot.has_clip:
-                return {"ok": False, "error": "No clip in slot"}
-
-            clip = clip_slot.clip
-
-            # Get the device parameter and envelope
-            device = track.devices[device_index]
-            param = device.parameters[param_index]
-
-            if hasattr(clip, "automation_envelope"):
-                envelope = clip.automation_envelope(param)
-                if envelope:
-                    # Get envelope value at different time points
-                    # Note: Full implementation would iterate through all steps
-                    return {
-                        "ok": True,
-                        "parameter_name": str(param.name),
-                        "has_envelope": True,
-                        "message": "Use insert_step/remove_step to modify automation",
-                    }
-                else:
-                    return {
-                        "ok": True,
-                        "parameter_name": str(param.name),
-                        "has_envelope": False,
-                        "message": "No automation envelope for this parameter",
-                    }
-            else:
-                return {"ok": False, "error": "automation_envelope not available"}
-        except Exception as e:
-            return {"ok": False, "error": str(e)}
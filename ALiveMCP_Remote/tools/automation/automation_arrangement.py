@@ -0,0 +1,268 @@
+"""
+Arrangement clip envelope read/write in song time.
+
+Single responsibility: resolve a device parameter of a regular track, then
+read or write the clip envelopes of the track's arrangement clips
+(clip.automation_envelope(param)) over a song-time range, mapping song beats
+to each clip's own time. This is clip-envelope automation, not the track's
+arrangement automation lane: Live exposes no track-level lane to Remote
+Scripts, ranges outside any arrangement clip cannot be reached, and Live may
+report no envelope for arrangement clips at all. Sampling and decimation are
+shared with session clip envelopes.
+"""
+
+from ..core.param_targets import make_target, resolve_parameter
+from .arrangement_time import check_single_pass, clip_spans, clip_time, cut_curve
+from .automation_curves import DEFAULT_RESOLUTION
+from .automation_values import SAMPLES_PER_STEP
+from .envelope_points import DEFAULT_STEP, default_tolerance, point_columns, sample_grid
+from .envelope_points import simplify as simplify_points
+
+NO_ENVELOPE = (
+    "Live returned no clip envelope for this parameter on the arrangement "
+    "clip at beat {}; Live may not expose envelopes of arrangement clips"
+)
+
+
+class AutomationArrangementMixin:
+    # ========================================================================
+    # ARRANGEMENT CLIP ENVELOPES
+    # ========================================================================
+
+    def get_arrangement_automation(
+        self,
+        track_index,
+        device_index,
+        param_index=None,
+        param_name=None,
+        start=0.0,
+        end=None,
+        step=DEFAULT_STEP,
+        simplify=True,
+        tolerance=None,
+        background=False,
+    ):
+        """Read a device parameter's clip envelopes from a track's arrangement clips.
+
+        Samples the clip envelope of every arrangement clip covering
+        start..end (clip.automation_envelope(param)) at song-time grid points
+        mapped into each clip's own time. This is not the track's arrangement
+        automation lane, which Live does not expose: ranges outside
+        arrangement clips return no points, and Live may report no envelope
+        for arrangement clips at all.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_arrangement_automation.md
+
+        Args:
+            track_index: 0-based index of a regular track (return tracks
+                and the master have no arrangement clips).
+            device_index: 0-based device index on the track.
+            param_index: 0-based parameter index on the device.
+            param_name: Parameter name instead of param_index.
+            start: First sample time in song beats (default 0.0).
+            end: Last sample time in song beats (default: song length).
+            step: Grid spacing in beats (default 0.25).
+            simplify: Reduce the samples to breakpoints (default True).
+            tolerance: Maximum value error when simplifying (default: 0.1%
+                of the parameter range).
+            background: When true, run as a background task and return its
+                task_id.
+
+        Returns:
+            dict: {"ok", "track", "parameter_name", "has_envelope", "start",
+            "end", "sample_count", "simplified", "tolerance", "min_value",
+            "max_value", "clips", "points"} where clips lists {"position",
+            "start", "end"} per arrangement clip read (position in
+            track.arrangement_clips) and points times are song beats.
+            Without any clip envelope in range: {"ok", "track",
+            "parameter_name", "device_name", "has_envelope": False, "clips":
+            [], "message"}.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            target = make_target(
+                track_index,
+                device_index=device_index,
+                param_index=param_index,
+                param_name=param_name,
+            )
+            track, param, info = resolve_parameter(self.song, target)
+            times = sample_grid(start, self.song.song_length if end is None else end, step)
+            segments = []
+            for n, clip, lo, hi in clip_spans(track, times[0], times[-1]):
+                envelope = clip.automation_envelope(param)
+                # A sample on a clip's end belongs to the next clip, except at the range end.
+                inside = [t for t in times if lo <= t < hi or t == hi == times[-1]]
+                if envelope and inside:
+                    segments.append((n, clip, envelope, inside))
+            if not segments:
+                return dict(
+                    info,
+                    ok=True,
+                    has_envelope=False,
+                    clips=[],
+                    message="No arrangement clip in range has a clip envelope for this parameter",
+                )
+
+            if tolerance is None:
+                tolerance = default_tolerance(param)
+            meta = dict(info, start=times[0], end=times[-1])
+            steps = self._arrangement_sample_steps(segments, simplify, float(tolerance), meta)
+            return self._run_task("get_arrangement_automation", steps, background)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def _arrangement_sample_steps(self, segments, simplify, tolerance, meta):
+        """Task generator: sample each clip's envelope in song time, SAMPLES_PER_STEP per step."""
+        total = sum(len(segment[3]) for segment in segments)
+        done = 0
+        times, values, sampled, clips = [], [], [], []
+        for n, clip, envelope, clip_times in segments:
+            clip_values = []
+            for first in range(0, len(clip_times), SAMPLES_PER_STEP):
+                chunk = clip_times[first : first + SAMPLES_PER_STEP]
+                clip_values.extend(float(envelope.value_at_time(clip_time(clip, t))) for t in chunk)
+                done += len(chunk)
+                yield {"done": done, "total": total}
+            sampled.extend(clip_values)
+            points = (clip_times, clip_values)
+            if simplify:
+                points = simplify_points(clip_times, clip_values, tolerance)
+            times.extend(points[0])
+            values.extend(points[1])
+            clips.append({"position": n, "start": clip_times[0], "end": clip_times[-1]})
+        return dict(
+            meta,
+            ok=True,
+            has_envelope=True,
+            sample_count=total,
+            simplified=bool(simplify),
+            tolerance=tolerance if simplify else None,
+            min_value=min(sampled),
+            max_value=max(sampled),
+            clips=clips,
+            points=point_columns(times, values),
+        )
+
+    def write_arrangement_automation(
+        self,
+        track_index,
+        device_index,
+        param_index=None,
+        param_name=None,
+        points=None,
+        shape=None,
+        start=0.0,
+        end=None,
+        resolution=DEFAULT_RESOLUTION,
+        tolerance=None,
+        clear=False,
+    ):
+        """Write a song-time curve for a device parameter into arrangement clip envelopes.
+
+        The curve is cut at clip boundaries and each part is decimated and
+        inserted into that clip's envelope (created if missing) at the
+        matching clip time. This is not the track's arrangement automation
+        lane, which Live does not expose: points outside every arrangement
+        clip are not written, and the call fails when Live provides no
+        envelope for a clip. A looped clip can only be written one loop pass
+        at a time.
+
+        See Also:
+            Wiki: docs/wiki/tools/write_arrangement_automation.md
+
+        Args:
+            track_index: 0-based index of a regular track (return tracks
+                and the master have no arrangement clips).
+            device_index: 0-based device index on the track.
+            param_index: 0-based parameter index on the device.
+            param_name: Parameter name instead of param_index.
+            points: List of [time, value] pairs in song beats.
+            shape: Generated curve instead of points (see
+                write_automation_curve); requires end.
+            start: Shape start in song beats (default 0.0).
+            end: Shape end in song beats.
+            resolution: Shape sampling step in beats before decimation
+                (default 0.0625).
+            tolerance: Maximum value error of the decimated curve (default:
+                0.1% of the parameter range).
+            clear: Delete existing automation between the first and last
+                point before writing (default False).
+
+        Returns:
+            dict: {"ok", "track", "parameter_name", "start", "end",
+            "input_count", "point_count", "tolerance", "cleared", "clips",
+            "points"} where clips lists {"position", "start", "end",
+            "point_count"} per clip written and points holds the written
+            breakpoints in song beats.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            target = make_target(
+                track_index,
+                device_index=device_index,
+                param_index=param_index,
+                param_name=param_name,
+            )
+            track, param, info = resolve_parameter(self.song, target)
+            if shape is not None and points is None and end is None:
+                return {"ok": False, "error": "end is required for shapes"}
+            times, values = self._curve_points(param, points, shape, start, end, resolution)
+
+            # Check every clip before writing so a bad clip leaves the others untouched.
+            targets = []
+            for n, clip, lo, hi in clip_spans(track, times[0], times[-1]):
+                check_single_pass(clip, lo, hi)
+                envelope = clip.automation_envelope(param)
+                if not envelope and hasattr(clip, "create_automation_envelope"):
+                    envelope = clip.create_automation_envelope(param)
+                if not envelope:
+                    return {"ok": False, "error": NO_ENVELOPE.format(float(clip.start_time))}
+                targets.append((n, clip, envelope, lo, hi))
+            if not targets:
+                return {
+                    "ok": False,
+                    "error": "No arrangement clip covers beats "
+                    + str(times[0])
+                    + " to "
+                    + str(times[-1]),
+                }
+
+            if tolerance is None:
+                tolerance = default_tolerance(param)
+            kept_times, kept_values, clips = [], [], []
+            for n, clip, envelope, lo, hi in targets:
+                cut_times, cut_values = cut_curve(times, values, lo, hi)
+                # Linear from the span start: no loop wrap inside a single pass.
+                offset = clip_time(clip, lo) - lo
+                written = self._write_curve(
+                    envelope, param, [t + offset for t in cut_times], cut_values, tolerance, clear
+                )
+                columns = written["points"]["columns"]
+                kept_times.extend(t - offset for t in columns["time"])
+                kept_values.extend(columns["value"])
+                clips.append(
+                    {
+                        "position": n,
+                        "start": cut_times[0],
+                        "end": cut_times[-1],
+                        "point_count": written["point_count"],
+                    }
+                )
+            return dict(
+                info,
+                ok=True,
+                start=times[0],
+                end=times[-1],
+                input_count=len(times),
+                point_count=len(kept_times),
+                tolerance=float(tolerance),
+                cleared=bool(clear),
+                clips=clips,
+                points=point_columns(kept_times, kept_values),
+            )
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
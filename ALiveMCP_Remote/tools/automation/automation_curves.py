@@ -0,0 +1,121 @@
+"""
+Bulk automation curve writing.
+
+Single responsibility: build a curve from client points or a generated shape,
+clamp it to the parameter range, decimate it to the fewest breakpoints within
+a tolerance, and insert every breakpoint in one main-thread pass (optionally
+clearing the range first), so a whole sweep is one command instead of one
+insert_automation_step per breakpoint.
+"""
+
+from .envelope_points import default_tolerance, point_columns, sample_grid, simplify
+from .envelope_shapes import parse_points, shape_values
+
+DEFAULT_RESOLUTION = 0.0625
+
+
+class AutomationCurvesMixin:
+    # ========================================================================
+    # AUTOMATION CURVES
+    # ========================================================================
+
+    def _curve_points(self, param, points, shape, start, end, resolution):
+        """(times, values) of the requested curve, clamped to the parameter range."""
+        low, high = float(param.min), float(param.max)
+        if points is not None:
+            times, values = parse_points(points)
+        elif shape is not None:
+            times = sample_grid(start, end, resolution)
+            values = shape_values(shape, times, low, high)
+        else:
+            raise ValueError("Pass points or shape")
+        return times, [min(high, max(low, v)) for v in values]
+
+    def _write_curve(self, envelope, param, times, values, tolerance, clear):
+        """Decimate and insert a curve into ``envelope``; returns the result fields."""
+        if tolerance is None:
+            tolerance = default_tolerance(param)
+        kept_times, kept_values = simplify(times, values, float(tolerance))
+        if clear:
+            if not hasattr(envelope, "delete_events_in_range"):
+                raise ValueError("delete_events_in_range not available")
+            envelope.delete_events_in_range(times[0], times[-1])
+        for time, value in zip(kept_times, kept_values):
+            # A zero-length step is a single breakpoint.
+            envelope.insert_step(time, 0.0, value)
+        return {
+            "ok": True,
+            "parameter_name": str(param.name),
+            "start": times[0],
+            "end": times[-1],
+            "input_count": len(times),
+            "point_count": len(kept_times),
+            "tolerance": float(tolerance),
+            "cleared": bool(clear),
+            "points": point_columns(kept_times, kept_values),
+        }
+
+    def write_automation_curve(
+        self,
+        track_index,
+        clip_index,
+        device_index,
+        param_index,
+        points=None,
+        shape=None,
+        start=0.0,
+        end=None,
+        resolution=DEFAULT_RESOLUTION,
+        tolerance=None,
+        clear=False,
+    ):
+        """Write a whole automation curve into a clip envelope in one call.
+
+        See Also:
+            Wiki: docs/wiki/tools/write_automation_curve.md
+
+        Args:
+            track_index: 0-based track index.
+            clip_index: 0-based clip slot index.
+            device_index: 0-based device index on the track.
+            param_index: 0-based parameter index on the device.
+            points: List of [time, value] pairs (or {"time", "value"} dicts
+                or a columnar payload); times in beats from the clip start.
+            shape: Generated curve instead of points: {"type": "linear" |
+                "exponential" | "s_curve" | "sine" | "random_walk", ...}.
+            start: Shape start in beats (default 0.0).
+            end: Shape end in beats (default: clip length).
+            resolution: Shape sampling step in beats before decimation
+                (default 0.0625).
+            tolerance: Maximum value error of the decimated curve, in
+                parameter units (default: 0.1% of the parameter range).
+            clear: Delete existing automation between the first and last
+                point before writing (default False).
+
+        Returns:
+            dict: {"ok", "parameter_name", "device_name", "start", "end",
+            "input_count", "point_count", "tolerance", "cleared", "points"}
+            where points holds the breakpoints written, in columnar form.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            clip, device, param = self._clip_parameter(
+                track_index, clip_index, device_index, param_index
+            )
+            if not hasattr(clip, "automation_envelope"):
+                return {"ok": False, "error": "automation_envelope not available"}
+            times, values = self._curve_points(
+                param, points, shape, start, clip.length if end is None else end, resolution
+            )
+            envelope = clip.automation_envelope(param)
+            if not envelope and hasattr(clip, "create_automation_envelope"):
+                envelope = clip.create_automation_envelope(param)
+            if not envelope:
+                return {"ok": False, "error": "No automation envelope for this parameter"}
+
+            result = self._write_curve(envelope, param, times, values, tolerance, clear)
+            result["device_name"] = str(device.name)
+            return result
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,185 @@
+"""
+LFO modulators on device and mixer parameters.
+
+Single responsibility: add, list and remove Modulator tick jobs (see lfo.py).
+Several modulators run concurrently, one per parameter; adding a modulator to
+a parameter that already has one replaces it. Removing a modulator restores
+the parameter's value from before modulation unless asked not to.
+"""
+
+from ..core.param_targets import make_target, resolve_parameter_key
+from .lfo import Modulator
+
+
+class AutomationModulatorsMixin:
+    # ========================================================================
+    # LFO MODULATORS
+    # ========================================================================
+
+    def _stop_modulator(self, modulator, restore):
+        stopped = self._jobs.cancel(modulator.job_id)
+        if stopped and restore:
+            modulator.param.value = modulator.original_value
+        return stopped
+
+    def add_modulator(
+        self,
+        waveform="sine",
+        track_index=None,
+        return_index=None,
+        master=False,
+        device_index=None,
+        param_index=None,
+        param_name=None,
+        mixer=None,
+        send_index=None,
+        period_beats=None,
+        rate_hz=None,
+        depth=0.25,
+        offset=None,
+        min_value=None,
+        max_value=None,
+        phase=0.0,
+        seed=None,
+    ):
+        """Attach an LFO to a device or mixer parameter, driven on every tick.
+
+        See Also:
+            Wiki: docs/wiki/tools/add_modulator.md
+
+        Args:
+            waveform: "sine" (default), "triangle", "square", "sample_hold"
+                or "random_walk".
+            track_index: 0-based track index (or pass return_index / master).
+            return_index: 0-based return track index.
+            master: Target the master track.
+            device_index: 0-based device index on the track.
+            param_index: 0-based parameter index on the device.
+            param_name: Parameter name instead of param_index.
+            mixer: "volume", "pan" or "send" instead of a device parameter.
+            send_index: Send index when mixer is "send".
+            period_beats: Cycle length in beats, synced to song time.
+            rate_hz: Free-running rate in Hz (when period_beats is not given).
+            depth: Amplitude as a fraction of the parameter range (default
+                0.25).
+            offset: Centre as a fraction of the parameter range (default: the
+                parameter's current position, or its pre-modulation position
+                when replacing a modulator).
+            min_value: Lower clamp in parameter units (default: parameter min).
+            max_value: Upper clamp in parameter units (default: parameter max).
+            phase: Start phase in cycles, 0-1 (default 0.0).
+            seed: Random seed for sample_hold / random_walk.
+
+        Returns:
+            dict: {"ok", "modulator_id", "target", "track", "parameter_name",
+            "waveform", "period_beats", "rate_hz", "depth", "offset",
+            "min_value", "max_value", "phase", "replaced"} where replaced is
+            the id of a modulator on the same parameter that was stopped, or
+            None.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            target = make_target(
+                track_index,
+                return_index,
+                master,
+                device_index,
+                param_index,
+                param_name,
+                mixer,
+                send_index,
+            )
+            _, param, info, key = resolve_parameter_key(self.song, target)
+            if period_beats is None and rate_hz is None:
+                return {"ok": False, "error": "Pass period_beats or rate_hz"}
+            if (period_beats is not None and float(period_beats) <= 0) or (
+                period_beats is None and float(rate_hz) <= 0
+            ):
+                return {"ok": False, "error": "period_beats / rate_hz must be > 0"}
+
+            # A modulator already on this parameter has moved param.value; centre
+            # on (and later restore) the value from before any modulation.
+            running = [job for job in self._jobs.running(Modulator.kind) if job.key == key]
+            centre = running[0].original_value if running else float(param.value)
+            low, high = float(param.min), float(param.max)
+            if offset is None:
+                offset = (centre - low) / (high - low) if high > low else 0.0
+            settings = {
+                "waveform": waveform,
+                "period_beats": None if period_beats is None else float(period_beats),
+                "rate_hz": None if rate_hz is None else float(rate_hz),
+                "depth": float(depth),
+                "offset": float(offset),
+                "min_value": low if min_value is None else max(low, float(min_value)),
+                "max_value": high if max_value is None else min(high, float(max_value)),
+                "phase": float(phase),
+                "seed": seed,
+            }
+            modulator = Modulator(self.song, param, key, info, settings)
+
+            replaced = None
+            for job in running:
+                modulator.original_value = centre
+                self._stop_modulator(job, restore=False)
+                replaced = job.job_id
+            self._jobs.add(modulator)
+            result = modulator.describe(modulator.started)
+            for name in ("value", "original_value"):
+                result.pop(name)
+            return dict(result, ok=True, modulator_id=modulator.job_id, replaced=replaced)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def list_modulators(self):
+        """List running modulators with their settings and current values.
+
+        See Also:
+            Wiki: docs/wiki/tools/list_modulators.md
+
+        Args:
+            None.
+
+        Returns:
+            dict: {"ok", "count", "modulators"} where each modulator carries
+            job_id, status, ticks, elapsed_ms, target, track, parameter_name,
+            the settings passed to add_modulator, value and original_value.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            now = self._jobs.clock()
+            modulators = [m.to_dict(now) for m in self._jobs.running(Modulator.kind)]
+            return {"ok": True, "count": len(modulators), "modulators": modulators}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def remove_modulator(self, modulator_id=None, restore=True):
+        """Stop a modulator (or all of them) and optionally restore the parameter.
+
+        See Also:
+            Wiki: docs/wiki/tools/remove_modulator.md
+
+        Args:
+            modulator_id: Id returned by add_modulator (default: every
+                running modulator).
+            restore: Put the parameter back to its value from before
+                modulation (default True).
+
+        Returns:
+            dict: {"ok", "removed"} where removed lists the ids stopped.
+
+        Raises:
+            None: unknown modulator ids are returned as {"ok": False, "error": ...}."""
+        try:
+            if modulator_id is not None:
+                modulator = self._jobs.get(modulator_id)
+                if modulator is None or modulator.kind != Modulator.kind:
+                    return {"ok": False, "error": "Unknown modulator_id: " + str(modulator_id)}
+                modulators = [modulator]
+            else:
+                modulators = self._jobs.running(Modulator.kind)
+            removed = [m.job_id for m in modulators if self._stop_modulator(m, restore)]
+            return {"ok": True, "removed": removed}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,224 @@
+"""
+Remote-side parameter ramps advanced on update_display() ticks.
+
+Single responsibility: register an interpolation job for one device or mixer
+parameter (target value, duration in beats or milliseconds, easing curve)
+and move the parameter a little on every tick until the target is reached.
+The client sends one command; no network traffic happens while the ramp
+runs. A new ramp on a parameter replaces the one already running on it.
+"""
+
+from ..core.param_targets import clamp, make_target, resolve_parameter_key
+from ..core.tick_jobs import TickJob
+from .envelope_shapes import ease
+
+
+class ParameterRamp(TickJob):
+    """Interpolates ``param`` from its current value to ``target`` over ``duration`` seconds."""
+
+    kind = "ramp"
+
+    def __init__(self, param, key, info, start_value, target, duration, curve, curvature):
+        TickJob.__init__(self)
+        self.param = param
+        self.key = key
+        self.info = info
+        self.start_value = start_value
+        self.target = target
+        self.duration = duration
+        self.curve = curve
+        self.curvature = curvature
+        self.value = start_value
+        self.progress = 0.0
+
+    def advance(self, now):
+        elapsed = now - self.started
+        self.progress = 1.0 if self.duration <= 0 else min(1.0, elapsed / self.duration)
+        fraction = ease(self.curve, self.progress, self.curvature)
+        value = clamp(self.param, self.start_value + (self.target - self.start_value) * fraction)
+        if value != self.value or self.ticks == 1:
+            self.param.value = value
+            self.value = value
+        return self.progress < 1.0
+
+    def describe(self, now):
+        return dict(
+            self.info,
+            target=self.key,
+            from_value=self.start_value,
+            to_value=self.target,
+            value=self.value,
+            progress=round(self.progress, 4),
+            duration_ms=round(self.duration * 1000.0, 3),
+            curve=self.curve,
+        )
+
+
+class AutomationRampsMixin:
+    # ========================================================================
+    # PARAMETER RAMPS
+    # ========================================================================
+
+    def ramp_parameter(
+        self,
+        value,
+        track_index=None,
+        return_index=None,
+        master=False,
+        device_index=None,
+        param_index=None,
+        param_name=None,
+        mixer=None,
+        send_index=None,
+        duration_beats=None,
+        duration_ms=None,
+        curve="linear",
+        curvature=3.0,
+    ):
+        """Ramp a device or mixer parameter to a value, advanced on every tick.
+
+        See Also:
+            Wiki: docs/wiki/tools/ramp_parameter.md
+
+        Args:
+            value: Target value (clamped to the parameter range).
+            track_index: 0-based track index (or pass return_index / master).
+            return_index: 0-based return track index.
+            master: Target the master track.
+            device_index: 0-based device index on the track.
+            param_index: 0-based parameter index on the device.
+            param_name: Parameter name instead of param_index.
+            mixer: "volume", "pan" or "send" instead of a device parameter.
+            send_index: Send index when mixer is "send".
+            duration_beats: Ramp length in beats at the current tempo.
+            duration_ms: Ramp length in milliseconds (used when
+                duration_beats is not given).
+            curve: "linear" (default), "exponential" or "s_curve".
+            curvature: Bend of the exponential curve (default 3.0; negative
+                bends the other way).
+
+        Returns:
+            dict: {"ok", "ramp_id", "target", "track", "parameter_name",
+            "from_value", "to_value", "duration_ms", "curve", "replaced"}
+            where replaced is the id of a running ramp on the same parameter
+            that was cancelled, or None.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            target = make_target(
+                track_index,
+                return_index,
+                master,
+                device_index,
+                param_index,
+                param_name,
+                mixer,
+                send_index,
+            )
+            _, param, info, key = resolve_parameter_key(self.song, target)
+            ease(curve, 0.0, float(curvature))  # rejects unknown curves up front
+            if duration_beats is not None:
+                seconds = float(duration_beats) * 60.0 / float(self.song.tempo)
+            elif duration_ms is not None:
+                seconds = float(duration_ms) / 1000.0
+            else:
+                return {"ok": False, "error": "Pass duration_beats or duration_ms"}
+            if seconds < 0:
+                return {"ok": False, "error": "Duration must be >= 0"}
+
+            replaced = None
+            for running in self._jobs.running(ParameterRamp.kind):
+                if running.key == key:
+                    self._jobs.cancel(running.job_id)
+                    replaced = running.job_id
+            start_value = float(param.value)
+            ramp = self._jobs.add(
+                ParameterRamp(
+                    param,
+                    key,
+                    info,
+                    start_value,
+                    clamp(param, value),
+                    seconds,
+                    curve,
+                    float(curvature),
+                )
+            )
+            return {
+                "ok": True,
+                "ramp_id": ramp.job_id,
+                "target": key,
+                "track": info["track"],
+                "parameter_name": info["parameter_name"],
+                "from_value": start_value,
+                "to_value": ramp.target,
+                "duration_ms": round(seconds * 1000.0, 3),
+                "curve": curve,
+                "replaced": replaced,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def get_ramps(self, ramp_id=None):
+        """Get the state of one ramp or of all running and recent ramps.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_ramps.md
+
+        Args:
+            ramp_id: Id returned by ramp_parameter (default: all ramps).
+
+        Returns:
+            dict: With ramp_id: {"ok", "job_id", "kind", "status", "ticks",
+            "elapsed_ms", "target", "from_value", "to_value", "value",
+            "progress", "duration_ms", "curve", ...}. Without:
+            {"ok", "count", "running", "ramps"}.
+
+        Raises:
+            None: unknown ramp ids are returned as {"ok": False, "error": ...}."""
+        try:
+            now = self._jobs.clock()
+            if ramp_id is not None:
+                ramp = self._jobs.get(ramp_id)
+                if ramp is None or ramp.kind != ParameterRamp.kind:
+                    return {"ok": False, "error": "Unknown ramp_id: " + str(ramp_id)}
+                return dict(ramp.to_dict(now), ok=True)
+            ramps = [
+                j.to_dict(now) for j in self._jobs.jobs.values() if j.kind == ParameterRamp.kind
+            ]
+            return {
+                "ok": True,
+                "count": len(ramps),
+                "running": len(self._jobs.running(ParameterRamp.kind)),
+                "ramps": ramps,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def cancel_ramp(self, ramp_id=None):
+        """Stop a running ramp (or all running ramps), leaving parameters where they are.
+
+        See Also:
+            Wiki: docs/wiki/tools/cancel_ramp.md
+
+        Args:
+            ramp_id: Id of the ramp to stop (default: every running ramp).
+
+        Returns:
+            dict: {"ok", "cancelled"} where cancelled lists the ids stopped.
+
+        Raises:
+            None: unknown ramp ids are returned as {"ok": False, "error": ...}."""
+        try:
+            if ramp_id is not None:
+                ramp = self._jobs.get(ramp_id)
+                if ramp is None or ramp.kind != ParameterRamp.kind:
+                    return {"ok": False, "error": "Unknown ramp_id: " + str(ramp_id)}
+                ramps = [ramp]
+            else:
+                ramps = self._jobs.running(ParameterRamp.kind)
+            cancelled = [r.job_id for r in ramps if self._jobs.cancel(r.job_id)]
+            return {"ok": True, "cancelled": cancelled}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
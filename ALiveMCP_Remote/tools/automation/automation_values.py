@@ -0,0 +1,154 @@
+"""
+Clip automation envelope readback.
+
+Single responsibility: sample an automation envelope with value_at_time over
+a caller-chosen grid as one time-sliced task (a chunk of samples per step),
+optionally reduce the samples to the breakpoints that reproduce them within a
+tolerance, and return the points in columnar form.
+"""
+
+from .envelope_points import (
+    DEFAULT_STEP,
+    default_tolerance,
+    point_columns,
+    sample_grid,
+)
+from .envelope_points import simplify as simplify_points
+
+SAMPLES_PER_STEP = 512
+
+
+class AutomationValuesMixin:
+    # ========================================================================
+    # CLIP AUTOMATION READBACK
+    # ========================================================================
+
+    def _clip_parameter(self, track_index, clip_index, device_index, param_index):
+        """Return (clip, device, param) for a session clip and a track device parameter."""
+        if track_index < 0 or track_index >= len(self.song.tracks):
+            raise ValueError("Invalid track index")
+        track = self.song.tracks[track_index]
+        if clip_index < 0 or clip_index >= len(track.clip_slots):
+            raise ValueError("Invalid clip index")
+        clip_slot = track.clip_slots[clip_index]
+        if not clip_slot.has_clip:
+            raise ValueError("No clip in slot")
+        if device_index < 0 or device_index >= len(track.devices):
+            raise ValueError("Invalid device index")
+        device = track.devices[device_index]
+        if param_index < 0 or param_index >= len(device.parameters):
+            raise ValueError("Invalid parameter index")
+        return clip_slot.clip, device, device.parameters[param_index]
+
+    def _sample_envelope(self, name, envelope, param, times, options, meta):
+        """Run the sampling task for ``envelope``; shared by clip and arrangement readback.
+
+        ``options`` holds simplify, tolerance and background; ``meta`` is
+        merged into the result.
+        """
+        tolerance = options["tolerance"]
+        if tolerance is None:
+            tolerance = default_tolerance(param)
+        steps = self._envelope_sample_steps(
+            envelope, times, options["simplify"], float(tolerance), meta
+        )
+        return self._run_task(name, steps, options["background"])
+
+    def _envelope_sample_steps(self, envelope, times, simplify, tolerance, meta):
+        """Task generator: sample SAMPLES_PER_STEP points per step."""
+        values = []
+        for first in range(0, len(times), SAMPLES_PER_STEP):
+            chunk = times[first : first + SAMPLES_PER_STEP]
+            values.extend(float(envelope.value_at_time(t)) for t in chunk)
+            yield {"done": len(values), "total": len(times)}
+
+        points = (times, values)
+        if simplify:
+            points = simplify_points(times, values, tolerance)
+        return dict(
+            meta,
+            ok=True,
+            has_envelope=True,
+            start=times[0],
+            end=times[-1],
+            sample_count=len(times),
+            simplified=bool(simplify),
+            tolerance=tolerance if simplify else None,
+            min_value=min(values),
+            max_value=max(values),
+            points=point_columns(*points),
+        )
+
+    def get_automation_envelope_values(
+        self,
+        track_index,
+        clip_index,
+        device_index,
+        param_index,
+        start=0.0,
+        end=None,
+        step=DEFAULT_STEP,
+        simplify=False,
+        tolerance=None,
+        background=False,
+    ):
+        """Read back a clip automation envelope by sampling it over a time grid.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_automation_envelope_values.md
+
+        Args:
+            track_index: 0-based track index.
+            clip_index: 0-based clip slot index.
+            device_index: 0-based device index on the track.
+            param_index: 0-based parameter index on the device.
+            start: First sample time in beats, relative to the clip start
+                (default 0.0).
+            end: Last sample time in beats (default: clip length).
+            step: Grid spacing in beats (default 0.25).
+            simplify: Reduce the samples to the breakpoints that reproduce
+                them within tolerance (default False).
+            tolerance: Maximum value error when simplifying, in parameter
+                units (default: 0.1% of the parameter range).
+            background: When true, run as a background task and return its
+                task_id.
+
+        Returns:
+            dict: {"ok", "parameter_name", "device_name", "has_envelope",
+            "start", "end", "sample_count", "simplified", "tolerance",
+            "min_value", "max_value", "points"} where points is
+            {"format": "columnar", "count", "columns": {"time", "value"}}.
+            Without an envelope: {"ok", "parameter_name", "has_envelope":
+            False, "message"}. With background=true: {"ok", "task_id",
+            "name", "status"}.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            clip, device, param = self._clip_parameter(
+                track_index, clip_index, device_index, param_index
+            )
+            if not hasattr(clip, "automation_envelope"):
+                return {"ok": False, "error": "automation_envelope not available"}
+            envelope = clip.automation_envelope(param)
+            if not envelope:
+                return {
+                    "ok": True,
+                    "parameter_name": str(param.name),
+                    "has_envelope": False,
+                    "message": "No automation envelope for this parameter",
+                }
+            if not hasattr(envelope, "value_at_time"):
+                return {"ok": False, "error": "value_at_time not available"}
+
+            times = sample_grid(start, clip.length if end is None else end, step)
+            return self._sample_envelope(
+                "get_automation_envelope_values",
+                envelope,
+                param,
+                times,
+                {"simplify": simplify, "tolerance": tolerance, "background": background},
+                {"parameter_name": str(param.name), "device_name": str(device.name)},
+            )
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
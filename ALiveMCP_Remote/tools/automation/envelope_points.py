@@ -0,0 +1,83 @@
+"""
+Automation point helpers shared by the envelope read and write tools.
+
+Single responsibility: pure functions over automation points kept as two
+parallel lists (times in beats, values in parameter units): the sampling
+grid, reduction of a densely sampled curve to the breakpoints that
+reproduce it within a tolerance (Ramer-Douglas-Peucker over the piecewise
+linear curve), and the columnar payload the tools return. Nothing here
+talks to Live.
+"""
+
+DEFAULT_STEP = 0.25
+MAX_POINTS = 65536
+
+# Fraction of the parameter range used as simplification tolerance when the
+# caller does not pass one.
+DEFAULT_TOLERANCE_FRACTION = 0.001
+
+
+def sample_grid(start, end, step=DEFAULT_STEP):
+    """Times from ``start`` to ``end`` (inclusive) every ``step`` beats."""
+    start, end, step = float(start), float(end), float(step)
+    if step <= 0:
+        raise ValueError("step must be > 0")
+    if end < start:
+        raise ValueError("end must be >= start")
+    count = int((end - start) / step + 1e-9) + 1
+    if count > MAX_POINTS:
+        raise ValueError("Too many samples (" + str(count) + "); use a larger step")
+    times = [start + i * step for i in range(count)]
+    if end - times[-1] > 1e-9:
+        times.append(end)
+    return times
+
+
+def default_tolerance(param):
+    """Simplification tolerance for ``param``: a small fraction of its range."""
+    return abs(float(param.max) - float(param.min)) * DEFAULT_TOLERANCE_FRACTION
+
+
+def _deviation(times, values, first, last, i):
+    """Vertical distance of point ``i`` from the chord first..last."""
+    span = times[last] - times[first]
+    if span <= 0:
+        return abs(values[i] - values[first])
+    ratio = (times[i] - times[first]) / span
+    return abs(values[i] - (values[first] + ratio * (values[last] - values[first])))
+
+
+def simplify(times, values, tolerance):
+    """Keep the fewest points whose linear interpolation stays within ``tolerance``.
+
+    Iterative Ramer-Douglas-Peucker using vertical (value) distance; the
+    first and last points are always kept. Returns new (times, values).
+    """
+    if len(times) <= 2:
+        return list(times), list(values)
+    tolerance = max(0.0, float(tolerance))
+    keep = [False] * len(times)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(times) - 1)]
+    while stack:
+        first, last = stack.pop()
+        worst, worst_i = -1.0, None
+        for i in range(first + 1, last):
+            d = _deviation(times, values, first, last, i)
+            if d > worst:
+                worst, worst_i = d, i
+        if worst_i is not None and worst > tolerance:
+            keep[worst_i] = True
+            stack.append((first, worst_i))
+            stack.append((worst_i, last))
+    kept = [i for i, k in enumerate(keep) if k]
+    return [times[i] for i in kept], [values[i] for i in kept]
+
+
+def point_columns(times, values):
+    """Columnar point payload, as the note tools return columnar notes."""
+    return {
+        "format": "columnar",
+        "count": len(times),
+        "columns": {"time": list(times), "value": list(values)},
+    }
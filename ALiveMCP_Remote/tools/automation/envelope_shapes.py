@@ -0,0 +1,115 @@
+"""
+Automation curve generators and point parsing for write_automation_curve.
+
+Single responsibility: turn a shape spec ({"type": ..., parameters}) or a
+client point list into (times, values) lists sampled on a grid. Values are
+in parameter units and are clamped to the parameter range by the caller.
+The easing functions are shared with the real-time parameter ramps.
+
+Shapes (x runs 0..1 over [start, end]):
+    linear       from_value -> to_value
+    exponential  from_value -> to_value along (e^(k*x) - 1) / (e^k - 1),
+                 k = curve (default 3; negative bends the other way)
+    s_curve      from_value -> to_value along smoothstep 3x^2 - 2x^3
+    sine         between low and high, period beats, phase 0-1
+    random_walk  from from_value, steps of up to step_size, reflected at
+                 low/high; seed makes it repeatable
+"""
+
+import math
+import random
+
+EASINGS = ("linear", "exponential", "s_curve")
+
+
+def ease(curve, x, k=3.0):
+    """Fraction (0..1) of a transition at progress ``x`` (0..1) along ``curve``."""
+    if curve == "linear" or (curve == "exponential" and abs(k) < 1e-9):
+        return x
+    if curve == "exponential":
+        return math.expm1(k * x) / math.expm1(k)
+    if curve == "s_curve":
+        return x * x * (3.0 - 2.0 * x)
+    raise ValueError("curve must be one of: " + ", ".join(EASINGS))
+
+
+def _ramp(curve):
+    def generate(x, params, low, high, rng):
+        a = float(params.get("from_value", low))
+        b = float(params.get("to_value", high))
+        k = float(params.get("curve", 3.0))
+        return [a + (b - a) * ease(curve, v, k) for v in x]
+
+    return generate
+
+
+def _sine(x, params, low, high, rng, span=1.0):
+    lo = float(params.get("low", low))
+    hi = float(params.get("high", high))
+    period = float(params.get("period", 4.0))
+    if period <= 0:
+        raise ValueError("period must be > 0")
+    phase = float(params.get("phase", 0.0))
+    mid, depth = (lo + hi) / 2.0, (hi - lo) / 2.0
+    return [mid + depth * math.sin(2.0 * math.pi * (v * span / period + phase)) for v in x]
+
+
+def _random_walk(x, params, low, high, rng):
+    lo = float(params.get("low", low))
+    hi = float(params.get("high", high))
+    step = float(params.get("step_size", (hi - lo) * 0.05))
+    value = float(params.get("from_value", (lo + hi) / 2.0))
+    values = []
+    for _ in x:
+        values.append(value)
+        value += rng.uniform(-step, step)
+        if value > hi:
+            value = 2.0 * hi - value
+        if value < lo:
+            value = 2.0 * lo - value
+    return values
+
+
+SHAPES = {
+    "linear": _ramp("linear"),
+    "exponential": _ramp("exponential"),
+    "s_curve": _ramp("s_curve"),
+    "sine": _sine,
+    "random_walk": _random_walk,
+}
+
+
+def shape_values(shape, times, low, high):
+    """Values of ``shape`` at ``times``; ``low``/``high`` are the parameter range."""
+    if not isinstance(shape, dict):
+        raise ValueError("shape must be an object with a 'type'")
+    params = dict(shape)
+    kind = params.pop("type", None)
+    if kind not in SHAPES:
+        raise ValueError("shape type must be one of: " + ", ".join(SHAPES))
+    start, end = times[0], times[-1]
+    span = end - start
+    x = [(t - start) / span if span else 0.0 for t in times]
+    rng = random.Random(params.get("seed"))
+    if kind == "sine":
+        return _sine(x, params, low, high, rng, span=span)
+    return SHAPES[kind](x, params, low, high, rng)
+
+
+def parse_points(points):
+    """Parse client points into (times, values) sorted by time.
+
+    Accepts [time, value] pairs, {"time", "value"} dicts or a columnar
+    {"columns": {"time", "value"}} payload.
+    """
+    if isinstance(points, dict):
+        columns = points.get("columns", points)
+        pairs = list(zip(columns["time"], columns["value"]))
+    else:
+        pairs = [(p["time"], p["value"]) if isinstance(p, dict) else tuple(p) for p in points]
+    if not pairs:
+        raise ValueError("points must not be empty")
+    pairs = sorted((float(t), float(v)) for t, v in pairs)
+    if pairs[0][0] < 0:
+        raise ValueError("point times must be >= 0")
+    return [t for t, _ in pairs], [v for _, v in pairs]
@@ -0,0 +1,109 @@
+"""
+LFO modulator tick job.
+
+Single responsibility: drive one DeviceParameter from a low-frequency
+oscillator on every update_display() tick. The oscillator phase follows
+song time (current_song_time / period in beats) while the transport plays
+and tempo-synced modulators are used; otherwise it free-runs on the wall
+clock at the requested rate (or at the tempo-derived rate while stopped).
+
+Output: value = min + range * (offset + depth * wave), clamped to
+[min_value, max_value], where wave is in [-1, 1] and offset/depth are
+fractions of the parameter range.
+"""
+
+import math
+import random
+
+from ..core.tick_jobs import TickJob
+
+WAVEFORMS = ("sine", "triangle", "square", "sample_hold", "random_walk")
+
+
+def _triangle(phase):
+    x = phase % 1.0
+    return 4.0 * x - 1.0 if x < 0.5 else 3.0 - 4.0 * x
+
+
+def _square(phase):
+    return 1.0 if phase % 1.0 < 0.5 else -1.0
+
+
+class Modulator(TickJob):
+    """Oscillates ``param`` around ``offset`` by ``depth`` (fractions of its range)."""
+
+    kind = "modulator"
+
+    def __init__(self, song, param, key, info, settings):
+        TickJob.__init__(self)
+        if settings["waveform"] not in WAVEFORMS:
+            raise ValueError("waveform must be one of: " + ", ".join(WAVEFORMS))
+        self.song = song
+        self.param = param
+        self.key = key
+        self.info = info
+        self.settings = settings
+        self.original_value = float(param.value)
+        self.low = float(param.min)
+        self.span = float(param.max) - self.low
+        self.rng = random.Random(settings.get("seed"))
+        self.phase = float(settings.get("phase", 0.0))
+        self.cycle = None
+        self.held = 0.0
+        self.value = self.original_value
+        self.last_tick = None
+
+    def _cycles_per_second(self):
+        period = self.settings.get("period_beats")
+        if period:
+            return float(self.song.tempo) / 60.0 / float(period)
+        return float(self.settings["rate_hz"])
+
+    def _advance_phase(self, now):
+        period = self.settings.get("period_beats")
+        if period and self.song.is_playing:
+            song_time = float(self.song.current_song_time)
+            self.phase = song_time / float(period) + float(self.settings.get("phase", 0.0))
+        elif self.last_tick is not None:
+            self.phase += (now - self.last_tick) * self._cycles_per_second()
+        self.last_tick = now
+
+    def _wave(self, dt):
+        waveform = self.settings["waveform"]
+        if waveform == "sine":
+            return math.sin(2.0 * math.pi * self.phase)
+        if waveform == "triangle":
+            return _triangle(self.phase)
+        if waveform == "square":
+            return _square(self.phase)
+        if waveform == "sample_hold":
+            cycle = int(math.floor(self.phase))
+            if cycle != self.cycle:
+                self.cycle = cycle
+                self.held = self.rng.uniform(-1.0, 1.0)
+            return self.held
+        # random_walk: drift of up to one full swing per cycle, reflected at +-1.
+        self.held += self.rng.uniform(-1.0, 1.0) * 2.0 * dt * self._cycles_per_second()
+        if self.held > 1.0:
+            self.held = 2.0 - self.held
+        if self.held < -1.0:
+            self.held = -2.0 - self.held
+        return self.held
+
+    def advance(self, now):
+        dt = 0.0 if self.last_tick is None else now - self.last_tick
+        self._advance_phase(now)
+        settings = self.settings
+        fraction = settings["offset"] + settings["depth"] * self._wave(dt)
+        value = self.low + self.span * fraction
+        value = max(settings["min_value"], min(settings["max_value"], value))
+        if value != self.value:
+            self.param.value = value
+            self.value = value
+        return True
+
+    def describe(self, now):
+        info = dict(self.info, target=self.key)
+        info.update((k, v) for k, v in self.settings.items() if k != "seed")
+        info.update(value=self.value, original_value=self.original_value)
+        return info
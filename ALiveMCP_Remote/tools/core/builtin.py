@@ -1,18 +1,24 @@
 """
-Built-in tools: ping, health_check, and the public PARAM_ALIASES backward-compat table.
+Built-in tools: ping, health_check, get_performance_stats, the command
+dispatcher and the public PARAM_ALIASES backward-compat table.
 
-These tools are handled at the LiveAPITools level so the dispatcher in
-ALiveMCP.__init__ can route them uniformly via getattr, exactly like all other
-tools, with no special-case branching.
+These tools are handled at the LiveAPITools level so the dispatcher can route
+them uniformly via getattr, exactly like all other tools, with no
+special-case branching. _dispatch_command is the single dispatch path: the
+socket commands handled by ALiveMCP._process_command and the scheduled
+commands fired by the schedule tool both go through it, so aliases and
+profiling apply to both.
 
-PARAM_ALIASES lives here because the built-in dispatcher (ALiveMCP.__init__)
-consumes it — keeping it co-located with the tools that motivated its creation
-makes the dependency explicit.
+PARAM_ALIASES lives here because the dispatcher consumes it — keeping it
+co-located with the tools that motivated its creation makes the dependency
+explicit.
 
 NOTE: Do not remove PARAM_ALIASES entries — each is a supported public alias
 (see CLAUDE.md).
 """
 
+import time
+
 import Live
 
 # Per-action parameter aliases for backward compatibility.
@@ -34,12 +40,48 @@ PARAM_ALIASES = {
 
 class BuiltinMixin:
     """
-    Provides ping, health_check, and access to PARAM_ALIASES.
+    Provides ping, health_check, get_performance_stats, and access to PARAM_ALIASES.
 
     Single responsibility: built-in diagnostic/protocol tools that every
     ALiveMCP client expects to be available regardless of domain.
     """
 
+    def _dispatch_command(self, command, queue_wait=None):
+        """Run one command dict: resolve the action, apply PARAM_ALIASES, call the tool.
+
+        The call is timed with perf_counter and recorded in the attached
+        profiler (if any) together with ``queue_wait``; unknown actions and
+        tool exceptions are recorded as errors. Tool exceptions propagate to
+        the caller after being recorded.
+        """
+        action = ""
+        started = time.perf_counter()
+        ok = False
+        known = False
+        params = None
+        try:
+            action = command.get("action", "")
+            method = getattr(self, action, None)
+            if method is None:
+                return {
+                    "ok": False,
+                    "error": "Unknown action: " + str(action),
+                    "available_actions": self.get_available_tools(),
+                }
+            known = True
+
+            aliases = PARAM_ALIASES.get(action, {})
+            params = {aliases.get(k, k): v for k, v in command.items() if k != "action"}
+            response = method(**params)
+            ok = not (isinstance(response, dict) and response.get("ok") is False)
+            return response
+        finally:
+            profiler = getattr(self, "_profiler", None)
+            if profiler is not None:
+                profiler.record_command(
+                    str(action), time.perf_counter() - started, queue_wait, ok, params, known
+                )
+
     def ping(self):
         """Return a pong response confirming the script is running.
 
@@ -64,7 +106,7 @@ class BuiltinMixin:
         }
 
     def health_check(self):
-        """Return health status including version, tool count, and queue size.
+        """Return health status including version, tool count, queue size and tick stats.
 
         See Also:
             Wiki: docs/wiki/tools/health_check.md
@@ -85,6 +127,7 @@ class BuiltinMixin:
             ableton_version = "unknown"
 
         cmd_queue = getattr(self, "_command_queue", None)
+        profiler = getattr(self, "_profiler", None)
         return {
             "ok": True,
             "message": "ALiveMCP Remote Script running (thread-safe)",
@@ -92,4 +135,35 @@ class BuiltinMixin:
             "tool_count": len(self.get_available_tools()),
             "ableton_version": ableton_version,
             "queue_size": cmd_queue.qsize() if cmd_queue is not None else 0,
+            "performance": profiler.summary() if profiler is not None else None,
         }
+
+    def get_performance_stats(self, action_name=None, reset=False):
+        """Return main-thread timing stats: per-action histograms, slow commands, tick overruns.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_performance_stats.md
+
+        Args:
+            action_name: Optional action to limit the per-action histograms to.
+            reset: When true, clear all collected stats after building the report.
+
+        Returns:
+            dict: {"ok", "uptime_seconds", "commands", "ticks", "busy_ticks",
+            "tick_overruns", "max_tick_ms", "max_queue_wait_ms", "slow_commands",
+            "mean_busy_tick_ms", "thresholds_ms", "actions", "slow_command_log",
+            "error_command_log", "tick_overrun_log"}. Each action entry has
+            count, errors, mean/p50/p95/p99/max in ms and mean_queue_wait_ms;
+            unknown actions share one "<unknown>" entry.
+
+        Raises:
+            None: returns {"ok": False, "error": ...} when no profiler is attached."""
+        profiler = getattr(self, "_profiler", None)
+        if profiler is None:
+            return {"ok": False, "error": "Profiler not available"}
+
+        stats = profiler.stats(action_name)
+        if reset:
+            profiler.reset()
+        stats["ok"] = True
+        return stats
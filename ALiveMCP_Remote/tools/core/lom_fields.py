@@ -0,0 +1,181 @@
+"""
+Field getter tables for common Live Object Model types.
+
+Each table maps an output key to a getter taking the LOM object. Tables are
+consumed by projection.project(), so a getter only runs when its key is
+selected. Keys follow the names already used by the per-object read tools
+(get_track_info, get_track_chain_summary, get_scene_info, ...).
+"""
+
+from .projection import Nested
+
+
+def _display_value(param):
+    if hasattr(param, "display_value"):
+        return str(param.display_value)
+    return str(param.value)
+
+
+def _is_quantized(param):
+    return bool(param.is_quantized) if hasattr(param, "is_quantized") else False
+
+
+def _value_items(param):
+    return [str(v) for v in param.value_items] if _is_quantized(param) else []
+
+
+def _master_display_value(param):
+    if hasattr(param, "display_value"):
+        return str(param.display_value)
+    return str(param.__str__())
+
+
+def _master_value_items(param):
+    return [str(v) for v in param.value_items] if hasattr(param, "value_items") else []
+
+
+def _rack_display_value(param):
+    try:
+        return str(param.str_for_value(param.value))
+    except Exception:
+        return str(param.value)
+
+
+def _rack_value_items(param):
+    if _is_quantized(param) and hasattr(param, "value_items"):
+        return [str(v) for v in param.value_items]
+    return []
+
+
+PARAMETER_FIELDS = {
+    "name": lambda p: str(p.name),
+    "raw_value": lambda p: float(p.value),
+    "display_value": _display_value,
+    "min": lambda p: float(p.min),
+    "max": lambda p: float(p.max),
+    "is_quantized": _is_quantized,
+    "value_items": _value_items,
+}
+
+# Master chain parameters keep their historical display/value_items fallbacks.
+MASTER_PARAMETER_FIELDS = dict(
+    PARAMETER_FIELDS,
+    display_value=_master_display_value,
+    value_items=_master_value_items,
+)
+
+# Rack chain parameters render display strings through str_for_value().
+RACK_PARAMETER_FIELDS = dict(
+    PARAMETER_FIELDS,
+    display_value=_rack_display_value,
+    value_items=_rack_value_items,
+)
+
+DEVICE_FIELDS = {
+    "name": lambda d: str(d.name),
+    "class_name": lambda d: str(d.class_name),
+    "is_active": lambda d: bool(d.is_active),
+}
+
+CLIP_SLOT_FIELDS = {
+    "has_clip": lambda cs: bool(cs.has_clip),
+    "clip_name": lambda cs: str(cs.clip.name) if cs.has_clip else None,
+    "clip_length": lambda cs: float(cs.clip.length) if cs.has_clip else None,
+    "is_midi_clip": lambda cs: bool(cs.clip.is_midi_clip) if cs.has_clip else None,
+    "is_playing": lambda cs: bool(cs.clip.is_playing) if cs.has_clip else False,
+}
+
+TRACK_FIELDS = {
+    "name": lambda t: str(t.name),
+    "color": lambda t: t.color,
+    "mute": lambda t: bool(t.mute),
+    "solo": lambda t: bool(t.solo),
+    "arm": lambda t: bool(t.arm) if t.can_be_armed else False,
+    "has_midi_input": lambda t: bool(t.has_midi_input),
+    "has_audio_input": lambda t: bool(t.has_audio_input),
+    "volume": lambda t: float(t.mixer_device.volume.value),
+    "pan": lambda t: float(t.mixer_device.panning.value),
+    "sends": lambda t: [float(s.value) for s in t.mixer_device.sends],
+    "num_devices": lambda t: len(t.devices),
+}
+
+# Shape returned by get_track_info (raw LOM values, clip count).
+TRACK_INFO_FIELDS = {
+    "name": lambda t: str(t.name),
+    "color": lambda t: t.color if hasattr(t, "color") else None,
+    "is_foldable": lambda t: t.is_foldable,
+    "mute": lambda t: t.mute,
+    "solo": lambda t: t.solo,
+    "arm": lambda t: t.arm if t.can_be_armed else False,
+    "has_midi_input": lambda t: t.has_midi_input,
+    "has_audio_input": lambda t: t.has_audio_input,
+    "volume": lambda t: float(t.mixer_device.volume.value),
+    "pan": lambda t: float(t.mixer_device.panning.value),
+    "num_devices": lambda t: len(t.devices),
+    "num_clips": lambda t: len([cs for cs in t.clip_slots if cs.has_clip]),
+}
+
+SCENE_FIELDS = {
+    "name": lambda s: str(s.name),
+    "color": lambda s: s.color,
+    "tempo": lambda s: float(s.tempo),
+    "is_empty": lambda s: bool(s.is_empty),
+}
+
+SONG_FIELDS = {
+    "tempo": lambda s: float(s.tempo),
+    "time_signature_numerator": lambda s: s.signature_numerator,
+    "time_signature_denominator": lambda s: s.signature_denominator,
+    "is_playing": lambda s: bool(s.is_playing),
+    "current_song_time": lambda s: float(s.current_song_time),
+    "loop_start": lambda s: float(s.loop_start),
+    "loop_length": lambda s: float(s.loop_length),
+    "record_mode": lambda s: bool(s.record_mode),
+    "num_tracks": lambda s: len(s.tracks),
+    "num_scenes": lambda s: len(s.scenes),
+    "num_return_tracks": lambda s: len(s.return_tracks),
+}
+
+DEVICE_CHILDREN = {
+    "parameters": Nested(lambda d: d.parameters, PARAMETER_FIELDS),
+}
+
+MASTER_DEVICE_CHILDREN = {
+    "parameters": Nested(lambda d: d.parameters, MASTER_PARAMETER_FIELDS),
+}
+
+RACK_DEVICE_FIELDS = dict(
+    DEVICE_FIELDS,
+    is_active=lambda d: bool(d.is_active) if hasattr(d, "is_active") else False,
+)
+
+RACK_CHAIN_FIELDS = {
+    "chain_name": lambda c: str(c.name),
+}
+
+RACK_CHAIN_CHILDREN = {
+    "devices": Nested(
+        lambda c: c.devices if hasattr(c, "devices") else [],
+        RACK_DEVICE_FIELDS,
+        {
+            "parameters": Nested(
+                lambda d: d.parameters if hasattr(d, "parameters") else [],
+                RACK_PARAMETER_FIELDS,
+                index_key=None,
+            ),
+        },
+        index_key="device_index",
+    ),
+}
+
+TRACK_CHILDREN = {
+    "devices": Nested(lambda t: t.devices, DEVICE_FIELDS, DEVICE_CHILDREN),
+    "clip_slots": Nested(lambda t: t.clip_slots, CLIP_SLOT_FIELDS),
+}
+
+SONG_CHILDREN = {
+    "tracks": Nested(lambda s: s.tracks, TRACK_FIELDS, TRACK_CHILDREN),
+    "return_tracks": Nested(lambda s: s.return_tracks, TRACK_FIELDS, TRACK_CHILDREN),
+    "master_track": Nested(lambda s: s.master_track, TRACK_FIELDS, TRACK_CHILDREN, many=False),
+    "scenes": Nested(lambda s: s.scenes, SCENE_FIELDS),
+}
@@ -0,0 +1,78 @@
+"""
+Cursor-based pagination shared by list-returning read tools.
+
+A cursor is an opaque string "<offset>:<version>". The version is a cheap
+fingerprint of the collection taken when the page was served; if the next
+request sees a different fingerprint the collection changed mid-walk and the
+cursor is rejected instead of returning a torn page. Live does not expose a
+change counter for most objects, so each tool supplies a key function
+returning the identifying values of an item (names, times, note tuples).
+
+Pagination is opt-in: when neither limit nor cursor is given, paginate()
+returns the full sequence and no extra response keys, so existing callers see
+the exact same payload.
+"""
+
+import zlib
+
+
+def fingerprint(items, key=None):
+    """Return a short hex fingerprint of ``items`` (order-sensitive)."""
+    if key is None:
+        data = str(len(items))
+    else:
+        data = repr([key(item) for item in items])
+    return "%08x" % (zlib.crc32(data.encode("utf-8")) & 0xFFFFFFFF)
+
+
+def parse_cursor(cursor):
+    """Split a cursor into (offset, version); raises ValueError if malformed."""
+    try:
+        offset, version = str(cursor).split(":", 1)
+        offset = int(offset)
+    except ValueError:
+        raise ValueError("Invalid cursor: " + str(cursor))
+    if offset < 0 or not version:
+        raise ValueError("Invalid cursor: " + str(cursor))
+    return offset, version
+
+
+def paginate(items, limit=None, cursor=None, key=None):
+    """Slice ``items`` for one page.
+
+    Args:
+        items: Sequence in stable order (a list or LOM vector).
+        limit: Maximum number of items per page (None = rest of the sequence).
+        cursor: Cursor returned as next_cursor by the previous page.
+        key: Callable(item) -> identifying values used for the fingerprint.
+
+    Returns:
+        tuple: (page, start, info) where ``start`` is the absolute index of the
+        first item and ``info`` holds {"total", "next_cursor"} when pagination
+        was requested, otherwise {}.
+
+    Raises:
+        ValueError: limit < 1, a malformed cursor, or a stale cursor.
+    """
+    items = list(items)
+    if limit is None and cursor is None:
+        return items, 0, {}
+
+    if limit is not None:
+        limit = int(limit)
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+
+    version = fingerprint(items, key)
+    start = 0
+    if cursor is not None:
+        start, cursor_version = parse_cursor(cursor)
+        if cursor_version != version:
+            raise ValueError(
+                "Stale cursor: the collection changed since the previous page; "
+                "restart without a cursor"
+            )
+
+    end = len(items) if limit is None else min(start + limit, len(items))
+    next_cursor = str(end) + ":" + version if end < len(items) else None
+    return items[start:end], start, {"total": len(items), "next_cursor": next_cursor}
@@ -0,0 +1,137 @@
+"""
+Resolution of parameter targets shared by automation, ramp and bulk tools.
+
+A target is a dict naming one DeviceParameter anywhere in the set:
+
+    track:      {"track_index": i} | {"return_index": i} | {"master": true}
+    parameter:  {"mixer": "volume" | "pan" | "send", "send_index": j}
+                or {"device_index": d, "param_index": p}
+                or {"device_index": d, "param_name": "Cutoff"}
+
+Every tool that addresses parameters this way validates targets with the same
+error strings ("Invalid track index", "Invalid device index", ...).
+"""
+
+MIXER_PARAMETERS = ("volume", "pan", "send")
+
+
+def make_target(
+    track_index=None,
+    return_index=None,
+    master=False,
+    device_index=None,
+    param_index=None,
+    param_name=None,
+    mixer=None,
+    send_index=None,
+):
+    """Build a target dict from the flat keyword arguments the tools accept."""
+    return {
+        "track_index": track_index,
+        "return_index": return_index,
+        "master": master,
+        "device_index": device_index,
+        "param_index": param_index,
+        "param_name": param_name,
+        "mixer": mixer,
+        "send_index": send_index,
+    }
+
+
+def resolve_track(song, target):
+    """Return (track, label) for the track part of ``target``; raises ValueError."""
+    if target.get("master"):
+        return song.master_track, "master"
+    if target.get("return_index") is not None:
+        index = int(target["return_index"])
+        if index < 0 or index >= len(song.return_tracks):
+            raise ValueError("Invalid return track index")
+        return song.return_tracks[index], "return " + str(index)
+    if target.get("track_index") is not None:
+        index = int(target["track_index"])
+        if index < 0 or index >= len(song.tracks):
+            raise ValueError("Invalid track index")
+        return song.tracks[index], "track " + str(index)
+    raise ValueError("Pass track_index, return_index or master")
+
+
+def _mixer_parameter(track, mixer, send_index):
+    if mixer == "volume":
+        return track.mixer_device.volume
+    if mixer == "pan":
+        return track.mixer_device.panning
+    if mixer == "send":
+        sends = list(track.mixer_device.sends)
+        if send_index is None or int(send_index) < 0 or int(send_index) >= len(sends):
+            raise ValueError("Invalid send index")
+        return sends[int(send_index)]
+    raise ValueError("mixer must be one of: " + ", ".join(MIXER_PARAMETERS))
+
+
+def _device_parameter(track, device_index, param_index, param_name):
+    """Return (device, param_index, param), looking the index up by name if given."""
+    if device_index is None or int(device_index) < 0 or int(device_index) >= len(track.devices):
+        raise ValueError("Invalid device index")
+    device = track.devices[int(device_index)]
+    if param_name is not None:
+        for index, param in enumerate(device.parameters):
+            if str(param.name) == str(param_name):
+                return device, index, param
+        raise ValueError("Parameter not found: " + str(param_name))
+    if param_index is None or int(param_index) < 0 or int(param_index) >= len(device.parameters):
+        raise ValueError("Invalid parameter index")
+    return device, int(param_index), device.parameters[int(param_index)]
+
+
+def resolve_parameter_key(song, target):
+    """Return (track, param, info, key) for ``target``; raises ValueError.
+
+    ``info`` describes the target for responses: track label, device name
+    (device parameters only) and parameter name. ``key`` is a canonical
+    string naming the parameter (e.g. "track 0/device 1/param 3" or
+    "return 0/send 1"), equal for every spelling of the same target.
+    """
+    track, label = resolve_track(song, target)
+    info = {"track": label}
+    mixer = target.get("mixer")
+    if mixer is not None:
+        param = _mixer_parameter(track, mixer, target.get("send_index"))
+        key = label + "/" + (mixer if mixer != "send" else "send " + str(int(target["send_index"])))
+    else:
+        device, param_index, param = _device_parameter(
+            track,
+            target.get("device_index"),
+            target.get("param_index"),
+            target.get("param_name"),
+        )
+        info["device_name"] = str(device.name)
+        key = label + "/device " + str(int(target["device_index"])) + "/param " + str(param_index)
+    info["parameter_name"] = str(param.name)
+    return track, param, info, key
+
+
+def resolve_parameter(song, target):
+    """Return (track, param, info) for ``target`` (see resolve_parameter_key)."""
+    return resolve_parameter_key(song, target)[:3]
+
+
+def clamp(param, value):
+    """Clamp ``value`` to the parameter's min/max range."""
+    return max(float(param.min), min(float(param.max), float(value)))
+
+
+def resolve_value(param, value):
+    """Value to write for ``param``: numbers are clamped, strings looked up in value_items.
+
+    Raises ValueError when a string does not name one of a quantized
+    parameter's value_items.
+    """
+    if not isinstance(value, str):
+        return clamp(param, value)
+    is_quantized = bool(param.is_quantized) if hasattr(param, "is_quantized") else False
+    value_items = [str(v) for v in param.value_items] if is_quantized else []
+    if not value_items:
+        raise ValueError("Parameter has no value_items for string lookup")
+    if value not in value_items:
+        raise ValueError("'" + value + "' not in value_items: " + str(value_items))
+    return float(value_items.index(value))
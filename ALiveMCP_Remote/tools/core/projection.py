@@ -0,0 +1,157 @@
+"""
+Field projection helpers shared by read tools.
+
+A field selector is a list (or comma-separated string) of dotted paths such as
+``["tracks.name", "tracks.devices.class_name"]``. parse_fields() turns it into a
+nested selector tree and project() walks a LOM object against a table of field
+getters, evaluating only the getters that were selected. Unselected fields are
+never read, so expensive bridge calls (display strings, value_items lists) are
+skipped entirely.
+
+Selector tree format: ``None`` selects every field at that level; a dict maps
+selected keys to their own sub-tree.
+"""
+
+from collections import namedtuple
+
+# A nested collection inside a projected object.
+#   items:     callable(obj) -> iterable of children (or a single child if many=False)
+#   fields:    {name: getter(child)} scalar field table for each child
+#   children:  {name: Nested} nested collections of each child
+#   many:      False when items() returns a single object (e.g. master_track)
+#   index_key: key holding each child's position in the list (None to omit it)
+Nested = namedtuple("Nested", ["items", "fields", "children", "many", "index_key"])
+Nested.__new__.__defaults__ = (None, True, "index")
+
+
+def parse_fields(fields):
+    """Parse a field selector into a nested selector tree.
+
+    Returns None (select everything) when ``fields`` is empty or None.
+    """
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+
+    tree = {}
+    for path in fields:
+        parts = [p.strip() for p in str(path).split(".") if p.strip()]
+        node = tree
+        for i, part in enumerate(parts):
+            if i == len(parts) - 1:
+                node[part] = None
+            elif part in node and node[part] is None:
+                break
+            else:
+                node = node.setdefault(part, {})
+    return tree or None
+
+
+def selects(tree, key):
+    """Return True when ``key`` is selected by ``tree``."""
+    return tree is None or key in tree
+
+
+def subtree(tree, key):
+    """Return the selector sub-tree for ``key`` (None selects everything)."""
+    return None if tree is None else tree.get(key)
+
+
+def check_fields(tree, available, where="item"):
+    """Raise ValueError when ``tree`` names fields that ``available`` does not offer."""
+    if tree is None:
+        return
+    unknown = sorted(set(tree) - set(available))
+    if unknown:
+        raise ValueError(
+            "Unknown field(s) for "
+            + where
+            + ": "
+            + ", ".join(unknown)
+            + ". Available: "
+            + ", ".join(sorted(available))
+        )
+
+
+def project(obj, tree, fields, children=None, depth=None, where="item", strict=False):
+    """Build a dict for ``obj`` containing only the selected fields.
+
+    Scalar getters that raise (e.g. a property missing on return tracks)
+    yield None unless ``strict`` is set, in which case the error propagates.
+    ``depth`` limits how many levels of nested collections are expanded
+    (None = unlimited, 0 = scalars only).
+    """
+    children = children or {}
+    check_fields(tree, list(fields) + list(children), where)
+
+    out = {}
+    for key, getter in fields.items():
+        if not selects(tree, key):
+            continue
+        try:
+            out[key] = getter(obj)
+        except Exception:
+            if strict:
+                raise
+            out[key] = None
+
+    if depth is not None and depth <= 0:
+        return out
+
+    next_depth = None if depth is None else depth - 1
+    for key, nested in children.items():
+        if not selects(tree, key):
+            continue
+        child_tree = subtree(tree, key)
+        try:
+            items = nested.items(obj)
+        except Exception:
+            if strict:
+                raise
+            out[key] = None
+            continue
+        if nested.many:
+            out[key] = project_items(
+                items,
+                child_tree,
+                nested.fields,
+                nested.children,
+                next_depth,
+                key,
+                strict,
+                nested.index_key,
+            )
+        else:
+            out[key] = project(
+                items, child_tree, nested.fields, nested.children, next_depth, key, strict
+            )
+    return out
+
+
+def project_items(
+    items,
+    tree,
+    fields,
+    children=None,
+    depth=None,
+    where="item",
+    strict=False,
+    index_key="index",
+    start=0,
+):
+    """Project every object in ``items``, prefixing each dict with its index.
+
+    ``index_key`` is always emitted (it costs nothing), so selecting it
+    explicitly is accepted but not required. ``start`` offsets the emitted
+    indices when ``items`` is a page of a longer collection.
+    """
+    if tree is not None and index_key in tree:
+        tree = {k: v for k, v in tree.items() if k != index_key}
+
+    out = []
+    for i, item in enumerate(items, start):
+        entry = {index_key: i} if index_key else {}
+        entry.update(project(item, tree, fields, children, depth, where, strict))
+        out.append(entry)
+    return out
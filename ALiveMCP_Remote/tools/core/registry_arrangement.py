@@ -0,0 +1,43 @@
+"""
+Arrangement tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+ARRANGEMENT_TOOLS = [
+    # Project & Arrangement (6 tools)
+    "get_project_root_folder",
+    "trigger_session_record",
+    "get_can_jump_to_next_cue",
+    "get_can_jump_to_prev_cue",
+    "jump_to_next_cue",
+    "jump_to_prev_cue",
+    # Browser operations (4 tools)
+    "browse_devices",
+    "browse_plugins",
+    "load_device_from_browser",
+    "get_browser_items",
+    # Loop & Locator operations (6 tools)
+    "set_loop_enabled",
+    "get_loop_enabled",
+    "create_locator",
+    "delete_locator",
+    "get_locators",
+    "jump_by_amount",
+    # View/Navigation (4 tools)
+    "show_clip_view",
+    "show_arrangement_view",
+    "focus_track",
+    "scroll_view_to_time",
+    # Arrangement View Clips (3 tools)
+    "get_arrangement_clips",
+    "duplicate_to_arrangement",
+    "consolidate_clip",
+    # Take Lanes Support (8 tools) - Live 12
+    "get_take_lanes",
+    "create_take_lane",
+    "get_take_lane_name",
+    "set_take_lane_name",
+    "create_audio_clip_in_lane",
+    "create_midi_clip_in_lane",
+    "get_clips_in_take_lane",
+    "delete_take_lane",
+]
@@ -0,0 +1,25 @@
+"""
+Automation tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+AUTOMATION_TOOLS = [
+    # Clip Automation Envelopes (7 tools)
+    "get_clip_automation_envelope",
+    "create_automation_envelope",
+    "clear_automation_envelope",
+    "insert_automation_step",
+    "remove_automation_step",
+    "get_automation_envelope_values",
+    "write_automation_curve",
+    # Arrangement clip envelopes (2 tools)
+    "get_arrangement_automation",
+    "write_arrangement_automation",
+    # Parameter ramps (3 tools)
+    "ramp_parameter",
+    "get_ramps",
+    "cancel_ramp",
+    # LFO modulators (3 tools)
+    "add_modulator",
+    "list_modulators",
+    "remove_modulator",
+]
@@ -0,0 +1,56 @@
+"""
+Clips tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+CLIPS_TOOLS = [
+    # Clip operations (8 tools)
+    "create_midi_clip",
+    "delete_clip",
+    "duplicate_clip",
+    "launch_clip",
+    "stop_clip",
+    "stop_all_clips",
+    "get_clip_info",
+    "set_clip_name",
+    # Clip extras (10 tools)
+    "set_clip_looping",
+    "set_clip_loop_start",
+    "set_clip_loop_end",
+    "set_clip_start_marker",
+    "set_clip_end_marker",
+    "set_clip_muted",
+    "set_clip_gain",
+    "set_clip_pitch_coarse",
+    "set_clip_pitch_fine",
+    "set_clip_signature_numerator",
+    # MIDI notes (1 tool)
+    "add_notes",
+    # Groove & Quantize (2 tools)
+    "quantize_clip",
+    "quantize_clip_pitch",
+    # Clip color (1 tool)
+    "set_clip_color",
+    # Audio Clip Operations (5 tools)
+    "get_clip_warp_mode",
+    "set_clip_warp_mode",
+    "get_clip_file_path",
+    "set_clip_warping",
+    "get_warp_markers",
+    # Follow Actions (3 tools)
+    "get_clip_follow_action",
+    "set_clip_follow_action",
+    "set_follow_action_time",
+    # Color Utilities (1 tool)
+    "get_clip_color",
+    # Clip Fade In/Out (4 tools)
+    "get_clip_fade_in",
+    "set_clip_fade_in",
+    "get_clip_fade_out",
+    "set_clip_fade_out",
+    # Clip Annotations (2 tools)
+    "get_clip_annotation",
+    "set_clip_annotation",
+    # Clip RAM Mode (2 tools)
+    "get_clip_ram_mode",
+    "set_clip_ram_mode",
+]
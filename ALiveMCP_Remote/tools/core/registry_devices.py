@@ -0,0 +1,38 @@
+"""
+Devices tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+DEVICES_TOOLS = [
+    # Devices (3 tools)
+    "add_device",
+    "get_track_devices",
+    "set_device_param",
+    # Device extras (8 tools)
+    "set_device_on_off",
+    "get_device_parameters",
+    "get_device_parameter_by_name",
+    "set_device_parameter_by_name",
+    "delete_device",
+    "get_device_presets",
+    "set_device_preset",
+    "randomize_device_parameters",
+    # Device extras - missing tool (1 tool)
+    "randomize_device",
+    # Rack/Chain Operations (5 tools)
+    "get_device_chains",
+    "get_chain_devices",
+    "get_rack_contents",
+    "set_chain_mute",
+    "set_chain_solo",
+    # Plugin Window Control (2 tools)
+    "show_plugin_window",
+    "hide_plugin_window",
+    # Device Utilities (2 tools)
+    "get_device_class_name",
+    "get_device_type",
+    # Device Parameter Display Values (2 tools) - Live 12
+    "get_device_param_display_value",
+    "get_all_param_display_values",
+    # Bulk parameter writes (1 tool)
+    "set_parameters_bulk",
+]
@@ -0,0 +1,15 @@
+"""
+Max for Live tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+M4L_TOOLS = [
+    # Max for Live (M4L) operations (4 tools)
+    "is_max_device",
+    "get_m4l_devices",
+    "get_m4l_param_by_name",
+    "get_cv_tools_devices",
+    # Sample/Simpler Operations (3 tools)
+    "get_sample_length",
+    "get_sample_playback_mode",
+    "set_sample_playback_mode",
+]
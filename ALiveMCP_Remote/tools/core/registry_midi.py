@@ -0,0 +1,30 @@
+"""
+MIDI tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+MIDI_TOOLS = [
+    # MIDI notes (2 tools)
+    "get_clip_notes",
+    "remove_notes",
+    # MIDI extras (4 tools)
+    "select_all_notes",
+    "deselect_all_notes",
+    "replace_selected_notes",
+    "get_notes_extended",
+    # MIDI CC/Program Change (2 tools)
+    "send_midi_cc",
+    "send_program_change",
+    # MIDI note-ID editing (2 tools)
+    "apply_note_modifications",
+    "remove_notes_by_id",
+    # Bulk MIDI notes (2 tools)
+    "get_all_notes",
+    "set_notes_bulk",
+    # MIDI pattern index (6 tools)
+    "build_pattern_index",
+    "get_pattern_index_status",
+    "clear_pattern_index",
+    "find_motif",
+    "find_rhythm",
+    "find_duplicate_clips",
+]
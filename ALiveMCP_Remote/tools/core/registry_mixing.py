@@ -0,0 +1,49 @@
+"""
+Mixing tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+MIXING_TOOLS = [
+    # Track extras (2 tools)
+    "set_track_send",
+    "get_track_sends",
+    # Groove & Quantize (3 tools)
+    "set_clip_groove_amount",
+    "get_groove_amount",
+    "set_groove_amount",
+    # Master Track Control (9 tools)
+    "get_master_track_info",
+    "set_master_volume",
+    "set_master_pan",
+    "get_master_devices",
+    "get_master_device_params",
+    "set_master_device_param",
+    "set_master_device_param_by_name",
+    "get_master_device_param_info",
+    "get_master_chain_summary",
+    # Return Track Operations (3 tools)
+    "get_return_track_count",
+    "get_return_track_info",
+    "set_return_track_volume",
+    # Crossfader (3 tools)
+    "get_crossfader_assignment",
+    "set_crossfader_assignment",
+    "get_crossfader_position",
+    # Groove Pool (2 tools)
+    "get_groove_pool_grooves",
+    "set_clip_groove",
+    # Output meters (3 tools)
+    "subscribe_meters",
+    "read_meters",
+    "unsubscribe_meters",
+    # Level analysis (3 tools)
+    "analyze_levels",
+    "get_level_analysis",
+    "cancel_level_analysis",
+    # Mixer snapshots (3 tools)
+    "capture_mixer_snapshot",
+    "recall_mixer_snapshot",
+    "morph_mixer_snapshots",
+    # Send matrix (2 tools)
+    "get_send_matrix",
+    "set_send_matrix",
+]
@@ -0,0 +1,22 @@
+"""
+Properties tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+PROPERTIES_TOOLS = [
+    # Application Methods (4 tools) - Live 12
+    "get_build_id",
+    "get_variant",
+    "show_message_box",
+    "get_application_version",
+    # Missing Track/Clip/Scene Properties (10 tools)
+    "get_clip_start_time",
+    "set_clip_start_time",
+    "get_track_is_foldable",
+    "get_track_is_frozen",
+    "get_scene_is_empty",
+    "get_scene_tempo",
+    "get_arrangement_overdub",
+    "set_record_mode",
+    "get_signature_numerator",
+    "get_signature_denominator",
+]
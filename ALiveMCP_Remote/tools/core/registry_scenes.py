@@ -0,0 +1,16 @@
+"""
+Scenes tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+SCENES_TOOLS = [
+    # Scenes (6 tools)
+    "create_scene",
+    "delete_scene",
+    "duplicate_scene",
+    "launch_scene",
+    "rename_scene",
+    "get_scene_info",
+    # Scene Color (2 tools)
+    "get_scene_color",
+    "set_scene_color",
+]
@@ -0,0 +1,56 @@
+"""
+Session tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+SESSION_TOOLS = [
+    # Server health (3 tools)
+    "ping",
+    "health_check",
+    "get_performance_stats",
+    # Session control (14 tools)
+    "start_playback",
+    "stop_playback",
+    "start_recording",
+    "stop_recording",
+    "continue_playing",
+    "get_session_info",
+    "set_tempo",
+    "set_time_signature",
+    "set_loop_start",
+    "set_loop_length",
+    "set_metronome",
+    "tap_tempo",
+    "undo",
+    "redo",
+    # Transport (8 tools)
+    "jump_to_time",
+    "get_current_time",
+    "set_arrangement_overdub",
+    "set_back_to_arranger",
+    "set_punch_in",
+    "set_punch_out",
+    "nudge_up",
+    "nudge_down",
+    # Automation (6 tools)
+    "re_enable_automation",
+    "get_session_automation_record",
+    "set_session_automation_record",
+    "get_session_record",
+    "set_session_record",
+    "capture_midi",
+    # Metronome Volume (2 tools)
+    "get_metronome_volume",
+    "set_metronome_volume",
+    # Song snapshot (1 tool)
+    "get_song_snapshot",
+    # Background tasks (3 tools)
+    "get_task_status",
+    "cancel_task",
+    "list_tasks",
+    # Scheduled commands (3 tools)
+    "schedule",
+    "get_scheduled",
+    "cancel_scheduled",
+    # Clock sync (1 tool)
+    "clock_sync",
+]
@@ -0,0 +1,57 @@
+"""
+Tracks tool names exposed by LiveAPITools (joined in registry.py).
+"""
+
+TRACKS_TOOLS = [
+    # Track lookup (1 tool)
+    "get_track_index_by_name",
+    # Track management (13 tools)
+    "create_midi_track",
+    "create_audio_track",
+    "create_return_track",
+    "delete_track",
+    "duplicate_track",
+    "rename_track",
+    "set_track_volume",
+    "set_track_pan",
+    "arm_track",
+    "solo_track",
+    "mute_track",
+    "get_track_info",
+    "set_track_color",
+    # Track extras (3 tools)
+    "set_track_fold_state",
+    "set_track_input_routing",
+    "set_track_output_routing",
+    # Monitoring & Input (4 tools)
+    "set_track_current_monitoring_state",
+    "get_track_available_input_routing_types",
+    "get_track_available_output_routing_types",
+    "get_track_input_routing_type",
+    # Track routing extras (3 tools)
+    "get_track_output_routing",
+    "set_track_input_sub_routing",
+    "set_track_output_sub_routing",
+    # Track Device Parameters — Enriched (4 tools)
+    "get_track_device_params",
+    "set_track_device_param",
+    "set_track_device_param_by_name",
+    "get_track_chain_summary",
+    # Track Groups (4 tools)
+    "create_group_track",
+    "group_tracks",
+    "get_track_is_grouped",
+    "ungroup_track",
+    # Color Utilities (1 tool)
+    "get_track_color",
+    # Track Freeze/Flatten (3 tools)
+    "freeze_track",
+    "unfreeze_track",
+    "flatten_track",
+    # Track Annotations (2 tools)
+    "get_track_annotation",
+    "set_track_annotation",
+    # Track Delay Compensation (2 tools)
+    "get_track_delay",
+    "set_track_delay",
+]
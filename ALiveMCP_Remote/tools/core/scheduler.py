@@ -0,0 +1,106 @@
+"""
+Beat-quantized command scheduling.
+
+Single responsibility: keep scheduled commands in a heap ordered by song
+position and fire each one on the first update_display() tick at which
+Song.current_song_time has reached it. The heap is owned by a tick job that
+runs only while commands are pending. Also maps Live's launch quantization
+(Song.clip_trigger_quantization) to grid sizes in beats.
+"""
+
+import heapq
+import math
+
+from .tick_jobs import TickJob
+
+# Index order matches Live.Song.Quantization; values are (bars, note fraction).
+# Song time is counted in quarter-note beats, so a 1/4 note is always 1 beat.
+QUANTIZATION = (
+    ("none", None, None),
+    ("8 bars", 8, None),
+    ("4 bars", 4, None),
+    ("2 bars", 2, None),
+    ("1 bar", 1, None),
+    ("1/2", None, 2.0),
+    ("1/2t", None, 4.0 / 3.0),
+    ("1/4", None, 1.0),
+    ("1/4t", None, 2.0 / 3.0),
+    ("1/8", None, 0.5),
+    ("1/8t", None, 1.0 / 3.0),
+    ("1/16", None, 0.25),
+    ("1/16t", None, 1.0 / 6.0),
+    ("1/32", None, 0.125),
+)
+QUANTIZATION_ALIASES = {"bar": "1 bar", "beat": "1/4"}
+
+
+def bar_length(song):
+    """Length of one bar in beats for the song's time signature."""
+    return float(song.signature_numerator) * 4.0 / float(song.signature_denominator)
+
+
+def quantization_name(song, quantize):
+    """Resolve ``quantize`` ("global", a name or an alias) to a QUANTIZATION name."""
+    if quantize == "global":
+        return QUANTIZATION[int(song.clip_trigger_quantization)][0]
+    name = QUANTIZATION_ALIASES.get(str(quantize).lower(), str(quantize).lower())
+    if name not in [q[0] for q in QUANTIZATION]:
+        names = [q[0] for q in QUANTIZATION] + list(QUANTIZATION_ALIASES) + ["global"]
+        raise ValueError("quantize must be one of: " + ", ".join(names))
+    return name
+
+
+def grid_beats(song, name):
+    """Grid size in beats for a QUANTIZATION name (0.0 for "none")."""
+    for q_name, bars, beats in QUANTIZATION:
+        if q_name == name:
+            if bars is not None:
+                return bars * bar_length(song)
+            return beats or 0.0
+    raise ValueError("Unknown quantization: " + str(name))
+
+
+def next_boundary(position, grid, count=1):
+    """The ``count``-th grid line strictly after ``position`` (``position`` if grid is 0)."""
+    if grid <= 0:
+        return position
+    # A tiny epsilon keeps a position sitting exactly on a grid line from
+    # being rounded down to the previous line by float error.
+    return (math.floor(position / grid + 1e-9) + count) * grid
+
+
+class CommandScheduler(TickJob):
+    """Fires entries whose beat has been reached; finishes when the heap is empty."""
+
+    kind = "scheduler"
+
+    def __init__(self, song, fire):
+        TickJob.__init__(self)
+        self.song = song
+        self.fire = fire
+        self.heap = []
+        self._sequence = 0
+
+    def push(self, entry):
+        # The sequence number keeps entries for the same beat in submission order.
+        self._sequence += 1
+        heapq.heappush(self.heap, (entry["beat"], self._sequence, entry))
+
+    def discard(self, schedule_ids):
+        """Drop the entries with these schedule_ids from the heap; returns how many."""
+        kept = [item for item in self.heap if item[2]["schedule_id"] not in schedule_ids]
+        removed = len(self.heap) - len(kept)
+        heapq.heapify(kept)
+        self.heap = kept
+        return removed
+
+    def advance(self, now):
+        position = float(self.song.current_song_time)
+        while self.heap and self.heap[0][0] <= position:
+            entry = heapq.heappop(self.heap)[2]
+            if entry["status"] == "pending":
+                self.fire(entry, position)
+        return bool(self.heap)
+
+    def describe(self, now):
+        return {"pending": len(self.heap)}
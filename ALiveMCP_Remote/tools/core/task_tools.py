@@ -0,0 +1,131 @@
+"""
+Background task tools: status, cancellation and listing for time-sliced tasks.
+
+Single responsibility: expose the TaskRunner (tools/core/tasks.py) to clients
+and give long-running tools one entry point, _run_task(), that either drains
+their generator synchronously or schedules it across update_display() ticks.
+Also owns the per-tick job runner (tools/core/tick_jobs.py) that ramps,
+modulators and other clock-driven features register with.
+"""
+
+from .tasks import TaskRunner, run_to_completion
+from .tick_jobs import TickJobs
+
+
+class TasksMixin:
+    # ========================================================================
+    # BACKGROUND TASKS
+    # ========================================================================
+
+    @property
+    def _tasks(self):
+        runner = getattr(self, "_task_runner", None)
+        if runner is None:
+            runner = self._task_runner = TaskRunner()
+        return runner
+
+    @property
+    def _jobs(self):
+        jobs = getattr(self, "_tick_jobs", None)
+        if jobs is None:
+            jobs = self._tick_jobs = TickJobs()
+        return jobs
+
+    def _process_tasks(self):
+        """Resume background tasks and advance tick jobs for one tick (called from update_display)."""
+        return self._tasks.tick() + self._jobs.tick()
+
+    def _run_task(self, name, steps, background=False):
+        """Run a task generator now, or schedule it and return its task_id."""
+        if not background:
+            return run_to_completion(steps)
+        task = self._tasks.submit(name, steps)
+        return {"ok": True, "task_id": task.task_id, "name": name, "status": task.status}
+
+    def get_task_status(self, task_id, since=0):
+        """Get progress, partial results and the final result of a background task.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_task_status.md
+
+        Args:
+            task_id: Id returned by a tool called with background=true.
+            since: Number of partial items already fetched; only newer ones
+                are returned (default 0).
+
+        Returns:
+            dict: {"ok", "task_id", "name", "status", "progress", "ticks",
+            "elapsed_ms", "partial", "partial_count"} plus "result" when
+            status is "done" or "error" when it failed.
+
+        Raises:
+            None: unknown task ids are returned as {"ok": False, "error": ...}."""
+        try:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return {"ok": False, "error": "Unknown task_id: " + str(task_id)}
+            info = task.to_dict(since=max(0, int(since)))
+            info["ok"] = True
+            return info
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def cancel_task(self, task_id):
+        """Cancel a running background task.
+
+        See Also:
+            Wiki: docs/wiki/tools/cancel_task.md
+
+        Args:
+            task_id: Id of the task to cancel.
+
+        Returns:
+            dict: {"ok", "task_id", "cancelled", "status"}; cancelled is False
+            when the task had already finished.
+
+        Raises:
+            None: unknown task ids are returned as {"ok": False, "error": ...}."""
+        try:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return {"ok": False, "error": "Unknown task_id: " + str(task_id)}
+            cancelled = task.cancel()
+            return {
+                "ok": True,
+                "task_id": task.task_id,
+                "cancelled": cancelled,
+                "status": task.status,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def list_tasks(self):
+        """List background tasks (running and recently finished).
+
+        See Also:
+            Wiki: docs/wiki/tools/list_tasks.md
+
+        Args:
+            None.
+
+        Returns:
+            dict: {"ok", "count", "running", "tasks"} where each task carries
+            task_id, name, status, progress, ticks and elapsed_ms.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            tasks = []
+            for task in self._tasks.tasks.values():
+                info = task.to_dict()
+                for key in ("partial", "result", "error"):
+                    info.pop(key, None)
+                tasks.append(info)
+            return {
+                "ok": True,
+                "count": len(tasks),
+                "running": len(self._tasks.running()),
+                "tasks": tasks,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
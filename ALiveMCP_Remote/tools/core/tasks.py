@@ -0,0 +1,156 @@
+"""
+Cooperative time-sliced task runner for long operations on Live's main thread.
+
+Every LOM call must happen on the main thread, inside update_display(). A tool
+that walks hundreds of tracks in one go therefore stalls Live's UI for that
+tick. Long tools are written as generators instead: they yield a progress dict
+between units of work and return their result. The runner resumes running
+tasks round-robin on each tick until the tick budget is spent, so the walk is
+spread over as many ticks as it needs.
+
+Step protocol (what a task generator yields):
+    {"done": 3, "total": 40, ...}         progress, stored as task.progress
+    {"partial": [item, ...], ...}          items appended to task.partial and
+                                          streamed via get_task_status(since=)
+
+The generator's return value becomes task.result.
+"""
+
+import time
+
+from ...constants import MAX_FINISHED_TASKS, TASK_TICK_BUDGET_SECONDS
+
+RUNNING = "running"
+DONE = "done"
+ERROR = "error"
+CANCELLED = "cancelled"
+
+
+class Task:
+    """A generator-backed unit of background work."""
+
+    def __init__(self, task_id, name, steps, clock):
+        self.task_id = task_id
+        self.name = name
+        self.steps = steps
+        self.status = RUNNING
+        self.progress = {}
+        self.partial = []
+        self.result = None
+        self.error = None
+        self.ticks = 0
+        self._clock = clock
+        self.started = clock()
+        self.finished = None
+
+    def step(self):
+        """Advance the generator by one unit of work; returns False once finished."""
+        try:
+            update = next(self.steps)
+        except StopIteration as stop:
+            self._finish(DONE, result=stop.value)
+            return False
+        except Exception as e:
+            self._finish(ERROR, error=str(e))
+            return False
+
+        if isinstance(update, dict):
+            update = dict(update)
+            self.partial.extend(update.pop("partial", []))
+            self.progress = update
+        return True
+
+    def cancel(self):
+        """Stop the task, closing its generator."""
+        if self.status != RUNNING:
+            return False
+        self.steps.close()
+        self._finish(CANCELLED)
+        return True
+
+    def _finish(self, status, result=None, error=None):
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished = self._clock()
+
+    def to_dict(self, since=0):
+        """Serialise the task state; ``since`` skips partial items already fetched."""
+        end = self.finished if self.finished is not None else self._clock()
+        info = {
+            "task_id": self.task_id,
+            "name": self.name,
+            "status": self.status,
+            "progress": self.progress,
+            "ticks": self.ticks,
+            "elapsed_ms": round((end - self.started) * 1000.0, 3),
+            "partial": self.partial[since:],
+            "partial_count": len(self.partial),
+        }
+        if self.status == DONE:
+            info["result"] = self.result
+        if self.status == ERROR:
+            info["error"] = self.error
+        return info
+
+
+class TaskRunner:
+    """Owns background tasks and resumes them within a per-tick time budget."""
+
+    def __init__(self, budget=TASK_TICK_BUDGET_SECONDS, clock=time.perf_counter):
+        self.budget = budget
+        self.clock = clock
+        self.tasks = {}
+        self._next_id = 1
+
+    def submit(self, name, steps):
+        """Register a generator as a new running task and return it."""
+        task = Task(self._next_id, name, steps, self.clock)
+        self._next_id += 1
+        self.tasks[task.task_id] = task
+        self._prune()
+        return task
+
+    def get(self, task_id):
+        return self.tasks.get(int(task_id))
+
+    def running(self):
+        return [t for t in self.tasks.values() if t.status == RUNNING]
+
+    def tick(self):
+        """Resume running tasks round-robin until the budget is spent.
+
+        Every running task gets at least one step per tick so a slow step can
+        never starve the others. Returns the number of steps executed.
+        """
+        active = self.running()
+        if not active:
+            return 0
+
+        deadline = self.clock() + self.budget
+        steps = 0
+        for task in active:
+            task.ticks += 1
+        while active:
+            for task in list(active):
+                if not task.step():
+                    active.remove(task)
+                steps += 1
+            if self.clock() >= deadline:
+                break
+        self._prune()
+        return steps
+
+    def _prune(self):
+        finished = [t for t in self.tasks.values() if t.status != RUNNING]
+        for task in finished[: max(0, len(finished) - MAX_FINISHED_TASKS)]:
+            del self.tasks[task.task_id]
+
+
+def run_to_completion(steps):
+    """Drain a task generator synchronously and return its result."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
@@ -0,0 +1,120 @@
+"""
+Per-tick jobs: work that must advance exactly once per update_display() tick.
+
+Background tasks (tasks.py) drain a generator as fast as the tick budget
+allows. Parameter ramps, modulators, scheduled commands and meter sampling
+are different: they are driven by the clock, so each one is advanced once
+per tick with the tick's timestamp and decides for itself what to do.
+
+A job subclasses TickJob and implements advance(now), returning False once
+finished. Jobs are identified by "<kind>-<n>" ids; finished jobs stay
+queryable until MAX_FINISHED_TASKS newer ones have finished.
+"""
+
+import time
+
+from ...constants import MAX_FINISHED_TASKS
+
+RUNNING = "running"
+DONE = "done"
+ERROR = "error"
+CANCELLED = "cancelled"
+
+
+class TickJob:
+    """Base class for clock-driven jobs advanced once per tick."""
+
+    kind = "job"
+
+    def __init__(self):
+        self.job_id = None
+        self.status = RUNNING
+        self.error = None
+        self.ticks = 0
+        self.started = None
+        self.finished = None
+
+    def advance(self, now):
+        """Do this tick's work; return False when the job is finished."""
+        raise NotImplementedError
+
+    def cancel(self, now=None):
+        if self.status != RUNNING:
+            return False
+        self.status = CANCELLED
+        self.finished = now
+        return True
+
+    def describe(self, now):
+        """Job-specific fields for to_dict()."""
+        return {}
+
+    def to_dict(self, now):
+        end = self.finished if self.finished is not None else now
+        info = {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "ticks": self.ticks,
+            "elapsed_ms": round((end - self.started) * 1000.0, 3),
+        }
+        if self.error is not None:
+            info["error"] = self.error
+        info.update(self.describe(now))
+        return info
+
+
+class TickJobs:
+    """Owns tick jobs and advances every running one on each tick."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.jobs = {}
+        self._next_id = 1
+
+    def add(self, job):
+        """Register ``job`` as running and return it."""
+        job.job_id = job.kind + "-" + str(self._next_id)
+        job.started = self.clock()
+        self._next_id += 1
+        self.jobs[job.job_id] = job
+        self._prune()
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(str(job_id))
+
+    def running(self, kind=None):
+        return [
+            j
+            for j in self.jobs.values()
+            if j.status == RUNNING and (kind is None or j.kind == kind)
+        ]
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        return job is not None and job.cancel(self.clock())
+
+    def tick(self):
+        """Advance every running job once; returns the number advanced."""
+        active = self.running()
+        if not active:
+            return 0
+        now = self.clock()
+        for job in active:
+            job.ticks += 1
+            try:
+                alive = job.advance(now)
+            except Exception as e:
+                job.status, job.error, alive = ERROR, str(e), False
+            if not alive and job.status == RUNNING:
+                job.status = DONE
+            if job.status != RUNNING and job.finished is None:
+                job.finished = now
+        self._prune()
+        return len(active)
+
+    def _prune(self):
+        finished = [j for j in self.jobs.values() if j.status != RUNNING]
+        for job in finished[: max(0, len(finished) - MAX_FINISHED_TASKS)]:
+            del self.jobs[job.job_id]
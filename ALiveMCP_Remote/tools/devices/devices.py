@@ -1,9 +1,11 @@
 """
 Device operations composite: composes all device-domain mixins.
 
-Imports: core, extras (plugin windows), display values, racks/chains, rack contents.
+Imports: core, extras (plugin windows), display values, racks/chains, rack contents,
+bulk parameter writes.
 """
 
+from .devices_bulk import DevicesBulkMixin
 from .devices_core import DevicesCoreMixin
 from .devices_display import DevicesDisplayMixin
 from .devices_extras import DevicesExtrasMixin
@@ -17,5 +19,6 @@ class DevicesMixin(
     DevicesExtrasMixin,
     DevicesRacksMixin,
     DevicesRackContentsMixin,
+    DevicesBulkMixin,
 ):
     pass
@@ -0,0 +1,115 @@
+"""
+Bulk parameter writes across devices and mixers.
+
+Single responsibility: resolve a list of parameter targets (see
+tools/core/param_targets.py) up front, then write every value in the same
+update_display() tick so preset-like changes across a whole chain are never
+heard half-applied. A write Live rejects is reported on its own entry; with
+atomic, the writes already made are rolled back to their previous values.
+"""
+
+from ..core.param_targets import resolve_parameter_key, resolve_value
+
+TARGET_KEYS = (
+    "track_index",
+    "return_index",
+    "master",
+    "device_index",
+    "param_index",
+    "param_name",
+    "mixer",
+    "send_index",
+)
+
+
+class DevicesBulkMixin:
+    # ========================================================================
+    # BULK PARAMETER WRITES
+    # ========================================================================
+
+    @staticmethod
+    def _roll_back(applied, pending):
+        """Restore already written parameters and mark the unwritten entries after a failed write."""
+        for param, previous, result in reversed(applied):
+            try:
+                param.value = previous
+                result.pop("value", None)
+                result.update(ok=False, error="Rolled back: another write failed")
+            except Exception as e:
+                result["rollback_error"] = str(e)
+        for _, _, result in pending:
+            result.update(ok=False, error="Not written: another entry failed")
+
+    def set_parameters_bulk(self, entries, atomic=True):
+        """Set many device and mixer parameters in the same tick.
+
+        See Also:
+            Wiki: docs/wiki/tools/set_parameters_bulk.md
+
+        Args:
+            entries: List of {"value": ..., <target>} dicts where the target
+                is track_index / return_index / master plus device_index and
+                param_index or param_name, or mixer ("volume", "pan", "send"
+                with send_index). Numbers are clamped to the parameter range;
+                strings select one of a quantized parameter's value_items.
+            atomic: When true (default), write nothing if any entry fails to
+                resolve, and roll back the writes already made if Live
+                rejects one; when false, write every entry that resolved
+                and report failed writes per entry.
+
+        Returns:
+            dict: {"ok", "written", "failed", "results"} with one result per
+            entry in order: {"ok", "target", "track", "parameter_name",
+            "value"} (plus "device_name" for device parameters) or
+            {"ok": False, "error"}. ok is False when atomic and any entry
+            failed; written counts the values left in place.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            if not isinstance(entries, list) or not entries:
+                return {"ok": False, "error": "entries must be a non-empty list"}
+
+            results, writes = [], []
+            for entry in entries:
+                try:
+                    if "value" not in entry:
+                        raise ValueError("Missing value")
+                    target = {k: entry.get(k) for k in TARGET_KEYS}
+                    _, param, info, key = resolve_parameter_key(self.song, target)
+                    value = resolve_value(param, entry["value"])
+                    result = dict(info, ok=True, target=key)
+                    writes.append((param, value, result))
+                    results.append(result)
+                except Exception as e:
+                    results.append({"ok": False, "error": str(e)})
+
+            failed = len(results) - len(writes)
+            if failed and atomic:
+                for result in results:
+                    if result["ok"]:
+                        result.update(ok=False, error="Not written: another entry failed")
+                return {"ok": False, "written": 0, "failed": failed, "results": results}
+
+            applied = []
+            for n, (param, value, result) in enumerate(writes):
+                try:
+                    previous = param.value
+                    param.value = value
+                    result["value"] = float(param.value)
+                    applied.append((param, previous, result))
+                except Exception as e:
+                    result.update(ok=False, error="Write failed: " + str(e))
+                    if atomic:
+                        self._roll_back(applied, writes[n + 1 :])
+                        break
+            written = sum(1 for result in results if result["ok"])
+            failed = len(results) - written
+            return {
+                "ok": not (atomic and failed),
+                "written": written,
+                "failed": failed,
+                "results": results,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -1,22 +1,40 @@
 """Full rack interior inspection: chains, chain devices, and enriched parameter lists."""
 
+from ..core.lom_fields import RACK_CHAIN_CHILDREN, RACK_CHAIN_FIELDS
+from ..core.pagination import paginate
+from ..core.projection import parse_fields, project_items
+
+
+def _chain_key(chain):
+    devices = chain.devices if hasattr(chain, "devices") else []
+    return (str(chain.name), len(devices))
+
 
 class DevicesRackContentsMixin:
-    def get_rack_contents(self, track_index, device_index):
+    def get_rack_contents(self, track_index, device_index, fields=None, limit=None, cursor=None):
         """Get full rack interior: chains, chain devices, and enriched parameters.
 
         See Also:
             Wiki: docs/wiki/tools/get_rack_contents.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the track in song.tracks.
+            device_index: Index of the rack device on that track.
+            fields: Optional chain fields to return, dotted for nested levels
+                (e.g. ["chain_name", "devices.name", "devices.parameters.name"]).
+            limit: Optional maximum number of chains per page.
+            cursor: next_cursor from the previous page.
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "track_index", "device_index", "rack_name", "chains",
+            "count"}, plus "total" and "next_cursor" when limit or cursor is
+            given.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors (including unknown field names) are returned as
+            {"ok": False, "error": ...}."""
         try:
+            tree = parse_fields(fields)
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
 
@@ -32,65 +50,19 @@ class DevicesRackContentsMixin:
             if not hasattr(rack_device, "chains"):
                 return {"ok": False, "error": "Device at device_index is not a rack (no chains)"}
 
-            chains_info = []
-            for chain_index, chain in enumerate(rack_device.chains):
-                chain_devices = []
-
-                if hasattr(chain, "devices"):
-                    for d_idx, device in enumerate(chain.devices):
-                        params_info = []
-
-                        if hasattr(device, "parameters"):
-                            for param in device.parameters:
-                                try:
-                                    display_value = str(param.str_for_value(param.value))
-                                except Exception:
-                                    display_value = str(param.value)
-
-                                is_quantized = (
-                                    bool(param.is_quantized)
-                                    if hasattr(param, "is_quantized")
-                                    else False
-                                )
-                                value_items = []
-                                if is_quantized and hasattr(param, "value_items"):
-                                    value_items = [str(v) for v in param.value_items]
-
-                                params_info.append(
-                                    {
-                                        "name": str(param.name),
-                                        "raw_value": float(param.value),
-                                        "display_value": display_value,
-                                        "min": float(param.min),
-                                        "max": float(param.max),
-                                        "is_quantized": is_quantized,
-                                        "value_items": value_items,
-                                    }
-                                )
-
-                        chain_devices.append(
-                            {
-                                "device_index": d_idx,
-                                "name": str(device.name),
-                                "class_name": str(device.class_name),
-                                "is_active": (
-                                    bool(device.is_active)
-                                    if hasattr(device, "is_active")
-                                    else False
-                                ),
-                                "parameters": params_info,
-                            }
-                        )
-
-                chains_info.append(
-                    {
-                        "chain_index": chain_index,
-                        "chain_name": str(chain.name),
-                        "devices": chain_devices,
-                    }
-                )
-
-            return {
+            page, start, page_info = paginate(rack_device.chains, limit, cursor, key=_chain_key)
+            chains_info = project_items(
+                page,
+                tree,
+                RACK_CHAIN_FIELDS,
+                RACK_CHAIN_CHILDREN,
+                where="chain",
+                strict=True,
+                index_key="chain_index",
+                start=start,
+            )
+
+            result = {
                 "ok": True,
                 "track_index": track_index,
                 "device_index": device_index,
@@ -98,5 +70,7 @@ class DevicesRackContentsMixin:
                 "chains": chains_info,
                 "count": len(chains_info),
             }
+            result.update(page_info)
+            return result
         except Exception as e:
             return {"ok": False, "error": str(e)}
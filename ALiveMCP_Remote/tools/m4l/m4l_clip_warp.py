@@ -2,6 +2,15 @@
 M4L audio clip warp helpers: warp mode, warping toggle, and warp markers.
 """
 
+from ..core.pagination import paginate
+
+
+def _marker_key(marker):
+    return (
+        float(marker.sample_time) if hasattr(marker, "sample_time") else 0.0,
+        float(marker.beat_time) if hasattr(marker, "beat_time") else 0.0,
+    )
+
 
 class M4LClipWarpMixin:
     # ========================================================================
@@ -134,20 +143,24 @@ class M4LClipWarpMixin:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    def get_warp_markers(self, track_index, clip_index):
+    def get_warp_markers(self, track_index, clip_index, limit=None, cursor=None):
         """Get warp markers from audio clip
 
         See Also:
             Wiki: docs/wiki/tools/get_warp_markers.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the track in song.tracks.
+            clip_index: Index of the clip slot holding the audio clip.
+            limit: Optional maximum number of markers per page.
+            cursor: next_cursor from the previous page.
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "markers", "count"}, plus "total" and "next_cursor" when limit or cursor is given.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors (including stale cursors) are returned as
+            {"ok": False, "error": ...}."""
         try:
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
@@ -165,8 +178,10 @@ class M4LClipWarpMixin:
                 return {"ok": False, "error": "Clip is not an audio clip"}
 
             markers = []
+            page_info = {}
             if hasattr(clip, "warp_markers"):
-                for marker in clip.warp_markers:
+                page, _, page_info = paginate(clip.warp_markers, limit, cursor, key=_marker_key)
+                for marker in page:
                     markers.append(
                         {
                             "sample_time": float(marker.sample_time)
@@ -178,6 +193,8 @@ class M4LClipWarpMixin:
                         }
                     )
 
-            return {"ok": True, "markers": markers, "count": len(markers)}
+            result = {"ok": True, "markers": markers, "count": len(markers)}
+            result.update(page_info)
+            return result
         except Exception as e:
             return {"ok": False, "error": str(e)}
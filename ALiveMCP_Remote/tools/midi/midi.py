@@ -1,10 +1,12 @@
 """
-MIDI note operations, note selection, and CC/program change.
+MIDI note operations, note selection, CC/program change and pattern search.
 """
 
 from .midi_cc import MidiCCMixin
 from .midi_notes import MidiNotesMixin
+from .midi_pattern_index import MidiPatternIndexMixin
+from .midi_pattern_search import MidiPatternSearchMixin
 
 
-class MidiMixin(MidiNotesMixin, MidiCCMixin):
+class MidiMixin(MidiNotesMixin, MidiCCMixin, MidiPatternIndexMixin, MidiPatternSearchMixin):
     pass
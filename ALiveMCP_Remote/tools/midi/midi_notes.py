@@ -4,12 +4,20 @@ MIDI notes aggregator module.
 Composes smaller mixins to keep file sizes under the limit.
 """
 
+from .midi_notes_bulk import MidiNotesBulkMixin
+from .midi_notes_edit import MidiNotesEditMixin
 from .midi_notes_operations import MidiNotesOperationsMixin
 from .midi_notes_queries import MidiNotesQueriesMixin
 from .midi_notes_selection import MidiNotesSelectionMixin
 
 
-class MidiNotesMixin(MidiNotesOperationsMixin, MidiNotesSelectionMixin, MidiNotesQueriesMixin):
-    """Aggregator combining MIDI notes operations, selection, and queries."""
+class MidiNotesMixin(
+    MidiNotesOperationsMixin,
+    MidiNotesSelectionMixin,
+    MidiNotesQueriesMixin,
+    MidiNotesEditMixin,
+    MidiNotesBulkMixin,
+):
+    """Aggregator combining MIDI notes operations, selection, queries, note-ID edits and bulk I/O."""
 
     pass
@@ -0,0 +1,212 @@
+"""
+MIDI bulk note mixin: read or write the notes of many clips in one request.
+
+Single responsibility: select session clips by track/scene ranges or by
+explicit [track_index, clip_index] pairs and run the per-clip reads/writes as
+one time-sliced task (one clip per step), so a whole-song dump or rewrite is a
+single round trip instead of one command per clip.
+"""
+
+from .note_columns import check_encoding, decode_notes, encode_notes
+from .note_specs import normalize_notes, read_notes, write_notes
+
+
+def _index_range(value, count, name):
+    """Expand an inclusive [first, last] range (None = everything)."""
+    if value is None:
+        return range(count)
+    first, last = int(value[0]), int(value[1])
+    if first < 0 or last >= count or first > last:
+        raise ValueError("Invalid " + name + " range: " + str([first, last]))
+    return range(first, last + 1)
+
+
+def clear_notes(clip):
+    """Remove every note of ``clip`` in one LOM call."""
+    if hasattr(clip, "remove_notes_extended"):
+        clip.remove_notes_extended(0, 128, 0.0, clip.length)
+    else:
+        clip.remove_notes(0.0, 0, clip.length, 128)
+
+
+class MidiNotesBulkMixin:
+    # ========================================================================
+    # BULK NOTE READ / WRITE
+    # ========================================================================
+
+    def _bulk_midi_clip(self, track_index, clip_index):
+        """Return the MIDI clip at (track_index, clip_index); raises ValueError."""
+        if track_index < 0 or track_index >= len(self.song.tracks):
+            raise ValueError("Invalid track index")
+        track = self.song.tracks[track_index]
+        if clip_index < 0 or clip_index >= len(track.clip_slots):
+            raise ValueError("Invalid clip index")
+        clip_slot = track.clip_slots[clip_index]
+        if not clip_slot.has_clip or not clip_slot.clip.is_midi_clip:
+            raise ValueError("No MIDI clip in slot")
+        return clip_slot.clip
+
+    def _select_midi_clips(self, track_range=None, scene_range=None, clips=None):
+        """List (track_index, clip_index) pairs of the MIDI clips to visit.
+
+        Explicit ``clips`` pairs are returned as given (validated per clip
+        later); ranges select every slot holding a MIDI clip.
+        """
+        if clips is not None:
+            return [(int(pair[0]), int(pair[1])) for pair in clips]
+
+        tracks = self.song.tracks
+        selected = []
+        for t in _index_range(track_range, len(tracks), "track"):
+            slots = tracks[t].clip_slots
+            for c in _index_range(scene_range, len(slots), "scene"):
+                slot = slots[c]
+                if slot.has_clip and slot.clip.is_midi_clip:
+                    selected.append((t, c))
+        return selected
+
+    def get_all_notes(
+        self,
+        track_range=None,
+        scene_range=None,
+        clips=None,
+        encoding="objects",
+        background=False,
+    ):
+        """Get the notes of many MIDI clips in one request.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_all_notes.md
+
+        Args:
+            track_range: Optional inclusive [first, last] track indices
+                (default all tracks).
+            scene_range: Optional inclusive [first, last] scene indices
+                (default all scenes).
+            clips: Optional list of [track_index, clip_index] pairs; overrides
+                the ranges.
+            encoding: "objects" (default), "columnar" or "columnar_base64".
+            background: When true, run as a background task and return its
+                task_id; each finished clip is streamed as a partial item.
+
+        Returns:
+            dict: {"ok", "clips", "clip_count", "note_count", "encoding",
+            "errors"} where each clip has track_index, clip_index, name,
+            length, notes and count, and errors lists clips that could not be
+            read. With background=true: {"ok", "task_id", "name", "status"}.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            check_encoding(encoding)
+            targets = self._select_midi_clips(track_range, scene_range, clips)
+            return self._run_task(
+                "get_all_notes", self._get_all_notes_steps(targets, encoding), background
+            )
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def _get_all_notes_steps(self, targets, encoding):
+        """Task generator: read one clip per step."""
+        entries = []
+        errors = []
+        note_count = 0
+        for done, (track_index, clip_index) in enumerate(targets, 1):
+            try:
+                clip = self._bulk_midi_clip(track_index, clip_index)
+                notes = read_notes(clip)
+                entry = {
+                    "track_index": track_index,
+                    "clip_index": clip_index,
+                    "name": clip.name,
+                    "length": clip.length,
+                    "notes": encode_notes(notes, encoding),
+                    "count": len(notes),
+                }
+                entries.append(entry)
+                note_count += len(notes)
+                partial = [entry]
+            except Exception as e:
+                errors.append(
+                    {"track_index": track_index, "clip_index": clip_index, "error": str(e)}
+                )
+                partial = []
+            yield {"done": done, "total": len(targets), "partial": partial}
+
+        return {
+            "ok": True,
+            "clips": entries,
+            "clip_count": len(entries),
+            "note_count": note_count,
+            "encoding": encoding,
+            "errors": errors,
+        }
+
+    def set_notes_bulk(self, entries, replace=False, background=False):
+        """Write notes to many MIDI clips in one request.
+
+        Each clip is written with one bulk LOM call (see add_notes).
+
+        See Also:
+            Wiki: docs/wiki/tools/set_notes_bulk.md
+
+        Args:
+            entries: List of {"track_index", "clip_index", "notes",
+                optional "replace"} dicts. notes may be a note list or a
+                columnar payload.
+            replace: Default for entries without "replace": clear the clip's
+                existing notes before writing (default False = add).
+            background: When true, run as a background task and return its
+                task_id.
+
+        Returns:
+            dict: {"ok", "results", "clip_count", "note_count", "failed"}
+            where each result has index, track_index, clip_index, ok and
+            either note_count/rejected_count/rejected or error. With
+            background=true: {"ok", "task_id", "name", "status"}.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            entries = list(entries or [])
+            return self._run_task(
+                "set_notes_bulk", self._set_notes_bulk_steps(entries, replace), background
+            )
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def _set_notes_bulk_steps(self, entries, replace):
+        """Task generator: write one clip per step."""
+        results = []
+        for i, entry in enumerate(entries):
+            result = {"index": i}
+            try:
+                track_index = int(entry["track_index"])
+                clip_index = int(entry["clip_index"])
+                result.update({"track_index": track_index, "clip_index": clip_index})
+                clip = self._bulk_midi_clip(track_index, clip_index)
+                records, rejected = normalize_notes(decode_notes(entry.get("notes")))
+                if entry.get("replace", replace):
+                    clear_notes(clip)
+                write_notes(clip, records)
+                result.update(
+                    {
+                        "ok": True,
+                        "note_count": len(records),
+                        "rejected_count": len(rejected),
+                        "rejected": rejected,
+                    }
+                )
+            except Exception as e:
+                result.update({"ok": False, "error": str(e)})
+            results.append(result)
+            yield {"done": i + 1, "total": len(entries), "partial": [result]}
+
+        written = [r for r in results if r["ok"]]
+        return {
+            "ok": True,
+            "results": results,
+            "clip_count": len(written),
+            "note_count": sum(r["note_count"] for r in written),
+            "failed": len(results) - len(written),
+        }
@@ -0,0 +1,152 @@
+"""
+MIDI note-ID editing mixin: incremental edits via Live 11 note ids.
+
+Single responsibility: modify or remove individual notes by the stable
+note_id reported by get_notes_extended, without rewriting the whole clip.
+Requires Live 11+ (apply_note_modifications / remove_notes_by_id).
+"""
+
+from .note_specs import normalize_modification
+
+
+class MidiNotesEditMixin:
+    # ========================================================================
+    # NOTE-ID EDITING (LIVE 11+)
+    # ========================================================================
+
+    def _note_id_clip(self, track_index, clip_index):
+        """Return (clip, None) for a MIDI clip supporting note ids, else (None, error)."""
+        if track_index < 0 or track_index >= len(self.song.tracks):
+            return None, {"ok": False, "error": "Invalid track index"}
+
+        track = self.song.tracks[track_index]
+        if clip_index < 0 or clip_index >= len(track.clip_slots):
+            return None, {"ok": False, "error": "Invalid clip index"}
+
+        clip_slot = track.clip_slots[clip_index]
+        if not clip_slot.has_clip or not clip_slot.clip.is_midi_clip:
+            return None, {"ok": False, "error": "No MIDI clip in slot"}
+
+        clip = clip_slot.clip
+        if not hasattr(clip, "apply_note_modifications"):
+            return None, {"ok": False, "error": "Note ids require Live 11 or later"}
+        return clip, None
+
+    @staticmethod
+    def _notes_by_id(clip, ids):
+        """Return (notes, {note_id: note}) for the notes of ``clip`` with an id in ``ids``.
+
+        ``notes`` is the container Live returned (it may hold every note when
+        get_notes_by_id rejects an unknown id) and is what gets written back.
+        """
+        try:
+            notes = clip.get_notes_by_id(ids)
+        except Exception:
+            notes = clip.get_all_notes_extended()
+        return notes, {note.note_id: note for note in notes if note.note_id in ids}
+
+    def apply_note_modifications(self, track_index, clip_index, modifications):
+        """Modify individual notes in place by note_id.
+
+        Only the listed notes are touched; note identity is preserved and the
+        edit is a single LOM call.
+
+        See Also:
+            Wiki: docs/wiki/tools/apply_note_modifications.md
+
+        Args:
+            track_index: Index of the track in song.tracks.
+            clip_index: Index of the clip slot on that track.
+            modifications: List of {"note_id", ...changed fields} dicts. Fields:
+                pitch, start_time (or start), duration, velocity, muted,
+                probability, velocity_deviation, release_velocity.
+
+        Returns:
+            dict: {"ok", "track_index", "clip_index", "modified_count",
+            "rejected_count", "rejected"} where rejected lists
+            {"index", "note_id", "reason"}.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            clip, error = self._note_id_clip(track_index, clip_index)
+            if error:
+                return error
+
+            edits = {}
+            rejected = []
+            for i, mod in enumerate(modifications or []):
+                try:
+                    note_id, changes = normalize_modification(mod)
+                    # Repeated ids merge into one edit; later fields win.
+                    edits.setdefault(note_id, (i, {}))[1].update(changes)
+                except ValueError as e:
+                    note_id = mod.get("note_id") if isinstance(mod, dict) else None
+                    rejected.append({"index": i, "note_id": note_id, "reason": str(e)})
+
+            modified = 0
+            if edits:
+                notes, by_id = self._notes_by_id(clip, tuple(sorted(edits)))
+                for note_id, (i, changes) in edits.items():
+                    note = by_id.get(note_id)
+                    if note is None:
+                        rejected.append(
+                            {"index": i, "note_id": note_id, "reason": "unknown note_id"}
+                        )
+                        continue
+                    for attr, value in changes.items():
+                        setattr(note, attr, value)
+                    modified += 1
+
+                if modified:
+                    clip.apply_note_modifications(notes)
+
+            rejected.sort(key=lambda r: r["index"])
+            return {
+                "ok": True,
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "modified_count": modified,
+                "rejected_count": len(rejected),
+                "rejected": rejected,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def remove_notes_by_id(self, track_index, clip_index, note_ids):
+        """Remove individual notes by note_id.
+
+        See Also:
+            Wiki: docs/wiki/tools/remove_notes_by_id.md
+
+        Args:
+            track_index: Index of the track in song.tracks.
+            clip_index: Index of the clip slot on that track.
+            note_ids: List of note ids from get_notes_extended.
+
+        Returns:
+            dict: {"ok", "track_index", "clip_index", "removed_count",
+            "removed", "missing"} where removed lists the ids deleted and
+            missing the requested ids not present in the clip.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            clip, error = self._note_id_clip(track_index, clip_index)
+            if error:
+                return error
+
+            ids = tuple(sorted({int(note_id) for note_id in note_ids or []}))
+            removed = tuple(sorted(self._notes_by_id(clip, ids)[1])) if ids else ()
+            if removed:
+                clip.remove_notes_by_id(removed)
+            return {
+                "ok": True,
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "removed_count": len(removed),
+                "removed": list(removed),
+                "missing": [note_id for note_id in ids if note_id not in removed],
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
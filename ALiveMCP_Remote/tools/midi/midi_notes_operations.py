@@ -2,6 +2,10 @@
 MIDI note operation mixin: add, get, remove notes.
 """
 
+from ..core.pagination import paginate
+from .note_columns import check_encoding, decode_notes, encode_notes
+from .note_specs import normalize_notes, write_notes
+
 
 class MidiNotesOperationsMixin:
     # ========================================================================
@@ -11,17 +15,28 @@ class MidiNotesOperationsMixin:
     def add_notes(self, track_index, clip_index, notes):
         """Add MIDI notes to a clip
 
+        All valid notes are written in a single LOM call (one undo step):
+        add_new_notes with MidiNoteSpecification when Live supports it,
+        otherwise one set_notes tuple.
+
         See Also:
             Wiki: docs/wiki/tools/add_notes.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the MIDI track in song.tracks.
+            clip_index: Index of the clip slot on that track.
+            notes: List of {"pitch", "start", "duration", "velocity", "muted"}
+                dicts; "probability", "velocity_deviation" and
+                "release_velocity" are honoured on Live 11+. A columnar
+                payload (as returned with encoding="columnar") is accepted too.
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "message", "track_index", "clip_index", "note_count",
+            "api", "rejected_count", "rejected"} where note_count is the number
+            of notes written and rejected lists {"index", "note", "reason"}.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors are returned as {"ok": False, "error": ...}."""
         try:
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
@@ -41,46 +56,46 @@ class MidiNotesOperationsMixin:
             if not clip.is_midi_clip:
                 return {"ok": False, "error": "Clip is not a MIDI clip"}
 
-            for note in notes:
-                pitch = int(note.get("pitch", 60))
-                start = float(note.get("start", 0.0))
-                duration = float(note.get("duration", 1.0))
-                velocity = int(note.get("velocity", 100))
-
-                if pitch < 0 or pitch > 127:
-                    continue
-                if velocity < 0 or velocity > 127:
-                    continue
-                if duration <= 0:
-                    continue
-
-                clip.set_notes(((pitch, start, duration, velocity, False),))
+            records, rejected = normalize_notes(decode_notes(notes))
+            api = write_notes(clip, records)
 
             return {
                 "ok": True,
                 "message": "Notes added",
                 "track_index": track_index,
                 "clip_index": clip_index,
-                "note_count": len(notes),
+                "note_count": len(records),
+                "api": api,
+                "rejected_count": len(rejected),
+                "rejected": rejected,
             }
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    def get_clip_notes(self, track_index, clip_index):
+    def get_clip_notes(self, track_index, clip_index, limit=None, cursor=None, encoding="objects"):
         """Get all MIDI notes from a clip
 
         See Also:
             Wiki: docs/wiki/tools/get_clip_notes.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the MIDI track in song.tracks.
+            clip_index: Index of the clip slot on that track.
+            limit: Optional maximum number of notes per page.
+            cursor: next_cursor from the previous page.
+            encoding: "objects" (list of note dicts, default), "columnar"
+                (parallel arrays) or "columnar_base64" (packed arrays).
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "track_index", "clip_index", "notes", "count",
+            "encoding"}, plus "total" and "next_cursor" when limit or cursor
+            is given. Columnar notes are {"format", "count", "columns", ...}.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors (including stale cursors) are returned as
+            {"ok": False, "error": ...}."""
         try:
+            check_encoding(encoding)
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
 
@@ -100,6 +115,7 @@ class MidiNotesOperationsMixin:
                 return {"ok": False, "error": "Clip is not a MIDI clip"}
 
             notes_data = clip.get_notes(0, 0, clip.length, 128)
+            notes_data, _, page_info = paginate(notes_data, limit, cursor, key=tuple)
 
             notes = []
             for note_tuple in notes_data:
@@ -113,13 +129,16 @@ class MidiNotesOperationsMixin:
                     }
                 )
 
-            return {
+            result = {
                 "ok": True,
                 "track_index": track_index,
                 "clip_index": clip_index,
-                "notes": notes,
+                "notes": encode_notes(notes, encoding),
                 "count": len(notes),
+                "encoding": encoding,
             }
+            result.update(page_info)
+            return result
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
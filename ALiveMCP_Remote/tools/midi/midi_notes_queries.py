@@ -2,25 +2,48 @@
 MIDI note query mixin: extended note queries.
 """
 
+from .note_columns import check_encoding, encode_notes
+from .note_specs import note_to_dict
+
 
 class MidiNotesQueriesMixin:
     def get_notes_extended(
-        self, track_index, clip_index, start_time, time_span, start_pitch, pitch_span
+        self,
+        track_index,
+        clip_index,
+        start_time,
+        time_span,
+        start_pitch,
+        pitch_span,
+        encoding="objects",
     ):
         """Get notes with extended filtering options
 
+        On Live 11+ each note carries its stable "note_id" plus probability,
+        velocity_deviation and release_velocity, for use with
+        apply_note_modifications and remove_notes_by_id.
+
         See Also:
             Wiki: docs/wiki/tools/get_notes_extended.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the track in song.tracks.
+            clip_index: Index of the clip slot on that track.
+            start_time: Start of the time range in beats.
+            time_span: Length of the time range in beats.
+            start_pitch: Lowest pitch of the range.
+            pitch_span: Number of pitches in the range.
+            encoding: "objects" (default), "columnar" or "columnar_base64".
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "notes", "count", "encoding"}; each note has pitch,
+            start_time, duration, velocity, muted and, on Live 11+, note_id
+            and the extended fields (as columns when encoding is columnar).
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors are returned as {"ok": False, "error": ...}."""
         try:
+            check_encoding(encoding)
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
 
@@ -40,18 +63,13 @@ class MidiNotesQueriesMixin:
                 pitch_span=int(pitch_span),
             )
 
-            notes = []
-            for note_tuple in notes_data:
-                notes.append(
-                    {
-                        "pitch": note_tuple[0],
-                        "start_time": float(note_tuple[1]),
-                        "duration": float(note_tuple[2]),
-                        "velocity": note_tuple[3],
-                        "muted": note_tuple[4],
-                    }
-                )
-
-            return {"ok": True, "notes": notes, "count": len(notes)}
+            notes = [note_to_dict(note) for note in notes_data]
+
+            return {
+                "ok": True,
+                "notes": encode_notes(notes, encoding),
+                "count": len(notes),
+                "encoding": encoding,
+            }
         except Exception as e:
             return {"ok": False, "error": str(e)}
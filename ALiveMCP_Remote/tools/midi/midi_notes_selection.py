@@ -2,6 +2,8 @@
 MIDI note selection mixin: select/deselect and replace selected notes.
 """
 
+from .note_columns import decode_notes
+
 
 class MidiNotesSelectionMixin:
     def select_all_notes(self, track_index, clip_index):
@@ -75,13 +77,17 @@ class MidiNotesSelectionMixin:
             Wiki: docs/wiki/tools/replace_selected_notes.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the track in song.tracks.
+            clip_index: Index of the clip slot on that track.
+            notes: List of {"pitch", "start" (or "start_time"), "duration",
+                "velocity", "muted"} dicts, or a columnar payload as returned
+                by get_clip_notes with encoding="columnar".
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "message", "note_count"}.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors are returned as {"ok": False, "error": ...}."""
         try:
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
@@ -96,10 +102,11 @@ class MidiNotesSelectionMixin:
 
             clip = clip_slot.clip
 
+            notes = decode_notes(notes)
             note_tuples = []
             for note in notes:
                 pitch = int(note.get("pitch", 60))
-                start = float(note.get("start", 0.0))
+                start = float(note.get("start", note.get("start_time", 0.0)))
                 duration = float(note.get("duration", 1.0))
                 velocity = int(note.get("velocity", 100))
                 muted = bool(note.get("muted", False))
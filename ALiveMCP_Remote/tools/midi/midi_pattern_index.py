@@ -0,0 +1,288 @@
+"""
+MIDI pattern index mixin: build and maintain the clip pattern search index.
+
+Single responsibility: walk every session and arrangement MIDI clip once (as
+a time-sliced task, one clip per step) into a PatternIndex, then keep it
+current incrementally: note-change listeners on indexed clips, has_clip
+listeners on session slots and arrangement_clips listeners on tracks only
+mark entries dirty, and the dirty entries are re-read just before the next
+query. Queries therefore never re-read unchanged clips. Keys are positional,
+so tracks / scenes / clip_slots listeners mark the whole index stale instead;
+the next query then starts a background rebuild and asks the caller to retry.
+"""
+
+import time
+
+from .note_specs import read_notes
+from .pattern_index import (
+    DEFAULT_GRID,
+    PatternIndex,
+    arrangement_key,
+    clip_features,
+    session_key,
+)
+
+ARRANGEMENT_PREFIX = "arrangement:"
+
+
+def _parse_key(key):
+    kind, track_index, position = key.split(":")
+    return kind, int(track_index), int(position)
+
+
+def _listen(subject, name, callback):
+    """Attach ``callback`` to ``subject``'s ``name`` property; returns a remover or None."""
+    add = getattr(subject, "add_" + name + "_listener", None)
+    if add is None:
+        return None
+    add(callback)
+
+    def remove():
+        if getattr(subject, name + "_has_listener", lambda _: True)(callback):
+            getattr(subject, "remove_" + name + "_listener")(callback)
+
+    return remove
+
+
+class MidiPatternIndexMixin:
+    # ========================================================================
+    # PATTERN INDEX: BUILD / MAINTAIN
+    # ========================================================================
+
+    @property
+    def _patterns(self):
+        index = getattr(self, "_pattern_index", None)
+        if index is None:
+            index = self._pattern_index = PatternIndex()
+        return index
+
+    def _bar_length(self):
+        return float(self.song.signature_numerator) * 4.0 / float(self.song.signature_denominator)
+
+    def _watch(self, owner, subject, name, callback):
+        """Attach a listener and remember how to remove it under ``owner``."""
+        remove = _listen(subject, name, callback)
+        if remove is not None:
+            self._patterns.listeners.setdefault(owner, []).append(remove)
+
+    def _unwatch(self, owner):
+        for remove in self._patterns.listeners.pop(owner, []):
+            try:
+                remove()
+            except Exception:
+                pass
+
+    def _pattern_clip(self, key):
+        """The MIDI clip behind ``key``, or None when it no longer exists."""
+        kind, track_index, position = _parse_key(key)
+        if track_index >= len(self.song.tracks):
+            return None
+        track = self.song.tracks[track_index]
+        if kind == "session":
+            if position >= len(track.clip_slots) or not track.clip_slots[position].has_clip:
+                return None
+            clip = track.clip_slots[position].clip
+        else:
+            clips = list(getattr(track, "arrangement_clips", []))
+            clip = clips[position] if position < len(clips) else None
+        return clip if clip is not None and clip.is_midi_clip else None
+
+    def _index_clip(self, key):
+        """(Re-)index one clip and listen for its note changes; returns True if indexed."""
+        index = self._patterns
+        self._unwatch(key)
+        clip = self._pattern_clip(key)
+        if clip is None:
+            index.remove(key)
+            return False
+        kind, track_index, position = _parse_key(key)
+        info = {"kind": kind, "track_index": track_index, "name": clip.name}
+        if kind == "session":
+            info["clip_index"] = position
+        else:
+            info["position"] = position
+            info["start_time"] = clip.start_time
+        features = clip_features(read_notes(clip), clip.length, self._bar_length(), index.grid)
+        info.update({"length": features["length"], "note_count": features["note_count"]})
+        index.add(key, features, info)
+        self._watch(key, clip, "notes", lambda: index.dirty.add(key))
+        return True
+
+    def _mark_stale(self):
+        self._patterns.stale = True
+
+    def _pattern_targets(self, include_arrangement):
+        """Keys of every MIDI clip to index; also installs song/slot/track listeners."""
+        index = self._patterns
+        keys = []
+        self._watch("song", self.song, "tracks", self._mark_stale)
+        self._watch("song", self.song, "scenes", self._mark_stale)
+        for t, track in enumerate(self.song.tracks):
+            self._watch("track:" + str(t), track, "clip_slots", self._mark_stale)
+            for c, slot in enumerate(track.clip_slots):
+                key = session_key(t, c)
+                self._watch("slot:" + key, slot, "has_clip", lambda k=key: index.dirty.add(k))
+                if slot.has_clip and slot.clip.is_midi_clip:
+                    keys.append(key)
+            if include_arrangement and hasattr(track, "arrangement_clips"):
+                self._watch(
+                    "track:" + str(t),
+                    track,
+                    "arrangement_clips",
+                    lambda t=t: index.dirty_tracks.add(t),
+                )
+                for n, clip in enumerate(track.arrangement_clips):
+                    if clip.is_midi_clip:
+                        keys.append(arrangement_key(t, n))
+        return keys
+
+    def _refresh_pattern_index(self):
+        """Re-read dirty clips and re-scan changed arrangement tracks; returns the count."""
+        index = self._patterns
+        if not index.built:
+            if index.rebuild_task is not None:
+                raise ValueError(
+                    "Pattern index is being rebuilt (task "
+                    + str(index.rebuild_task)
+                    + "); retry when it is done"
+                )
+            raise ValueError("Pattern index not built; call build_pattern_index first")
+        if index.stale:
+            task_id = self._start_pattern_rebuild()
+            raise ValueError(
+                "Pattern index is stale after tracks, scenes or clip slots changed; "
+                "rebuilding as task " + str(task_id) + ", retry when it is done"
+            )
+        for t in sorted(index.dirty_tracks):
+            prefix = arrangement_key(t, "")
+            for key in [k for k in index.clips if k.startswith(prefix)]:
+                self._unwatch(key)
+                index.remove(key)
+            if t < len(self.song.tracks):
+                for n, clip in enumerate(self.song.tracks[t].arrangement_clips):
+                    if clip.is_midi_clip:
+                        index.dirty.add(arrangement_key(t, n))
+        index.dirty_tracks.clear()
+        refreshed = sorted(index.dirty)
+        for key in refreshed:
+            self._index_clip(key)
+        index.dirty.clear()
+        return len(refreshed)
+
+    def _start_pattern_rebuild(self):
+        """Replace a stale index with one filled by a background task; returns its task_id."""
+        old = self._patterns
+        for owner in list(old.listeners):
+            self._unwatch(owner)
+        index = self._pattern_index = PatternIndex(old.grid, old.include_arrangement)
+        keys = self._pattern_targets(old.include_arrangement)
+        task = self._run_task("build_pattern_index", self._build_steps(keys), background=True)
+        index.rebuild_task = task["task_id"]
+        return index.rebuild_task
+
+    def build_pattern_index(self, include_arrangement=True, grid=DEFAULT_GRID, background=False):
+        """Index the MIDI content of every clip for motif, rhythm and duplicate search.
+
+        See Also:
+            Wiki: docs/wiki/tools/build_pattern_index.md
+
+        Args:
+            include_arrangement: Also index arrangement clips (default True).
+            grid: Onset grid in beats for rhythm patterns (default 0.25).
+            background: When true, run as a background task and return its
+                task_id.
+
+        Returns:
+            dict: {"ok", "clip_count", "session_clips", "arrangement_clips",
+            "elapsed_ms"}. With background=true: {"ok", "task_id", "name",
+            "status"}.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            grid = float(grid)
+            if grid <= 0:
+                raise ValueError("grid must be > 0")
+            self.clear_pattern_index()
+            self._pattern_index = PatternIndex(grid, bool(include_arrangement))
+            keys = self._pattern_targets(include_arrangement)
+            return self._run_task("build_pattern_index", self._build_steps(keys), background)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def _build_steps(self, keys):
+        """Task generator: index one clip per step."""
+        started = time.perf_counter()
+        index = self._patterns
+        for done, key in enumerate(keys, 1):
+            self._index_clip(key)
+            yield {"done": done, "total": len(keys)}
+        index.built = True
+        arrangement = sum(1 for k in index.clips if k.startswith(ARRANGEMENT_PREFIX))
+        return {
+            "ok": True,
+            "clip_count": len(index.clips),
+            "session_clips": len(index.clips) - arrangement,
+            "arrangement_clips": arrangement,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 3),
+        }
+
+    def get_pattern_index_status(self):
+        """Get the size and freshness of the pattern index.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_pattern_index_status.md
+
+        Args:
+            None.
+
+        Returns:
+            dict: {"ok", "built", "clip_count", "dirty", "dirty_tracks",
+            "stale", "rebuild_task", "ngrams", "onset_patterns", "listeners",
+            "grid"} where stale means tracks, scenes or clip slots changed and
+            the next query starts a background rebuild; rebuild_task is the
+            task_id of that rebuild (None when none was started).
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            index = self._patterns
+            return {
+                "ok": True,
+                "built": index.built,
+                "clip_count": len(index.clips),
+                "dirty": len(index.dirty),
+                "dirty_tracks": len(index.dirty_tracks),
+                "stale": index.stale,
+                "rebuild_task": index.rebuild_task,
+                "ngrams": len(index.ngrams),
+                "onset_patterns": len(index.bars),
+                "listeners": sum(len(r) for r in index.listeners.values()),
+                "grid": index.grid,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def clear_pattern_index(self):
+        """Drop the pattern index and remove all of its Live listeners.
+
+        See Also:
+            Wiki: docs/wiki/tools/clear_pattern_index.md
+
+        Args:
+            None.
+
+        Returns:
+            dict: {"ok", "cleared"} where cleared is the number of clips
+            that were indexed.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            index = self._patterns
+            for owner in list(index.listeners):
+                self._unwatch(owner)
+            self._pattern_index = None
+            return {"ok": True, "cleared": len(index.clips)}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
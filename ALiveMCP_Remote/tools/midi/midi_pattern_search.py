@@ -0,0 +1,153 @@
+"""
+MIDI pattern search mixin: motif, rhythm and duplicate-clip queries.
+
+Single responsibility: answer queries from the PatternIndex kept by
+MidiPatternIndexMixin. Each query first re-reads only the clips marked dirty
+by listeners since the last query, then works on the in-memory index alone,
+so it costs no LOM reads for unchanged clips.
+"""
+
+import time
+
+
+def _elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000.0, 3)
+
+
+class MidiPatternSearchMixin:
+    # ========================================================================
+    # PATTERN INDEX: QUERIES
+    # ========================================================================
+
+    def find_motif(self, pitches=None, intervals=None, transpose=True, limit=100):
+        """Find clips whose melody contains a motif.
+
+        The melody of a clip is its highest note at each onset. Motifs match
+        contiguous runs of that melody by interval, so they are found in any
+        key unless transpose is false.
+
+        See Also:
+            Wiki: docs/wiki/tools/find_motif.md
+
+        Args:
+            pitches: Motif as MIDI pitches, e.g. [60, 62, 64, 60].
+            intervals: Motif as semitone steps, e.g. [2, 2, -4]; used when
+                pitches is not given.
+            transpose: Match the motif at any pitch (default True); false
+                requires the exact pitches.
+            limit: Maximum number of clips returned (default 100).
+
+        Returns:
+            dict: {"ok", "intervals", "matches", "match_count", "clip_count",
+            "refreshed", "elapsed_ms"} where each match carries the clip's
+            kind, track_index, clip_index (session) or position/start_time
+            (arrangement), name, length, note_count and "positions" (motif
+            start times in beats).
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            started = time.perf_counter()
+            if pitches is not None:
+                pitches = [int(p) for p in pitches]
+                intervals = [b - a for a, b in zip(pitches, pitches[1:])]
+            if not intervals:
+                raise ValueError("Pass pitches (2 or more) or intervals (1 or more)")
+            refreshed = self._refresh_pattern_index()
+            index = self._patterns
+            exact = None if transpose or pitches is None else pitches
+            hits = index.find_intervals(intervals, exact)
+            matches = [dict(index.info[key], positions=starts) for key, starts in hits]
+            return {
+                "ok": True,
+                "intervals": [int(i) for i in intervals],
+                "matches": matches[: int(limit)],
+                "match_count": len(matches),
+                "clip_count": len(index.clips),
+                "refreshed": refreshed,
+                "elapsed_ms": _elapsed_ms(started),
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def find_rhythm(self, onsets, limit=100):
+        """Find clips with a bar whose onsets match a rhythm pattern exactly.
+
+        See Also:
+            Wiki: docs/wiki/tools/find_rhythm.md
+
+        Args:
+            onsets: Onset positions in beats from the start of the bar, e.g.
+                [0, 1, 2, 2.5, 3]; quantized to the index grid.
+            limit: Maximum number of clips returned (default 100).
+
+        Returns:
+            dict: {"ok", "steps", "grid", "matches", "match_count",
+            "clip_count", "refreshed", "elapsed_ms"} where each match carries
+            the clip fields (see find_motif) and "bars" (0-based bar numbers
+            with that pattern).
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            started = time.perf_counter()
+            refreshed = self._refresh_pattern_index()
+            index = self._patterns
+            steps = sorted({int(round(float(o) / index.grid)) for o in onsets or []})
+            if not steps:
+                raise ValueError("onsets must contain at least one position")
+            hits = index.find_onsets(steps)
+            matches = [dict(index.info[key], bars=bars) for key, bars in hits]
+            return {
+                "ok": True,
+                "steps": steps,
+                "grid": index.grid,
+                "matches": matches[: int(limit)],
+                "match_count": len(matches),
+                "clip_count": len(index.clips),
+                "refreshed": refreshed,
+                "elapsed_ms": _elapsed_ms(started),
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def find_duplicate_clips(self, transposed=False):
+        """Find groups of clips with identical note content.
+
+        See Also:
+            Wiki: docs/wiki/tools/find_duplicate_clips.md
+
+        Args:
+            transposed: Also treat clips as duplicates when they differ only
+                by a transposition (default False).
+
+        Returns:
+            dict: {"ok", "groups", "group_count", "clip_count", "refreshed",
+            "elapsed_ms"} where each group is {"hash", "clips"} and clips
+            carry the fields described in find_motif. Empty clips are never
+            reported.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            started = time.perf_counter()
+            refreshed = self._refresh_pattern_index()
+            index = self._patterns
+            field = "shape_hash" if transposed else "hash"
+            groups = [
+                {
+                    "hash": index.clips[keys[0]][field],
+                    "clips": [index.info[key] for key in keys],
+                }
+                for keys in index.duplicate_groups(transposed)
+            ]
+            return {
+                "ok": True,
+                "groups": groups,
+                "group_count": len(groups),
+                "clip_count": len(index.clips),
+                "refreshed": refreshed,
+                "elapsed_ms": _elapsed_ms(started),
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,122 @@
+"""
+Columnar note encoding for note-heavy responses and requests.
+
+Single responsibility: convert between the per-note dict list used by the
+MIDI tools and a compact columnar payload:
+
+    {"format": "columnar", "count": n,
+     "columns": {"pitch": [...], "start_time": [...], ...}}
+
+or, base64-packed (little-endian array module buffers):
+
+    {"format": "columnar_base64", "count": n, "byteorder": "little",
+     "dtypes": {"pitch": "B", "start_time": "f", ...},
+     "columns": {"pitch": "<base64>", ...}}
+
+Either payload can be sent back as the ``notes`` argument of add_notes or
+replace_selected_notes.
+"""
+
+import base64
+import sys
+from array import array
+
+OBJECTS = "objects"
+COLUMNAR = "columnar"
+COLUMNAR_BASE64 = "columnar_base64"
+ENCODINGS = (OBJECTS, COLUMNAR, COLUMNAR_BASE64)
+
+# array typecodes for packed columns; unknown columns fall back to float32.
+COLUMN_DTYPES = {
+    "note_id": "I",
+    "pitch": "B",
+    "start_time": "f",
+    "duration": "f",
+    "velocity": "f",
+    "muted": "B",
+    "probability": "f",
+    "velocity_deviation": "f",
+    "release_velocity": "f",
+}
+
+DEFAULT_COLUMNS = ("pitch", "start_time", "duration", "velocity", "muted")
+
+
+def check_encoding(encoding):
+    """Raise ValueError unless ``encoding`` is a supported note encoding."""
+    if encoding not in ENCODINGS:
+        raise ValueError("encoding must be one of: " + ", ".join(ENCODINGS))
+
+
+def _pack(values, typecode):
+    buf = array(typecode, values)
+    if sys.byteorder != "little":
+        buf.byteswap()
+    return base64.b64encode(buf.tobytes()).decode("ascii")
+
+
+def _unpack(data, typecode):
+    buf = array(typecode)
+    buf.frombytes(base64.b64decode(data))
+    if sys.byteorder != "little":
+        buf.byteswap()
+    return buf.tolist()
+
+
+def encode_notes(notes, encoding=OBJECTS):
+    """Encode a list of note dicts; returns the list unchanged for "objects"."""
+    check_encoding(encoding)
+    if encoding == OBJECTS:
+        return notes
+
+    names = list(notes[0]) if notes else list(DEFAULT_COLUMNS)
+    columns = {name: [note.get(name) for note in notes] for name in names}
+    if encoding == COLUMNAR:
+        return {"format": COLUMNAR, "count": len(notes), "columns": columns}
+
+    dtypes = {name: COLUMN_DTYPES.get(name, "f") for name in names}
+    packed = {}
+    for name, values in columns.items():
+        if name == "muted":
+            values = [1 if v else 0 for v in values]
+        packed[name] = _pack(values, dtypes[name])
+    return {
+        "format": COLUMNAR_BASE64,
+        "count": len(notes),
+        "byteorder": "little",
+        "dtypes": dtypes,
+        "columns": packed,
+    }
+
+
+def decode_notes(payload):
+    """Turn a columnar payload back into a list of note dicts.
+
+    Lists are returned unchanged so callers can accept either form.
+    """
+    if not isinstance(payload, dict):
+        return payload
+
+    fmt = payload.get("format", COLUMNAR)
+    columns = payload.get("columns") or {}
+    if fmt == COLUMNAR_BASE64:
+        dtypes = payload.get("dtypes") or {}
+        columns = {
+            name: _unpack(data, dtypes.get(name, COLUMN_DTYPES.get(name, "f")))
+            for name, data in columns.items()
+        }
+    elif fmt != COLUMNAR:
+        raise ValueError("Unknown notes format: " + str(fmt))
+
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("Columnar notes have columns of different lengths")
+
+    count = lengths.pop() if lengths else 0
+    notes = []
+    for i in range(count):
+        note = {name: values[i] for name, values in columns.items()}
+        if "muted" in note:
+            note["muted"] = bool(note["muted"])
+        notes.append(note)
+    return notes
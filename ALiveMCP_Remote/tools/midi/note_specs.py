@@ -0,0 +1,211 @@
+"""
+MIDI note validation and bulk writing shared by the note tools.
+
+Single responsibility: turn client note dicts into validated note records,
+report the ones that were rejected (with a reason), and write the accepted
+notes to a clip in one LOM call — add_new_notes with MidiNoteSpecification
+on Live 11+, or a single legacy set_notes tuple otherwise. Also converts LOM
+notes (Live 11 MidiNote objects or legacy tuples) back into dicts and
+validates note-id modifications for apply_note_modifications.
+"""
+
+import Live
+
+# Extended note properties only understood by the Live 11+ note API.
+EXTENDED_NOTE_FIELDS = ("probability", "velocity_deviation", "release_velocity")
+
+API_ADD_NEW_NOTES = "add_new_notes"
+API_SET_NOTES = "set_notes"
+
+
+def _number(value, name, cast=float):
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        raise ValueError(name + " must be a number, got " + repr(value))
+
+
+def _ranged(value, lo, hi, name, cast=float):
+    value = _number(value, name, cast)
+    if value < lo or value > hi:
+        raise ValueError(name + " must be between " + str(lo) + " and " + str(hi))
+    return value
+
+
+def normalize_note(note):
+    """Validate one client note dict and return a normalized record.
+
+    Accepts "start" or "start_time" and "muted" or "mute". Raises ValueError
+    with a human-readable reason when the note is invalid.
+    """
+    if not isinstance(note, dict):
+        raise ValueError("note must be an object")
+
+    record = {
+        "pitch": _ranged(note.get("pitch", 60), 0, 127, "pitch", int),
+        "start": _number(note.get("start", note.get("start_time", 0.0)), "start"),
+        "duration": _number(note.get("duration", 1.0), "duration"),
+        "velocity": _ranged(note.get("velocity", 100), 0, 127, "velocity"),
+        "mute": bool(note.get("muted", note.get("mute", False))),
+    }
+    if record["duration"] <= 0:
+        raise ValueError("duration must be > 0")
+
+    if "probability" in note:
+        record["probability"] = _ranged(note["probability"], 0.0, 1.0, "probability")
+    if "velocity_deviation" in note:
+        record["velocity_deviation"] = _ranged(
+            note["velocity_deviation"], -127.0, 127.0, "velocity_deviation"
+        )
+    if "release_velocity" in note:
+        record["release_velocity"] = _ranged(
+            note["release_velocity"], 0.0, 127.0, "release_velocity"
+        )
+    return record
+
+
+def normalize_notes(notes):
+    """Split ``notes`` into (accepted records, rejected entries).
+
+    Rejected entries are {"index", "note", "reason"} so clients can see
+    exactly which input was dropped and why.
+    """
+    accepted = []
+    rejected = []
+    for i, note in enumerate(notes or []):
+        try:
+            accepted.append(normalize_note(note))
+        except ValueError as e:
+            rejected.append({"index": i, "note": note, "reason": str(e)})
+    return accepted, rejected
+
+
+def note_tuple(record):
+    """Legacy (pitch, start, duration, velocity, mute) tuple for set_notes."""
+    return (
+        record["pitch"],
+        record["start"],
+        record["duration"],
+        int(round(record["velocity"])),
+        record["mute"],
+    )
+
+
+def note_specification(record):
+    """Build a Live.Clip.MidiNoteSpecification for ``record``."""
+    kwargs = {
+        "pitch": record["pitch"],
+        "start_time": record["start"],
+        "duration": record["duration"],
+        "velocity": record["velocity"],
+        "mute": record["mute"],
+    }
+    for field in EXTENDED_NOTE_FIELDS:
+        if field in record:
+            kwargs[field] = record[field]
+    return Live.Clip.MidiNoteSpecification(**kwargs)
+
+
+def supports_note_specs(clip):
+    """True when the clip and Live expose the Live 11+ add_new_notes API."""
+    return hasattr(clip, "add_new_notes") and hasattr(
+        getattr(Live, "Clip", None), "MidiNoteSpecification"
+    )
+
+
+def write_notes(clip, records):
+    """Add ``records`` to ``clip`` in a single LOM call; returns the API used."""
+    if supports_note_specs(clip):
+        if records:
+            clip.add_new_notes(tuple(note_specification(r) for r in records))
+        return API_ADD_NEW_NOTES
+
+    if records:
+        clip.set_notes(tuple(note_tuple(r) for r in records))
+    return API_SET_NOTES
+
+
+def note_to_dict(note):
+    """Convert a Live 11 MidiNote or a legacy note tuple into a client dict."""
+    if isinstance(note, (tuple, list)):
+        return {
+            "pitch": note[0],
+            "start_time": float(note[1]),
+            "duration": float(note[2]),
+            "velocity": note[3],
+            "muted": note[4],
+        }
+
+    data = {
+        "note_id": note.note_id,
+        "pitch": int(note.pitch),
+        "start_time": float(note.start_time),
+        "duration": float(note.duration),
+        "velocity": float(note.velocity),
+        "muted": bool(note.mute),
+    }
+    for field in EXTENDED_NOTE_FIELDS:
+        if hasattr(note, field):
+            data[field] = float(getattr(note, field))
+    return data
+
+
+def read_notes(clip):
+    """Every note of ``clip`` as client dicts.
+
+    Uses get_all_notes_extended on Live 11+ so note ids and the extended
+    fields survive a read-modify-write round trip.
+    """
+    if hasattr(clip, "get_all_notes_extended"):
+        notes = clip.get_all_notes_extended()
+    else:
+        notes = clip.get_notes(0, 0, clip.length, 128)
+    return [note_to_dict(note) for note in notes]
+
+
+# Client key -> (MidiNote attribute, validator) for apply_note_modifications.
+_MODIFIABLE = {
+    "pitch": ("pitch", lambda v: _ranged(v, 0, 127, "pitch", int)),
+    "start_time": ("start_time", lambda v: _number(v, "start_time")),
+    "start": ("start_time", lambda v: _number(v, "start")),
+    "duration": ("duration", lambda v: _number(v, "duration")),
+    "velocity": ("velocity", lambda v: _ranged(v, 0, 127, "velocity")),
+    "muted": ("mute", bool),
+    "mute": ("mute", bool),
+    "probability": ("probability", lambda v: _ranged(v, 0.0, 1.0, "probability")),
+    "velocity_deviation": (
+        "velocity_deviation",
+        lambda v: _ranged(v, -127.0, 127.0, "velocity_deviation"),
+    ),
+    "release_velocity": (
+        "release_velocity",
+        lambda v: _ranged(v, 0.0, 127.0, "release_velocity"),
+    ),
+}
+
+
+def normalize_modification(mod):
+    """Validate one {"note_id", <field>: value, ...} edit.
+
+    Returns (note_id, {midi_note_attribute: value}); raises ValueError with a
+    reason for missing ids, unknown fields or out-of-range values.
+    """
+    if not isinstance(mod, dict):
+        raise ValueError("modification must be an object")
+    if "note_id" not in mod:
+        raise ValueError("note_id is required")
+    note_id = _number(mod["note_id"], "note_id", int)
+
+    changes = {}
+    for key, value in mod.items():
+        if key == "note_id":
+            continue
+        if key not in _MODIFIABLE:
+            raise ValueError("unknown field: " + str(key))
+        attr, validate = _MODIFIABLE[key]
+        changes[attr] = validate(value)
+    if not changes:
+        raise ValueError("no fields to modify")
+    if changes.get("duration", 1.0) <= 0:
+        raise ValueError("duration must be > 0")
+    return note_id, changes
@@ -0,0 +1,196 @@
+"""
+In-memory search index over the MIDI content of session and arrangement clips.
+
+Single responsibility: turn one clip's notes into searchable features and keep
+inverted indexes over them, with no LOM access:
+
+- melody: the top (highest unmuted) pitch of every onset, with its start time
+- interval n-grams: consecutive melody intervals, NGRAM_SIZE at a time
+  (transposition invariant, so a motif is found in any key)
+- onset patterns: per bar, the grid steps that hold an onset
+- content hash: sha1 of the sorted notes and clip length (exact duplicates)
+  and shape hash: the same with pitches relative to the lowest one
+  (duplicates up to transposition)
+
+Clips are keyed by strings: "session:<track>:<slot>" and
+"arrangement:<track>:<n>" (n-th clip of track.arrangement_clips).
+"""
+
+import hashlib
+
+NGRAM_SIZE = 3
+DEFAULT_GRID = 0.25
+
+
+def session_key(track_index, clip_index):
+    return "session:" + str(track_index) + ":" + str(clip_index)
+
+
+def arrangement_key(track_index, position):
+    return "arrangement:" + str(track_index) + ":" + str(position)
+
+
+def _digest(rows, length):
+    digest = hashlib.sha1()
+    digest.update(repr((round(float(length), 6), rows)).encode("ascii"))
+    return digest.hexdigest()
+
+
+def melody_line(notes):
+    """(start_time, pitch) of the highest unmuted note at each onset, in time order."""
+    top = {}
+    for note in notes:
+        if note.get("muted"):
+            continue
+        start = round(float(note["start_time"]), 6)
+        top[start] = max(top.get(start, -1), int(note["pitch"]))
+    return sorted(top.items())
+
+
+def onset_patterns(notes, length, bar_length, grid=DEFAULT_GRID):
+    """Per bar, the sorted tuple of grid steps holding an onset (empty bars give ())."""
+    bar_count = max(1, int(-(-float(length) // bar_length)))
+    bars = [set() for _ in range(bar_count)]
+    for note in notes:
+        if note.get("muted"):
+            continue
+        start = float(note["start_time"])
+        bar = int(start // bar_length)
+        if 0 <= bar < bar_count:
+            bars[bar].add(int(round((start - bar * bar_length) / grid)))
+    return [tuple(sorted(steps)) for steps in bars]
+
+
+def clip_features(notes, length, bar_length, grid=DEFAULT_GRID):
+    """Searchable features of one clip (see module docstring)."""
+    rows = sorted(
+        (
+            int(n["pitch"]),
+            round(float(n["start_time"]), 6),
+            round(float(n["duration"]), 6),
+            round(float(n.get("velocity", 100)), 3),
+            bool(n.get("muted")),
+        )
+        for n in notes
+    )
+    low = min((r[0] for r in rows), default=0)
+    shape = sorted((p - low, s, d, v, m) for p, s, d, v, m in rows)
+    melody = melody_line(notes)
+    pitches = [p for _, p in melody]
+    return {
+        "length": float(length),
+        "note_count": len(rows),
+        "hash": _digest(rows, length),
+        "shape_hash": _digest(shape, length),
+        "onsets": [s for s, _ in melody],
+        "pitches": pitches,
+        "intervals": [b - a for a, b in zip(pitches, pitches[1:])],
+        "bars": onset_patterns(notes, length, bar_length, grid),
+    }
+
+
+def _ngrams(intervals):
+    return {tuple(intervals[i : i + NGRAM_SIZE]) for i in range(len(intervals) - NGRAM_SIZE + 1)}
+
+
+def _find_run(sequence, run):
+    """Start indexes where ``run`` occurs as a contiguous slice of ``sequence``."""
+    size = len(run)
+    return [i for i in range(len(sequence) - size + 1) if sequence[i : i + size] == run]
+
+
+class PatternIndex:
+    """Clip features plus inverted indexes (n-gram, onset pattern, hashes)."""
+
+    def __init__(self, grid=DEFAULT_GRID, include_arrangement=True):
+        self.grid = grid
+        self.include_arrangement = include_arrangement
+        self.built = False
+        self.clips = {}
+        self.info = {}
+        self.ngrams = {}
+        self.bars = {}
+        self.hashes = {}
+        self.shapes = {}
+        self.dirty = set()
+        # Track indexes whose arrangement clip list changed (re-scanned whole).
+        self.dirty_tracks = set()
+        # Set when tracks, scenes or clip slots were added, removed or moved:
+        # positional keys no longer name the same clips, so rebuild in full.
+        self.stale = False
+        # Task id of the background rebuild that is filling this index, if any.
+        self.rebuild_task = None
+        # Owner -> callables that remove the Live listeners installed for it.
+        self.listeners = {}
+
+    def _link(self, table, token, key):
+        table.setdefault(token, set()).add(key)
+
+    def _unlink(self, table, token, key):
+        keys = table.get(token)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del table[token]
+
+    def _tokens(self, features):
+        yield self.ngrams, _ngrams(features["intervals"])
+        yield self.bars, {bar for bar in features["bars"] if bar}
+        # Empty clips are all identical; keep them out of the duplicate tables.
+        if features["note_count"]:
+            yield self.hashes, {features["hash"]}
+            yield self.shapes, {features["shape_hash"]}
+
+    def remove(self, key):
+        features = self.clips.pop(key, None)
+        self.info.pop(key, None)
+        self.dirty.discard(key)
+        if features is not None:
+            for table, tokens in self._tokens(features):
+                for token in tokens:
+                    self._unlink(table, token, key)
+
+    def add(self, key, features, info):
+        """Index (or re-index) one clip; ``info`` is returned with query hits."""
+        self.remove(key)
+        self.clips[key] = features
+        self.info[key] = dict(info, key=key)
+        for table, tokens in self._tokens(features):
+            for token in tokens:
+                self._link(table, token, key)
+
+    def find_intervals(self, intervals, pitches=None):
+        """Clips whose melody contains ``intervals`` (and ``pitches`` if given).
+
+        Returns [(key, [start_time, ...])]. Queries of NGRAM_SIZE or more
+        intervals are narrowed through the n-gram index first.
+        """
+        intervals = [int(i) for i in intervals]
+        grams = _ngrams(intervals)
+        if grams:
+            candidates = set.intersection(*(self.ngrams.get(g, set()) for g in grams))
+        else:
+            candidates = set(self.clips)
+        hits = []
+        for key in sorted(candidates):
+            features = self.clips[key]
+            starts = _find_run(features["intervals"], intervals)
+            if pitches is not None:
+                starts = [i for i in starts if features["pitches"][i : i + len(pitches)] == pitches]
+            if starts:
+                hits.append((key, [features["onsets"][i] for i in starts]))
+        return hits
+
+    def find_onsets(self, pattern):
+        """Clips with a bar whose onset steps equal ``pattern``: [(key, [bar, ...])]."""
+        pattern = tuple(sorted(int(step) for step in pattern))
+        hits = []
+        for key in sorted(self.bars.get(pattern, ())):
+            bars = [i for i, bar in enumerate(self.clips[key]["bars"]) if bar == pattern]
+            hits.append((key, bars))
+        return hits
+
+    def duplicate_groups(self, transposed=False):
+        """Lists of keys sharing a content hash (shape hash when ``transposed``)."""
+        table = self.shapes if transposed else self.hashes
+        return [sorted(keys) for _, keys in sorted(table.items()) if len(keys) > 1]
@@ -0,0 +1,145 @@
+"""
+Output-meter sampling for tracks, return tracks and the master track.
+
+Single responsibility: pick the channels to meter, read their
+output_meter_left / output_meter_right / output_meter_level properties, and
+run a MeterSubscription tick job that samples every update_display() tick and
+decimates to the requested frame rate with peak-hold (each frame carries the
+highest reading seen since the previous frame). Frames are kept in a bounded
+buffer until the client reads them.
+"""
+
+import base64
+import sys
+from array import array
+from collections import deque
+
+from ..core.tick_jobs import TickJob
+
+METER_FIELDS = {
+    "left": "output_meter_left",
+    "right": "output_meter_right",
+    "level": "output_meter_level",
+}
+DEFAULT_FIELDS = ("left", "right")
+ENCODINGS = ("array", "base64")
+
+
+def check_fields(fields):
+    """Normalise ``fields`` (list or comma-separated string) to a tuple of meter names."""
+    if fields is None:
+        return DEFAULT_FIELDS
+    if isinstance(fields, str):
+        fields = [f.strip() for f in fields.split(",") if f.strip()]
+    for field in fields:
+        if field not in METER_FIELDS:
+            raise ValueError("fields must be drawn from: " + ", ".join(METER_FIELDS))
+    if not fields:
+        raise ValueError("fields must not be empty")
+    return tuple(fields)
+
+
+def _pick(collection, indices, error, prefix):
+    if indices is None:
+        indices = range(len(collection))
+    picked = []
+    for index in indices:
+        if int(index) < 0 or int(index) >= len(collection):
+            raise ValueError(error)
+        picked.append((prefix + str(int(index)), collection[int(index)]))
+    return picked
+
+
+def meter_channels(song, tracks=None, returns=None, master=True):
+    """Return [(label, track)] for the selected tracks, returns and master.
+
+    ``tracks`` / ``returns`` are lists of indices; None selects all of them
+    and an empty list none.
+    """
+    channels = _pick(song.tracks, tracks, "Invalid track index", "track ")
+    channels += _pick(song.return_tracks, returns, "Invalid return track index", "return ")
+    if master:
+        channels.append(("master", song.master_track))
+    return channels
+
+
+def read_channel(track, fields):
+    """Current meter readings of ``track`` for ``fields`` (0.0 where a meter is missing)."""
+    return [float(getattr(track, METER_FIELDS[field], 0.0) or 0.0) for field in fields]
+
+
+def pack_floats(values):
+    """Base64 of little-endian float32 ``values``."""
+    buf = array("f", values)
+    if sys.byteorder != "little":
+        buf.byteswap()
+    return base64.b64encode(buf.tobytes()).decode("ascii")
+
+
+class MeterSubscription(TickJob):
+    """Samples meters every tick and emits a peak-held frame every ``interval`` seconds."""
+
+    kind = "meters"
+
+    def __init__(self, channels, fields, interval, buffer_frames, timeout):
+        TickJob.__init__(self)
+        self.channels = channels
+        self.fields = fields
+        self.interval = interval
+        self.timeout = timeout
+        self.frames = deque(maxlen=buffer_frames)
+        self.next_seq = 0
+        self.dropped = 0
+        self.peaks = None
+        self.window_start = None
+        self.last_read = None
+
+    def advance(self, now):
+        if self.last_read is None:
+            self.last_read = self.window_start = self.started
+        if self.timeout and now - self.last_read > self.timeout:
+            return False
+        sample = []
+        for _, track in self.channels:
+            sample.extend(read_channel(track, self.fields))
+        self.peaks = sample if self.peaks is None else list(map(max, self.peaks, sample))
+        # 1 ms of slack so a frame due "on" a tick is not pushed to the next one.
+        if now - self.window_start >= self.interval - 0.001:
+            if len(self.frames) == self.frames.maxlen:
+                self.dropped += 1
+            self.frames.append((self.next_seq, now - self.started, self.peaks))
+            self.next_seq += 1
+            self.peaks = None
+            self.window_start = now
+        return True
+
+    def read(self, now, since=0, encoding="array"):
+        """Frames with seq >= ``since`` as a compact payload; marks the subscription read."""
+        if encoding not in ENCODINGS:
+            raise ValueError("encoding must be one of: " + ", ".join(ENCODINGS))
+        self.last_read = now
+        frames = [f for f in self.frames if f[0] >= int(since)]
+        payload = {
+            "format": encoding,
+            "count": len(frames),
+            "width": len(self.channels) * len(self.fields),
+            "seq": [f[0] for f in frames],
+            "time": [round(f[1], 4) for f in frames],
+        }
+        if encoding == "array":
+            payload["values"] = [[round(v, 4) for v in f[2]] for f in frames]
+        else:
+            payload["dtype"] = "f"
+            payload["byteorder"] = "little"
+            payload["values"] = pack_floats([v for f in frames for v in f[2]])
+        return payload
+
+    def describe(self, now):
+        return {
+            "channels": [label for label, _ in self.channels],
+            "fields": list(self.fields),
+            "rate_hz": round(1.0 / self.interval, 3),
+            "buffered": len(self.frames),
+            "next": self.next_seq,
+            "dropped": self.dropped,
+        }
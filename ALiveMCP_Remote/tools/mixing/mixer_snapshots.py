@@ -0,0 +1,233 @@
+"""
+Mixer snapshots: capture, blend and apply the whole mix in one pass.
+
+Single responsibility: read and write volume, pan, sends, mute, solo and
+crossfader assignment of every track, return track and the master track (plus
+the crossfader position) as a compact columnar dict:
+
+    {"version": 1, "channels": ["track 0", ..., "return 0", ..., "master"],
+     "names": [...], "volume": [...], "pan": [...], "sends": [[...], ...],
+     "mute": [...], "solo": [...], "crossfade_assign": [...],
+     "crossfader": 0.0}
+
+Values a channel does not have (master mute/solo) are None. Snapshots are
+plain JSON, so they can be written to disk as they are. align() maps a
+snapshot onto the current set by track name (falling back to position) so
+inserted, deleted or reordered tracks keep their own mix. MixerMorph
+interpolates between two snapshots on update_display() ticks.
+"""
+
+from ..automation.envelope_shapes import ease
+from ..core.tick_jobs import TickJob
+from .meters import meter_channels
+
+SNAPSHOT_VERSION = 1
+# Continuous columns are interpolated; discrete ones switch half-way through a morph.
+DISCRETE = ("mute", "solo", "crossfade_assign")
+COLUMNS = ("names", "volume", "pan", "sends") + DISCRETE
+
+
+def _optional(obj, attr, cast):
+    return cast(getattr(obj, attr)) if hasattr(obj, attr) else None
+
+
+def capture(song):
+    """Read the mix of every track, return and the master track into a snapshot dict."""
+    channels = meter_channels(song)
+    snapshot = {"version": SNAPSHOT_VERSION, "channels": [], "names": [], "volume": []}
+    for column in ("pan", "sends") + DISCRETE:
+        snapshot[column] = []
+    for label, track in channels:
+        mixer = track.mixer_device
+        snapshot["channels"].append(label)
+        snapshot["names"].append(str(track.name))
+        snapshot["volume"].append(float(mixer.volume.value))
+        snapshot["pan"].append(float(mixer.panning.value))
+        snapshot["sends"].append([float(s.value) for s in getattr(mixer, "sends", [])])
+        snapshot["mute"].append(None if label == "master" else _optional(track, "mute", bool))
+        snapshot["solo"].append(None if label == "master" else _optional(track, "solo", bool))
+        snapshot["crossfade_assign"].append(
+            None if label == "master" else _optional(mixer, "crossfade_assign", int)
+        )
+    master_mixer = song.master_track.mixer_device
+    crossfader = getattr(master_mixer, "crossfader", None)
+    snapshot["crossfader"] = None if crossfader is None else float(crossfader.value)
+    return snapshot
+
+
+def validate(snapshot):
+    """Raise ValueError unless ``snapshot`` has every column, one entry per channel.
+
+    Checked before a loaded snapshot is stored, so a malformed file cannot
+    half-apply a mix.
+    """
+    if not isinstance(snapshot, dict) or not isinstance(snapshot.get("channels"), list):
+        raise ValueError("Not a mixer snapshot: missing channels")
+    count = len(snapshot["channels"])
+    for column in COLUMNS:
+        values = snapshot.get(column)
+        if not isinstance(values, list) or len(values) != count:
+            raise ValueError(
+                "Malformed mixer snapshot: " + column + " must list one value per channel"
+            )
+    if not all(isinstance(sends, list) for sends in snapshot["sends"]):
+        raise ValueError("Malformed mixer snapshot: sends must hold one list per channel")
+
+
+def _kind(label):
+    return label.split(" ")[0]
+
+
+def align(song, snapshot):
+    """Relabel ``snapshot`` onto the current channels; returns (aligned, remapped).
+
+    A channel keeps its label when the track there still has the captured
+    name, otherwise it moves to the only unmatched channel of the same kind
+    (track / return / master) with that name, otherwise it falls back to its
+    old position. ``remapped`` lists every channel that did not land on the
+    same label and name: {"channel", "name", "applied_to", "current_name"},
+    with applied_to None when the channel was skipped.
+    """
+    names = {label: str(track.name) for label, track in meter_channels(song)}
+    free = set(names)
+    targets = {}
+    for i, label in enumerate(snapshot["channels"]):
+        if names.get(label) == snapshot["names"][i]:
+            targets[i] = label
+            free.discard(label)
+    for i, label in enumerate(snapshot["channels"]):
+        if i not in targets:
+            same = [
+                c for c in free if _kind(c) == _kind(label) and names[c] == snapshot["names"][i]
+            ]
+            if len(same) == 1:
+                targets[i] = same[0]
+                free.discard(same[0])
+    for i, label in enumerate(snapshot["channels"]):
+        if i not in targets and label in free:
+            targets[i] = label
+            free.discard(label)
+
+    aligned = {
+        "version": SNAPSHOT_VERSION,
+        "channels": [],
+        "crossfader": snapshot.get("crossfader"),
+    }
+    for column in COLUMNS:
+        aligned[column] = []
+    remapped = []
+    for i, label in enumerate(snapshot["channels"]):
+        target = targets.get(i)
+        if target != label or names[target] != snapshot["names"][i]:
+            remapped.append(
+                {
+                    "channel": label,
+                    "name": snapshot["names"][i],
+                    "applied_to": target,
+                    "current_name": names.get(target),
+                }
+            )
+        if target is not None:
+            aligned["channels"].append(target)
+            for column in COLUMNS:
+                aligned[column].append(snapshot[column][i])
+    return aligned, remapped
+
+
+def _mix(a, b, amount):
+    if a is None or b is None:
+        return b if amount >= 0.5 else a
+    # Exact end points, so a full recall lands on the stored values.
+    if amount >= 1.0:
+        return b
+    if amount <= 0.0:
+        return a
+    return a + (b - a) * amount
+
+
+def blend(a, b, amount):
+    """Snapshot ``amount`` of the way from ``a`` to ``b`` (channels present in both)."""
+    index_b = {label: i for i, label in enumerate(b["channels"])}
+    result = {"version": SNAPSHOT_VERSION, "channels": [], "names": []}
+    for column in ("volume", "pan", "sends") + DISCRETE:
+        result[column] = []
+    for i, label in enumerate(a["channels"]):
+        j = index_b.get(label)
+        if j is None:
+            continue
+        result["channels"].append(label)
+        result["names"].append(b["names"][j])
+        result["volume"].append(_mix(a["volume"][i], b["volume"][j], amount))
+        result["pan"].append(_mix(a["pan"][i], b["pan"][j], amount))
+        result["sends"].append([_mix(x, y, amount) for x, y in zip(a["sends"][i], b["sends"][j])])
+        for column in DISCRETE:
+            result[column].append(b[column][j] if amount >= 0.5 else a[column][i])
+    result["crossfader"] = _mix(a.get("crossfader"), b.get("crossfader"), amount)
+    return result
+
+
+def _set(param, value):
+    value = max(float(param.min), min(float(param.max), float(value)))
+    if float(param.value) != value:
+        param.value = value
+
+
+def apply(song, snapshot):
+    """Write ``snapshot`` to the set; returns the number of channels written.
+
+    Channels are matched by label ("track 3", "return 0", "master"); labels
+    missing from the current set are skipped. Pass the result of align() to
+    match channels by track name instead.
+    """
+    current = dict(meter_channels(song))
+    applied = 0
+    for i, label in enumerate(snapshot["channels"]):
+        track = current.get(label)
+        if track is None:
+            continue
+        mixer = track.mixer_device
+        _set(mixer.volume, snapshot["volume"][i])
+        _set(mixer.panning, snapshot["pan"][i])
+        for send, value in zip(getattr(mixer, "sends", []), snapshot["sends"][i]):
+            _set(send, value)
+        for column, owner in (("mute", track), ("solo", track), ("crossfade_assign", mixer)):
+            value = snapshot[column][i]
+            if value is not None and hasattr(owner, column) and getattr(owner, column) != value:
+                setattr(owner, column, value)
+        applied += 1
+    crossfader = getattr(song.master_track.mixer_device, "crossfader", None)
+    if crossfader is not None and snapshot.get("crossfader") is not None:
+        _set(crossfader, snapshot["crossfader"])
+    return applied
+
+
+class MixerMorph(TickJob):
+    """Moves the mix from snapshot ``a`` towards ``b`` over ``duration`` seconds."""
+
+    kind = "mixer_morph"
+
+    def __init__(self, song, a, b, amount, duration, curve, label):
+        TickJob.__init__(self)
+        self.song = song
+        self.a = a
+        self.b = b
+        self.amount = amount
+        self.duration = duration
+        self.curve = curve
+        self.label = label
+        self.progress = 0.0
+
+    def advance(self, now):
+        elapsed = now - self.started
+        self.progress = 1.0 if self.duration <= 0 else min(1.0, elapsed / self.duration)
+        apply(self.song, blend(self.a, self.b, self.amount * ease(self.curve, self.progress)))
+        return self.progress < 1.0
+
+    def describe(self, now):
+        return {
+            "morph": self.label,
+            "progress": round(self.progress, 4),
+            "amount": self.amount,
+            "duration_ms": round(self.duration * 1000.0, 3),
+            "curve": self.curve,
+        }
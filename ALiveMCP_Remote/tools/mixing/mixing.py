@@ -7,9 +7,12 @@ the project's 300-line limit.
 
 from .mixing_crossfader import MixingCrossfaderMixin
 from .mixing_groove import MixingGrooveMixin
+from .mixing_levels import MixingLevelsMixin
 from .mixing_master import MixingMasterMixin
+from .mixing_meters import MixingMetersMixin
 from .mixing_return import MixingReturnMixin
 from .mixing_sends import MixingSendsMixin
+from .mixing_snapshots import MixingSnapshotsMixin
 
 
 class MixingMixin(
@@ -18,6 +21,9 @@ class MixingMixin(
     MixingMasterMixin,
     MixingReturnMixin,
     MixingCrossfaderMixin,
+    MixingMetersMixin,
+    MixingLevelsMixin,
+    MixingSnapshotsMixin,
 ):
     """Aggregate mixing-related mixins."""
 
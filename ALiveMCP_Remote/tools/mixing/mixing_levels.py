@@ -0,0 +1,196 @@
+"""
+Gain-staging analysis over a window of playback.
+
+Single responsibility: sample the output meters of tracks, returns and master
+on every tick while the transport plays (see meters.py) until N bars have
+been played, then summarise peak, RMS and meter headroom per channel. The window is
+measured in beats actually played (wall time x tempo while playing), so loop
+playback and stopping the transport do not cut it short. A run that sees no
+playback for ``timeout`` seconds ends on its own so a forgotten analysis does
+not keep reading meters for the rest of the session.
+"""
+
+import math
+
+from ..core.scheduler import bar_length
+from ..core.tick_jobs import TickJob
+from .meters import meter_channels, read_channel
+
+# A meter reading at or above this counts as a clipped tick.
+CLIP_LEVEL = 1.0
+DEFAULT_LEVELS_TIMEOUT = 60.0
+
+
+class LevelAnalysis(TickJob):
+    """Accumulates per-channel meter statistics until ``beats`` have been played."""
+
+    kind = "levels"
+
+    def __init__(self, song, channels, beats, timeout):
+        TickJob.__init__(self)
+        self.song = song
+        self.channels = channels
+        self.beats = beats
+        self.timeout = timeout
+        self.timed_out = False
+        self.played = 0.0
+        self.last_tick = None
+        self.last_playing = None
+        self.samples = 0
+        self.peak = [0.0] * len(channels)
+        self.total = [0.0] * len(channels)
+        self.squares = [0.0] * len(channels)
+        self.clipped = [0] * len(channels)
+
+    def advance(self, now):
+        last, self.last_tick = self.last_tick, now
+        if self.last_playing is None:
+            self.last_playing = self.started
+        if not self.song.is_playing:
+            if self.timeout and now - self.last_playing > self.timeout:
+                self.timed_out = True
+                return False
+            return True
+        self.last_playing = now
+        if last is not None:
+            self.played += (now - last) * float(self.song.tempo) / 60.0
+        self.samples += 1
+        for i, (_, track) in enumerate(self.channels):
+            value = max(read_channel(track, ("left", "right")))
+            self.peak[i] = max(self.peak[i], value)
+            self.total[i] += value
+            self.squares[i] += value * value
+            if value >= CLIP_LEVEL:
+                self.clipped[i] += 1
+        return self.played < self.beats
+
+    def summary(self):
+        n = max(1, self.samples)
+        return [
+            {
+                "channel": label,
+                "peak": round(self.peak[i], 4),
+                "rms": round(math.sqrt(self.squares[i] / n), 4),
+                "mean": round(self.total[i] / n, 4),
+                "meter_headroom": round(CLIP_LEVEL - self.peak[i], 4),
+                "clipped_ticks": self.clipped[i],
+            }
+            for i, (label, _) in enumerate(self.channels)
+        ]
+
+    def describe(self, now):
+        return {
+            "beats": self.beats,
+            "beats_played": round(min(self.played, self.beats), 3),
+            "samples": self.samples,
+            "timed_out": self.timed_out,
+            "levels": self.summary(),
+        }
+
+
+class MixingLevelsMixin:
+    # ========================================================================
+    # LEVEL ANALYSIS
+    # ========================================================================
+
+    def analyze_levels(
+        self, bars=4, tracks=None, returns=None, master=True, timeout=DEFAULT_LEVELS_TIMEOUT
+    ):
+        """Measure peak/RMS output levels per channel over N bars of playback.
+
+        See Also:
+            Wiki: docs/wiki/tools/analyze_levels.md
+
+        Args:
+            bars: Length of the window in bars of playback (default 4).
+            tracks: Track indices to analyse (default: all tracks; [] for none).
+            returns: Return track indices (default: all; [] for none).
+            master: Include the master track (default True).
+            timeout: Seconds with the transport stopped after which the
+                analysis ends early with timed_out=true (default 60; 0
+                waits for playback indefinitely).
+
+        Returns:
+            dict: {"ok", "analysis_id", "channels", "beats", "is_playing"};
+            poll get_level_analysis for the per-channel summary.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            if float(bars) <= 0:
+                return {"ok": False, "error": "bars must be > 0"}
+            channels = meter_channels(self.song, tracks, returns, master)
+            if not channels:
+                return {"ok": False, "error": "No channels selected"}
+            beats = float(bars) * bar_length(self.song)
+            job = self._jobs.add(LevelAnalysis(self.song, channels, beats, float(timeout or 0)))
+            return {
+                "ok": True,
+                "analysis_id": job.job_id,
+                "channels": [label for label, _ in channels],
+                "beats": beats,
+                "is_playing": bool(self.song.is_playing),
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def _level_analysis(self, analysis_id):
+        job = self._jobs.get(analysis_id)
+        if job is None or job.kind != LevelAnalysis.kind:
+            raise ValueError("Unknown analysis_id: " + str(analysis_id))
+        return job
+
+    def get_level_analysis(self, analysis_id):
+        """Get the progress and per-channel level summary of an analyze_levels run.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_level_analysis.md
+
+        Args:
+            analysis_id: Id returned by analyze_levels.
+
+        Returns:
+            dict: {"ok", "analysis_id", "status", "beats", "beats_played",
+            "samples", "timed_out", "levels"} where levels holds one
+            {"channel", "peak", "rms", "mean", "meter_headroom",
+            "clipped_ticks"} per channel in Live's 0.0-1.0 meter display
+            units, which are not dB: the scale is non-linear, so
+            meter_headroom (1.0 - peak) ranks how close channels peak to
+            clipping but is not a gain change to apply with
+            set_track_volume. The summary is final once status is "done" or
+            "cancelled"; timed_out marks a run that ended waiting for
+            playback.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            job = self._level_analysis(analysis_id)
+            info = job.describe(self._jobs.clock())
+            return dict(info, ok=True, analysis_id=job.job_id, status=job.status)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def cancel_level_analysis(self, analysis_id=None):
+        """Stop a running analyze_levels run (or all of them).
+
+        See Also:
+            Wiki: docs/wiki/tools/cancel_level_analysis.md
+
+        Args:
+            analysis_id: Id returned by analyze_levels (default: every
+                running analysis).
+
+        Returns:
+            dict: {"ok", "cancelled"} where cancelled lists the ids stopped.
+
+        Raises:
+            None: unknown analysis ids are returned as {"ok": False, "error": ...}."""
+        try:
+            if analysis_id is not None:
+                jobs = [self._level_analysis(analysis_id)]
+            else:
+                jobs = self._jobs.running(LevelAnalysis.kind)
+            cancelled = [j.job_id for j in jobs if self._jobs.cancel(j.job_id)]
+            return {"ok": True, "cancelled": cancelled}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -2,6 +2,9 @@
 Master track device parameter tools: read, inspect, and set params on master chain devices.
 """
 
+from ..core.lom_fields import DEVICE_FIELDS, MASTER_DEVICE_CHILDREN
+from ..core.projection import parse_fields, project_items
+
 
 class MixingMasterDevicesMixin:
     # ========================================================================
@@ -217,60 +220,34 @@ class MixingMasterDevicesMixin:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    def get_master_chain_summary(self):
+    def get_master_chain_summary(self, fields=None):
         """Get all devices on the master track with full enriched parameter lists
 
         See Also:
             Wiki: docs/wiki/tools/get_master_chain_summary.md
 
         Args:
-            TODO: describe parameters.
+            fields: Optional device fields to return, dotted for parameters
+                (e.g. ["name", "parameters.display_value"]). Omitting
+                "parameters" skips the parameter walk entirely.
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "count", "devices"}.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors (including unknown field names) are returned as
+            {"ok": False, "error": ...}."""
         try:
+            tree = parse_fields(fields)
             master = self.song.master_track
-            devices = []
-
-            for d_idx, device in enumerate(master.devices):
-                params_info = []
-                for i, param in enumerate(device.parameters):
-                    display_value = (
-                        str(param.display_value)
-                        if hasattr(param, "display_value")
-                        else str(param.__str__())
-                    )
-                    is_quantized = (
-                        bool(param.is_quantized) if hasattr(param, "is_quantized") else False
-                    )
-                    value_items = (
-                        [str(v) for v in param.value_items] if hasattr(param, "value_items") else []
-                    )
-                    params_info.append(
-                        {
-                            "index": i,
-                            "name": str(param.name),
-                            "raw_value": float(param.value),
-                            "display_value": display_value,
-                            "min": float(param.min),
-                            "max": float(param.max),
-                            "is_quantized": is_quantized,
-                            "value_items": value_items,
-                        }
-                    )
-
-                devices.append(
-                    {
-                        "index": d_idx,
-                        "name": str(device.name),
-                        "class_name": str(device.class_name),
-                        "is_active": device.is_active,
-                        "parameters": params_info,
-                    }
-                )
+            devices = project_items(
+                master.devices,
+                tree,
+                DEVICE_FIELDS,
+                MASTER_DEVICE_CHILDREN,
+                where="device",
+                strict=True,
+            )
 
             return {"ok": True, "count": len(devices), "devices": devices}
         except Exception as e:
@@ -0,0 +1,152 @@
+"""
+Output-meter subscriptions for tracks, return tracks and master.
+
+Single responsibility: start, read and stop MeterSubscription tick jobs (see
+meters.py). Meters are sampled on the Remote side every tick; the client
+collects decimated, peak-held frames in one read_meters call instead of
+polling each meter through the request queue.
+"""
+
+from .meters import MeterSubscription, check_fields, meter_channels
+
+DEFAULT_METER_RATE_HZ = 20.0
+DEFAULT_BUFFER_FRAMES = 256
+DEFAULT_METER_TIMEOUT = 30.0
+
+
+class MixingMetersMixin:
+    # ========================================================================
+    # OUTPUT METERS
+    # ========================================================================
+
+    def _meter_subscription(self, subscription_id):
+        job = self._jobs.get(subscription_id)
+        if job is None or job.kind != MeterSubscription.kind:
+            raise ValueError("Unknown subscription_id: " + str(subscription_id))
+        return job
+
+    def subscribe_meters(
+        self,
+        tracks=None,
+        returns=None,
+        master=True,
+        fields=None,
+        rate_hz=DEFAULT_METER_RATE_HZ,
+        buffer_frames=DEFAULT_BUFFER_FRAMES,
+        timeout=DEFAULT_METER_TIMEOUT,
+    ):
+        """Start sampling output meters every tick, decimated to frames with peak-hold.
+
+        See Also:
+            Wiki: docs/wiki/tools/subscribe_meters.md
+
+        Args:
+            tracks: Track indices to meter (default: all tracks; [] for none).
+            returns: Return track indices to meter (default: all; [] for none).
+            master: Meter the master track (default True).
+            fields: Meters per channel from "left", "right", "level"
+                (default ["left", "right"]).
+            rate_hz: Frames per second (default 20; at most the ~60 Hz tick
+                rate is meaningful).
+            buffer_frames: Frames kept until read (default 256); older frames
+                are dropped first.
+            timeout: Seconds without a read_meters call after which the
+                subscription stops (default 30; 0 disables).
+
+        Returns:
+            dict: {"ok", "subscription_id", "channels", "fields", "rate_hz"}
+            where each frame holds len(channels) * len(fields) values,
+            channel-major.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            fields = check_fields(fields)
+            if float(rate_hz) <= 0:
+                return {"ok": False, "error": "rate_hz must be > 0"}
+            if int(buffer_frames) < 1:
+                return {"ok": False, "error": "buffer_frames must be >= 1"}
+            channels = meter_channels(self.song, tracks, returns, master)
+            if not channels:
+                return {"ok": False, "error": "No channels selected"}
+            job = self._jobs.add(
+                MeterSubscription(
+                    channels,
+                    fields,
+                    1.0 / float(rate_hz),
+                    int(buffer_frames),
+                    float(timeout or 0),
+                )
+            )
+            info = job.describe(job.started)
+            return {
+                "ok": True,
+                "subscription_id": job.job_id,
+                "channels": info["channels"],
+                "fields": info["fields"],
+                "rate_hz": info["rate_hz"],
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def read_meters(self, subscription_id, since=0, encoding="array"):
+        """Read buffered meter frames of a subscription.
+
+        See Also:
+            Wiki: docs/wiki/tools/read_meters.md
+
+        Args:
+            subscription_id: Id returned by subscribe_meters.
+            since: Return frames with seq >= since (pass the previous
+                response's "next" to get only new frames; default 0).
+            encoding: "array" (nested lists, default) or "base64" (one
+                little-endian float32 blob of count * width values).
+
+        Returns:
+            dict: {"ok", "subscription_id", "status", "channels", "fields",
+            "rate_hz", "next", "dropped", "frames"} where frames is
+            {"format", "count", "width", "seq", "time", "values"} and time is
+            seconds since the subscription started.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            job = self._meter_subscription(subscription_id)
+            now = self._jobs.clock()
+            frames = job.read(now, since, encoding)
+            info = job.describe(now)
+            info.pop("buffered")
+            return dict(
+                info,
+                ok=True,
+                subscription_id=job.job_id,
+                status=job.status,
+                frames=frames,
+            )
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def unsubscribe_meters(self, subscription_id=None):
+        """Stop a meter subscription (or all of them).
+
+        See Also:
+            Wiki: docs/wiki/tools/unsubscribe_meters.md
+
+        Args:
+            subscription_id: Id returned by subscribe_meters (default: every
+                running subscription).
+
+        Returns:
+            dict: {"ok", "stopped"} where stopped lists the ids stopped.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            if subscription_id is not None:
+                jobs = [self._meter_subscription(subscription_id)]
+            else:
+                jobs = self._jobs.running(MeterSubscription.kind)
+            stopped = [j.job_id for j in jobs if self._jobs.cancel(j.job_id)]
+            return {"ok": True, "stopped": stopped}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
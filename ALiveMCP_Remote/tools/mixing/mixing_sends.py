@@ -1,7 +1,8 @@
 """
 Send operations for Mixing.
 
-Single responsibility: operations for track sends.
+Single responsibility: operations for track sends, one at a time or as the
+whole tracks-by-returns matrix.
 """
 
 
@@ -68,3 +69,93 @@ class MixingSendsMixin:
             return {"ok": True, "track_index": track_index, "sends": sends, "count": len(sends)}
         except Exception as e:
             return {"ok": False, "error": str(e)}
+
+    # ========================================================================
+    # SEND MATRIX
+    # ========================================================================
+
+    def _send_rows(self, include_returns):
+        rows = [("track " + str(i), t) for i, t in enumerate(self.song.tracks)]
+        if include_returns:
+            rows += [("return " + str(i), t) for i, t in enumerate(self.song.return_tracks)]
+        return rows
+
+    def get_send_matrix(self, include_returns=False):
+        """Get the whole tracks-by-returns send grid in one call.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_send_matrix.md
+
+        Args:
+            include_returns: Also add a row per return track (returns can
+                send to other returns; default False).
+
+        Returns:
+            dict: {"ok", "rows", "row_names", "columns", "values"} where rows
+            labels each row ("track 0", ..., "return 0"), columns holds the
+            return track names and values[row][send] the send levels.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            rows = self._send_rows(include_returns)
+            return {
+                "ok": True,
+                "rows": [label for label, _ in rows],
+                "row_names": [str(track.name) for _, track in rows],
+                "columns": [str(r.name) for r in self.song.return_tracks],
+                "values": [[float(s.value) for s in track.mixer_device.sends] for _, track in rows],
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def set_send_matrix(self, values=None, updates=None, include_returns=False):
+        """Set many send levels at once from a dense grid and/or sparse updates.
+
+        See Also:
+            Wiki: docs/wiki/tools/set_send_matrix.md
+
+        Args:
+            values: Dense grid, values[row][send], in get_send_matrix row
+                order; null entries are left unchanged.
+            updates: Sparse updates as [row, send_index, value] triples,
+                applied after values.
+            include_returns: Rows after the tracks address return tracks
+                (default False).
+
+        Returns:
+            dict: {"ok", "written", "clamped"} counting the sends written and
+            the values clamped to the send range. Nothing is written unless
+            every entry is valid.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            rows = self._send_rows(include_returns)
+            writes = []
+            if values is not None:
+                if len(values) != len(rows):
+                    return {"ok": False, "error": "values must have " + str(len(rows)) + " rows"}
+                for row, levels in enumerate(values):
+                    writes.extend((row, send, v) for send, v in enumerate(levels) if v is not None)
+            for update in updates or []:
+                row, send, value = update
+                writes.append((int(row), int(send), value))
+
+            resolved = []
+            for row, send, value in writes:
+                if row < 0 or row >= len(rows):
+                    return {"ok": False, "error": "Invalid track index"}
+                sends = rows[row][1].mixer_device.sends
+                if send < 0 or send >= len(sends):
+                    return {"ok": False, "error": "Invalid send index"}
+                resolved.append((sends[send], float(value)))
+
+            clamped = 0
+            for param, value in resolved:
+                level = max(float(param.min), min(float(param.max), value))
+                clamped += level != value
+                param.value = level
+            return {"ok": True, "written": len(resolved), "clamped": clamped}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,214 @@
+"""
+Mixer snapshot capture, recall and morphing.
+
+Single responsibility: keep named mixer snapshots (see mixer_snapshots.py) in
+memory, optionally saved to and loaded from JSON files, and apply them either
+in one main-thread pass or gradually through a MixerMorph tick job. Starting
+a recall or morph stops any morph still running. Snapshots are matched to
+the current tracks by name (see align()), and every channel that moved or
+was skipped is reported. Files follow the rules of
+the SMF tools: relative paths resolve against the Live project folder and an
+existing file is only replaced with overwrite=True.
+"""
+
+import json
+import os
+
+from ..automation.envelope_shapes import ease
+from .mixer_snapshots import MixerMorph, align, apply, blend, capture, validate
+
+
+class MixingSnapshotsMixin:
+    # ========================================================================
+    # MIXER SNAPSHOTS
+    # ========================================================================
+
+    @property
+    def _mixer_snapshots(self):
+        snapshots = getattr(self, "_stored_mixer_snapshots", None)
+        if snapshots is None:
+            snapshots = self._stored_mixer_snapshots = {}
+        return snapshots
+
+    def _snapshot(self, name):
+        snapshot = self._mixer_snapshots.get(str(name))
+        if snapshot is None:
+            raise ValueError("Unknown snapshot: " + str(name))
+        return snapshot
+
+    def _snapshot_path(self, path):
+        """Absolute ``path``, resolving relative paths against the project folder."""
+        path = os.path.expanduser(str(path))
+        if os.path.isabs(path):
+            return path
+        folder = getattr(self.song, "project_root_folder", None)
+        if not folder:
+            raise ValueError(
+                "Relative paths need a saved Live project (project_root_folder); "
+                "pass an absolute path"
+            )
+        return os.path.join(str(folder), path)
+
+    def _morph_seconds(self, duration_beats, duration_ms):
+        if duration_beats is not None:
+            seconds = float(duration_beats) * 60.0 / float(self.song.tempo)
+        else:
+            seconds = float(duration_ms or 0) / 1000.0
+        if seconds < 0:
+            raise ValueError("Duration must be >= 0")
+        return seconds
+
+    def _start_morph(self, a, b, amount, seconds, curve, label):
+        """Stop running morphs, then apply the blend now or register a morph job."""
+        ease(curve, 0.0)  # rejects unknown curves up front
+        for running in self._jobs.running(MixerMorph.kind):
+            self._jobs.cancel(running.job_id)
+        if seconds <= 0:
+            return {"channels": apply(self.song, blend(a, b, amount)), "morph_id": None}
+        job = self._jobs.add(MixerMorph(self.song, a, b, amount, seconds, curve, label))
+        return {"channels": len(a["channels"]), "morph_id": job.job_id}
+
+    def capture_mixer_snapshot(self, name, path=None, overwrite=False):
+        """Capture volume, pan, sends, mute/solo and crossfader settings of the whole mix.
+
+        See Also:
+            Wiki: docs/wiki/tools/capture_mixer_snapshot.md
+
+        Args:
+            name: Name to store the snapshot under (replaces an existing one).
+            path: Optional JSON file to also write the snapshot to; relative
+                paths resolve against the Live project folder.
+            overwrite: Replace an existing file at path (default False).
+
+        Returns:
+            dict: {"ok", "name", "channels", "path", "snapshots"} where
+            channels is the number of channels captured and snapshots lists
+            every stored name.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            snapshot = capture(self.song)
+            if path is not None:
+                path = self._snapshot_path(path)
+                if os.path.exists(path) and not overwrite:
+                    return {"ok": False, "error": "File exists (pass overwrite=true): " + path}
+                folder = os.path.dirname(path)
+                if folder:
+                    os.makedirs(folder, exist_ok=True)
+                with open(path, "w") as f:
+                    json.dump(dict(snapshot, name=str(name)), f)
+            self._mixer_snapshots[str(name)] = snapshot
+            return {
+                "ok": True,
+                "name": str(name),
+                "channels": len(snapshot["channels"]),
+                "path": path,
+                "snapshots": sorted(self._mixer_snapshots),
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def recall_mixer_snapshot(
+        self, name=None, path=None, duration_beats=None, duration_ms=None, curve="linear"
+    ):
+        """Apply a stored (or saved) mixer snapshot, instantly or over a duration.
+
+        See Also:
+            Wiki: docs/wiki/tools/recall_mixer_snapshot.md
+
+        Args:
+            name: Name of a stored snapshot (with path: name to store the
+                loaded snapshot under; default the file's name).
+            path: JSON file written by capture_mixer_snapshot to load;
+                relative paths resolve against the Live project folder.
+            duration_beats: Morph from the current mix over this many beats.
+            duration_ms: Morph duration in milliseconds (when duration_beats
+                is not given). Without either, the snapshot is applied in a
+                single pass.
+            curve: "linear" (default), "exponential" or "s_curve".
+
+        Returns:
+            dict: {"ok", "name", "channels", "morph_id", "remapped"} where
+            morph_id is the tick job id of a timed recall, or None, and
+            remapped lists the snapshot channels not applied to the same
+            label and track name ({"channel", "name", "applied_to",
+            "current_name"}; applied_to is None when skipped). Channels are
+            matched by track name, falling back to position.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            if path is not None:
+                path = self._snapshot_path(path)
+                with open(path) as f:
+                    snapshot = json.load(f)
+                try:
+                    validate(snapshot)
+                except ValueError as e:
+                    return {"ok": False, "error": str(e) + " (" + path + ")"}
+                stored_name = snapshot.pop("name", None)
+                name = name or stored_name or os.path.basename(path)
+                self._mixer_snapshots[str(name)] = snapshot
+            elif name is None:
+                return {"ok": False, "error": "Pass name or path"}
+            target, remapped = align(self.song, self._snapshot(name))
+            seconds = self._morph_seconds(duration_beats, duration_ms)
+            started = self._start_morph(
+                capture(self.song), target, 1.0, seconds, curve, "current -> " + str(name)
+            )
+            return dict(started, ok=True, name=str(name), remapped=remapped)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def morph_mixer_snapshots(
+        self,
+        from_snapshot,
+        to_snapshot,
+        amount=1.0,
+        duration_beats=None,
+        duration_ms=None,
+        curve="linear",
+    ):
+        """Blend between two stored snapshots, instantly or animated over a duration.
+
+        See Also:
+            Wiki: docs/wiki/tools/morph_mixer_snapshots.md
+
+        Args:
+            from_snapshot: Name of the starting snapshot.
+            to_snapshot: Name of the target snapshot.
+            amount: Blend position 0.0 (from) to 1.0 (to) (default 1.0).
+                Without a duration the mix is set to this blend at once; with
+                one it moves from from_snapshot to this blend.
+            duration_beats: Morph length in beats at the current tempo.
+            duration_ms: Morph length in milliseconds (when duration_beats is
+                not given).
+            curve: "linear" (default), "exponential" or "s_curve".
+
+        Returns:
+            dict: {"ok", "from", "to", "amount", "channels", "morph_id",
+            "remapped"} where remapped lists, per snapshot name, the
+            channels not applied to the same label and track name (see
+            recall_mixer_snapshot).
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            amount = float(amount)
+            if amount < 0.0 or amount > 1.0:
+                return {"ok": False, "error": "amount must be between 0.0 and 1.0"}
+            a, remapped_a = align(self.song, self._snapshot(from_snapshot))
+            b, remapped_b = align(self.song, self._snapshot(to_snapshot))
+            seconds = self._morph_seconds(duration_beats, duration_ms)
+            started = self._start_morph(
+                a, b, amount, seconds, curve, str(from_snapshot) + " -> " + str(to_snapshot)
+            )
+            return dict(
+                started,
+                ok=True,
+                remapped={str(from_snapshot): remapped_a, str(to_snapshot): remapped_b},
+                **{"from": str(from_snapshot), "to": str(to_snapshot), "amount": amount},
+            )
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
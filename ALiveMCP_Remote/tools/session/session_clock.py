@@ -0,0 +1,53 @@
+"""
+Clock synchronization with clients.
+
+Single responsibility: return the Remote Script's monotonic clock together
+with the transport state (song position, tempo, play state) read in the same
+main-thread instant, so a client can align its own clock and extrapolate the
+song position locally (see SongClock in ableton_client.py) instead of polling
+get_current_time.
+"""
+
+import time
+
+
+class SessionClockMixin:
+    # ========================================================================
+    # CLOCK SYNC
+    # ========================================================================
+
+    def clock_sync(self, client_time=None):
+        """Get the Remote's monotonic time and the transport state in one reading.
+
+        See Also:
+            Wiki: docs/wiki/tools/clock_sync.md
+
+        Args:
+            client_time: Optional client timestamp, echoed back unchanged so
+                the client can match responses to requests.
+
+        Returns:
+            dict: {"ok", "remote_time", "current_song_time", "tempo",
+            "is_playing", "signature_numerator", "signature_denominator",
+            "client_time"} where remote_time is time.perf_counter() in
+            seconds, read right after the song fields.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            song = self.song
+            song_time = float(song.current_song_time)
+            tempo = float(song.tempo)
+            remote_time = time.perf_counter()
+            return {
+                "ok": True,
+                "remote_time": remote_time,
+                "current_song_time": song_time,
+                "tempo": tempo,
+                "is_playing": bool(song.is_playing),
+                "signature_numerator": int(song.signature_numerator),
+                "signature_denominator": int(song.signature_denominator),
+                "client_time": client_time,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
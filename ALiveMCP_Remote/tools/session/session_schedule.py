@@ -0,0 +1,203 @@
+"""
+Beat-quantized command scheduling tools.
+
+Single responsibility: accept a command (or a batch of commands) plus a
+musical time and run it on the Remote side on the first tick at or after that
+song position, so changes land on the downbeat regardless of network latency.
+The heap and quantization grid live in tools/core/scheduler.py.
+"""
+
+from ...constants import MAX_FINISHED_TASKS
+from ..core.scheduler import CommandScheduler, grid_beats, next_boundary, quantization_name
+from ..core.tick_jobs import RUNNING
+
+
+class SessionScheduleMixin:
+    # ========================================================================
+    # SCHEDULED COMMANDS
+    # ========================================================================
+
+    @property
+    def _schedule(self):
+        entries = getattr(self, "_scheduled_commands", None)
+        if entries is None:
+            entries = self._scheduled_commands = {}
+        return entries
+
+    def _call_tool(self, command):
+        """Run one scheduled command through the shared dispatcher (aliases, profiling)."""
+        try:
+            response = self._dispatch_command(command)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+        if isinstance(response, dict):
+            response.pop("available_actions", None)
+        return response
+
+    def _fire_scheduled(self, entry, position):
+        entry["status"] = "fired"
+        entry["fired_at"] = position
+        entry["results"] = [self._call_tool(command) for command in entry["commands"]]
+        self._prune_schedule()
+
+    def _prune_schedule(self):
+        finished = [k for k, e in self._schedule.items() if e["status"] != "pending"]
+        for key in finished[: max(0, len(finished) - MAX_FINISHED_TASKS)]:
+            del self._schedule[key]
+
+    def _scheduler_job(self):
+        job = getattr(self, "_command_scheduler", None)
+        if job is None or job.status != RUNNING:
+            job = self._command_scheduler = self._jobs.add(
+                CommandScheduler(self.song, self._fire_scheduled)
+            )
+        return job
+
+    @staticmethod
+    def _entry_info(entry):
+        info = {k: v for k, v in entry.items() if k != "commands"}
+        info["actions"] = [c.get("action") for c in entry["commands"]]
+        return info
+
+    def schedule(self, command=None, commands=None, beat=None, quantize="global", count=1):
+        """Run a command or batch on the first tick at or after a song position.
+
+        See Also:
+            Wiki: docs/wiki/tools/schedule.md
+
+        Args:
+            command: One command dict, e.g. {"action": "set_tempo", "bpm": 128}.
+            commands: A list of command dicts run in order in the same tick
+                (instead of command).
+            beat: Absolute song position in beats. When omitted the position
+                is the next quantize grid line after the current song time.
+            quantize: "global" (Live's launch quantization, default), "none",
+                "8 bars", "4 bars", "2 bars", "1 bar" (or "bar"), "1/2",
+                "1/2t", "1/4" (or "beat"), "1/4t", "1/8", "1/8t", "1/16",
+                "1/16t" or "1/32".
+            count: Number of grid lines ahead (default 1; quantize="bar",
+                count=4 means "in 4 bars").
+
+        Returns:
+            dict: {"ok", "schedule_id", "beat", "current_song_time",
+            "quantize", "actions"}.
+
+        Raises:
+            None: errors are returned as {"ok": False, "error": ...}."""
+        try:
+            batch = list(commands) if commands is not None else [command]
+            if not batch or batch == [None]:
+                return {"ok": False, "error": "Pass command or commands"}
+            for item in batch:
+                if (
+                    not isinstance(item, dict)
+                    or getattr(self, item.get("action", ""), None) is None
+                ):
+                    action = item.get("action") if isinstance(item, dict) else item
+                    return {"ok": False, "error": "Unknown action: " + str(action)}
+            if int(count) < 1:
+                return {"ok": False, "error": "count must be >= 1"}
+
+            position = float(self.song.current_song_time)
+            name = None
+            if beat is not None:
+                target = float(beat)
+            else:
+                name = quantization_name(self.song, quantize)
+                target = next_boundary(position, grid_beats(self.song, name), int(count))
+
+            self._schedule_counter = getattr(self, "_schedule_counter", 0) + 1
+            entry = {
+                "schedule_id": "schedule-" + str(self._schedule_counter),
+                "status": "pending",
+                "beat": target,
+                "quantize": name,
+                "commands": batch,
+                "fired_at": None,
+                "results": None,
+            }
+            self._schedule[entry["schedule_id"]] = entry
+            self._scheduler_job().push(entry)
+            return {
+                "ok": True,
+                "schedule_id": entry["schedule_id"],
+                "beat": target,
+                "current_song_time": position,
+                "quantize": name,
+                "actions": [c["action"] for c in batch],
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def get_scheduled(self, schedule_id=None):
+        """Get one scheduled command batch, or all pending and recently fired ones.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_scheduled.md
+
+        Args:
+            schedule_id: Id returned by schedule (default: all entries).
+
+        Returns:
+            dict: With schedule_id: {"ok", "schedule_id", "status", "beat",
+            "quantize", "actions", "fired_at", "results"} where status is
+            "pending", "fired" or "cancelled" and results holds each
+            command's response once fired. Without: {"ok", "count",
+            "pending", "scheduled"}.
+
+        Raises:
+            None: unknown schedule ids are returned as {"ok": False, "error": ...}."""
+        try:
+            if schedule_id is not None:
+                entry = self._schedule.get(str(schedule_id))
+                if entry is None:
+                    return {"ok": False, "error": "Unknown schedule_id: " + str(schedule_id)}
+                return dict(self._entry_info(entry), ok=True)
+            entries = [self._entry_info(e) for e in self._schedule.values()]
+            return {
+                "ok": True,
+                "count": len(entries),
+                "pending": sum(1 for e in entries if e["status"] == "pending"),
+                "scheduled": entries,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def cancel_scheduled(self, schedule_id=None):
+        """Cancel a pending scheduled command batch (or all pending ones).
+
+        See Also:
+            Wiki: docs/wiki/tools/cancel_scheduled.md
+
+        Args:
+            schedule_id: Id returned by schedule (default: every pending entry).
+
+        Returns:
+            dict: {"ok", "cancelled"} where cancelled lists the ids stopped.
+
+        Raises:
+            None: unknown schedule ids are returned as {"ok": False, "error": ...}."""
+        try:
+            if schedule_id is not None:
+                entry = self._schedule.get(str(schedule_id))
+                if entry is None:
+                    return {"ok": False, "error": "Unknown schedule_id: " + str(schedule_id)}
+                entries = [entry]
+            else:
+                entries = list(self._schedule.values())
+            cancelled = []
+            for entry in entries:
+                if entry["status"] == "pending":
+                    entry["status"] = "cancelled"
+                    cancelled.append(entry["schedule_id"])
+            # Drop cancelled entries from the heap now so they do not keep the
+            # scheduler job alive until the song position passes them.
+            job = getattr(self, "_command_scheduler", None)
+            if cancelled and job is not None and job.status == RUNNING:
+                job.discard(set(cancelled))
+                if not job.heap:
+                    self._jobs.cancel(job.job_id)
+            self._prune_schedule()
+            return {"ok": True, "cancelled": cancelled}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,104 @@
+"""
+Whole-song snapshot mixin.
+
+Single responsibility: walk the Live Object Model once and return a projected
+view of the song (tracks, return tracks, master track, scenes, devices, clip
+slots, parameters) containing only the requested fields. The walk yields after
+each track/scene so large sets can run as a time-sliced background task.
+"""
+
+from ..core.lom_fields import SONG_CHILDREN, SONG_FIELDS
+from ..core.projection import check_fields, parse_fields, project, project_items, selects, subtree
+
+# Nesting depth used when neither fields nor depth are given:
+# song scalars plus the scalar fields of tracks, returns, master and scenes.
+DEFAULT_SNAPSHOT_DEPTH = 1
+
+
+class SessionSnapshotMixin:
+    def get_song_snapshot(self, fields=None, depth=None, background=False):
+        """Get a projected snapshot of the whole song in a single call.
+
+        Replaces chains of get_session_info / get_track_info /
+        get_track_devices / get_scene_info calls with one LOM walk.
+
+        See Also:
+            Wiki: docs/wiki/tools/get_song_snapshot.md
+
+        Args:
+            fields: Dotted field paths relative to the song, as a list or a
+                comma-separated string (e.g. "tempo,tracks.name,
+                tracks.devices.class_name"). Omit to select every field.
+            depth: Maximum nesting depth (0 = song scalars, 1 = tracks/scenes,
+                2 = devices/clip slots, 3 = parameters). Defaults to 1 when
+                fields is omitted, otherwise unlimited.
+            background: When true, walk the song across update_display ticks
+                and return {"ok", "task_id"} immediately; poll get_task_status
+                for progress, per-item partial results and the final result.
+
+        Returns:
+            dict: {"ok": True, "depth", "song": {...}} where collections are
+            lists of dicts carrying their "index".
+
+        Raises:
+            None: errors (including unknown field names) are returned as
+            {"ok": False, "error": ...}."""
+        try:
+            tree = parse_fields(fields)
+            if depth is None and tree is None:
+                depth = DEFAULT_SNAPSHOT_DEPTH
+            if depth is not None:
+                depth = int(depth)
+                if depth < 0:
+                    return {"ok": False, "error": "depth must be >= 0"}
+
+            check_fields(tree, list(SONG_FIELDS) + list(SONG_CHILDREN), "song")
+            return self._run_task(
+                "get_song_snapshot", self._snapshot_steps(tree, depth), background
+            )
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def _snapshot_steps(self, tree, depth):
+        """Task generator: project the song one track/scene at a time."""
+        song = project(self.song, tree, SONG_FIELDS, SONG_CHILDREN, 0, "song")
+        if depth is not None and depth <= 0:
+            return {"ok": True, "depth": depth, "song": song}
+
+        next_depth = None if depth is None else depth - 1
+        collections = []
+        for key, nested in SONG_CHILDREN.items():
+            if not selects(tree, key):
+                continue
+            try:
+                items = list(nested.items(self.song)) if nested.many else [nested.items(self.song)]
+            except Exception:
+                song[key] = None
+                continue
+            collections.append((key, nested, items))
+            song[key] = [] if nested.many else None
+
+        total = sum(len(items) for _, _, items in collections)
+        done = 0
+        for key, nested, items in collections:
+            child_tree = subtree(tree, key)
+            for i, item in enumerate(items):
+                if nested.many:
+                    entry = project_items(
+                        [item], child_tree, nested.fields, nested.children, next_depth, key, start=i
+                    )[0]
+                    song[key].append(entry)
+                else:
+                    entry = project(
+                        item, child_tree, nested.fields, nested.children, next_depth, key
+                    )
+                    song[key] = entry
+                done += 1
+                yield {
+                    "done": done,
+                    "total": total,
+                    "collection": key,
+                    "partial": [dict(entry, collection=key)],
+                }
+
+        return {"ok": True, "depth": depth, "song": song}
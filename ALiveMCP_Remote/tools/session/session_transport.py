@@ -7,8 +7,11 @@ and tests that expect a single aggregated mixin.
 """
 
 from .session_automation import SessionAutomationMixin
+from .session_clock import SessionClockMixin
 from .session_metronome import SessionMetronomeMixin
 from .session_playback import SessionPlaybackMixin
+from .session_schedule import SessionScheduleMixin
+from .session_snapshot import SessionSnapshotMixin
 from .session_tempo import SessionTempoMixin
 
 
@@ -17,6 +20,9 @@ class SessionTransportMixin(
     SessionMetronomeMixin,
     SessionTempoMixin,
     SessionAutomationMixin,
+    SessionSnapshotMixin,
+    SessionScheduleMixin,
+    SessionClockMixin,
 ):
     """Aggregated session transport mixin for backwards compatibility.
 
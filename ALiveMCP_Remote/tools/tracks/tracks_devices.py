@@ -3,13 +3,18 @@ Track device parameter tools with enriched parameter data (display values, items
 Provides get and set operations matching master-channel enrichment level.
 """
 
+from ..core.lom_fields import DEVICE_CHILDREN, DEVICE_FIELDS, PARAMETER_FIELDS
+from ..core.pagination import paginate
+from ..core.param_targets import resolve_value
+from ..core.projection import parse_fields, project_items
+
 
 class TracksDevicesMixin:
     # ========================================================================
     # TRACK DEVICE PARAMETERS — ENRICHED
     # ========================================================================
 
-    def get_track_device_params(self, track_index, device_index):
+    def get_track_device_params(self, track_index, device_index, fields=None):
         """Get all enriched parameter info for a device on any track.
 
         Returns name, raw_value, display_value, min, max, is_quantized, value_items
@@ -19,14 +24,20 @@ class TracksDevicesMixin:
             Wiki: docs/wiki/tools/get_track_device_params.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the track in song.tracks.
+            device_index: Index of the device on that track.
+            fields: Optional parameter fields to return (list or comma-separated
+                string, e.g. ["name", "raw_value"]). Unselected fields are not
+                read from Live. "index" is always included.
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "track_index", "device_name", "count", "parameters"}.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors (including unknown field names) are returned as
+            {"ok": False, "error": ...}."""
         try:
+            tree = parse_fields(fields)
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
 
@@ -35,27 +46,9 @@ class TracksDevicesMixin:
                 return {"ok": False, "error": "Invalid device index"}
 
             device = track.devices[device_index]
-            params_info = []
-            for i, param in enumerate(device.parameters):
-                display_value = (
-                    str(param.display_value)
-                    if hasattr(param, "display_value")
-                    else str(param.value)
-                )
-                is_quantized = bool(param.is_quantized) if hasattr(param, "is_quantized") else False
-                value_items = [str(v) for v in param.value_items] if is_quantized else []
-                params_info.append(
-                    {
-                        "index": i,
-                        "name": str(param.name),
-                        "raw_value": float(param.value),
-                        "display_value": display_value,
-                        "min": float(param.min),
-                        "max": float(param.max),
-                        "is_quantized": is_quantized,
-                        "value_items": value_items,
-                    }
-                )
+            params_info = project_items(
+                device.parameters, tree, PARAMETER_FIELDS, where="parameter", strict=True
+            )
 
             return {
                 "ok": True,
@@ -141,27 +134,7 @@ class TracksDevicesMixin:
                 if str(param.name) != param_name:
                     continue
 
-                if isinstance(value, str):
-                    is_quantized = (
-                        bool(param.is_quantized) if hasattr(param, "is_quantized") else False
-                    )
-                    value_items = [str(v) for v in param.value_items] if is_quantized else []
-                    if not value_items:
-                        return {
-                            "ok": False,
-                            "error": "Parameter has no value_items for string lookup",
-                        }
-                    try:
-                        idx = value_items.index(value)
-                    except ValueError:
-                        return {
-                            "ok": False,
-                            "error": "'" + value + "' not in value_items: " + str(value_items),
-                        }
-                    param.value = float(idx)
-                else:
-                    clamped = max(float(param.min), min(float(param.max), float(value)))
-                    param.value = clamped
+                param.value = resolve_value(param, value)
 
                 try:
                     display_value = str(param.str_for_value(param.value))
@@ -180,7 +153,7 @@ class TracksDevicesMixin:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    def get_track_chain_summary(self, track_index):
+    def get_track_chain_summary(self, track_index, fields=None, limit=None, cursor=None):
         """Get all devices on any track with full enriched parameter lists.
 
         Lets the AI read the entire device chain in one round trip, which is
@@ -191,61 +164,47 @@ class TracksDevicesMixin:
             Wiki: docs/wiki/tools/get_track_chain_summary.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the track in song.tracks.
+            fields: Optional device fields to return, dotted for parameters
+                (e.g. ["class_name", "parameters.name"]). Omitting
+                "parameters" skips the parameter walk entirely.
+            limit: Optional maximum number of devices per page.
+            cursor: next_cursor from the previous page.
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "track_index", "track_name", "count", "devices"}, plus
+            "total" and "next_cursor" when limit or cursor is given.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors (including unknown field names) are returned as
+            {"ok": False, "error": ...}."""
         try:
+            tree = parse_fields(fields)
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
 
             track = self.song.tracks[track_index]
-            devices = []
-
-            for d_idx, device in enumerate(track.devices):
-                params_info = []
-                for i, param in enumerate(device.parameters):
-                    display_value = (
-                        str(param.display_value)
-                        if hasattr(param, "display_value")
-                        else str(param.value)
-                    )
-                    is_quantized = (
-                        bool(param.is_quantized) if hasattr(param, "is_quantized") else False
-                    )
-                    value_items = [str(v) for v in param.value_items] if is_quantized else []
-                    params_info.append(
-                        {
-                            "index": i,
-                            "name": str(param.name),
-                            "raw_value": float(param.value),
-                            "display_value": display_value,
-                            "min": float(param.min),
-                            "max": float(param.max),
-                            "is_quantized": is_quantized,
-                            "value_items": value_items,
-                        }
-                    )
-
-                devices.append(
-                    {
-                        "index": d_idx,
-                        "name": str(device.name),
-                        "class_name": str(device.class_name),
-                        "is_active": device.is_active,
-                        "parameters": params_info,
-                    }
-                )
-
-            return {
+            page, start, page_info = paginate(
+                track.devices, limit, cursor, key=lambda d: (str(d.name), str(d.class_name))
+            )
+            devices = project_items(
+                page,
+                tree,
+                DEVICE_FIELDS,
+                DEVICE_CHILDREN,
+                where="device",
+                strict=True,
+                start=start,
+            )
+
+            result = {
                 "ok": True,
                 "track_index": track_index,
                 "track_name": str(track.name),
                 "count": len(devices),
                 "devices": devices,
             }
+            result.update(page_info)
+            return result
         except Exception as e:
             return {"ok": False, "error": str(e)}
@@ -2,47 +2,43 @@
 Track information helpers: get info, lookup index by name, get color.
 """
 
+from ..core.lom_fields import TRACK_INFO_FIELDS
+from ..core.projection import parse_fields, project
+
 
 class TracksInfoMixin:
     # ========================================================================
     # TRACK INFO
     # ========================================================================
 
-    def get_track_info(self, track_index):
+    def get_track_info(self, track_index, fields=None):
         """Get detailed track information
 
         See Also:
             Wiki: docs/wiki/tools/get_track_info.md
 
         Args:
-            TODO: describe parameters.
+            track_index: Index of the track in song.tracks.
+            fields: Optional track fields to return (e.g. ["name", "volume"]).
+                "ok" and "track_index" are always included.
 
         Returns:
-            TODO: describe return value.
+            dict: {"ok", "track_index", "name", "color", "is_foldable", "mute",
+            "solo", "arm", "has_midi_input", "has_audio_input", "volume", "pan",
+            "num_devices", "num_clips"}, limited to the selected fields.
 
         Raises:
-            TODO: exceptions raised."""
+            None: errors (including unknown field names) are returned as
+            {"ok": False, "error": ...}."""
         try:
+            tree = parse_fields(fields)
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
 
             track = self.song.tracks[track_index]
-            return {
-                "ok": True,
-                "track_index": track_index,
-                "name": str(track.name),
-                "color": track.color if hasattr(track, "color") else None,
-                "is_foldable": track.is_foldable,
-                "mute": track.mute,
-                "solo": track.solo,
-                "arm": track.arm if track.can_be_armed else False,
-                "has_midi_input": track.has_midi_input,
-                "has_audio_input": track.has_audio_input,
-                "volume": float(track.mixer_device.volume.value),
-                "pan": float(track.mixer_device.panning.value),
-                "num_devices": len(track.devices),
-                "num_clips": len([cs for cs in track.clip_slots if cs.has_clip]),
-            }
+            result = {"ok": True, "track_index": track_index}
+            result.update(project(track, tree, TRACK_INFO_FIELDS, where="track", strict=True))
+            return result
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
@@ -3,12 +3,24 @@ Ableton Live TCP client.
 
 Single responsibility: low-level TCP socket communication with the ALiveMCP
 Remote Script. Exposes a single callable `_call_ableton(action, params)`
-and the connection constants HOST / PORT.
+and the connection constants HOST / PORT, plus `decode_note_columns()` for
+columnar note payloads (get_clip_notes / get_notes_extended with
+encoding="columnar" or "columnar_base64") and `SongClock`, which syncs with
+the Remote's clock_sync tool and extrapolates the song position locally.
 """
 
+import base64
 import json
 import os
 import socket
+import sys
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
 
 # Host and port for the ALiveMCP Remote Script. Allow override via environment for tests.
 HOST = os.environ.get("ALIVEMCP_HOST", "127.0.0.1")
@@ -40,3 +52,109 @@ def _call_ableton(action: str, params: dict) -> dict:
         }
     except Exception as e:
         return {"ok": False, "error": str(e)}
+
+
+def decode_note_columns(payload: dict, use_numpy: bool | None = None) -> dict:
+    """Decode a columnar note payload into {column: array}.
+
+    Returns NumPy arrays when NumPy is installed (or ``use_numpy`` is True),
+    otherwise plain lists. Accepts the "notes" value of a columnar response
+    or the whole response dict.
+    """
+    if "notes" in payload and isinstance(payload["notes"], dict):
+        payload = payload["notes"]
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy and np is None:
+        raise ImportError("numpy is not installed")
+
+    fmt = payload.get("format")
+    columns = payload.get("columns") or {}
+    decoded = {}
+    for name, data in columns.items():
+        if fmt == "columnar_base64":
+            typecode = payload.get("dtypes", {}).get(name, "f")
+            raw = base64.b64decode(data)
+            if use_numpy:
+                decoded[name] = np.frombuffer(raw, dtype=np.dtype(typecode).newbyteorder("<"))
+                continue
+            values = array(typecode)
+            values.frombytes(raw)
+            if sys.byteorder != "little":
+                values.byteswap()
+            data = values.tolist()
+        elif fmt != "columnar":
+            raise ValueError(f"Unknown notes format: {fmt}")
+        decoded[name] = np.asarray(data) if use_numpy else list(data)
+    return decoded
+
+
+class SongClock:
+    """Local estimate of the song position, kept in step with clock_sync.
+
+    sync() performs a few clock_sync round trips and keeps the one with the
+    shortest round-trip time, assuming the Remote read its clock halfway
+    through it (error at most half that round trip). Between syncs the song
+    position is extrapolated from the tempo, so dashboards and agents can show
+    or aim at beat positions without polling get_current_time. Re-sync after
+    changing tempo or transport state, or when ``age()`` grows large.
+    """
+
+    def __init__(self, call=None, clock=time.monotonic):
+        self._call = call or _call_ableton
+        self._clock = clock
+        self.state: dict | None = None
+        self.synced_at: float | None = None
+        self.round_trip: float | None = None
+        self.offset: float | None = None
+
+    def sync(self, samples: int = 5) -> dict:
+        """Run ``samples`` clock_sync exchanges and keep the tightest one."""
+        best = None
+        for _ in range(max(1, samples)):
+            sent = self._clock()
+            response = self._call("clock_sync", {"client_time": sent})
+            received = self._clock()
+            if not response.get("ok"):
+                return response
+            if best is None or received - sent < best[0]:
+                best = (received - sent, (sent + received) / 2.0, response)
+        self.round_trip, self.synced_at, self.state = best
+        self.offset = self.state["remote_time"] - self.synced_at
+        return {
+            "ok": True,
+            "round_trip_ms": round(self.round_trip * 1000.0, 3),
+            "offset": self.offset,
+            "current_song_time": self.state["current_song_time"],
+            "tempo": self.state["tempo"],
+            "is_playing": self.state["is_playing"],
+        }
+
+    def _require_sync(self) -> dict:
+        if self.state is None:
+            raise RuntimeError("SongClock.sync() has not been called")
+        return self.state
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the last sync."""
+        self._require_sync()
+        return (self._clock() if now is None else now) - self.synced_at
+
+    def song_time(self, now: float | None = None) -> float:
+        """Estimated song position in beats at local time ``now`` (default: now)."""
+        state = self._require_sync()
+        if not state["is_playing"]:
+            return state["current_song_time"]
+        return state["current_song_time"] + self.age(now) * state["tempo"] / 60.0
+
+    def seconds_until(self, beat: float, now: float | None = None) -> float | None:
+        """Local seconds until the playhead reaches ``beat``; None while stopped."""
+        state = self._require_sync()
+        if not state["is_playing"]:
+            return None
+        return (float(beat) - self.song_time(now)) * 60.0 / state["tempo"]
+
+    def remote_time(self, now: float | None = None) -> float:
+        """The Remote's perf_counter() value corresponding to local time ``now``."""
+        self._require_sync()
+        return (self._clock() if now is None else now) + self.offset
@@ -5,16 +5,17 @@ Verify that docs/wiki tool pages match the AVAILABLE_TOOLS registry.
 Exit code 0 on success (no missing/extra). Exit code 1 if mismatches found.
 """
 
-import importlib.util
 import os
 import sys
 
 
 def load_registry(path):
-    spec = importlib.util.spec_from_file_location("registry", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return getattr(mod, "AVAILABLE_TOOLS", [])
+    # registry.py joins per-domain lists with relative imports, so it is read
+    # statically rather than executed as a standalone module.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from scripts.registry_lib import load_registry_tools
+
+    return load_registry_tools(path)
 
 
 def gather_md_files(docs_root):
@@ -42,6 +43,13 @@ def main():
 
     tools = set(load_registry(registry_path))
     md_map = gather_md_files(docs_root)
+    # docs/wiki/tools/server documents MCP-server-side tools (server_tools/),
+    # which never appear in AVAILABLE_TOOLS.
+    md_map = {
+        name: [p for p in paths if not p.startswith("server" + os.sep)]
+        for name, paths in md_map.items()
+    }
+    md_map = {name: paths for name, paths in md_map.items() if paths}
     md_names = set(md_map.keys())
 
     missing = sorted([t for t in tools if t not in md_names])
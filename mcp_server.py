@@ -11,6 +11,7 @@ Ableton Live must be running with the ALiveMCP Remote Script loaded.
 """
 
 import asyncio
+import functools
 import json
 
 import mcp.server.stdio
@@ -20,6 +21,7 @@ from mcp.server.models import InitializationOptions
 
 from ableton_client import _call_ableton
 from mcp_server_tool_defs import TOOL_DEFS
+from server_tools import LOCAL_TOOL_DEFS, LOCAL_TOOLS, call_local_tool
 
 server = Server("alivemcp")
 
@@ -28,15 +30,18 @@ server = Server("alivemcp")
 async def list_tools() -> list[types.Tool]:
     return [
         types.Tool(name=name, description=desc, inputSchema=schema)
-        for name, desc, schema in TOOL_DEFS
+        for name, desc, schema in TOOL_DEFS + LOCAL_TOOL_DEFS
     ]
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
-    result = await asyncio.get_event_loop().run_in_executor(
-        None, _call_ableton, name, arguments or {}
-    )
+    if name in LOCAL_TOOLS:
+        # Server-side tools compose Remote Script commands via _call_ableton.
+        run = functools.partial(call_local_tool, name, arguments or {}, _call_ableton)
+    else:
+        run = functools.partial(_call_ableton, name, arguments or {})
+    result = await asyncio.get_event_loop().run_in_executor(None, run)
     return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
 
 
@@ -7,22 +7,14 @@ import os
 import sys
 from pathlib import Path
 
+from .registry_lib import load_registry_tools
+
 
 def load_available_tools(registry_path):
     try:
-        src = open(registry_path, encoding="utf-8").read()
+        return load_registry_tools(registry_path)
     except Exception:
         return []
-    tree = ast.parse(src, registry_path)
-    for node in tree.body:
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == "AVAILABLE_TOOLS":
-                    try:
-                        return ast.literal_eval(node.value)
-                    except Exception:
-                        pass
-    return []
 
 
 def collect_docstrings(tools_root):
@@ -156,28 +148,7 @@ def fix_missing_sections(missing_map, files_by_symbol):
 
 # Additional helpers used by alternative docstring-checker variants
 def extract_available_tools(registry_path: Path):
-    src = registry_path.read_text(encoding="utf-8")
-    tree = ast.parse(src)
-    for node in tree.body:
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if getattr(target, "id", None) == "AVAILABLE_TOOLS":
-                    val = node.value
-                    if isinstance(val, (ast.List, ast.Tuple)):
-                        items = []
-                        StrType = getattr(ast, "Str", None)
-                        ConstType = getattr(ast, "Constant", None)
-                        for elt in val.elts:
-                            if (
-                                ConstType is not None
-                                and isinstance(elt, ConstType)
-                                and isinstance(elt.value, str)
-                            ):
-                                items.append(elt.value)
-                            elif StrType is not None and isinstance(elt, StrType):
-                                items.append(elt.s)
-                        return items
-    raise RuntimeError(f"AVAILABLE_TOOLS not found in {registry_path}")
+    return load_registry_tools(registry_path)
 
 
 def slugify(name: str) -> str:
@@ -22,17 +22,13 @@ from collections import OrderedDict
 def load_available_tools(registry_path):
     if not os.path.exists(registry_path):
         return []
-    src = open(registry_path, encoding="utf-8").read()
-    tree = ast.parse(src, registry_path)
-    for node in tree.body:
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == "AVAILABLE_TOOLS":
-                    try:
-                        return ast.literal_eval(node.value)
-                    except Exception:
-                        pass
-    return []
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from scripts.registry_lib import load_registry_tools
+
+    try:
+        return load_registry_tools(registry_path)
+    except Exception:
+        return []
 
 
 def collect_code_tools(tools_root):
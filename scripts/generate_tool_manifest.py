@@ -6,7 +6,6 @@ Usage: python3 scripts/generate_tool_manifest.py
 This script is idempotent and safe to run as part of CI or locally.
 """
 
-import ast
 import json
 import os
 import re
@@ -20,29 +19,10 @@ OUT_PATH = os.path.join(BASE, "docs", "tool_manifest.json")
 
 
 def parse_registry(path):
-    src = open(path, encoding="utf-8").read()
-    module = ast.parse(src, filename=path)
-    for node in module.body:
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == "AVAILABLE_TOOLS":
-                    try:
-                        tools = ast.literal_eval(node.value)
-                        return list(tools)
-                    except Exception:
-                        # Fallback: try to evaluate the right-hand side safely
-                        try:
-                            # Extract slice from first [ to the matching ]
-                            start = src.find("AVAILABLE_TOOLS")
-                            eq = src.find("=", start)
-                            list_src = src[eq + 1 :]
-                            # Very small, controlled eval in empty namespace
-                            ns = {}
-                            exec("AVAILABLE_TOOLS = " + list_src, {}, ns)
-                            return list(ns["AVAILABLE_TOOLS"])
-                        except Exception as e:
-                            raise RuntimeError("Failed to parse AVAILABLE_TOOLS: " + str(e))
-    raise RuntimeError("AVAILABLE_TOOLS not found in " + path)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from scripts.registry_lib import load_registry_tools
+
+    return load_registry_tools(path)
 
 
 def parse_mcp_defs(path):
@@ -12,7 +12,6 @@ By default the script runs in dry-run mode and prints actions. Use `--write`
 to actually create files under `docs/wiki/`.
 """
 
-import ast
 import json
 import sys
 from datetime import date
@@ -25,26 +24,10 @@ OUT_DIR = ROOT / "docs" / "wiki"
 
 
 def extract_available_tools(registry_path: Path):
-    src = registry_path.read_text(encoding="utf-8")
-    tree = ast.parse(src)
-    for node in tree.body:
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if getattr(target, "id", None) == "AVAILABLE_TOOLS":
-                    val = node.value
-                    if isinstance(val, (ast.List, ast.Tuple)):
-                        items = []
-                        for elt in val.elts:
-                            if isinstance(elt, ast.Str):
-                                items.append(elt.s)
-                            elif (
-                                hasattr(ast, "Constant")
-                                and isinstance(elt, ast.Constant)
-                                and isinstance(elt.value, str)
-                            ):
-                                items.append(elt.value)
-                        return items
-    raise RuntimeError(f"AVAILABLE_TOOLS variable not found in {registry_path}")
+    sys.path.insert(0, str(ROOT))
+    from scripts.registry_lib import load_registry_tools
+
+    return load_registry_tools(registry_path)
 
 
 def load_tool_defs(path: Path):
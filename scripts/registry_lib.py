@@ -0,0 +1,67 @@
+"""
+Static reader for AVAILABLE_TOOLS shared by the docs/validation scripts.
+
+registry.py joins per-domain lists imported from sibling registry_<domain>.py
+modules. The scripts read it with ast instead of importing the Remote Script
+package (which needs Live), so names and ``+`` concatenations are resolved
+here by parsing the sibling modules.
+"""
+
+import ast
+import os
+
+
+def _module_tree(path):
+    with open(path, encoding="utf-8") as f:
+        return ast.parse(f.read(), path)
+
+
+def _assignments(tree):
+    found = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    found[target.id] = node.value
+    return found
+
+
+def _relative_imports(tree, directory):
+    found = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module:
+            path = os.path.join(directory, node.module.replace(".", os.sep) + ".py")
+            for alias in node.names:
+                found[alias.asname or alias.name] = (path, alias.name)
+    return found
+
+
+def _resolve_name(path, name):
+    tree = _module_tree(path)
+    assignments = _assignments(tree)
+    if name in assignments:
+        return _evaluate(assignments[name], path)
+    imported = _relative_imports(tree, os.path.dirname(path))
+    if name in imported:
+        return _resolve_name(*imported[name])
+    raise RuntimeError(f"{name} not found in {path}")
+
+
+def _evaluate(node, path):
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return list(ast.literal_eval(node))
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _evaluate(node.left, path) + _evaluate(node.right, path)
+    if isinstance(node, ast.Name):
+        return _resolve_name(path, node.id)
+    raise RuntimeError(f"Unsupported registry expression in {path}: {ast.dump(node)}")
+
+
+def load_registry_tools(registry_path):
+    """Return the AVAILABLE_TOOLS names defined by ``registry_path``.
+
+    Raises:
+        RuntimeError: when AVAILABLE_TOOLS (or a list it joins) is missing or
+            is not built from list literals and ``+``.
+    """
+    return [str(name) for name in _resolve_name(str(registry_path), "AVAILABLE_TOOLS")]
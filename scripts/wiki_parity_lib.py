@@ -8,27 +8,16 @@ import os
 import re
 from pathlib import Path
 
+from .registry_lib import load_registry_tools
+
 
 def load_available_tools(registry_path):
     if not os.path.exists(registry_path):
         return []
-    src = open(registry_path, encoding="utf-8").read()
-    tree = ast.parse(src, registry_path)
-    for node in tree.body:
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == "AVAILABLE_TOOLS":
-                    try:
-                        return ast.literal_eval(node.value)
-                    except Exception:
-                        pass
-    m = re.search(r"AVAILABLE_TOOLS\s*=\s*(\[[\s\S]*?\])", src)
-    if m:
-        try:
-            return ast.literal_eval(m.group(1))
-        except Exception:
-            pass
-    return []
+    try:
+        return load_registry_tools(registry_path)
+    except Exception:
+        return []
 
 
 def find_defined_symbols(tools_root):
@@ -0,0 +1,10 @@
+"""
+Tools executed inside the MCP server process.
+
+They build on the Remote Script's bulk and columnar commands and do their
+computation locally, off Live's main thread.
+"""
+
+from .registry import LOCAL_TOOL_DEFS, LOCAL_TOOLS, call_local_tool
+
+__all__ = ["LOCAL_TOOL_DEFS", "LOCAL_TOOLS", "call_local_tool"]
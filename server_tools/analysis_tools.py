@@ -0,0 +1,208 @@
+"""
+analyze_harmony: song-wide key, chord and pitch-class analysis.
+
+Single responsibility: one bulk get_all_notes read (packed columns), then
+per-clip analysis in the MCP server, cached by a hash of the clip's note
+content so unchanged clips are not re-analysed on the next call. Scene rows
+are analysed by summing the bar histograms of their clips (shorter clips
+loop to the longest one, as they do when the scene is launched).
+"""
+
+import hashlib
+from collections import OrderedDict
+
+from ableton_client import decode_note_columns
+
+from .harmony import (
+    add_histograms,
+    bar_histograms,
+    estimate_key,
+    key_candidates,
+    label_chord,
+    normalize,
+)
+from .theory import NOTE_NAMES
+
+CACHE_SIZE = 1024
+
+# content hash -> per-clip analysis; least recently used entries drop first.
+_cache = OrderedDict()
+
+
+def content_hash(clip, bar_length):
+    """Stable hash of a clip's packed note columns, length and bar length."""
+    notes = clip["notes"]
+    digest = hashlib.sha1()
+    digest.update(repr((float(clip["length"]), float(bar_length))).encode("ascii"))
+    for name in ("pitch", "start_time", "duration", "velocity", "muted"):
+        digest.update(name.encode("ascii"))
+        digest.update(str(notes["columns"].get(name, "")).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _analyze_clip(clip, bar_length):
+    columns = decode_note_columns(clip["notes"], use_numpy=False)
+    muted = columns.get("muted") or [0] * len(columns.get("pitch", []))
+    keep = [not m for m in muted]
+    pitches = [p for p, k in zip(columns.get("pitch", []), keep) if k]
+    starts = [s for s, k in zip(columns.get("start_time", []), keep) if k]
+    durations = [d for d, k in zip(columns.get("duration", []), keep) if k]
+
+    bars = bar_histograms(pitches, starts, durations, clip["length"], bar_length)
+    histogram = add_histograms(bars)
+    return {
+        "histogram": histogram,
+        "bars": bars,
+        "key": estimate_key(histogram),
+        "chords": [label_chord(bar) for bar in bars],
+    }
+
+
+def _cached_analysis(clip, bar_length):
+    """Return (analysis, hash, cache_hit) for one get_all_notes clip entry."""
+    digest = content_hash(clip, bar_length)
+    if digest in _cache:
+        _cache.move_to_end(digest)
+        return _cache[digest], digest, True
+    analysis = _analyze_clip(clip, bar_length)
+    _cache[digest] = analysis
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return analysis, digest, False
+
+
+def _named(hist):
+    return dict(zip(NOTE_NAMES, normalize(hist)))
+
+
+def _scene_summary(scene_index, analyses):
+    """Key and per-bar chords of a scene row, looping shorter clips."""
+    bar_count = max(len(a["bars"]) for a in analyses)
+    bars = [
+        add_histograms(a["bars"][i % len(a["bars"])] for a in analyses) for i in range(bar_count)
+    ]
+    histogram = add_histograms(bars)
+    return {
+        "scene_index": scene_index,
+        "clip_count": len(analyses),
+        "key": estimate_key(histogram),
+        "chords": [label_chord(bar) for bar in bars],
+    }
+
+
+def analyze_harmony(
+    call,
+    track_range=None,
+    scene_range=None,
+    clips=None,
+    exclude_tracks=None,
+    bar_length=None,
+    include_histograms=False,
+):
+    """Estimate the song key, per-clip keys/chords and per-scene chords."""
+    query = {"encoding": "columnar_base64"}
+    for name, value in (("track_range", track_range), ("scene_range", scene_range)):
+        if value is not None:
+            query[name] = value
+    if clips is not None:
+        query["clips"] = clips
+    read = call("get_all_notes", query)
+    if not read.get("ok"):
+        return read
+
+    if bar_length is None:
+        session = call("get_session_info", {})
+        if session.get("ok"):
+            numerator = session["time_signature_numerator"]
+            bar_length = numerator * 4.0 / session["time_signature_denominator"]
+        else:
+            bar_length = 4.0
+    bar_length = float(bar_length)
+    if bar_length <= 0:
+        return {"ok": False, "error": "bar_length must be > 0"}
+
+    excluded = set(exclude_tracks or [])
+    results = []
+    by_scene = {}
+    hits = 0
+    for clip in read["clips"]:
+        if clip["track_index"] in excluded:
+            continue
+        analysis, digest, hit = _cached_analysis(clip, bar_length)
+        hits += hit
+        entry = {
+            "track_index": clip["track_index"],
+            "clip_index": clip["clip_index"],
+            "name": clip.get("name"),
+            "hash": digest,
+            "key": analysis["key"],
+            "chords": analysis["chords"],
+        }
+        if include_histograms:
+            entry["histogram"] = _named(analysis["histogram"])
+        results.append(entry)
+        if any(analysis["histogram"]):
+            by_scene.setdefault(clip["clip_index"], []).append(analysis)
+
+    song_hist = add_histograms(
+        analysis["histogram"] for analyses in by_scene.values() for analysis in analyses
+    )
+    return {
+        "ok": True,
+        "key": estimate_key(song_hist),
+        "key_candidates": key_candidates(song_hist),
+        "histogram": _named(song_hist),
+        "bar_length": bar_length,
+        "clips": results,
+        "scenes": [_scene_summary(s, by_scene[s]) for s in sorted(by_scene)],
+        "clip_count": len(results),
+        "cache_hits": hits,
+        "errors": read.get("errors", []),
+    }
+
+
+TOOL_DEFS = [
+    (
+        "analyze_harmony",
+        "Analyse the harmony of the set in one bulk read: song key estimate (with "
+        "candidates), duration-weighted pitch-class histogram, per-clip key and per-bar "
+        "chord labels, and per-scene chords (clips of a scene summed, shorter clips "
+        "looped). Runs on the MCP server; per-clip results are cached by note-content "
+        "hash, so repeated calls only re-analyse clips that changed.",
+        {
+            "type": "object",
+            "properties": {
+                "track_range": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Inclusive [first, last] track indices (default all)",
+                },
+                "scene_range": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Inclusive [first, last] scene indices (default all)",
+                },
+                "clips": {
+                    "type": "array",
+                    "items": {"type": "array", "items": {"type": "integer"}},
+                    "description": "Explicit [track_index, clip_index] pairs",
+                },
+                "exclude_tracks": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Track indices to leave out, e.g. drum tracks",
+                },
+                "bar_length": {
+                    "type": "number",
+                    "description": "Bar length in beats (default: from the song time signature)",
+                },
+                "include_histograms": {
+                    "type": "boolean",
+                    "description": "Add a pitch-class histogram to each clip (default false)",
+                },
+            },
+        },
+    ),
+]
+
+HANDLERS = {"analyze_harmony": analyze_harmony}
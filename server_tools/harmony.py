@@ -0,0 +1,116 @@
+"""
+Pitch-class profiles, key estimation and chord labelling over note columns.
+
+Single responsibility: the numeric side of analyze_harmony. Histograms are
+duration-weighted pitch-class vectors (12 floats); keys are estimated with
+the Krumhansl-Kessler profiles (Pearson correlation over the 24 major/minor
+rotations) and chords by cosine similarity against chord templates.
+"""
+
+import math
+
+from .theory import NOTE_NAMES
+
+MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
+# Label suffix -> intervals above the root. Ordered simplest first so ties
+# resolve to triads.
+CHORD_TEMPLATES = (
+    ("", (0, 4, 7)),
+    ("m", (0, 3, 7)),
+    ("dim", (0, 3, 6)),
+    ("aug", (0, 4, 8)),
+    ("sus4", (0, 5, 7)),
+    ("sus2", (0, 2, 7)),
+    ("7", (0, 4, 7, 10)),
+    ("maj7", (0, 4, 7, 11)),
+    ("m7", (0, 3, 7, 10)),
+)
+
+MIN_CHORD_SCORE = 0.6
+
+
+def empty_histogram():
+    return [0.0] * 12
+
+
+def add_histograms(histograms):
+    total = empty_histogram()
+    for hist in histograms:
+        total = [a + b for a, b in zip(total, hist)]
+    return total
+
+
+def normalize(hist):
+    total = sum(hist)
+    return [round(v / total, 4) for v in hist] if total else list(hist)
+
+
+def bar_histograms(pitches, starts, durations, length, bar_length):
+    """Duration-weighted pitch-class histogram per bar of a clip.
+
+    Notes that cross a bar line contribute their overlap to each bar; notes
+    past ``length`` are ignored.
+    """
+    count = max(1, int(math.ceil(float(length) / bar_length - 1e-9)))
+    bars = [empty_histogram() for _ in range(count)]
+    for pitch, start, duration in zip(pitches, starts, durations):
+        end = min(float(length), start + duration)
+        bar = int(start // bar_length)
+        while bar < count and bar * bar_length < end:
+            lo = max(start, bar * bar_length)
+            hi = min(end, (bar + 1) * bar_length)
+            if hi > lo:
+                bars[bar][int(pitch) % 12] += hi - lo
+            bar += 1
+    return bars
+
+
+def _pearson(xs, ys):
+    mx, my = sum(xs) / 12.0, sum(ys) / 12.0
+    dx = [x - mx for x in xs]
+    dy = [y - my for y in ys]
+    denom = math.sqrt(sum(d * d for d in dx) * sum(d * d for d in dy))
+    return sum(a * b for a, b in zip(dx, dy)) / denom if denom else 0.0
+
+
+def key_candidates(hist, top=3):
+    """Best matching keys as [{"key", "tonic", "mode", "score"}], best first."""
+    if not any(hist):
+        return []
+    scored = []
+    for tonic in range(12):
+        rotated = hist[tonic:] + hist[:tonic]
+        for mode, profile in (("major", MAJOR_PROFILE), ("minor", MINOR_PROFILE)):
+            scored.append((_pearson(rotated, profile), tonic, mode))
+    scored.sort(key=lambda s: -s[0])
+    return [
+        {
+            "key": NOTE_NAMES[tonic] + " " + mode,
+            "tonic": tonic,
+            "mode": mode,
+            "score": round(score, 4),
+        }
+        for score, tonic, mode in scored[:top]
+    ]
+
+
+def estimate_key(hist):
+    candidates = key_candidates(hist, top=1)
+    return candidates[0] if candidates else None
+
+
+def label_chord(hist):
+    """Best chord label for a histogram, or None when nothing fits."""
+    norm = math.sqrt(sum(v * v for v in hist))
+    if not norm:
+        return None
+    best = None
+    for root in range(12):
+        for suffix, intervals in CHORD_TEMPLATES:
+            members = [(root + i) % 12 for i in intervals]
+            score = sum(hist[m] for m in members) / (norm * math.sqrt(len(members)))
+            if best is None or score > best[0] + 1e-9:
+                best = (score, NOTE_NAMES[root] + suffix)
+    return best[1] if best[0] >= MIN_CHORD_SCORE else None
@@ -0,0 +1,30 @@
+"""
+Registry of tools implemented in the MCP server process itself.
+
+These tools never reach the Remote Script's dispatcher directly: they are
+listed next to the Remote Script tools by mcp_server.list_tools() and
+executed by call_local_tool(), which composes Remote Script commands through
+the ``call`` function it is given (normally ableton_client._call_ableton).
+"""
+
+from . import analysis_tools, smf_tools, transform_tools
+
+_MODULES = (transform_tools, smf_tools, analysis_tools)
+
+# (name, description, schema) tuples, like mcp_server_tool_defs.TOOL_DEFS.
+LOCAL_TOOL_DEFS = [entry for module in _MODULES for entry in module.TOOL_DEFS]
+
+LOCAL_TOOLS = {}
+for _module in _MODULES:
+    LOCAL_TOOLS.update(_module.HANDLERS)
+
+
+def call_local_tool(name, arguments, call):
+    """Run local tool ``name`` with ``arguments``; errors become {"ok": False}."""
+    handler = LOCAL_TOOLS.get(name)
+    if handler is None:
+        return {"ok": False, "error": "Unknown local tool: " + str(name)}
+    try:
+        return handler(call, **(arguments or {}))
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
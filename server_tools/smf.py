@@ -0,0 +1,220 @@
+"""
+Pure-Python Standard MIDI File (SMF) reader and writer.
+
+Single responsibility: convert between .mid bytes and note lists in beats
+(quarter notes, Live's beat unit). Only what a clip needs is kept: notes,
+track names, the first tempo and time signature, and markers. SMPTE time
+division is not supported.
+
+Notes are dicts with pitch, start_time, duration, velocity (and channel on
+read), the same field names the Remote Script's note tools use.
+"""
+
+import struct
+
+DEFAULT_PPQ = 480
+
+
+class SMFError(ValueError):
+    """Raised for malformed or unsupported MIDI files."""
+
+
+# ----------------------------------------------------------------------------
+# Writing
+# ----------------------------------------------------------------------------
+
+
+def _vlq(value):
+    """Encode a variable-length quantity."""
+    out = [value & 0x7F]
+    value >>= 7
+    while value:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(out))
+
+
+def _meta(kind, data):
+    return b"\xff" + bytes([kind]) + _vlq(len(data)) + data
+
+
+def _track_chunk(events):
+    """Build an MTrk chunk from (tick, order, bytes) events."""
+    body = bytearray()
+    last = 0
+    for tick, _, data in sorted(events, key=lambda e: (e[0], e[1])):
+        body += _vlq(tick - last) + data
+        last = tick
+    body += _vlq(0) + _meta(0x2F, b"")
+    return b"MTrk" + struct.pack(">I", len(body)) + bytes(body)
+
+
+def build_track(
+    notes, ppq=DEFAULT_PPQ, name=None, channel=0, markers=(), tempo=None, time_signature=None
+):
+    """Return the event list of one SMF track.
+
+    ``markers`` are (beat, text) pairs. ``tempo`` (bpm) and ``time_signature``
+    ((numerator, denominator)) are written at tick 0, normally on the first
+    track only.
+    """
+    events = []
+    if name:
+        events.append((0, 0, _meta(0x03, str(name).encode("utf-8"))))
+    if tempo:
+        events.append((0, 0, _meta(0x51, struct.pack(">I", int(round(60000000 / tempo)))[1:])))
+    if time_signature:
+        numerator, denominator = time_signature
+        power = max(0, int(denominator).bit_length() - 1)
+        events.append((0, 0, _meta(0x58, bytes([int(numerator), power, 24, 8]))))
+    for beat, text in markers:
+        events.append((int(round(beat * ppq)), 0, _meta(0x06, str(text).encode("utf-8"))))
+
+    status = channel & 0x0F
+    for note in notes:
+        start = int(round(float(note["start_time"]) * ppq))
+        end = max(
+            start + 1, int(round((float(note["start_time"]) + float(note["duration"])) * ppq))
+        )
+        pitch = int(note["pitch"]) & 0x7F
+        velocity = max(1, min(127, int(round(float(note.get("velocity", 100))))))
+        # Note-offs sort before note-ons on the same tick (order 1 < 2).
+        events.append((start, 2, bytes([0x90 | status, pitch, velocity])))
+        events.append((end, 1, bytes([0x80 | status, pitch, 0])))
+    return events
+
+
+def write_smf(tracks, ppq=DEFAULT_PPQ):
+    """Serialize a list of track event lists (see build_track) to SMF bytes."""
+    fmt = 0 if len(tracks) == 1 else 1
+    header = b"MThd" + struct.pack(">IHHH", 6, fmt, len(tracks), ppq)
+    return header + b"".join(_track_chunk(events) for events in tracks)
+
+
+# ----------------------------------------------------------------------------
+# Reading
+# ----------------------------------------------------------------------------
+
+
+def _read_vlq(data, pos):
+    value = 0
+    for _ in range(4):
+        if pos >= len(data):
+            raise SMFError("Truncated variable-length quantity")
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos
+    raise SMFError("Variable-length quantity too long")
+
+
+# Data bytes per channel message type (high nibble).
+_DATA_LENGTH = {0x80: 2, 0x90: 2, 0xA0: 2, 0xB0: 2, 0xC0: 1, 0xD0: 1, 0xE0: 2}
+
+
+def _read_track(data, ppq, info):
+    """Parse one MTrk body into {"name", "notes", "markers"}; updates ``info``."""
+    track = {"name": None, "notes": [], "markers": []}
+    open_notes = {}
+    pos = tick = 0
+    status = None
+    while pos < len(data):
+        delta, pos = _read_vlq(data, pos)
+        tick += delta
+        if pos >= len(data):
+            raise SMFError("Truncated track")
+        byte = data[pos]
+        if byte == 0xFF:
+            if pos + 1 >= len(data):
+                raise SMFError("Truncated meta event")
+            kind = data[pos + 1]
+            length, pos = _read_vlq(data, pos + 2)
+            payload = data[pos : pos + length]
+            pos += length
+            if kind == 0x2F:
+                break
+            if kind == 0x03 and track["name"] is None:
+                track["name"] = payload.decode("utf-8", "replace")
+            elif kind == 0x06:
+                track["markers"].append(
+                    {"beat": tick / ppq, "text": payload.decode("utf-8", "replace")}
+                )
+            elif kind == 0x51 and info.get("tempo") is None and len(payload) == 3:
+                micros = int.from_bytes(payload, "big")
+                if not micros:
+                    raise SMFError("Invalid tempo event (0 microseconds per quarter note)")
+                info["tempo"] = round(60000000.0 / micros, 3)
+            elif kind == 0x58 and info.get("time_signature") is None and len(payload) >= 2:
+                info["time_signature"] = [payload[0], 2 ** payload[1]]
+            continue
+        if byte in (0xF0, 0xF7):
+            length, pos = _read_vlq(data, pos + 1)
+            pos += length
+            continue
+
+        if byte & 0x80:
+            status = byte
+            pos += 1
+        elif status is None:
+            raise SMFError("Running status without a previous status byte")
+        kind, channel = status & 0xF0, status & 0x0F
+        size = _DATA_LENGTH.get(kind)
+        if size is None:
+            raise SMFError(f"Unsupported status byte: 0x{status:02X}")
+        args = data[pos : pos + size]
+        pos += size
+        if len(args) < size:
+            raise SMFError("Truncated channel message")
+
+        if kind == 0x90 and args[1] > 0:
+            open_notes.setdefault((channel, args[0]), []).append((tick, args[1]))
+        elif kind in (0x80, 0x90):
+            pending = open_notes.get((channel, args[0]))
+            if pending:
+                start, velocity = pending.pop(0)
+                track["notes"].append(
+                    {
+                        "pitch": args[0],
+                        "start_time": start / ppq,
+                        "duration": max(1, tick - start) / ppq,
+                        "velocity": velocity,
+                        "channel": channel,
+                    }
+                )
+
+    # Close notes that never received a note-off at the end of the track.
+    for (channel, pitch), pending in open_notes.items():
+        for start, velocity in pending:
+            track["notes"].append(
+                {
+                    "pitch": pitch,
+                    "start_time": start / ppq,
+                    "duration": max(1, tick - start) / ppq,
+                    "velocity": velocity,
+                    "channel": channel,
+                }
+            )
+    track["notes"].sort(key=lambda n: (n["start_time"], n["pitch"]))
+    return track
+
+
+def read_smf(data):
+    """Parse SMF bytes into {"format", "ppq", "tempo", "time_signature", "tracks"}."""
+    if data[:4] != b"MThd" or len(data) < 14:
+        raise SMFError("Not a Standard MIDI File (missing MThd header)")
+    length, fmt, ntracks, division = struct.unpack(">IHHH", data[4:14])
+    if division & 0x8000:
+        raise SMFError("SMPTE time division is not supported")
+    if not division:
+        raise SMFError("Invalid time division (0 ticks per quarter note)")
+    info = {"format": fmt, "ppq": division, "tempo": None, "time_signature": None, "tracks": []}
+
+    pos = 8 + length
+    while pos + 8 <= len(data) and len(info["tracks"]) < ntracks:
+        chunk, size = data[pos : pos + 4], struct.unpack(">I", data[pos + 4 : pos + 8])[0]
+        body = data[pos + 8 : pos + 8 + size]
+        pos += 8 + size
+        if chunk == b"MTrk":
+            info["tracks"].append(_read_track(body, division, info))
+    return info
@@ -0,0 +1,285 @@
+"""
+export_midi_file / import_midi_file: move MIDI between clips and .mid files.
+
+Single responsibility: stream notes between disk and Live through the bulk
+note commands (get_all_notes with packed columns, set_notes_bulk), using the
+pure-Python SMF codec in server_tools.smf. Notes never pass through the MCP
+client. Relative paths resolve against the Live project folder.
+"""
+
+import math
+import os
+
+from ableton_client import decode_note_columns
+
+from .smf import DEFAULT_PPQ, build_track, read_smf, write_smf
+
+_CLIP_EXISTS = "already has a clip"
+
+
+def _resolve_path(call, path):
+    """Absolute ``path``, resolving relative paths against the project folder."""
+    path = os.path.expanduser(str(path))
+    if os.path.isabs(path):
+        return path
+    root = call("get_project_root_folder", {})
+    folder = root.get("project_root_folder") if root.get("ok") else None
+    if not folder:
+        raise ValueError(
+            "Relative paths need a saved Live project (project_root_folder); pass an absolute path"
+        )
+    return os.path.join(folder, path)
+
+
+def _clip_rows(clip, include_muted):
+    """Decode one get_all_notes clip entry into note dicts."""
+    columns = decode_note_columns(clip["notes"], use_numpy=False)
+    names = list(columns)
+    rows = [dict(zip(names, values)) for values in zip(*columns.values())]
+    if not include_muted:
+        rows = [row for row in rows if not row.get("muted")]
+    return rows
+
+
+def export_midi_file(
+    call,
+    path,
+    track_index=None,
+    clip_index=None,
+    scene_index=None,
+    ppq=DEFAULT_PPQ,
+    include_muted=False,
+    overwrite=False,
+):
+    """Write a clip, a track (clips in scene order) or a scene row to a .mid file."""
+    if track_index is not None and clip_index is not None:
+        mode, query = "clip", {"clips": [[track_index, clip_index]]}
+    elif track_index is not None:
+        mode, query = "track", {"track_range": [track_index, track_index]}
+    elif scene_index is not None:
+        mode, query = "scene", {"scene_range": [scene_index, scene_index]}
+    else:
+        return {
+            "ok": False,
+            "error": "Pass track_index and clip_index (clip), track_index (track) "
+            "or scene_index (scene row)",
+        }
+
+    target = _resolve_path(call, path)
+    if os.path.exists(target) and not overwrite:
+        return {"ok": False, "error": "File exists (pass overwrite=true): " + target}
+
+    read = call("get_all_notes", dict(query, encoding="columnar_base64"))
+    if not read.get("ok"):
+        return read
+    if read.get("errors"):
+        return {"ok": False, "error": read["errors"][0]["error"]}
+    if not read["clips"]:
+        return {"ok": False, "error": "No MIDI clips to export"}
+
+    session = call("get_session_info", {})
+    tempo = session.get("tempo") if session.get("ok") else None
+    signature = None
+    if session.get("ok"):
+        signature = (
+            session["time_signature_numerator"],
+            session["time_signature_denominator"],
+        )
+
+    ppq = int(ppq)
+    tracks = []
+    note_count = 0
+    if mode == "track":
+        notes, markers, offset = [], [], 0.0
+        for clip in read["clips"]:
+            for row in _clip_rows(clip, include_muted):
+                row["start_time"] += offset
+                notes.append(row)
+            markers.append((offset, clip.get("name") or "Clip " + str(clip["clip_index"])))
+            offset += float(clip["length"])
+        note_count = len(notes)
+        tracks.append(
+            build_track(notes, ppq, "Track " + str(track_index), 0, markers, tempo, signature)
+        )
+    else:
+        for i, clip in enumerate(read["clips"]):
+            notes = _clip_rows(clip, include_muted)
+            note_count += len(notes)
+            name = clip.get("name") or "Track " + str(clip["track_index"])
+            first = i == 0
+            tracks.append(
+                build_track(
+                    notes,
+                    ppq,
+                    name,
+                    0,
+                    (),
+                    tempo if first else None,
+                    signature if first else None,
+                )
+            )
+
+    data = write_smf(tracks, ppq)
+    folder = os.path.dirname(target)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(target, "wb") as fh:
+        fh.write(data)
+
+    return {
+        "ok": True,
+        "path": target,
+        "mode": mode,
+        "smf_tracks": len(tracks),
+        "clip_count": len(read["clips"]),
+        "note_count": note_count,
+        "bytes": len(data),
+    }
+
+
+def _bar_length(time_signature):
+    numerator, denominator = time_signature or (4, 4)
+    return float(numerator) * 4.0 / float(denominator)
+
+
+def import_midi_file(
+    call, path, track_index, clip_index, layout="merge", replace=False, length=None
+):
+    """Import a .mid file into clip slots via create_midi_clip and set_notes_bulk.
+
+    Each clip's notes are written before the next clip is created. When a
+    write fails, a clip created for it is deleted again and the response lists
+    only the fully imported clips under "imported".
+    """
+    if layout not in ("merge", "tracks"):
+        return {"ok": False, "error": "layout must be 'merge' or 'tracks'"}
+
+    source = _resolve_path(call, path)
+    with open(source, "rb") as fh:
+        smf = read_smf(fh.read())
+
+    stem = os.path.splitext(os.path.basename(source))[0]
+    filled = [t for t in smf["tracks"] if t["notes"]]
+    if not filled:
+        return {"ok": False, "error": "No notes in MIDI file: " + source}
+    if layout == "merge":
+        merged = [n for t in filled for n in t["notes"]]
+        names = [t["name"] for t in filled if t["name"]]
+        groups = [(names[0] if len(filled) == 1 and names else stem, merged)]
+    else:
+        groups = [(t["name"] or stem + " " + str(i + 1), t["notes"]) for i, t in enumerate(filled)]
+
+    bar = _bar_length(smf["time_signature"])
+    clips = []
+    for offset, (name, notes) in enumerate(groups):
+        target_track = int(track_index) + offset
+        end = max(n["start_time"] + n["duration"] for n in notes)
+        clip_length = float(length) if length else max(1.0, math.ceil(end / bar)) * bar
+        slot = {"track_index": target_track, "clip_index": clip_index}
+
+        created = call("create_midi_clip", dict(slot, length=clip_length))
+        if not created.get("ok"):
+            exists = _CLIP_EXISTS in str(created.get("error", ""))
+            if not (replace and exists):
+                created["imported"] = clips
+                return created
+        call("set_clip_name", dict(slot, name=name))
+
+        # Write each clip's notes before creating the next one, so a failure
+        # part-way through never leaves named clips without notes behind.
+        columns = {
+            key: [n[key] for n in notes] for key in ("pitch", "start_time", "duration", "velocity")
+        }
+        entry = dict(
+            slot,
+            notes={"format": "columnar", "count": len(notes), "columns": columns},
+            replace=True,
+        )
+        written = call("set_notes_bulk", {"entries": [entry]})
+        if written.get("ok") and not written["results"][0].get("ok"):
+            written = {"ok": False, "error": written["results"][0].get("error")}
+        if not written.get("ok"):
+            if created.get("ok"):
+                call("delete_clip", slot)
+            return {"ok": False, "error": written.get("error"), "imported": clips}
+
+        clips.append(dict(slot, name=name, length=clip_length, note_count=len(notes)))
+
+    return {
+        "ok": True,
+        "path": source,
+        "layout": layout,
+        "clips": clips,
+        "note_count": sum(c["note_count"] for c in clips),
+        "tempo": smf["tempo"],
+        "time_signature": smf["time_signature"],
+    }
+
+
+_PATH = {
+    "type": "string",
+    "description": "Path of the .mid file; relative paths resolve against the Live project folder",
+}
+
+TOOL_DEFS = [
+    (
+        "export_midi_file",
+        "Export MIDI to a Standard MIDI File on disk without sending notes through the "
+        "conversation: a clip (track_index + clip_index), a whole session track "
+        "(track_index: clips laid end to end in scene order, with a marker per clip) or "
+        "a scene row (scene_index: one SMF track per clip). Writes the song tempo and "
+        "time signature.",
+        {
+            "type": "object",
+            "properties": {
+                "path": _PATH,
+                "track_index": {"type": "integer", "description": "0-based track index"},
+                "clip_index": {"type": "integer", "description": "0-based clip slot index"},
+                "scene_index": {"type": "integer", "description": "0-based scene index"},
+                "ppq": {"type": "integer", "description": "Ticks per quarter note (default 480)"},
+                "include_muted": {
+                    "type": "boolean",
+                    "description": "Also export muted notes (default false)",
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Replace an existing file (default false)",
+                },
+            },
+            "required": ["path"],
+        },
+    ),
+    (
+        "import_midi_file",
+        "Import a Standard MIDI File into session clip slots: creates the clip(s) sized to "
+        "whole bars and writes each clip's notes with a bulk call right after creating it. layout 'merge' puts every "
+        "SMF track into one clip; 'tracks' puts SMF track i on Live track track_index + i.",
+        {
+            "type": "object",
+            "properties": {
+                "path": _PATH,
+                "track_index": {
+                    "type": "integer",
+                    "description": "0-based MIDI track index (first track for layout 'tracks')",
+                },
+                "clip_index": {"type": "integer", "description": "0-based clip slot index"},
+                "layout": {
+                    "type": "string",
+                    "enum": ["merge", "tracks"],
+                    "description": "How SMF tracks map to clips (default 'merge')",
+                },
+                "replace": {
+                    "type": "boolean",
+                    "description": "Replace the notes of an existing clip instead of failing",
+                },
+                "length": {
+                    "type": "number",
+                    "description": "Clip length in beats (default: last note end rounded up to a bar)",
+                },
+            },
+            "required": ["path", "track_index", "clip_index"],
+        },
+    ),
+]
+
+HANDLERS = {"export_midi_file": export_midi_file, "import_midi_file": import_midi_file}
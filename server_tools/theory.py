@@ -0,0 +1,61 @@
+"""
+Pitch-class and scale tables shared by the server-side MIDI tools.
+
+Single responsibility: name <-> pitch-class conversion and scale definitions,
+kept free of any Live or MCP dependency so it can be unit tested directly.
+"""
+
+NOTE_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+_FLATS = {"Db": 1, "Eb": 3, "Gb": 6, "Ab": 8, "Bb": 10, "Cb": 11, "Fb": 4}
+
+# Scale name -> semitone offsets from the root.
+SCALES = {
+    "major": (0, 2, 4, 5, 7, 9, 11),
+    "minor": (0, 2, 3, 5, 7, 8, 10),
+    "harmonic_minor": (0, 2, 3, 5, 7, 8, 11),
+    "melodic_minor": (0, 2, 3, 5, 7, 9, 11),
+    "dorian": (0, 2, 3, 5, 7, 9, 10),
+    "phrygian": (0, 1, 3, 5, 7, 8, 10),
+    "lydian": (0, 2, 4, 6, 7, 9, 11),
+    "mixolydian": (0, 2, 4, 5, 7, 9, 10),
+    "locrian": (0, 1, 3, 5, 6, 8, 10),
+    "major_pentatonic": (0, 2, 4, 7, 9),
+    "minor_pentatonic": (0, 3, 5, 7, 10),
+    "blues": (0, 3, 5, 6, 7, 10),
+    "chromatic": tuple(range(12)),
+}
+
+
+def parse_root(root):
+    """Return the pitch class (0-11) of a root given as int or name ("F#", "Bb")."""
+    if isinstance(root, int):
+        return root % 12
+    name = str(root).strip()
+    if name in _FLATS:
+        return _FLATS[name]
+    name = name[:1].upper() + name[1:]
+    if name in NOTE_NAMES:
+        return NOTE_NAMES.index(name)
+    raise ValueError("Unknown root note: " + str(root))
+
+
+def scale_pitch_classes(root=0, scale="major"):
+    """Pitch classes of ``scale`` on ``root``; ``scale`` may be a name or offsets."""
+    if isinstance(scale, str):
+        if scale not in SCALES:
+            raise ValueError(
+                "Unknown scale: " + scale + ". Available: " + ", ".join(sorted(SCALES))
+            )
+        offsets = SCALES[scale]
+    else:
+        offsets = [int(step) for step in scale]
+        if not offsets:
+            raise ValueError("scale must not be empty")
+    tonic = parse_root(root)
+    return sorted({(tonic + step) % 12 for step in offsets})
+
+
+def pitch_name(pitch):
+    """Note name with octave for a MIDI pitch (60 -> "C3", Live's convention)."""
+    return NOTE_NAMES[pitch % 12] + str(pitch // 12 - 2)
@@ -0,0 +1,103 @@
+"""
+transform_clip_notes: server-side MIDI transform pipeline.
+
+Single responsibility: read one clip's notes in columnar form (one command),
+run a transform pipeline locally (server_tools.transforms) and write the
+result back with one set_notes_bulk command that replaces the clip's notes.
+"""
+
+from .transforms import TRANSFORMS, apply_transforms
+
+
+def transform_clip_notes(call, track_index, clip_index, transforms, seed=None, dry_run=False):
+    """Apply a transform pipeline to a MIDI clip in two round trips."""
+    read = call("get_all_notes", {"clips": [[track_index, clip_index]], "encoding": "columnar"})
+    if not read.get("ok"):
+        return read
+    if read.get("errors"):
+        return {"ok": False, "error": read["errors"][0]["error"]}
+
+    clip = read["clips"][0]
+    columns = clip["notes"]["columns"]
+    columns.pop("note_id", None)
+    columns = apply_transforms(columns, clip["length"], transforms, seed)
+    count = len(columns.get("pitch", []))
+    notes = {"format": "columnar", "count": count, "columns": columns}
+
+    result = {
+        "ok": True,
+        "track_index": track_index,
+        "clip_index": clip_index,
+        "applied": [spec.get("op") for spec in transforms or []],
+        "note_count_before": clip["count"],
+        "note_count": count,
+        "dry_run": bool(dry_run),
+    }
+    if dry_run:
+        result["notes"] = notes
+        return result
+
+    entry = {
+        "track_index": track_index,
+        "clip_index": clip_index,
+        "notes": notes,
+        "replace": True,
+    }
+    written = call("set_notes_bulk", {"entries": [entry]})
+    if not written.get("ok"):
+        return written
+    outcome = written["results"][0]
+    if not outcome.get("ok"):
+        return {"ok": False, "error": outcome.get("error")}
+    result["note_count"] = outcome["note_count"]
+    result["rejected_count"] = outcome["rejected_count"]
+    return result
+
+
+_TRANSFORM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "op": {"type": "string", "enum": list(TRANSFORMS)},
+    },
+    "required": ["op"],
+    "additionalProperties": True,
+}
+
+TOOL_DEFS = [
+    (
+        "transform_clip_notes",
+        "Transform a MIDI clip's notes with a pipeline run on the MCP server: one "
+        "columnar read, all transforms applied locally, one bulk write that replaces "
+        "the clip's notes. Ops (applied in order): "
+        "transpose {semitones, out_of_range: fold|clamp|drop}; "
+        "scale {root (0-11 or name), scale (name or offsets), direction: nearest|up|down}; "
+        "quantize {grid (beats), strength 0-1, swing 0-1}; "
+        "humanize {timing (beats), velocity}; "
+        "velocity {gamma, scale, offset, min, max, set}; "
+        "legato {gap}; retrograde {}.",
+        {
+            "type": "object",
+            "properties": {
+                "track_index": {"type": "integer", "description": "0-based track index"},
+                "clip_index": {"type": "integer", "description": "0-based clip slot index"},
+                "transforms": {
+                    "type": "array",
+                    "description": "Pipeline steps, e.g. [{'op': 'quantize', 'grid': 0.25, "
+                    "'strength': 0.6, 'swing': 0.3}, {'op': 'humanize', 'timing': 0.01}]",
+                    "items": _TRANSFORM_SCHEMA,
+                },
+                "seed": {
+                    "type": "integer",
+                    "description": "Random seed for humanize (default: random)",
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "Return the transformed notes (columnar) without writing",
+                },
+            },
+            "required": ["track_index", "clip_index", "transforms"],
+        },
+    ),
+]
+
+HANDLERS = {"transform_clip_notes": transform_clip_notes}
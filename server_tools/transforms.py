@@ -0,0 +1,166 @@
+"""
+Column-wise MIDI note transforms for the server-side transform pipeline.
+
+Single responsibility: pure functions over columnar notes (a dict of equal
+length lists keyed by pitch, start_time, duration, velocity, muted, ...), as
+returned by the Remote Script with encoding="columnar". Every transform works
+on whole columns at once and returns the new columns; nothing here talks to
+Live, so a pipeline of transforms costs no round trips.
+
+Pipeline entries are {"op": <name>, ...parameters}; see TRANSFORMS.
+"""
+
+import random
+
+from .theory import scale_pitch_classes
+
+MIN_DURATION = 1.0 / 256
+
+
+def _clamp(value, lo, hi):
+    return max(lo, min(hi, value))
+
+
+def _select(cols, keep):
+    """Keep the rows whose ``keep`` flag is true, in every column."""
+    return {name: [v for v, k in zip(values, keep) if k] for name, values in cols.items()}
+
+
+def _fold(pitch):
+    """Move an out-of-range pitch by octaves back into 0-127."""
+    while pitch > 127:
+        pitch -= 12
+    while pitch < 0:
+        pitch += 12
+    return pitch
+
+
+def transpose(cols, length, rng, semitones=0, out_of_range="fold"):
+    """Shift pitches; out-of-range notes are folded by octaves, clamped or dropped."""
+    if out_of_range not in ("fold", "clamp", "drop"):
+        raise ValueError("out_of_range must be one of: fold, clamp, drop")
+    shifted = [p + int(semitones) for p in cols["pitch"]]
+    if out_of_range == "drop":
+        return _select(dict(cols, pitch=shifted), [0 <= p <= 127 for p in shifted])
+    if out_of_range == "clamp":
+        return dict(cols, pitch=[_clamp(p, 0, 127) for p in shifted])
+    return dict(cols, pitch=[_fold(p) for p in shifted])
+
+
+def _snap_pitch(pitch, allowed, direction):
+    up = next(d for d in range(12) if (pitch + d) % 12 in allowed)
+    down = next(d for d in range(12) if (pitch - d) % 12 in allowed)
+    if direction == "up" or (direction == "nearest" and up < down):
+        target = pitch + up
+    else:
+        target = pitch - down
+    if target > 127:
+        target = pitch - down
+    if target < 0:
+        target = pitch + up
+    return target
+
+
+def scale(cols, length, rng, root=0, scale="major", direction="nearest"):
+    """Constrain pitches to a scale (ties in "nearest" resolve downwards)."""
+    if direction not in ("nearest", "up", "down"):
+        raise ValueError("direction must be one of: nearest, up, down")
+    allowed = set(scale_pitch_classes(root, scale))
+    return dict(cols, pitch=[_snap_pitch(p, allowed, direction) for p in cols["pitch"]])
+
+
+def quantize(cols, length, rng, grid=0.25, strength=1.0, swing=0.0):
+    """Pull note starts toward the grid.
+
+    ``strength`` (0-1) is the fraction of the distance moved. ``swing`` (0-1)
+    delays every odd grid step by up to a third of a step (1.0 = triplet
+    shuffle).
+    """
+    grid = float(grid)
+    if grid <= 0:
+        raise ValueError("grid must be > 0")
+    strength = _clamp(float(strength), 0.0, 1.0)
+    delay = _clamp(float(swing), 0.0, 1.0) * grid / 3.0
+
+    def target(start):
+        step = int(round(start / grid))
+        return step * grid + (delay if step % 2 else 0.0)
+
+    starts = [s + strength * (target(s) - s) for s in cols["start_time"]]
+    return dict(cols, start_time=[max(0.0, s) for s in starts])
+
+
+def humanize(cols, length, rng, timing=0.0, velocity=0.0):
+    """Add uniform random offsets of up to ``timing`` beats and ``velocity`` steps."""
+    timing = abs(float(timing))
+    velocity = abs(float(velocity))
+    starts = [max(0.0, s + rng.uniform(-timing, timing)) for s in cols["start_time"]]
+    velocities = [_clamp(v + rng.uniform(-velocity, velocity), 1, 127) for v in cols["velocity"]]
+    return dict(cols, start_time=starts, velocity=velocities)
+
+
+def velocity(cols, length, rng, gamma=1.0, scale=1.0, offset=0.0, low=1, high=127, value=None):
+    """Reshape velocities: fixed value, or 127*(v/127)**gamma * scale + offset, clamped."""
+    lo, hi = float(low), float(high)
+    if value is not None:
+        return dict(cols, velocity=[_clamp(float(value), lo, hi)] * len(cols["velocity"]))
+    gamma = float(gamma)
+    if gamma <= 0:
+        raise ValueError("gamma must be > 0")
+    curved = [127.0 * (v / 127.0) ** gamma * float(scale) + float(offset) for v in cols["velocity"]]
+    return dict(cols, velocity=[_clamp(round(v, 3), lo, hi) for v in curved])
+
+
+def legato(cols, length, rng, gap=0.0):
+    """Extend each note to the next onset (the last ones to the clip end), minus ``gap``."""
+    starts = cols["start_time"]
+    onsets = sorted(set(starts))
+    following = {a: b for a, b in zip(onsets, onsets[1:])}
+    durations = []
+    for start, duration in zip(starts, cols["duration"]):
+        end = following.get(start, max(float(length), start + duration))
+        durations.append(max(MIN_DURATION, end - start - float(gap)))
+    return dict(cols, duration=durations)
+
+
+def retrograde(cols, length, rng):
+    """Reverse the clip in time: a note ending at t now starts at length - t."""
+    length = float(length)
+    starts = [max(0.0, length - s - d) for s, d in zip(cols["start_time"], cols["duration"])]
+    return dict(cols, start_time=starts)
+
+
+TRANSFORMS = {
+    "transpose": transpose,
+    "scale": scale,
+    "quantize": quantize,
+    "humanize": humanize,
+    "velocity": velocity,
+    "legato": legato,
+    "retrograde": retrograde,
+}
+
+# Pipeline parameter names that differ from the Python argument names
+# (the pipeline keeps min/max/set; the function avoids shadowing builtins).
+PARAM_ALIASES = {
+    "velocity": {"min": "low", "max": "high", "set": "value"},
+}
+
+
+def apply_transforms(cols, length, transforms, seed=None):
+    """Run ``transforms`` in order over ``cols``; returns the new columns."""
+    rng = random.Random(seed)
+    cols = {name: list(values) for name, values in cols.items()}
+    for i, spec in enumerate(transforms or []):
+        params = dict(spec) if isinstance(spec, dict) else {}
+        op = params.pop("op", None)
+        if op not in TRANSFORMS:
+            available = ", ".join(TRANSFORMS)
+            raise ValueError(f"transforms[{i}]: unknown op {op!r}. Available: {available}")
+        aliases = PARAM_ALIASES.get(op, {})
+        params = {aliases.get(k, k): v for k, v in params.items()}
+        try:
+            cols = TRANSFORMS[op](cols, length, rng, **params)
+        except TypeError as e:
+            raise ValueError(f"transforms[{i}] ({op}): {e}")
+    return cols
@@ -2,6 +2,8 @@
 Tests for ArrangementMixin locators and relative jump operations.
 """
 
+from unittest.mock import MagicMock
+
 
 def test_create_locator_with_create_cue_point(tools, song):
     result = tools.create_locator(4.0, name="Drop")
@@ -85,6 +87,43 @@ def test_get_locators_cue_no_time_or_name(tools, song):
     assert result["ok"] is True
 
 
+def _cues(times):
+    cues = []
+    for t in times:
+        cue = MagicMock()
+        cue.time = t
+        cue.name = "L" + str(int(t))
+        cues.append(cue)
+    return cues
+
+
+def test_get_locators_paginates_with_cursor(tools, song):
+    song.cue_points = _cues([0.0, 4.0, 8.0])
+    first = tools.get_locators(limit=2)
+    assert first["count"] == 2
+    assert first["total"] == 3
+    assert first["next_cursor"]
+
+    second = tools.get_locators(limit=2, cursor=first["next_cursor"])
+    assert [loc["index"] for loc in second["locators"]] == [2]
+    assert second["next_cursor"] is None
+
+
+def test_get_locators_stale_cursor(tools, song):
+    song.cue_points = _cues([0.0, 4.0, 8.0])
+    first = tools.get_locators(limit=1)
+    song.cue_points = _cues([0.0, 2.0, 4.0, 8.0])
+    result = tools.get_locators(limit=1, cursor=first["next_cursor"])
+    assert result["ok"] is False
+    assert "Stale cursor" in result["error"]
+
+
+def test_get_locators_invalid_cursor_and_limit(tools, song):
+    song.cue_points = _cues([0.0])
+    assert tools.get_locators(cursor="nope")["ok"] is False
+    assert tools.get_locators(limit=0)["error"] == "limit must be >= 1"
+
+
 def test_get_locators_exception(tools, song):
     song.cue_points = None
     result = tools.get_locators()
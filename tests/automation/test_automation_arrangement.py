@@ -0,0 +1,156 @@
+"""
+Tests for song-time read/write of arrangement clip envelopes.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ALiveMCP_Remote.tools.core.param_targets import resolve_parameter
+
+
+def _param(name, lo=0.0, hi=1.0):
+    param = MagicMock()
+    param.name = name
+    param.min = lo
+    param.max = hi
+    return param
+
+
+def _clip(start, end, marker=0.0, value=None, loop=None):
+    envelope = MagicMock()
+    envelope.value_at_time.side_effect = value or (lambda t: t / 8.0)
+    clip = SimpleNamespace(
+        start_time=start,
+        end_time=end,
+        start_marker=marker,
+        looping=loop is not None,
+        loop_start=loop[0] if loop else 0.0,
+        loop_end=loop[1] if loop else end - start,
+        automation_envelope=MagicMock(return_value=envelope),
+        create_automation_envelope=MagicMock(return_value=envelope),
+    )
+    return clip, envelope
+
+
+def _track(song, *clips):
+    track = song.tracks[0]
+    track.mixer_device.volume = _param("Track Volume")
+    track.mixer_device.sends = [_param("Send A")]
+    device = MagicMock()
+    device.name = "Filter"
+    device.parameters = [_param("Cutoff"), _param("Resonance")]
+    track.devices = [device]
+    track.arrangement_clips = list(clips)
+    return track
+
+
+def test_resolve_parameter_variants(song):
+    _track(song)
+    song.return_tracks[0].mixer_device.panning = _param("Track Panning", -1.0, 1.0)
+    assert resolve_parameter(song, {"track_index": 0, "mixer": "send", "send_index": 0})[2] == {
+        "track": "track 0",
+        "parameter_name": "Send A",
+    }
+    _, param, info = resolve_parameter(
+        song, {"track_index": 0, "device_index": 0, "param_name": "Resonance"}
+    )
+    assert info["device_name"] == "Filter"
+    assert param.name == "Resonance"
+    assert resolve_parameter(song, {"return_index": 0, "mixer": "pan"})[1].min == -1.0
+    with pytest.raises(ValueError, match="Invalid send index"):
+        resolve_parameter(song, {"track_index": 0, "mixer": "send", "send_index": 3})
+    with pytest.raises(ValueError, match="Pass track_index"):
+        resolve_parameter(song, {"mixer": "volume"})
+
+
+def test_read_maps_song_time_into_each_clip(tools, song):
+    first, _ = _clip(0.0, 8.0)
+    second, envelope = _clip(16.0, 24.0, marker=4.0, value=lambda t: 0.5)
+    _track(song, first, second)
+    result = tools.get_arrangement_automation(
+        track_index=0, device_index=0, param_index=0, end=24, step=4, simplify=False
+    )
+    assert result["ok"] is True
+    assert result["track"] == "track 0"
+    assert result["points"]["columns"] == {
+        "time": [0.0, 4.0, 16.0, 20.0, 24.0],
+        "value": [0.0, 0.5, 0.5, 0.5, 0.5],
+    }
+    assert result["clips"] == [
+        {"position": 0, "start": 0.0, "end": 4.0},
+        {"position": 1, "start": 16.0, "end": 24.0},
+    ]
+    assert [c.args[0] for c in envelope.value_at_time.call_args_list] == [4.0, 8.0, 12.0]
+
+
+def test_read_wraps_inside_looped_clip(tools, song):
+    clip, envelope = _clip(0.0, 16.0, loop=(0.0, 4.0))
+    _track(song, clip)
+    tools.get_arrangement_automation(track_index=0, device_index=0, param_index=0, start=6, end=6)
+    envelope.value_at_time.assert_called_once_with(2.0)
+
+
+def test_read_without_clip_envelopes(tools, song):
+    clip, _ = _clip(0.0, 8.0)
+    clip.automation_envelope.return_value = None
+    _track(song, clip)
+    result = tools.get_arrangement_automation(track_index=0, device_index=0, param_index=0, end=8)
+    assert result["has_envelope"] is False
+    assert result["clips"] == []
+
+    clip.create_automation_envelope.return_value = None
+    result = tools.write_arrangement_automation(
+        track_index=0, device_index=0, param_index=0, points=[[0, 0.1], [4, 0.9]]
+    )
+    assert result["ok"] is False
+    assert "no clip envelope" in result["error"]
+
+
+def test_write_shape_splits_across_clips(tools, song):
+    first, first_envelope = _clip(0.0, 8.0)
+    second, second_envelope = _clip(8.0, 16.0, marker=2.0)
+    _track(song, first, second)
+    result = tools.write_arrangement_automation(
+        track_index=0,
+        device_index=0,
+        param_index=0,
+        shape={"type": "linear", "from_value": 1.0, "to_value": 0.0},
+        start=0,
+        end=16,
+        clear=True,
+    )
+    assert result["ok"] is True
+    assert result["device_name"] == "Filter"
+    first_envelope.delete_events_in_range.assert_called_once_with(0.0, 8.0)
+    second_envelope.delete_events_in_range.assert_called_once_with(2.0, 10.0)
+    assert [c.args for c in first_envelope.insert_step.call_args_list] == [
+        (0.0, 0.0, 1.0),
+        (8.0, 0.0, 0.5),
+    ]
+    assert [c.args for c in second_envelope.insert_step.call_args_list] == [
+        (2.0, 0.0, 0.5),
+        (10.0, 0.0, 0.0),
+    ]
+    assert result["points"]["columns"]["time"] == [0.0, 8.0, 8.0, 16.0]
+    assert [c["point_count"] for c in result["clips"]] == [2, 2]
+
+
+def test_write_errors(tools, song):
+    looped, envelope = _clip(0.0, 16.0, loop=(0.0, 4.0))
+    _track(song, looped)
+    result = tools.write_arrangement_automation(
+        track_index=0, device_index=0, param_index=0, points=[[2, 0.1], [6, 0.9]]
+    )
+    assert "loops inside the range" in result["error"]
+    envelope.insert_step.assert_not_called()
+
+    result = tools.write_arrangement_automation(
+        track_index=0, device_index=0, param_index=0, points=[[20, 0.1], [24, 0.9]]
+    )
+    assert result == {"ok": False, "error": "No arrangement clip covers beats 20.0 to 24.0"}
+    result = tools.write_arrangement_automation(
+        track_index=0, device_index=0, param_index=0, shape={"type": "sine"}
+    )
+    assert result == {"ok": False, "error": "end is required for shapes"}
@@ -0,0 +1,91 @@
+"""
+Tests for write_automation_curve (shapes, decimation, clamping, clearing).
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ALiveMCP_Remote.tools.automation.envelope_points import sample_grid
+from ALiveMCP_Remote.tools.automation.envelope_shapes import parse_points, shape_values
+
+
+def _setup(song, length=4.0):
+    param = MagicMock()
+    param.name = "Cutoff"
+    param.min = 0.0
+    param.max = 1.0
+    device = MagicMock()
+    device.name = "Filter"
+    device.parameters = [param]
+    envelope = MagicMock()
+    clip = MagicMock()
+    clip.length = length
+    clip.automation_envelope.return_value = envelope
+    slot = MagicMock()
+    slot.has_clip = True
+    slot.clip = clip
+    song.tracks[0].clip_slots = [slot]
+    song.tracks[0].devices = [device]
+    return clip, envelope
+
+
+def _written(envelope):
+    return [(c.args[0], c.args[2]) for c in envelope.insert_step.call_args_list]
+
+
+def test_shapes_hit_their_end_points():
+    times = sample_grid(0, 4, 0.5)
+    for kind in ("linear", "exponential", "s_curve"):
+        values = shape_values({"type": kind, "from_value": 0.2, "to_value": 0.8}, times, 0, 1)
+        assert values[0] == pytest.approx(0.2)
+        assert values[-1] == pytest.approx(0.8)
+    sine = shape_values({"type": "sine", "period": 4}, times, 0, 1)
+    assert sine[0] == pytest.approx(0.5)
+    assert max(sine) == pytest.approx(1.0)
+    walk = {"type": "random_walk", "seed": 3, "step_size": 0.3}
+    values = shape_values(walk, times, 0, 1)
+    assert values == shape_values(walk, times, 0, 1)
+    assert all(0 <= v <= 1 for v in values)
+
+
+def test_unknown_shape_and_point_parsing():
+    with pytest.raises(ValueError):
+        shape_values({"type": "zigzag"}, [0.0, 1.0], 0, 1)
+    assert parse_points([[2, 0.5], {"time": 0, "value": 1}]) == ([0.0, 2.0], [1.0, 0.5])
+
+
+def test_linear_shape_is_decimated_to_two_breakpoints(tools, song):
+    _, envelope = _setup(song)
+    result = tools.write_automation_curve(0, 0, 0, 0, shape={"type": "linear"})
+    assert result["ok"] is True
+    assert result["input_count"] == 65
+    assert result["point_count"] == 2
+    assert _written(envelope) == [(0.0, 0.0), (4.0, 1.0)]
+    envelope.delete_events_in_range.assert_not_called()
+
+
+def test_points_are_clamped_and_range_cleared(tools, song):
+    _, envelope = _setup(song)
+    result = tools.write_automation_curve(
+        0, 0, 0, 0, points=[[0, -1.0], [1, 0.8], [2, 2.0]], clear=True
+    )
+    assert result["cleared"] is True
+    envelope.delete_events_in_range.assert_called_once_with(0.0, 2.0)
+    assert _written(envelope) == [(0.0, 0.0), (1.0, 0.8), (2.0, 1.0)]
+
+
+def test_missing_envelope_is_created(tools, song):
+    clip, _ = _setup(song)
+    clip.automation_envelope.return_value = None
+    created = MagicMock()
+    clip.create_automation_envelope.return_value = created
+    result = tools.write_automation_curve(0, 0, 0, 0, points=[[0, 0.1], [1, 0.2]])
+    assert result["ok"] is True
+    assert created.insert_step.call_count == 2
+
+
+def test_requires_points_or_shape(tools, song):
+    _setup(song)
+    result = tools.write_automation_curve(0, 0, 0, 0)
+    assert result == {"ok": False, "error": "Pass points or shape"}
@@ -0,0 +1,113 @@
+"""
+Tests for tick-driven LFO modulators.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _setup(song):
+    volume = MagicMock()
+    volume.name = "Track Volume"
+    volume.min = 0.0
+    volume.max = 1.0
+    volume.value = 0.5
+    song.tracks[0].mixer_device.volume = volume
+    song.tempo = 120.0
+    song.is_playing = True
+    song.current_song_time = 0.0
+    return volume
+
+
+def test_synced_sine_follows_song_time(tools, song, clock):
+    volume = _setup(song)
+    added = tools.add_modulator(track_index=0, mixer="volume", period_beats=4, depth=0.4)
+    assert added["ok"] is True
+    assert added["offset"] == 0.5
+    assert added["target"] == "track 0/volume"
+
+    song.current_song_time = 1.0
+    clock.tick()
+    assert volume.value == pytest.approx(0.9)
+    song.current_song_time = 3.0
+    clock.tick()
+    assert volume.value == pytest.approx(0.1)
+
+
+def test_free_running_square_is_clamped(tools, song, clock):
+    volume = _setup(song)
+    tools.add_modulator(
+        "square", track_index=0, mixer="volume", rate_hz=1.0, depth=1.0, max_value=0.7
+    )
+    clock.tick()
+    assert volume.value == 0.7
+    clock.tick(0.75)
+    assert volume.value == 0.0
+
+
+def test_synced_modulator_free_runs_while_stopped(tools, song, clock):
+    volume = _setup(song)
+    song.is_playing = False
+    tools.add_modulator("triangle", track_index=0, mixer="volume", period_beats=2, depth=0.5)
+    clock.tick()
+    assert volume.value == pytest.approx(0.0)
+    clock.tick(0.5)  # one beat at 120 BPM = half a cycle
+    assert volume.value == pytest.approx(1.0)
+
+
+def test_random_waveforms_stay_in_range(tools, song, clock):
+    volume = _setup(song)
+    tools.add_modulator("sample_hold", track_index=0, mixer="volume", rate_hz=4.0, seed=1)
+    values = []
+    for _ in range(20):
+        clock.tick(0.1)
+        values.append(volume.value)
+    assert all(0.25 <= v <= 0.75 for v in values)
+    assert len(set(values)) > 1
+
+
+def test_replace_and_remove_restore_original_value(tools, song, clock):
+    volume = _setup(song)
+    first = tools.add_modulator(track_index=0, mixer="volume", period_beats=4)
+    song.current_song_time = 1.0
+    clock.tick()
+    second = tools.add_modulator("triangle", track_index=0, mixer="volume", period_beats=1)
+    assert second["replaced"] == first["modulator_id"]
+    assert tools.list_modulators()["count"] == 1
+    assert tools.list_modulators()["modulators"][0]["original_value"] == 0.5
+
+    assert tools.remove_modulator() == {"ok": True, "removed": [second["modulator_id"]]}
+    assert volume.value == 0.5
+    assert tools.list_modulators()["count"] == 0
+
+
+def test_replacing_mid_swing_keeps_original_centre(tools, song, clock):
+    volume = _setup(song)
+    tools.add_modulator(track_index=0, mixer="volume", period_beats=4, depth=0.4)
+    song.current_song_time = 1.0
+    clock.tick()
+    assert volume.value == pytest.approx(0.9)
+
+    replaced = tools.add_modulator(track_index=0, mixer="volume", period_beats=4, depth=0.2)
+    assert replaced["offset"] == 0.5
+    song.current_song_time = 3.0
+    clock.tick()
+    assert volume.value == pytest.approx(0.3)
+    tools.remove_modulator()
+    assert volume.value == 0.5
+
+
+def test_add_modulator_validates_input(tools, song):
+    _setup(song)
+    assert tools.add_modulator(track_index=0, mixer="volume")["error"] == (
+        "Pass period_beats or rate_hz"
+    )
+    assert (
+        "waveform must be one of"
+        in tools.add_modulator("saw", track_index=0, mixer="volume", rate_hz=1)["error"]
+    )
+    assert tools.add_modulator(track_index=99, mixer="volume", rate_hz=1)["error"] == (
+        "Invalid track index"
+    )
+    assert tools.remove_modulator("modulator-99")["ok"] is False
@@ -0,0 +1,69 @@
+"""
+Tests for tick-driven parameter ramps.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _setup(song):
+    volume = MagicMock()
+    volume.name = "Track Volume"
+    volume.min = 0.0
+    volume.max = 1.0
+    volume.value = 0.8
+    song.tracks[0].mixer_device.volume = volume
+    song.tempo = 120.0
+    return volume
+
+
+def test_ramp_advances_each_tick_until_done(tools, song, clock):
+    volume = _setup(song)
+    started = tools.ramp_parameter(0.0, track_index=0, mixer="volume", duration_beats=2)
+    assert started["ok"] is True
+    assert started["duration_ms"] == 1000.0
+    assert started["target"] == "track 0/volume"
+
+    clock.tick(0.5)
+    assert volume.value == pytest.approx(0.4)
+    assert tools.get_ramps(started["ramp_id"])["progress"] == 0.5
+
+    clock.tick(0.6)
+    assert volume.value == 0.0
+    assert tools.get_ramps(started["ramp_id"])["status"] == "done"
+    assert tools.get_ramps()["running"] == 0
+
+
+def test_ramp_target_is_clamped_and_curved(tools, song, clock):
+    volume = _setup(song)
+    volume.value = 0.0
+    tools.ramp_parameter(5.0, track_index=0, mixer="volume", duration_ms=1000, curve="s_curve")
+    clock.tick(0.25)
+    assert volume.value == pytest.approx(0.15625)
+    clock.tick(1.0)
+    assert volume.value == 1.0
+
+
+def test_new_ramp_replaces_running_one(tools, song):
+    _setup(song)
+    first = tools.ramp_parameter(0.0, track_index=0, mixer="volume", duration_ms=1000)
+    second = tools.ramp_parameter(1.0, track_index=0, mixer="volume", duration_ms=1000)
+    assert second["replaced"] == first["ramp_id"]
+    assert tools.get_ramps(first["ramp_id"])["status"] == "cancelled"
+
+
+def test_cancel_ramp_stops_updates(tools, song, clock):
+    volume = _setup(song)
+    started = tools.ramp_parameter(0.0, track_index=0, mixer="volume", duration_ms=1000)
+    assert tools.cancel_ramp() == {"ok": True, "cancelled": [started["ramp_id"]]}
+    clock.tick(0.5)
+    assert volume.value == 0.8
+
+
+def test_ramp_errors(tools, song):
+    _setup(song)
+    assert "duration" in tools.ramp_parameter(0.5, track_index=0, mixer="volume")["error"]
+    bad_curve = tools.ramp_parameter(0.5, track_index=0, mixer="volume", duration_ms=10, curve="x")
+    assert "curve must be one of" in bad_curve["error"]
+    assert tools.get_ramps("ramp-99")["ok"] is False
@@ -0,0 +1,90 @@
+"""
+Tests for automation envelope readback (sampling grid and simplification).
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ALiveMCP_Remote.tools.automation.envelope_points import sample_grid, simplify
+
+
+def _setup(song, curve, length=4.0):
+    param = MagicMock()
+    param.name = "Cutoff"
+    param.min = 0.0
+    param.max = 1.0
+    device = MagicMock()
+    device.name = "Filter"
+    device.parameters = [param]
+    envelope = MagicMock()
+    envelope.value_at_time.side_effect = curve
+    clip = MagicMock()
+    clip.length = length
+    clip.automation_envelope.return_value = envelope
+    slot = MagicMock()
+    slot.has_clip = True
+    slot.clip = clip
+    song.tracks[0].clip_slots = [slot]
+    song.tracks[0].devices = [device]
+    return envelope
+
+
+def _triangle(t):
+    return t / 2.0 if t <= 2.0 else (4.0 - t) / 2.0
+
+
+def test_sample_grid_includes_end():
+    assert sample_grid(0, 1, 0.25) == [0.0, 0.25, 0.5, 0.75, 1.0]
+    assert sample_grid(0, 1, 0.4) == [0.0, 0.4, 0.8, 1.0]
+    with pytest.raises(ValueError):
+        sample_grid(0, 1, 0)
+
+
+def test_simplify_keeps_corners_only():
+    times = sample_grid(0, 4, 0.25)
+    times, values = simplify(times, [_triangle(t) for t in times], 0.001)
+    assert times == [0.0, 2.0, 4.0]
+    assert values == [0.0, 1.0, 0.0]
+
+
+def test_readback_samples_grid(tools, song):
+    _setup(song, _triangle)
+    result = tools.get_automation_envelope_values(0, 0, 0, 0, step=1.0)
+    assert result["ok"] is True
+    assert result["parameter_name"] == "Cutoff"
+    assert result["points"]["columns"] == {
+        "time": [0.0, 1.0, 2.0, 3.0, 4.0],
+        "value": [0.0, 0.5, 1.0, 0.5, 0.0],
+    }
+    assert result["sample_count"] == 5
+    assert result["max_value"] == 1.0
+
+
+def test_readback_simplified_in_background(tools, song):
+    _setup(song, _triangle)
+    started = tools.get_automation_envelope_values(
+        0, 0, 0, 0, step=0.0625, simplify=True, background=True
+    )
+    while tools._process_tasks():
+        pass
+    result = tools.get_task_status(started["task_id"])["result"]
+    assert result["points"]["count"] == 3
+    assert result["sample_count"] == 65
+    assert result["device_name"] == "Filter"
+
+
+def test_readback_invalid_step(tools, song):
+    _setup(song, _triangle)
+    result = tools.get_automation_envelope_values(0, 0, 0, 0, step=-1)
+    assert result["ok"] is False
+    assert "step" in result["error"]
+
+
+def test_readback_rejects_out_of_range_indices(tools, song):
+    _setup(song, _triangle)
+    values = tools.get_automation_envelope_values
+    assert values(-1, 0, 0, 0)["error"] == "Invalid track index"
+    assert values(0, 1, 0, 0)["error"] == "Invalid clip index"
+    assert values(0, 0, -1, 0)["error"] == "Invalid device index"
+    assert values(0, 0, 0, 1)["error"] == "Invalid parameter index"
@@ -51,3 +51,29 @@ def tools(song, c_instance):
     from ALiveMCP_Remote.liveapi_tools import LiveAPITools
 
     return LiveAPITools(song, c_instance)
+
+
+class Clock:
+    """Settable monotonic clock for tick-driven tools."""
+
+    def __init__(self, tools, now=100.0):
+        self.tools = tools
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def tick(self, seconds=0.0):
+        """Advance by ``seconds`` and run one update_display() tick."""
+        self.now += seconds
+        self.tools._process_tasks()
+
+
+@pytest.fixture
+def clock(tools):
+    """A Clock driving ``tools``' tick jobs; ``clock.tick(seconds)`` advances and ticks."""
+    from ALiveMCP_Remote.tools.core.tick_jobs import TickJobs
+
+    clock = Clock(tools)
+    tools._tick_jobs = TickJobs(clock=clock)
+    return clock
@@ -0,0 +1,132 @@
+"""
+Tests for set_parameters_bulk.
+"""
+
+from types import SimpleNamespace
+
+
+def _param(name, value=0.0, low=0.0, high=1.0, items=None):
+    param = SimpleNamespace(name=name, value=value, min=low, max=high)
+    param.is_quantized = items is not None
+    param.value_items = items or []
+    return param
+
+
+def _setup(song):
+    device = SimpleNamespace(
+        name="Auto Filter",
+        parameters=[
+            _param("Device On", 1.0),
+            _param("Frequency"),
+            _param("Mode", items=["LP", "HP"]),
+        ],
+    )
+    song.tracks[0].devices = [device]
+    song.return_tracks[0].mixer_device.volume = _param("Track Volume", 0.85)
+    return device
+
+
+def test_bulk_writes_all_entries(tools, song):
+    device = _setup(song)
+    result = tools.set_parameters_bulk(
+        [
+            {"track_index": 0, "device_index": 0, "param_name": "Frequency", "value": 1.7},
+            {"track_index": 0, "device_index": 0, "param_index": 2, "value": "HP"},
+            {"return_index": 0, "mixer": "volume", "value": 0.5},
+        ]
+    )
+    assert result["ok"] is True
+    assert (result["written"], result["failed"]) == (3, 0)
+    assert device.parameters[1].value == 1.0
+    assert device.parameters[2].value == 1.0
+    assert song.return_tracks[0].mixer_device.volume.value == 0.5
+    assert result["results"][0]["target"] == "track 0/device 0/param 1"
+    assert result["results"][2]["value"] == 0.5
+
+
+def test_atomic_failure_writes_nothing(tools, song):
+    device = _setup(song)
+    result = tools.set_parameters_bulk(
+        [
+            {"track_index": 0, "device_index": 0, "param_index": 1, "value": 0.3},
+            {"track_index": 0, "device_index": 4, "param_index": 0, "value": 0.3},
+            {"track_index": 0, "device_index": 0, "param_index": 2, "value": "BP"},
+        ]
+    )
+    assert result["ok"] is False
+    assert result["written"] == 0
+    assert result["failed"] == 2
+    assert result["results"][0]["error"] == "Not written: another entry failed"
+    assert result["results"][1]["error"] == "Invalid device index"
+    assert "not in value_items" in result["results"][2]["error"]
+    assert device.parameters[1].value == 0.0
+
+
+def test_non_atomic_writes_resolved_entries(tools, song):
+    device = _setup(song)
+    result = tools.set_parameters_bulk(
+        [
+            {"track_index": 0, "device_index": 0, "param_index": 1, "value": 0.3},
+            {"track_index": 9, "mixer": "volume", "value": 0.1},
+            {"track_index": 0, "device_index": 0, "param_index": 1},
+        ],
+        atomic=False,
+    )
+    assert result["ok"] is True
+    assert (result["written"], result["failed"]) == (1, 2)
+    assert result["results"][2]["error"] == "Missing value"
+    assert device.parameters[1].value == 0.3
+
+
+class _LockedParam:
+    name, min, max, value = "Locked", 0.0, 1.0, 0.0
+
+    def __setattr__(self, key, value):
+        raise RuntimeError("Parameter is automated")
+
+
+def test_bulk_matches_param_name_exactly(tools, song):
+    _setup(song)
+    result = tools.set_parameters_bulk(
+        [{"track_index": 0, "device_index": 0, "param_name": "frequency", "value": 0.2}]
+    )
+    assert result["results"][0]["error"] == "Parameter not found: frequency"
+
+
+def test_atomic_write_failure_rolls_back(tools, song):
+    device = _setup(song)
+    device.parameters.append(_LockedParam())
+    result = tools.set_parameters_bulk(
+        [
+            {"track_index": 0, "device_index": 0, "param_index": 1, "value": 0.3},
+            {"track_index": 0, "device_index": 0, "param_index": 3, "value": 0.5},
+            {"track_index": 0, "device_index": 0, "param_index": 2, "value": "HP"},
+        ]
+    )
+    assert result["ok"] is False
+    assert (result["written"], result["failed"]) == (0, 3)
+    assert result["results"][0]["error"] == "Rolled back: another write failed"
+    assert result["results"][1]["error"] == "Write failed: Parameter is automated"
+    assert result["results"][2]["error"] == "Not written: another entry failed"
+    assert (device.parameters[1].value, device.parameters[2].value) == (0.0, 0.0)
+
+
+def test_non_atomic_write_failure_reports_applied(tools, song):
+    device = _setup(song)
+    device.parameters.append(_LockedParam())
+    result = tools.set_parameters_bulk(
+        [
+            {"track_index": 0, "device_index": 0, "param_index": 3, "value": 0.5},
+            {"track_index": 0, "device_index": 0, "param_index": 1, "value": 0.3},
+        ],
+        atomic=False,
+    )
+    assert result["ok"] is True
+    assert (result["written"], result["failed"]) == (1, 1)
+    assert result["results"][0]["ok"] is False
+    assert result["results"][1]["value"] == 0.3
+    assert device.parameters[1].value == 0.3
+
+
+def test_bulk_rejects_empty_entries(tools, song):
+    assert tools.set_parameters_bulk([])["error"] == "entries must be a non-empty list"
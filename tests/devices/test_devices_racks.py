@@ -264,3 +264,23 @@ def test_set_chain_solo_except_block(tools):
     tools.song = None
     result = tools.set_chain_solo(0, 0, 0, True)
     assert result["ok"] is False
+
+
+def test_get_rack_contents_fields_structure_only(tools, song):
+    chain_device = _make_device(name="Chain Device", class_name="AudioEffect")
+    chain = _make_chain()
+    chain.devices = [chain_device]
+    rack = _make_device(name="Rack", class_name="AudioEffectGroupDevice", chains=[chain])
+    song.tracks[0].devices = [rack]
+
+    result = tools.get_rack_contents(0, 0, fields=["chain_name", "devices.name"])
+
+    assert result["ok"] is True
+    assert result["chains"] == [
+        {
+            "chain_index": 0,
+            "chain_name": "Chain 1",
+            "devices": [{"device_index": 0, "name": "Chain Device"}],
+        }
+    ]
+    chain_device.parameters[0].str_for_value.assert_not_called()
@@ -78,19 +78,67 @@ def test_add_notes_filters_invalid_pitch(tools, song):
     ]
     result = tools.add_notes(0, 0, notes)
     assert result["ok"] is True
-    assert result["note_count"] == 4
+    assert result["note_count"] == 1
+    assert result["rejected_count"] == 3
+    assert [r["index"] for r in result["rejected"]] == [0, 1, 2]
+    assert result["rejected"][0]["reason"] == "pitch must be between 0 and 127"
+    assert result["rejected"][1]["reason"] == "duration must be > 0"
 
 
 def test_add_notes_exception(tools, song):
     song.tracks[0].has_midi_input = True
     song.tracks[0].clip_slots[0].has_clip = True
     song.tracks[0].clip_slots[0].clip.is_midi_clip = True
-    song.tracks[0].clip_slots[0].clip.set_notes.side_effect = Exception("err")
+    song.tracks[0].clip_slots[0].clip.add_new_notes.side_effect = Exception("err")
     notes = [{"pitch": 60, "start": 0.0, "duration": 1.0, "velocity": 100}]
     result = tools.add_notes(0, 0, notes)
     assert result["ok"] is False
 
 
+def test_add_notes_single_bulk_call_with_note_specs(tools, song):
+    tools.song = _midi_song()
+    clip = tools.song.tracks[0].clip_slots[0].clip
+    notes = [
+        {"pitch": 36 + i % 48, "start": i * 0.25, "duration": 0.25, "probability": 0.5}
+        for i in range(100)
+    ]
+    result = tools.add_notes(0, 0, notes)
+    assert result["api"] == "add_new_notes"
+    assert result["note_count"] == 100
+    clip.add_new_notes.assert_called_once()
+    assert len(clip.add_new_notes.call_args[0][0]) == 100
+    clip.set_notes.assert_not_called()
+
+
+def test_add_notes_legacy_set_notes_single_call(tools, song):
+    tools.song = _midi_song()
+    clip = tools.song.tracks[0].clip_slots[0].clip
+    del clip.add_new_notes
+    notes = [
+        {"pitch": 60, "start": 0.0, "duration": 1.0, "velocity": 90},
+        {"pitch": 64, "start_time": 1.0, "duration": 0.5, "muted": True},
+    ]
+    result = tools.add_notes(0, 0, notes)
+    assert result["api"] == "set_notes"
+    clip.set_notes.assert_called_once_with(((60, 0.0, 1.0, 90, False), (64, 1.0, 0.5, 100, True)))
+
+
+def test_add_notes_rejects_bad_extended_values(tools, song):
+    tools.song = _midi_song()
+    notes = [
+        {"pitch": 60, "probability": 2.0},
+        {"pitch": "x"},
+        "not a note",
+    ]
+    result = tools.add_notes(0, 0, notes)
+    assert result["note_count"] == 0
+    assert [r["reason"] for r in result["rejected"]] == [
+        "probability must be between 0.0 and 1.0",
+        "pitch must be a number, got 'x'",
+        "note must be an object",
+    ]
+
+
 def test_get_clip_notes_success(tools, song):
     song.tracks[0].has_midi_input = True
     song.tracks[0].clip_slots[0].has_clip = True
@@ -102,6 +150,31 @@ def test_get_clip_notes_success(tools, song):
     assert result["notes"][0]["pitch"] == 60
 
 
+def test_get_clip_notes_paginated(tools, song):
+    tools.song = _midi_song()
+    clip = tools.song.tracks[0].clip_slots[0].clip
+    clip.get_notes.return_value = tuple((60 + i, float(i), 1.0, 100, False) for i in range(5))
+
+    pitches = []
+    cursor = None
+    while True:
+        result = tools.get_clip_notes(0, 0, limit=2, cursor=cursor)
+        assert result["ok"] is True
+        assert result["total"] == 5
+        pitches.extend(n["pitch"] for n in result["notes"])
+        cursor = result["next_cursor"]
+        if cursor is None:
+            break
+    assert pitches == [60, 61, 62, 63, 64]
+
+
+def test_get_clip_notes_without_limit_has_no_page_keys(tools, song):
+    tools.song = _midi_song()
+    result = tools.get_clip_notes(0, 0)
+    assert "next_cursor" not in result
+    assert "total" not in result
+
+
 def test_get_clip_notes_invalid_track(tools):
     result = tools.get_clip_notes(-1, 0)
     assert result["ok"] is False
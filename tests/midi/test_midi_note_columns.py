@@ -0,0 +1,92 @@
+"""
+Tests for columnar note encoding (note_columns) in the MIDI note tools.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ALiveMCP_Remote.tools.midi.note_columns import decode_notes, encode_notes
+
+NOTES = (
+    (60, 0.0, 0.5, 100, False),
+    (64, 0.5, 0.25, 90, True),
+    (67, 1.75, 1.0, 127, False),
+)
+
+
+def _midi_song(notes=NOTES):
+    clip = MagicMock()
+    clip.is_midi_clip = True
+    clip.get_notes.return_value = notes
+
+    clip_slot = MagicMock()
+    clip_slot.has_clip = True
+    clip_slot.clip = clip
+
+    track = MagicMock()
+    track.has_midi_input = True
+    track.clip_slots = [clip_slot]
+
+    s = MagicMock()
+    s.tracks = [track]
+    return s, clip
+
+
+def test_get_clip_notes_columnar(tools):
+    tools.song, _ = _midi_song()
+    result = tools.get_clip_notes(0, 0, encoding="columnar")
+    assert result["ok"] is True
+    assert result["encoding"] == "columnar"
+    columns = result["notes"]["columns"]
+    assert result["notes"]["count"] == 3
+    assert columns["pitch"] == [60, 64, 67]
+    assert columns["start_time"] == [0.0, 0.5, 1.75]
+    assert columns["muted"] == [False, True, False]
+
+
+def test_get_clip_notes_columnar_base64_round_trip(tools):
+    tools.song, _ = _midi_song()
+    objects = tools.get_clip_notes(0, 0)["notes"]
+    packed = tools.get_clip_notes(0, 0, encoding="columnar_base64")["notes"]
+    assert packed["dtypes"]["pitch"] == "B"
+    assert isinstance(packed["columns"]["start_time"], str)
+    assert decode_notes(packed) == objects
+
+
+def test_get_clip_notes_rejects_unknown_encoding(tools):
+    tools.song, _ = _midi_song()
+    result = tools.get_clip_notes(0, 0, encoding="csv")
+    assert result["ok"] is False
+    assert "encoding must be one of" in result["error"]
+
+
+def test_get_notes_extended_columnar(tools):
+    tools.song, clip = _midi_song()
+    clip.get_notes_extended.return_value = NOTES
+    result = tools.get_notes_extended(0, 0, 0, 4, 0, 128, encoding="columnar")
+    assert result["count"] == 3
+    assert result["notes"]["columns"]["velocity"] == [100, 90, 127]
+
+
+def test_add_notes_accepts_columnar_payload(tools):
+    tools.song, clip = _midi_song()
+    payload = encode_notes(tools.get_clip_notes(0, 0)["notes"], "columnar_base64")
+    result = tools.add_notes(0, 0, payload)
+    assert result["ok"] is True
+    assert result["note_count"] == 3
+    assert len(clip.add_new_notes.call_args[0][0]) == 3
+
+
+def test_replace_selected_notes_accepts_columnar_payload(tools):
+    tools.song, clip = _midi_song()
+    payload = tools.get_clip_notes(0, 0, encoding="columnar")["notes"]
+    result = tools.replace_selected_notes(0, 0, payload)
+    assert result["ok"] is True
+    assert clip.replace_selected_notes.call_args[0][0] == NOTES
+
+
+def test_decode_notes_rejects_ragged_columns():
+    payload = {"format": "columnar", "columns": {"pitch": [60, 62], "duration": [1.0]}}
+    with pytest.raises(ValueError, match="different lengths"):
+        decode_notes(payload)
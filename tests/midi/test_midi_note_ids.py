@@ -0,0 +1,145 @@
+"""
+Tests for MidiNotesEditMixin note-ID editing and note_id reporting in get_notes_extended.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+
+def _note(note_id, pitch=60, start=0.0, velocity=100.0):
+    return SimpleNamespace(
+        note_id=note_id,
+        pitch=pitch,
+        start_time=start,
+        duration=0.5,
+        velocity=velocity,
+        mute=False,
+        probability=1.0,
+        velocity_deviation=0.0,
+        release_velocity=64.0,
+    )
+
+
+def _song_with_notes(notes):
+    clip = MagicMock()
+    clip.is_midi_clip = True
+    clip.get_notes_by_id.side_effect = lambda ids: [n for n in notes if n.note_id in ids]
+    clip.get_notes_extended.return_value = notes
+
+    clip_slot = MagicMock()
+    clip_slot.has_clip = True
+    clip_slot.clip = clip
+
+    track = MagicMock()
+    track.clip_slots = [clip_slot]
+
+    s = MagicMock()
+    s.tracks = [track]
+    return s, clip
+
+
+def test_get_notes_extended_reports_note_ids(tools):
+    tools.song, _ = _song_with_notes([_note(7, pitch=62, start=1.0)])
+    result = tools.get_notes_extended(0, 0, 0, 4, 0, 128)
+    assert result["notes"] == [
+        {
+            "note_id": 7,
+            "pitch": 62,
+            "start_time": 1.0,
+            "duration": 0.5,
+            "velocity": 100.0,
+            "muted": False,
+            "probability": 1.0,
+            "velocity_deviation": 0.0,
+            "release_velocity": 64.0,
+        }
+    ]
+
+
+def test_apply_note_modifications_touches_only_listed_notes(tools):
+    notes = [_note(1), _note(2, pitch=64), _note(3, pitch=67)]
+    tools.song, clip = _song_with_notes(notes)
+
+    result = tools.apply_note_modifications(0, 0, [{"note_id": 2, "velocity": 70, "start": 0.02}])
+
+    assert result["ok"] is True
+    assert result["modified_count"] == 1
+    clip.get_notes_by_id.assert_called_once_with((2,))
+    applied = clip.apply_note_modifications.call_args[0][0]
+    assert [n.note_id for n in applied] == [2]
+    assert notes[1].velocity == 70.0
+    assert notes[1].start_time == 0.02
+    assert notes[0].velocity == 100.0
+
+
+def test_apply_note_modifications_reports_rejections(tools):
+    tools.song, clip = _song_with_notes([_note(1)])
+    result = tools.apply_note_modifications(
+        0,
+        0,
+        [
+            {"note_id": 1, "velocity": 300},
+            {"note_id": 99, "pitch": 61},
+            {"velocity": 10},
+            {"note_id": 1, "colour": "red"},
+        ],
+    )
+    assert result["modified_count"] == 0
+    assert [r["reason"] for r in result["rejected"]] == [
+        "velocity must be between 0 and 127",
+        "unknown note_id",
+        "note_id is required",
+        "unknown field: colour",
+    ]
+    clip.apply_note_modifications.assert_not_called()
+
+
+def test_apply_note_modifications_falls_back_to_all_notes(tools):
+    notes = [_note(1), _note(2)]
+    tools.song, clip = _song_with_notes(notes)
+    clip.get_notes_by_id.side_effect = RuntimeError("unknown id")
+    clip.get_all_notes_extended.return_value = notes
+
+    result = tools.apply_note_modifications(0, 0, [{"note_id": 1, "muted": True}])
+
+    assert result["modified_count"] == 1
+    assert notes[0].mute is True
+    clip.apply_note_modifications.assert_called_once_with(notes)
+
+
+def test_apply_note_modifications_merges_duplicate_ids(tools):
+    notes = [_note(1)]
+    tools.song, clip = _song_with_notes(notes)
+    result = tools.apply_note_modifications(
+        0, 0, [{"note_id": 1, "velocity": 70}, {"note_id": 1, "pitch": 62, "velocity": 80}]
+    )
+    assert result["modified_count"] == 1
+    assert (notes[0].pitch, notes[0].velocity) == (62, 80.0)
+
+
+def test_note_id_tools_require_live_11(tools):
+    tools.song, clip = _song_with_notes([])
+    del clip.apply_note_modifications
+    result = tools.remove_notes_by_id(0, 0, [1])
+    assert result == {"ok": False, "error": "Note ids require Live 11 or later"}
+
+
+def test_remove_notes_by_id(tools):
+    tools.song, clip = _song_with_notes([_note(1), _note(2)])
+    result = tools.remove_notes_by_id(0, 0, [2, 1, 2, 9])
+    assert result["removed_count"] == 2
+    assert result["removed"] == [1, 2]
+    assert result["missing"] == [9]
+    clip.remove_notes_by_id.assert_called_once_with((1, 2))
+
+
+def test_remove_notes_by_id_skips_unknown_ids(tools):
+    tools.song, clip = _song_with_notes([_note(1)])
+    result = tools.remove_notes_by_id(0, 0, [5])
+    assert result["removed_count"] == 0
+    clip.remove_notes_by_id.assert_not_called()
+
+
+def test_remove_notes_by_id_invalid_clip(tools):
+    tools.song, _ = _song_with_notes([])
+    assert tools.remove_notes_by_id(0, 5, [1])["error"] == "Invalid clip index"
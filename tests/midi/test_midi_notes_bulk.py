@@ -0,0 +1,103 @@
+"""
+Tests for MidiNotesBulkMixin get_all_notes / set_notes_bulk.
+"""
+
+from unittest.mock import MagicMock
+
+
+def _clip(pitch, midi=True):
+    clip = MagicMock()
+    clip.is_midi_clip = midi
+    clip.name = "clip " + str(pitch)
+    clip.length = 4.0
+    clip.get_notes.return_value = ((pitch, 0.0, 1.0, 100, False),)
+    del clip.get_all_notes_extended  # legacy (Live 10) note API
+    return clip
+
+
+def _song(grid):
+    """grid[track][scene] is a pitch (MIDI clip), "audio" or None (empty)."""
+    s = MagicMock()
+    s.tracks = []
+    for row in grid:
+        track = MagicMock()
+        track.clip_slots = []
+        for cell in row:
+            slot = MagicMock()
+            slot.has_clip = cell is not None
+            slot.clip = _clip(60, midi=False) if cell == "audio" else _clip(cell or 0)
+            track.clip_slots.append(slot)
+        s.tracks.append(track)
+    return s
+
+
+def test_get_all_notes_walks_midi_clips(tools):
+    tools.song = _song([[60, None], ["audio", 64], [67, 69]])
+    result = tools.get_all_notes()
+    assert result["ok"] is True
+    assert [(c["track_index"], c["clip_index"]) for c in result["clips"]] == [
+        (0, 0),
+        (1, 1),
+        (2, 0),
+        (2, 1),
+    ]
+    assert result["note_count"] == 4
+    assert result["clips"][1]["notes"][0]["pitch"] == 64
+
+
+def test_get_all_notes_ranges_and_columnar(tools):
+    tools.song = _song([[60, 62], [64, 65], [67, 69]])
+    result = tools.get_all_notes(track_range=[1, 2], scene_range=[1, 1], encoding="columnar")
+    assert [c["notes"]["columns"]["pitch"] for c in result["clips"]] == [[65], [69]]
+
+
+def test_get_all_notes_invalid_range(tools):
+    tools.song = _song([[60]])
+    result = tools.get_all_notes(track_range=[0, 3])
+    assert result["ok"] is False
+    assert "Invalid track range" in result["error"]
+
+
+def test_get_all_notes_explicit_clips_report_errors(tools):
+    tools.song = _song([[60, None]])
+    result = tools.get_all_notes(clips=[[0, 0], [0, 1], [5, 0]])
+    assert result["clip_count"] == 1
+    assert [e["error"] for e in result["errors"]] == ["No MIDI clip in slot", "Invalid track index"]
+
+
+def test_get_all_notes_background_streams_clips(tools):
+    tools.song = _song([[60, 62]])
+    started = tools.get_all_notes(background=True)
+    while tools.get_task_status(started["task_id"])["status"] == "running":
+        tools._process_tasks()
+    status = tools.get_task_status(started["task_id"])
+    assert status["result"]["clip_count"] == 2
+    assert len(status["partial"]) == 2
+
+
+def test_set_notes_bulk_writes_each_clip(tools):
+    tools.song = _song([[60], [62]])
+    result = tools.set_notes_bulk(
+        [
+            {"track_index": 0, "clip_index": 0, "notes": [{"pitch": 36, "start": 0.0}]},
+            {
+                "track_index": 1,
+                "clip_index": 0,
+                "notes": {"format": "columnar", "columns": {"pitch": [40, 200]}},
+                "replace": True,
+            },
+            {"track_index": 4, "clip_index": 0, "notes": []},
+        ]
+    )
+    assert result["ok"] is True
+    assert result["clip_count"] == 2
+    assert result["note_count"] == 2
+    assert result["failed"] == 1
+    assert result["results"][1]["rejected_count"] == 1
+    assert result["results"][2]["error"] == "Invalid track index"
+
+    first = tools.song.tracks[0].clip_slots[0].clip
+    second = tools.song.tracks[1].clip_slots[0].clip
+    first.remove_notes_extended.assert_not_called()
+    second.remove_notes_extended.assert_called_once_with(0, 128, 0.0, 4.0)
+    assert len(second.add_new_notes.call_args[0][0]) == 1
@@ -0,0 +1,165 @@
+"""
+Tests for the MIDI pattern index (build, incremental refresh and queries).
+"""
+
+from unittest.mock import MagicMock
+
+from ALiveMCP_Remote.tools.midi.pattern_index import clip_features
+
+
+def _clip(pitches, step=1.0, length=4.0):
+    clip = MagicMock()
+    clip.is_midi_clip = True
+    clip.name = "clip"
+    clip.length = length
+    clip.start_time = 0.0
+    clip.get_notes.return_value = tuple(
+        (p, i * step, step, 100, False) for i, p in enumerate(pitches)
+    )
+    del clip.get_all_notes_extended
+    return clip
+
+
+def _song(grid, arrangement=()):
+    """grid[track][scene] is a pitch list (MIDI clip) or None (empty slot)."""
+    s = MagicMock()
+    s.signature_numerator = 4
+    s.signature_denominator = 4
+    s.tracks = []
+    for t, row in enumerate(grid):
+        track = MagicMock()
+        track.clip_slots = []
+        for cell in row:
+            slot = MagicMock()
+            slot.has_clip = cell is not None
+            slot.clip = _clip(cell or [])
+            track.clip_slots.append(slot)
+        track.arrangement_clips = [_clip(p) for p in arrangement] if t == 0 else []
+        s.tracks.append(track)
+    return s
+
+
+def test_clip_features_melody_and_onsets():
+    notes = [
+        {"pitch": 60, "start_time": 0.0, "duration": 1.0},
+        {"pitch": 64, "start_time": 0.0, "duration": 1.0},
+        {"pitch": 67, "start_time": 1.5, "duration": 0.5},
+        {"pitch": 72, "start_time": 4.0, "duration": 1.0, "muted": True},
+    ]
+    features = clip_features(notes, 8.0, 4.0)
+    assert features["pitches"] == [64, 67]
+    assert features["intervals"] == [3]
+    assert features["bars"] == [(0, 6), ()]
+
+
+def test_build_and_find_motif_any_key(tools):
+    tools.song = _song([[[60, 62, 64, 65], [67, 69, 71, 72]], [[60, 64, 67, 72]]])
+    built = tools.build_pattern_index()
+    assert built["ok"] is True
+    assert built["clip_count"] == 3
+
+    result = tools.find_motif(pitches=[62, 64, 66, 67])
+    assert result["ok"] is True
+    assert [(m["track_index"], m["clip_index"]) for m in result["matches"]] == [(0, 0), (0, 1)]
+    assert result["matches"][0]["positions"] == [0.0]
+
+    exact = tools.find_motif(pitches=[60, 62, 64, 65], transpose=False)
+    assert [m["clip_index"] for m in exact["matches"]] == [0]
+
+
+def test_short_motif_and_arrangement_clips(tools):
+    tools.song = _song([[[60, 67]]], arrangement=[[50, 57, 50]])
+    tools.build_pattern_index()
+    result = tools.find_motif(intervals=[7])
+    keys = [m["key"] for m in result["matches"]]
+    assert keys == ["arrangement:0:0", "session:0:0"]
+    assert result["matches"][0]["kind"] == "arrangement"
+
+
+def test_find_rhythm_and_duplicates(tools):
+    tools.song = _song([[[60, 62], [60, 62]], [[65, 67], None]])
+    tools.build_pattern_index()
+
+    rhythm = tools.find_rhythm(onsets=[0, 1])
+    assert rhythm["steps"] == [0, 4]
+    assert rhythm["match_count"] == 3
+
+    exact = tools.find_duplicate_clips()
+    assert [[c["key"] for c in g["clips"]] for g in exact["groups"]] == [
+        ["session:0:0", "session:0:1"]
+    ]
+    shaped = tools.find_duplicate_clips(transposed=True)
+    assert len(shaped["groups"][0]["clips"]) == 3
+
+
+def test_queries_require_a_built_index(tools):
+    tools.song = _song([[[60, 62]]])
+    result = tools.find_duplicate_clips()
+    assert result["ok"] is False
+    assert "build_pattern_index" in result["error"]
+
+
+def test_note_listener_marks_clip_dirty_and_refreshes(tools):
+    tools.song = _song([[[60, 62, 64, 65]]])
+    tools.build_pattern_index()
+    clip = tools.song.tracks[0].clip_slots[0].clip
+    callback = clip.add_notes_listener.call_args[0][0]
+
+    clip.get_notes.return_value = ((70, 0.0, 1.0, 100, False), (75, 1.0, 1.0, 100, False))
+    callback()
+    assert tools.get_pattern_index_status()["dirty"] == 1
+
+    result = tools.find_motif(intervals=[5])
+    assert result["refreshed"] == 1
+    assert result["match_count"] == 1
+    assert tools.find_motif(intervals=[2, 2, 1])["match_count"] == 0
+
+
+def test_removed_slot_clip_leaves_index(tools):
+    tools.song = _song([[[60, 62], [60, 62]]])
+    tools.build_pattern_index()
+    slot = tools.song.tracks[0].clip_slots[1]
+    callback = slot.add_has_clip_listener.call_args[0][0]
+    slot.has_clip = False
+    callback()
+    assert tools.find_duplicate_clips()["group_count"] == 0
+    assert tools.get_pattern_index_status()["clip_count"] == 1
+
+
+def test_inserted_track_rebuilds_index(tools):
+    tools.song = _song([[[60, 62, 64, 65]]])
+    tools.build_pattern_index()
+    callback = tools.song.add_tracks_listener.call_args[0][0]
+
+    inserted = _song([[[70, 72, 74, 75], [50, 52, 54, 55]]]).tracks[0]
+    tools.song.tracks.insert(0, inserted)
+    callback()
+    assert tools.get_pattern_index_status()["stale"] is True
+
+    retry = tools.find_motif(intervals=[2, 2, 1])
+    assert retry["ok"] is False
+    assert "retry" in retry["error"]
+    task_id = tools.get_pattern_index_status()["rebuild_task"]
+    assert tools.find_motif(intervals=[2, 2, 1])["ok"] is False
+    while tools.get_task_status(task_id)["status"] == "running":
+        tools._process_tasks()
+
+    result = tools.find_motif(intervals=[2, 2, 1])
+    assert result["refreshed"] == 0
+    assert [(m["track_index"], m["clip_index"]) for m in result["matches"]] == [
+        (0, 0),
+        (0, 1),
+        (1, 0),
+    ]
+    assert tools.get_pattern_index_status()["stale"] is False
+
+
+def test_clear_pattern_index_removes_listeners(tools):
+    tools.song = _song([[[60, 62]]])
+    tools.build_pattern_index()
+    assert tools.get_pattern_index_status()["listeners"] > 0
+    result = tools.clear_pattern_index()
+    assert result == {"ok": True, "cleared": 1}
+    clip = tools.song.tracks[0].clip_slots[0].clip
+    assert clip.remove_notes_listener.called
+    assert tools.get_pattern_index_status()["built"] is False
@@ -0,0 +1,86 @@
+"""
+Tests for the gain-staging level analysis.
+"""
+
+import pytest
+
+
+def _setup(song):
+    song.tempo = 120.0
+    song.is_playing = True
+    song.signature_numerator = 4
+    song.signature_denominator = 4
+    track = song.tracks[0]
+    track.output_meter_left = 0.0
+    track.output_meter_right = 0.0
+    return track
+
+
+def test_analysis_summarises_window_of_playback(tools, song, clock):
+    track = _setup(song)
+    started = tools.analyze_levels(bars=1, tracks=[0], returns=[], master=False)
+    assert started["beats"] == 4.0
+
+    # 4 beats at 120 BPM = 2 seconds; one tick every 0.5 s.
+    for left, right in ((0.5, 0.4), (0.3, 1.0), (0.5, 0.5), (0.5, 0.5), (0.9, 0.9)):
+        track.output_meter_left = left
+        track.output_meter_right = right
+        clock.tick()
+        clock.now += 0.5
+
+    result = tools.get_level_analysis(started["analysis_id"])
+    assert result["status"] == "done"
+    assert result["beats_played"] == 4.0
+    level = result["levels"][0]
+    assert level["channel"] == "track 0"
+    assert level["peak"] == 1.0
+    assert level["meter_headroom"] == 0.0
+    assert level["clipped_ticks"] == 1
+    assert level["mean"] == pytest.approx(0.68)
+    assert level["rms"] == pytest.approx(0.7155, abs=1e-4)
+
+
+def test_analysis_waits_while_stopped(tools, song, clock):
+    _setup(song)
+    song.is_playing = False
+    started = tools.analyze_levels(bars=1, tracks=[0], returns=[], master=False)
+    for _ in range(10):
+        clock.tick(1.0)
+    result = tools.get_level_analysis(started["analysis_id"])
+    assert result["status"] == "running"
+    assert result["samples"] == 0
+
+
+def test_analyze_levels_validation(tools, song):
+    _setup(song)
+    assert tools.analyze_levels(bars=0)["error"] == "bars must be > 0"
+    assert tools.analyze_levels(returns=[3])["error"] == "Invalid return track index"
+    assert tools.get_level_analysis("levels-99")["ok"] is False
+
+
+def test_analysis_times_out_without_playback(tools, song, clock):
+    _setup(song)
+    song.is_playing = False
+    started = tools.analyze_levels(bars=1, tracks=[0], returns=[], master=False, timeout=5)
+    clock.tick(4.0)
+    song.is_playing = True
+    clock.tick()
+    song.is_playing = False
+    clock.tick(4.0)
+    assert tools.get_level_analysis(started["analysis_id"])["status"] == "running"
+
+    clock.tick(2.0)
+    result = tools.get_level_analysis(started["analysis_id"])
+    assert result["status"] == "done"
+    assert result["timed_out"] is True
+    assert result["samples"] == 1
+
+
+def test_cancel_level_analysis(tools, song):
+    _setup(song)
+    first = tools.analyze_levels(bars=1, tracks=[0], returns=[], master=False)["analysis_id"]
+    second = tools.analyze_levels(bars=1, tracks=[0], returns=[], master=False)["analysis_id"]
+    assert tools.cancel_level_analysis(first) == {"ok": True, "cancelled": [first]}
+    assert tools.get_level_analysis(first)["status"] == "cancelled"
+    assert tools.cancel_level_analysis() == {"ok": True, "cancelled": [second]}
+    assert tools.cancel_level_analysis("levels-99")["ok"] is False
@@ -209,3 +209,19 @@ def test_get_master_chain_summary_exception(tools, song):
     song.master_track = None
     result = tools.get_master_chain_summary()
     assert result["ok"] is False
+
+
+def test_get_master_chain_summary_fields(tools, song):
+    song.master_track.devices = [_make_device("Limiter", [_make_param("Ceiling", 0.9)])]
+    result = tools.get_master_chain_summary(fields=["name", "parameters.raw_value"])
+    assert result["ok"] is True
+    assert result["devices"] == [
+        {"index": 0, "name": "Limiter", "parameters": [{"index": 0, "raw_value": 0.9}]}
+    ]
+
+
+def test_get_master_chain_summary_unknown_field(tools, song):
+    song.master_track.devices = [_make_device()]
+    result = tools.get_master_chain_summary(fields=["parameters.bogus"])
+    assert result["ok"] is False
+    assert "bogus" in result["error"]
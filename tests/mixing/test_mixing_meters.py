@@ -0,0 +1,87 @@
+"""
+Tests for output-meter subscriptions.
+"""
+
+import base64
+from array import array
+
+import pytest
+
+FRAME = 1.0 / 60.0  # one update_display() tick at 60 Hz
+
+
+def _setup(song):
+    for track in (song.tracks[0], song.return_tracks[0], song.master_track):
+        track.output_meter_left = 0.0
+        track.output_meter_right = 0.0
+        track.output_meter_level = 0.0
+
+
+def test_frames_are_decimated_with_peak_hold(tools, song, clock):
+    _setup(song)
+    track = song.tracks[0]
+    sub = tools.subscribe_meters(tracks=[0], returns=[], master=False, rate_hz=10)
+    assert sub["channels"] == ["track 0"]
+    assert sub["fields"] == ["left", "right"]
+
+    for left in (0.2, 0.9, 0.3, 0.1, 0.4, 0.5):
+        track.output_meter_left = left
+        track.output_meter_right = left / 2
+        clock.tick(FRAME)
+    read = tools.read_meters(sub["subscription_id"])
+    assert read["frames"]["count"] == 1
+    assert read["frames"]["values"] == [[0.9, 0.45]]
+    assert read["next"] == 1
+    assert tools.read_meters(sub["subscription_id"], since=read["next"])["frames"]["count"] == 0
+
+
+def test_default_channels_and_base64_frames(tools, song, clock):
+    _setup(song)
+    song.master_track.output_meter_level = 0.75
+    sub = tools.subscribe_meters(fields="level", rate_hz=60)
+    assert sub["channels"] == ["track 0", "return 0", "master"]
+    clock.tick(FRAME)
+    frames = tools.read_meters(sub["subscription_id"], encoding="base64")["frames"]
+    values = array("f", base64.b64decode(frames["values"]))
+    assert frames["width"] == 3
+    assert list(values) == [0.0, 0.0, 0.75]
+
+
+def test_buffer_overflow_counts_dropped_frames(tools, song, clock):
+    _setup(song)
+    sub = tools.subscribe_meters(rate_hz=60, buffer_frames=2)
+    for _ in range(5):
+        clock.tick(FRAME)
+    read = tools.read_meters(sub["subscription_id"])
+    assert read["frames"]["seq"] == [3, 4]
+    assert read["dropped"] == 3
+
+
+def test_subscription_times_out_without_reads(tools, song, clock):
+    _setup(song)
+    sub = tools.subscribe_meters(timeout=1)
+    clock.tick(0.5)
+    tools.read_meters(sub["subscription_id"])
+    clock.tick(0.9)
+    assert tools.read_meters(sub["subscription_id"])["status"] == "running"
+    clock.tick(1.5)
+    assert tools.read_meters(sub["subscription_id"])["status"] == "done"
+
+
+def test_unsubscribe_and_validation(tools, song):
+    _setup(song)
+    sub = tools.subscribe_meters()
+    assert tools.unsubscribe_meters() == {"ok": True, "stopped": [sub["subscription_id"]]}
+    assert tools.subscribe_meters(tracks=[5])["error"] == "Invalid track index"
+    assert "fields must be drawn from" in tools.subscribe_meters(fields=["peak"])["error"]
+    assert tools.subscribe_meters(tracks=[], returns=[], master=False)["ok"] is False
+    assert tools.read_meters("meters-99")["ok"] is False
+
+
+@pytest.mark.parametrize("encoding", ["array", "base64"])
+def test_read_meters_encodings(tools, song, encoding):
+    _setup(song)
+    sub = tools.subscribe_meters()
+    assert tools.read_meters(sub["subscription_id"], encoding=encoding)["frames"]["format"] == (
+        encoding
+    )
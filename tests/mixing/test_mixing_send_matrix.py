@@ -0,0 +1,47 @@
+"""
+Tests for the send matrix tools.
+"""
+
+from types import SimpleNamespace
+
+
+def _track(name, sends):
+    params = [SimpleNamespace(value=v, min=0.0, max=1.0) for v in sends]
+    return SimpleNamespace(name=name, mixer_device=SimpleNamespace(sends=params))
+
+
+def _setup(song):
+    song.tracks = [_track("Drums", [0.0, 0.1]), _track("Vox", [0.5, 0.2])]
+    song.return_tracks = [_track("A-Reverb", [0.0, 0.3]), _track("B-Delay", [0.0, 0.0])]
+
+
+def _grid(tracks):
+    return [[s.value for s in t.mixer_device.sends] for t in tracks]
+
+
+def test_get_send_matrix(tools, song):
+    _setup(song)
+    result = tools.get_send_matrix()
+    assert result["rows"] == ["track 0", "track 1"]
+    assert result["columns"] == ["A-Reverb", "B-Delay"]
+    assert result["values"] == [[0.0, 0.1], [0.5, 0.2]]
+    assert tools.get_send_matrix(include_returns=True)["rows"][2:] == ["return 0", "return 1"]
+
+
+def test_set_send_matrix_dense_and_sparse(tools, song):
+    _setup(song)
+    result = tools.set_send_matrix(values=[[0.3, None], [0.4, 2.0]], updates=[[0, 1, 0.9]])
+    assert result == {"ok": True, "written": 4, "clamped": 1}
+    assert _grid(song.tracks) == [[0.3, 0.9], [0.4, 1.0]]
+
+    tools.set_send_matrix(updates=[[2, 1, 0.6]], include_returns=True)
+    assert song.return_tracks[0].mixer_device.sends[1].value == 0.6
+
+
+def test_set_send_matrix_validates_before_writing(tools, song):
+    _setup(song)
+    result = tools.set_send_matrix(updates=[[0, 0, 0.7], [0, 5, 0.1]])
+    assert result == {"ok": False, "error": "Invalid send index"}
+    assert song.tracks[0].mixer_device.sends[0].value == 0.0
+    assert tools.set_send_matrix(updates=[[2, 0, 0.1]])["error"] == "Invalid track index"
+    assert tools.set_send_matrix(values=[[0.1, 0.1]])["error"] == "values must have 2 rows"
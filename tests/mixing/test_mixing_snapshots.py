@@ -0,0 +1,178 @@
+"""
+Tests for mixer snapshot capture, recall and morphing.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+
+def _param(value, low=0.0, high=1.0):
+    return SimpleNamespace(value=value, min=low, max=high)
+
+
+def _channel(name, volume, pan, sends, mute=False, solo=False, assign=0):
+    mixer = SimpleNamespace(
+        volume=_param(volume),
+        panning=_param(pan, -1.0, 1.0),
+        sends=[_param(v) for v in sends],
+        crossfade_assign=assign,
+    )
+    return SimpleNamespace(name=name, mixer_device=mixer, mute=mute, solo=solo)
+
+
+def _setup(song):
+    song.tempo = 120.0
+    song.tracks = [_channel("Drums", 0.8, 0.0, [0.1])]
+    song.return_tracks = [_channel("Reverb", 0.7, 0.0, [])]
+    master = _channel("Master", 0.85, 0.0, [])
+    del master.mute, master.solo, master.mixer_device.crossfade_assign
+    master.mixer_device.crossfader = _param(0.0, -1.0, 1.0)
+    song.master_track = master
+
+
+def _mix(song):
+    track = song.tracks[0]
+    return (
+        track.mixer_device.volume.value,
+        track.mixer_device.panning.value,
+        track.mixer_device.sends[0].value,
+        track.mute,
+        track.mixer_device.crossfade_assign,
+        song.master_track.mixer_device.crossfader.value,
+    )
+
+
+def _change_mix(song):
+    track = song.tracks[0]
+    track.mixer_device.volume.value = 0.2
+    track.mixer_device.panning.value = 0.5
+    track.mixer_device.sends[0].value = 0.9
+    track.mute = True
+    track.mixer_device.crossfade_assign = 2
+    song.master_track.mixer_device.crossfader.value = 1.0
+
+
+def test_capture_and_instant_recall(tools, song):
+    _setup(song)
+    captured = tools.capture_mixer_snapshot("verse")
+    assert captured["channels"] == 3
+    assert captured["snapshots"] == ["verse"]
+    _change_mix(song)
+
+    recalled = tools.recall_mixer_snapshot("verse")
+    assert recalled == {
+        "ok": True,
+        "name": "verse",
+        "channels": 3,
+        "morph_id": None,
+        "remapped": [],
+    }
+    assert _mix(song) == (0.8, 0.0, 0.1, False, 0, 0.0)
+
+
+def test_morph_blends_continuous_and_switches_discrete(tools, song):
+    _setup(song)
+    tools.capture_mixer_snapshot("a")
+    _change_mix(song)
+    tools.capture_mixer_snapshot("b")
+
+    tools.morph_mixer_snapshots("a", "b", amount=0.25)
+    volume, pan, send, mute, assign, crossfader = _mix(song)
+    assert (volume, pan, send) == (pytest.approx(0.65), pytest.approx(0.125), pytest.approx(0.3))
+    assert (mute, assign, crossfader) == (False, 0, 0.25)
+
+    tools.morph_mixer_snapshots("a", "b", amount=0.75)
+    assert _mix(song)[3:5] == (True, 2)
+
+
+def test_timed_recall_runs_on_ticks(tools, song, clock):
+    _setup(song)
+    tools.capture_mixer_snapshot("verse")
+    _change_mix(song)
+    started = tools.recall_mixer_snapshot("verse", duration_beats=2)
+    assert started["morph_id"].startswith("mixer_morph-")
+
+    clock.tick(0.5)
+    assert song.tracks[0].mixer_device.volume.value == pytest.approx(0.5)
+    clock.tick(0.5)
+    assert _mix(song) == (pytest.approx(0.8), 0.0, pytest.approx(0.1), False, 0, 0.0)
+    assert tools._jobs.get(started["morph_id"]).status == "done"
+
+
+def test_recall_follows_tracks_by_name(tools, song):
+    _setup(song)
+    song.tracks.append(_channel("Bass", 0.6, -0.5, [0.0]))
+    tools.capture_mixer_snapshot("verse")
+    keys = _channel("Keys", 0.3, 0.2, [0.4])
+    song.tracks = [keys, song.tracks[1], song.tracks[0]]
+
+    recalled = tools.recall_mixer_snapshot("verse")
+    assert [(t.name, t.mixer_device.volume.value) for t in song.tracks] == [
+        ("Keys", 0.3),
+        ("Bass", 0.6),
+        ("Drums", 0.8),
+    ]
+    assert recalled["remapped"] == [
+        {"channel": "track 0", "name": "Drums", "applied_to": "track 2", "current_name": "Drums"}
+    ]
+
+    song.tracks = [_channel("Pads", 0.1, 0.0, [0.0])]
+    recalled = tools.recall_mixer_snapshot("verse")
+    assert song.tracks[0].mixer_device.volume.value == 0.8
+    assert recalled["remapped"][0]["current_name"] == "Pads"
+    assert recalled["remapped"][1]["applied_to"] is None
+
+
+def test_snapshot_file_round_trip(tools, song, tmp_path):
+    _setup(song)
+    path = tmp_path / "verse.json"
+    tools.capture_mixer_snapshot("verse", path=str(path))
+    _change_mix(song)
+    tools._stored_mixer_snapshots = None
+
+    recalled = tools.recall_mixer_snapshot(path=str(path))
+    assert recalled["name"] == "verse"
+    assert _mix(song)[0] == 0.8
+
+    again = tools.capture_mixer_snapshot("chorus", path=str(path))
+    assert again["ok"] is False
+    assert "overwrite" in again["error"]
+    assert tools.capture_mixer_snapshot("chorus", path=str(path), overwrite=True)["ok"] is True
+
+
+def test_snapshot_relative_paths_use_project_folder(tools, song, tmp_path):
+    _setup(song)
+    song.project_root_folder = None
+    result = tools.capture_mixer_snapshot("verse", path="verse.json")
+    assert "absolute path" in result["error"]
+    song.project_root_folder = str(tmp_path)
+    result = tools.capture_mixer_snapshot("verse", path="mixes/verse.json")
+    assert result["path"] == str(tmp_path / "mixes" / "verse.json")
+    assert (tmp_path / "mixes" / "verse.json").exists()
+
+
+def test_malformed_snapshot_file_is_not_stored(tools, song, tmp_path):
+    _setup(song)
+    path = tmp_path / "verse.json"
+    tools.capture_mixer_snapshot("verse", path=str(path))
+    data = json.loads(path.read_text())
+    data["pan"] = data["pan"][:1]
+    path.write_text(json.dumps(data))
+    _change_mix(song)
+
+    result = tools.recall_mixer_snapshot("broken", path=str(path))
+    assert result["ok"] is False
+    assert "pan must list one value per channel" in result["error"]
+    assert "broken" not in tools._mixer_snapshots
+    assert _mix(song)[0] == 0.2
+
+
+def test_snapshot_errors(tools, song):
+    _setup(song)
+    assert tools.recall_mixer_snapshot("missing")["error"] == "Unknown snapshot: missing"
+    assert tools.recall_mixer_snapshot()["error"] == "Pass name or path"
+    tools.capture_mixer_snapshot("a")
+    assert tools.morph_mixer_snapshots("a", "a", amount=2)["ok"] is False
+    assert "curve must be one of" in tools.recall_mixer_snapshot("a", curve="bounce")["error"]
@@ -0,0 +1,84 @@
+"""
+Tests for harmonic analysis (server_tools.harmony and analyze_harmony).
+"""
+
+import base64
+from array import array
+
+from server_tools import analysis_tools, call_local_tool
+from server_tools.harmony import bar_histograms, estimate_key, label_chord
+
+
+def _hist(pitch_classes):
+    hist = [0.0] * 12
+    for pc in pitch_classes:
+        hist[pc % 12] += 1.0
+    return hist
+
+
+def test_label_chord_triads_and_sevenths():
+    assert label_chord(_hist([0, 4, 7])) == "C"
+    assert label_chord(_hist([9, 0, 4])) == "Am"
+    assert label_chord(_hist([7, 11, 2, 5])) == "G7"
+    assert label_chord(_hist([])) is None
+    assert label_chord(_hist([3])) is None
+
+
+def test_estimate_key_from_scale_weighting():
+    # A natural minor with emphasis on the tonic triad.
+    hist = _hist([9, 11, 0, 2, 4, 5, 7, 9, 0, 4, 9, 4])
+    assert estimate_key(hist)["key"] == "A minor"
+
+
+def test_bar_histograms_split_notes_across_bar_lines():
+    bars = bar_histograms([60, 64], [0.0, 3.0], [1.0, 2.0], 8.0, 4.0)
+    assert bars[0][0] == 1.0
+    assert bars[0][4] == 1.0
+    assert bars[1][4] == 1.0
+
+
+def _packed_clip(track, clip, notes, length=8.0):
+    def pack(code, values):
+        return base64.b64encode(array(code, values).tobytes()).decode()
+
+    return {
+        "track_index": track,
+        "clip_index": clip,
+        "name": "clip",
+        "length": length,
+        "notes": {
+            "format": "columnar_base64",
+            "dtypes": {"pitch": "B", "start_time": "f", "duration": "f", "muted": "B"},
+            "columns": {
+                "pitch": pack("B", [n[0] for n in notes]),
+                "start_time": pack("f", [n[1] for n in notes]),
+                "duration": pack("f", [n[2] for n in notes]),
+                "muted": pack("B", [0] * len(notes)),
+            },
+        },
+    }
+
+
+def test_analyze_harmony_song_key_scene_chords_and_cache():
+    analysis_tools._cache.clear()
+    # C - F - G7 - C over four bars; a one-bar A bass clip loops underneath.
+    progression = [(0, (60, 64, 67)), (4, (65, 69, 72)), (8, (67, 71, 62, 65)), (12, (60, 64, 67))]
+    chords = [(p, float(bar), 4.0) for bar, pitches in progression for p in pitches]
+    bass = [(45, 0.0, 4.0)]
+    clips = [_packed_clip(0, 0, chords, length=16.0), _packed_clip(1, 0, bass, length=4.0)]
+
+    def call(action, params):
+        if action == "get_all_notes":
+            return {"ok": True, "clips": clips, "errors": []}
+        return {"ok": True, "time_signature_numerator": 4, "time_signature_denominator": 4}
+
+    result = call_local_tool("analyze_harmony", {}, call)
+    assert result["ok"] is True
+    assert result["key"]["key"] == "C major"
+    assert result["clips"][0]["chords"] == ["C", "F", "G7", "C"]
+    assert result["scenes"][0]["chords"] == ["Am7", "F", "G7", "Am7"]
+    assert result["cache_hits"] == 0
+
+    again = call_local_tool("analyze_harmony", {"exclude_tracks": [1]}, call)
+    assert again["cache_hits"] == 1
+    assert again["scenes"][0]["chords"] == ["C", "F", "G7", "C"]
@@ -0,0 +1,191 @@
+"""
+Tests for the pure-Python SMF codec and the export/import_midi_file tools.
+"""
+
+import base64
+import struct
+from array import array
+
+import pytest
+
+from server_tools import call_local_tool
+from server_tools.smf import SMFError, build_track, read_smf, write_smf
+
+NOTES = [
+    {"pitch": 60, "start_time": 0.0, "duration": 0.5, "velocity": 100},
+    {"pitch": 64, "start_time": 0.5, "duration": 1.5, "velocity": 90},
+    {"pitch": 60, "start_time": 0.5, "duration": 0.25, "velocity": 80},
+]
+
+
+def test_round_trip_notes_tempo_and_signature():
+    data = write_smf([build_track(NOTES, 480, "Lead", tempo=128.0, time_signature=(6, 8))])
+    smf = read_smf(data)
+    assert smf["format"] == 0
+    assert smf["tempo"] == 128.0
+    assert smf["time_signature"] == [6, 8]
+    track = smf["tracks"][0]
+    assert track["name"] == "Lead"
+    assert [(n["pitch"], n["start_time"], n["duration"]) for n in track["notes"]] == [
+        (60, 0.0, 0.5),
+        (60, 0.5, 0.25),
+        (64, 0.5, 1.5),
+    ]
+
+
+def test_reads_running_status_and_zero_velocity_note_off():
+    events = bytes([0x00, 0x90, 60, 100, 0x60, 60, 0, 0x00, 0xFF, 0x2F, 0x00])
+    data = (
+        b"MThd"
+        + struct.pack(">IHHH", 6, 0, 1, 96)
+        + b"MTrk"
+        + struct.pack(">I", len(events))
+        + events
+    )
+    notes = read_smf(data)["tracks"][0]["notes"]
+    assert notes == [
+        {"pitch": 60, "start_time": 0.0, "duration": 1.0, "velocity": 100, "channel": 0}
+    ]
+
+
+def test_rejects_non_midi_data():
+    with pytest.raises(SMFError, match="MThd"):
+        read_smf(b"RIFF0000")
+
+
+def _packed(notes):
+    def pack(code, values):
+        return base64.b64encode(array(code, values).tobytes()).decode()
+
+    return {
+        "format": "columnar_base64",
+        "dtypes": {"pitch": "B", "start_time": "f", "duration": "f", "velocity": "f", "muted": "B"},
+        "columns": {
+            "pitch": pack("B", [n["pitch"] for n in notes]),
+            "start_time": pack("f", [n["start_time"] for n in notes]),
+            "duration": pack("f", [n["duration"] for n in notes]),
+            "velocity": pack("f", [n["velocity"] for n in notes]),
+            "muted": pack("B", [0] * len(notes)),
+        },
+    }
+
+
+class FakeAbleton:
+    def __init__(self, clips=()):
+        self.clips = list(clips)
+        self.calls = []
+
+    def __call__(self, action, params):
+        self.calls.append((action, params))
+        if action == "get_all_notes":
+            return {"ok": True, "clips": self.clips, "errors": []}
+        if action == "get_session_info":
+            return {
+                "ok": True,
+                "tempo": 100.0,
+                "time_signature_numerator": 4,
+                "time_signature_denominator": 4,
+            }
+        if action == "set_notes_bulk":
+            return {"ok": True, "results": [{"ok": True} for _ in params["entries"]]}
+        return {"ok": True}
+
+
+def test_export_track_concatenates_clips(tmp_path):
+    fake = FakeAbleton(
+        [
+            {
+                "track_index": 0,
+                "clip_index": 0,
+                "name": "A",
+                "length": 4.0,
+                "notes": _packed(NOTES),
+            },
+            {
+                "track_index": 0,
+                "clip_index": 2,
+                "name": "B",
+                "length": 2.0,
+                "notes": _packed(NOTES[:1]),
+            },
+        ]
+    )
+    target = tmp_path / "out" / "track.mid"
+    result = call_local_tool("export_midi_file", {"path": str(target), "track_index": 0}, fake)
+    assert result["ok"] is True
+    assert result["note_count"] == 4
+
+    smf = read_smf(target.read_bytes())
+    assert smf["tempo"] == 100.0
+    starts = [n["start_time"] for n in smf["tracks"][0]["notes"]]
+    assert starts == [0.0, 0.5, 0.5, 4.0]
+    assert [m["text"] for m in smf["tracks"][0]["markers"]] == ["A", "B"]
+
+    again = call_local_tool("export_midi_file", {"path": str(target), "track_index": 0}, fake)
+    assert again["ok"] is False
+    assert "overwrite" in again["error"]
+
+
+def test_import_tracks_layout_creates_one_clip_per_smf_track(tmp_path):
+    source = tmp_path / "song.mid"
+    source.write_bytes(
+        write_smf([build_track(NOTES, name="Keys"), build_track(NOTES[:1], name="Bass")])
+    )
+    fake = FakeAbleton()
+    result = call_local_tool(
+        "import_midi_file",
+        {"path": str(source), "track_index": 1, "clip_index": 0, "layout": "tracks"},
+        fake,
+    )
+    assert result["ok"] is True
+    assert [(c["track_index"], c["name"], c["length"]) for c in result["clips"]] == [
+        (1, "Keys", 4.0),
+        (2, "Bass", 4.0),
+    ]
+    writes = [params for action, params in fake.calls if action == "set_notes_bulk"]
+    assert [w["entries"][0]["track_index"] for w in writes] == [1, 2]
+    assert writes[0]["entries"][0]["notes"]["columns"]["pitch"] == [60, 60, 64]
+
+
+def test_import_stops_without_leaving_empty_clips(tmp_path):
+    source = tmp_path / "song.mid"
+    source.write_bytes(
+        write_smf([build_track(NOTES, name="Keys"), build_track(NOTES[:1], name="Bass")])
+    )
+    fake = FakeAbleton()
+    default = FakeAbleton.__call__
+
+    def call(action, params):
+        if action == "set_notes_bulk" and params["entries"][0]["track_index"] == 2:
+            fake.calls.append((action, params))
+            return {"ok": True, "results": [{"ok": False, "error": "Not a MIDI clip"}]}
+        return default(fake, action, params)
+
+    result = call_local_tool(
+        "import_midi_file",
+        {"path": str(source), "track_index": 1, "clip_index": 0, "layout": "tracks"},
+        call,
+    )
+    assert result["ok"] is False
+    assert result["error"] == "Not a MIDI clip"
+    assert [c["name"] for c in result["imported"]] == ["Keys"]
+    assert fake.calls[-1] == ("delete_clip", {"track_index": 2, "clip_index": 0})
+
+
+def test_rejects_zero_division_and_zero_tempo():
+    with pytest.raises(SMFError, match="time division"):
+        read_smf(write_smf([build_track(NOTES)], ppq=0))
+    tempo = write_smf([build_track(NOTES, tempo=120.0)])
+    zeroed = tempo.replace(b"\xff\x51\x03\x07\xa1\x20", b"\xff\x51\x03\x00\x00\x00")
+    assert zeroed != tempo
+    with pytest.raises(SMFError, match="tempo"):
+        read_smf(zeroed)
+
+
+def test_relative_path_without_project_folder_is_an_error():
+    def call(action, params):
+        return {"ok": True, "project_root_folder": None}
+
+    result = call_local_tool("export_midi_file", {"path": "x.mid", "track_index": 0}, call)
+    assert result["ok"] is False
+    assert "absolute path" in result["error"]
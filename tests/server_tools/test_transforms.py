@@ -0,0 +1,170 @@
+"""
+Tests for the server-side MIDI transform pipeline (server_tools.transforms and
+transform_clip_notes).
+"""
+
+import pytest
+
+from server_tools import call_local_tool
+from server_tools.theory import parse_root, scale_pitch_classes
+from server_tools.transforms import apply_transforms
+
+
+def _cols(pitches, starts, durations=None, velocities=None):
+    n = len(pitches)
+    return {
+        "pitch": list(pitches),
+        "start_time": list(starts),
+        "duration": list(durations or [0.25] * n),
+        "velocity": list(velocities or [100] * n),
+        "muted": [False] * n,
+    }
+
+
+def test_transpose_folds_out_of_range():
+    cols = apply_transforms(_cols([60, 125], [0, 1]), 4.0, [{"op": "transpose", "semitones": 5}])
+    assert cols["pitch"] == [65, 118]
+
+
+def test_transpose_drop_removes_rows_in_every_column():
+    cols = apply_transforms(
+        _cols([60, 125], [0, 1]), 4.0, [{"op": "transpose", "semitones": 5, "out_of_range": "drop"}]
+    )
+    assert cols["pitch"] == [65]
+    assert cols["start_time"] == [0]
+
+
+def test_scale_constrains_to_nearest_degree():
+    cols = apply_transforms(
+        _cols([61, 63, 66], [0, 1, 2]), 4.0, [{"op": "scale", "root": "C", "scale": "major"}]
+    )
+    assert cols["pitch"] == [60, 62, 65]
+    assert scale_pitch_classes("A", "minor_pentatonic") == [0, 2, 4, 7, 9]
+    assert parse_root("Bb") == 10
+
+
+def test_quantize_strength_and_swing():
+    cols = apply_transforms(
+        _cols([60, 60], [0.1, 0.55]), 4.0, [{"op": "quantize", "grid": 0.5, "strength": 0.5}]
+    )
+    assert cols["start_time"] == pytest.approx([0.05, 0.525])
+
+    swung = apply_transforms(
+        _cols([60, 60], [0.0, 0.5]), 4.0, [{"op": "quantize", "grid": 0.5, "swing": 1.0}]
+    )
+    assert swung["start_time"] == pytest.approx([0.0, 0.5 + 0.5 / 3])
+
+
+def test_humanize_is_seeded_and_bounded():
+    spec = [{"op": "humanize", "timing": 0.02, "velocity": 10}]
+    a = apply_transforms(_cols([60] * 8, [1.0] * 8), 4.0, spec, seed=7)
+    b = apply_transforms(_cols([60] * 8, [1.0] * 8), 4.0, spec, seed=7)
+    assert a == b
+    assert all(0.98 <= s <= 1.02 for s in a["start_time"])
+    assert all(90 <= v <= 110 for v in a["velocity"])
+
+
+def test_velocity_curve_clamps():
+    cols = apply_transforms(
+        _cols([60, 60], [0, 1], velocities=[127, 20]),
+        4.0,
+        [{"op": "velocity", "scale": 1.5, "min": 30, "max": 120}],
+    )
+    assert cols["velocity"] == [120, 30]
+
+
+def test_velocity_set_is_clamped_to_range():
+    cols = apply_transforms(
+        _cols([60, 60], [0, 1]), 4.0, [{"op": "velocity", "set": 127, "max": 100}]
+    )
+    assert cols["velocity"] == [100.0, 100.0]
+
+
+def test_legato_extends_to_next_onset_and_clip_end():
+    cols = apply_transforms(
+        _cols([60, 64, 67], [0.0, 0.0, 1.0]), 4.0, [{"op": "legato", "gap": 0.0}]
+    )
+    assert cols["duration"] == [1.0, 1.0, 3.0]
+
+
+def test_retrograde_mirrors_in_time():
+    cols = apply_transforms(
+        _cols([60, 62], [0.0, 1.0], durations=[0.5, 1.0]), 4.0, [{"op": "retrograde"}]
+    )
+    assert cols["start_time"] == [3.5, 2.0]
+
+
+def test_unknown_op_and_bad_params_are_reported():
+    with pytest.raises(ValueError, match="unknown op 'reverse'"):
+        apply_transforms(_cols([60], [0]), 4.0, [{"op": "reverse"}])
+    with pytest.raises(ValueError, match="transforms\\[0\\] \\(legato\\)"):
+        apply_transforms(_cols([60], [0]), 4.0, [{"op": "legato", "amount": 1}])
+
+
+class FakeAbleton:
+    def __init__(self, columns, length=4.0):
+        self.clip = {
+            "track_index": 0,
+            "clip_index": 1,
+            "name": "Lead",
+            "length": length,
+            "notes": {"format": "columnar", "count": len(columns["pitch"]), "columns": columns},
+            "count": len(columns["pitch"]),
+        }
+        self.calls = []
+
+    def __call__(self, action, params):
+        self.calls.append((action, params))
+        if action == "get_all_notes":
+            return {"ok": True, "clips": [self.clip], "errors": []}
+        count = params["entries"][0]["notes"]["count"]
+        return {
+            "ok": True,
+            "results": [{"ok": True, "note_count": count, "rejected_count": 0}],
+        }
+
+
+def test_transform_clip_notes_reads_once_and_writes_once():
+    fake = FakeAbleton(dict(_cols([61, 66], [0.1, 1.0]), note_id=[1, 2]))
+    result = call_local_tool(
+        "transform_clip_notes",
+        {
+            "track_index": 0,
+            "clip_index": 1,
+            "transforms": [{"op": "scale", "scale": "major"}, {"op": "quantize", "grid": 0.25}],
+        },
+        fake,
+    )
+    assert result["ok"] is True
+    assert result["applied"] == ["scale", "quantize"]
+    assert [action for action, _ in fake.calls] == ["get_all_notes", "set_notes_bulk"]
+    entry = fake.calls[1][1]["entries"][0]
+    assert entry["replace"] is True
+    assert entry["notes"]["columns"]["pitch"] == [60, 65]
+    assert "note_id" not in entry["notes"]["columns"]
+
+
+def test_transform_clip_notes_dry_run_does_not_write():
+    fake = FakeAbleton(_cols([60], [0.0]))
+    result = call_local_tool(
+        "transform_clip_notes",
+        {
+            "track_index": 0,
+            "clip_index": 1,
+            "transforms": [{"op": "transpose", "semitones": 12}],
+            "dry_run": True,
+        },
+        fake,
+    )
+    assert result["notes"]["columns"]["pitch"] == [72]
+    assert len(fake.calls) == 1
+
+
+def test_transform_clip_notes_reports_bad_pipeline():
+    result = call_local_tool(
+        "transform_clip_notes",
+        {"track_index": 0, "clip_index": 1, "transforms": [{"op": "nope"}]},
+        FakeAbleton(_cols([60], [0.0])),
+    )
+    assert result["ok"] is False
+    assert "unknown op" in result["error"]
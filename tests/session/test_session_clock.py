@@ -0,0 +1,24 @@
+"""
+Tests for clock_sync.
+"""
+
+
+def test_clock_sync_reports_transport_state(tools, song):
+    song.current_song_time = 12.5
+    song.tempo = 124.0
+    song.is_playing = True
+    song.signature_numerator = 3
+    song.signature_denominator = 4
+    result = tools.clock_sync(client_time=1.25)
+    assert result["ok"] is True
+    assert result["current_song_time"] == 12.5
+    assert result["tempo"] == 124.0
+    assert result["is_playing"] is True
+    assert result["signature_numerator"] == 3
+    assert result["client_time"] == 1.25
+    assert tools.clock_sync()["remote_time"] >= result["remote_time"]
+
+
+def test_clock_sync_returns_error_dict(tools, song):
+    song.current_song_time = "bad"
+    assert tools.clock_sync()["ok"] is False
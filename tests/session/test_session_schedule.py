@@ -0,0 +1,117 @@
+"""
+Tests for beat-quantized command scheduling.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ALiveMCP_Remote.profiler import Profiler
+from ALiveMCP_Remote.tools.core.scheduler import grid_beats, next_boundary
+
+
+def _setup(song, position=5.5):
+    song.current_song_time = position
+    song.signature_numerator = 4
+    song.signature_denominator = 4
+    song.clip_trigger_quantization = 4  # 1 bar
+    song.tempo = 120.0
+
+
+def test_next_boundary_skips_position_on_grid_line():
+    assert next_boundary(4.0, 4.0) == 8.0
+    assert next_boundary(5.5, 4.0, 2) == 12.0
+    assert next_boundary(5.5, 0.0) == 5.5
+
+
+def test_grid_follows_time_signature(song):
+    _setup(song)
+    song.signature_numerator = 6
+    song.signature_denominator = 8
+    assert grid_beats(song, "1 bar") == 3.0
+    assert grid_beats(song, "2 bars") == 6.0
+    assert grid_beats(song, "1/8t") == pytest.approx(1.0 / 3.0)
+
+
+def test_schedule_fires_on_first_tick_at_or_after_beat(tools, song):
+    _setup(song)
+    scheduled = tools.schedule(command={"action": "set_tempo", "bpm": 128})
+    assert scheduled["beat"] == 8.0
+    assert scheduled["quantize"] == "1 bar"
+
+    song.current_song_time = 7.99
+    tools._process_tasks()
+    assert song.tempo == 120.0
+    assert tools.get_scheduled(scheduled["schedule_id"])["status"] == "pending"
+
+    song.current_song_time = 8.01
+    tools._process_tasks()
+    entry = tools.get_scheduled(scheduled["schedule_id"])
+    assert song.tempo == 128
+    assert entry["status"] == "fired"
+    assert entry["fired_at"] == 8.01
+    assert entry["results"][0]["ok"] is True
+
+
+def test_batches_fire_in_beat_order(tools, song):
+    _setup(song)
+    fired = []
+    tools.ping = lambda tag: fired.append(tag) or {"ok": True}
+    tools.schedule(command={"action": "ping", "tag": "late"}, beat=12)
+    tools.schedule(
+        commands=[{"action": "ping", "tag": "a"}, {"action": "ping", "tag": "b"}],
+        quantize="beat",
+        count=2,
+    )
+    song.current_song_time = 20.0
+    tools._process_tasks()
+    assert fired == ["a", "b", "late"]
+    assert tools.get_scheduled()["pending"] == 0
+
+
+def test_cancel_scheduled_skips_entry(tools, song):
+    _setup(song)
+    scheduled = tools.schedule(command={"action": "set_tempo", "bpm": 90}, quantize="4 bars")
+    assert scheduled["beat"] == 16.0
+    assert tools.cancel_scheduled() == {"ok": True, "cancelled": [scheduled["schedule_id"]]}
+    song.current_song_time = 17.0
+    tools._process_tasks()
+    assert song.tempo == 120.0
+    assert tools.get_scheduled(scheduled["schedule_id"])["status"] == "cancelled"
+
+
+def test_cancel_drops_entries_from_the_scheduler(tools, song):
+    _setup(song)
+    first = tools.schedule(command={"action": "ping"}, quantize="4 bars")["schedule_id"]
+    tools.schedule(command={"action": "ping"}, quantize="8 bars")
+    job = tools._command_scheduler
+    tools.cancel_scheduled(first)
+    assert job.describe(0)["pending"] == 1
+    tools.cancel_scheduled()
+    assert job.status == "cancelled"
+    assert tools._jobs.running("scheduler") == []
+
+
+def test_scheduled_commands_use_aliases_and_profiler(tools, song):
+    _setup(song)
+    tools._profiler = Profiler()
+    tools.set_clip_name = MagicMock(return_value={"ok": True})
+    tools.schedule(
+        command={"action": "set_clip_name", "track_index": 0, "scene_index": 2, "name": "A"},
+        beat=6,
+    )
+    song.current_song_time = 6.0
+    tools._process_tasks()
+    tools.set_clip_name.assert_called_once_with(track_index=0, clip_index=2, name="A")
+    assert tools._profiler.stats()["actions"]["set_clip_name"]["count"] == 1
+
+
+def test_schedule_validates_input(tools, song):
+    _setup(song)
+    assert tools.schedule()["error"] == "Pass command or commands"
+    assert tools.schedule(command={"action": "nope"})["error"] == "Unknown action: nope"
+    assert (
+        "quantize must be one of"
+        in tools.schedule(command={"action": "ping"}, quantize="3 bars")["error"]
+    )
+    assert tools.get_scheduled("schedule-99")["ok"] is False
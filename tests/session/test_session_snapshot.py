@@ -0,0 +1,116 @@
+"""
+Tests for SessionSnapshotMixin.get_song_snapshot and the shared field projection helpers.
+"""
+
+from unittest.mock import MagicMock, PropertyMock
+
+from ALiveMCP_Remote.tools.core.projection import parse_fields
+
+
+def _snapshot_song():
+    param = MagicMock()
+    param.name = "Gain"
+    param.value = 0.5
+
+    device = MagicMock()
+    device.name = "Utility"
+    device.class_name = "StereoGain"
+    device.parameters = [param]
+
+    track = MagicMock()
+    track.name = "Drums"
+    track.devices = [device]
+    track.clip_slots = [MagicMock()]
+
+    master = MagicMock()
+    master.name = "Master"
+
+    ret = MagicMock()
+    ret.name = "A-Reverb"
+
+    scene = MagicMock()
+    scene.name = "Verse"
+
+    s = MagicMock()
+    s.tempo = 124.0
+    s.tracks = [track]
+    s.return_tracks = [ret]
+    s.master_track = master
+    s.scenes = [scene]
+    return s
+
+
+def test_parse_fields_builds_nested_tree():
+    tree = parse_fields("tracks.name, tracks.devices.class_name,tempo")
+    assert tree == {"tracks": {"name": None, "devices": {"class_name": None}}, "tempo": None}
+
+
+def test_parse_fields_whole_subtree_wins():
+    assert parse_fields(["tracks.name", "tracks"]) == {"tracks": None}
+    assert parse_fields(["tracks", "tracks.name"]) == {"tracks": None}
+
+
+def test_parse_fields_empty_selects_everything():
+    assert parse_fields(None) is None
+    assert parse_fields([]) is None
+    assert parse_fields("") is None
+
+
+def test_get_song_snapshot_projects_requested_fields(tools):
+    tools.song = _snapshot_song()
+    result = tools.get_song_snapshot(fields="tempo,tracks.name,tracks.devices.class_name")
+    assert result["ok"] is True
+    assert result["song"] == {
+        "tempo": 124.0,
+        "tracks": [
+            {"index": 0, "name": "Drums", "devices": [{"index": 0, "class_name": "StereoGain"}]}
+        ],
+    }
+
+
+def test_get_song_snapshot_skips_unrequested_getters(tools):
+    song = _snapshot_song()
+    display = PropertyMock(return_value="0 dB")
+    type(song.tracks[0].devices[0].parameters[0]).display_value = display
+    tools.song = song
+
+    result = tools.get_song_snapshot(fields=["tracks.devices.parameters.name"])
+
+    assert result["song"]["tracks"][0]["devices"][0]["parameters"] == [{"index": 0, "name": "Gain"}]
+    display.assert_not_called()
+
+
+def test_get_song_snapshot_includes_master_and_returns(tools):
+    tools.song = _snapshot_song()
+    result = tools.get_song_snapshot(fields=["master_track.name", "return_tracks.name"])
+    assert result["song"]["master_track"] == {"name": "Master"}
+    assert result["song"]["return_tracks"] == [{"index": 0, "name": "A-Reverb"}]
+
+
+def test_get_song_snapshot_default_depth_stops_at_tracks(tools):
+    tools.song = _snapshot_song()
+    result = tools.get_song_snapshot()
+    assert result["depth"] == 1
+    track = result["song"]["tracks"][0]
+    assert track["name"] == "Drums"
+    assert "devices" not in track
+    assert result["song"]["scenes"][0]["name"] == "Verse"
+
+
+def test_get_song_snapshot_depth_zero_returns_song_scalars(tools):
+    tools.song = _snapshot_song()
+    result = tools.get_song_snapshot(depth=0)
+    assert result["song"]["tempo"] == 124.0
+    assert "tracks" not in result["song"]
+
+
+def test_get_song_snapshot_unknown_field(tools):
+    tools.song = _snapshot_song()
+    result = tools.get_song_snapshot(fields=["tracks.bogus"])
+    assert result["ok"] is False
+    assert "bogus" in result["error"]
+
+
+def test_get_song_snapshot_negative_depth(tools):
+    result = tools.get_song_snapshot(depth=-1)
+    assert result == {"ok": False, "error": "depth must be >= 0"}
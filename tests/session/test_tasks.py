@@ -0,0 +1,102 @@
+"""
+Tests for the time-sliced TaskRunner and the background task tools.
+"""
+
+from ALiveMCP_Remote.tools.core.tasks import TaskRunner, run_to_completion
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting(n, clock=None, cost=0.0):
+    for i in range(n):
+        if clock is not None:
+            clock.now += cost
+        yield {"done": i + 1, "total": n, "partial": [i]}
+    return {"ok": True, "count": n}
+
+
+def test_run_to_completion_returns_generator_result():
+    assert run_to_completion(_counting(3)) == {"ok": True, "count": 3}
+
+
+def test_tick_respects_budget_and_resumes_later():
+    clock = FakeClock()
+    runner = TaskRunner(budget=0.004, clock=clock)
+    task = runner.submit("count", _counting(10, clock, cost=0.001))
+
+    runner.tick()
+    assert task.status == "running"
+    assert task.progress == {"done": 4, "total": 10}
+
+    while runner.running():
+        runner.tick()
+    assert task.status == "done"
+    assert task.result == {"ok": True, "count": 10}
+    assert task.partial == list(range(10))
+    assert task.ticks == 3
+
+
+def test_tick_gives_every_task_a_step():
+    clock = FakeClock()
+    runner = TaskRunner(budget=0.0, clock=clock)
+    a = runner.submit("a", _counting(2))
+    b = runner.submit("b", _counting(2))
+    runner.tick()
+    assert a.progress["done"] == 1
+    assert b.progress["done"] == 1
+
+
+def test_failed_task_records_error():
+    def boom():
+        yield {}
+        raise RuntimeError("bad track")
+
+    runner = TaskRunner()
+    task = runner.submit("boom", boom())
+    runner.tick()
+    assert task.status == "error"
+    assert task.to_dict()["error"] == "bad track"
+
+
+def test_background_snapshot_streams_partials(tools, song):
+    song.tracks[0].name = "Drums"
+    started = tools.get_song_snapshot(fields=["tracks.name"], background=True)
+    assert started["ok"] is True
+
+    while tools.list_tasks()["running"]:
+        tools._process_tasks()
+
+    status = tools.get_task_status(started["task_id"])
+    assert status["status"] == "done"
+    assert status["partial"] == [{"collection": "tracks", "index": 0, "name": "Drums"}]
+    assert status["result"]["song"]["tracks"] == [{"index": 0, "name": "Drums"}]
+    assert tools.get_task_status(started["task_id"], since=1)["partial"] == []
+
+
+def test_background_snapshot_validates_fields_up_front(tools):
+    result = tools.get_song_snapshot(fields=["bogus"], background=True)
+    assert result["ok"] is False
+    assert tools.list_tasks()["count"] == 0
+
+
+def test_cancel_task(tools):
+    started = tools._run_task("count", _counting(5), background=True)
+    result = tools.cancel_task(started["task_id"])
+    assert result == {
+        "ok": True,
+        "task_id": started["task_id"],
+        "cancelled": True,
+        "status": "cancelled",
+    }
+    assert tools.cancel_task(started["task_id"])["cancelled"] is False
+
+
+def test_unknown_task_id(tools):
+    assert tools.get_task_status(99)["ok"] is False
+    assert tools.cancel_task(99)["ok"] is False
@@ -156,6 +156,66 @@ def test_update_display_handles_exception_in_processing(mcp):
     mcp.update_display()
 
 
+def test_update_display_resumes_background_tasks(mcp):
+    mcp.tools._process_tasks = MagicMock()
+    mcp.update_display()
+    mcp.tools._process_tasks.assert_called_once_with()
+
+
+def test_update_display_survives_task_error(mcp):
+    mcp.tools._process_tasks = MagicMock(side_effect=RuntimeError("boom"))
+    mcp.update_display()
+
+
+def test_process_command_records_timing(mcp):
+    mcp._process_command({"action": "ping"}, queue_wait=0.002)
+    mcp._process_command({"action": "get_track_info", "track_index": 99})
+    stats = mcp.profiler.stats()
+    assert stats["actions"]["ping"]["count"] == 1
+    assert stats["actions"]["ping"]["mean_queue_wait_ms"] == 2.0
+    assert stats["actions"]["get_track_info"]["errors"] == 1
+
+
+def test_process_command_records_failures(mcp):
+    mcp.tools.start_playback = MagicMock(side_effect=RuntimeError("boom"))
+    mcp._process_command({"action": "start_playback"})
+    mcp._process_command({"action": "nonexistent_action"})
+    mcp._process_command({"action": "another_missing_action"})
+    stats = mcp.profiler.stats()
+    assert stats["actions"]["start_playback"]["errors"] == 1
+    assert stats["actions"]["<unknown>"]["errors"] == 2
+    assert "nonexistent_action" not in stats["actions"]
+    logged = [entry["action"] for entry in stats["error_command_log"]]
+    assert logged == ["start_playback", "nonexistent_action", "another_missing_action"]
+
+
+def test_update_display_measures_queue_wait_and_ticks(mcp):
+    mcp.profiler.mark_enqueued(3)
+    _put_command(mcp, 3, {"action": "ping"})
+    mcp.update_display()
+    mcp.update_display()
+    summary = mcp.profiler.summary()
+    assert summary["ticks"] == 2
+    assert summary["busy_ticks"] == 1
+    assert summary["commands"] == 1
+    assert mcp.profiler._enqueued == {}
+
+
+def test_health_check_includes_performance_summary(mcp):
+    result = mcp._process_command({"action": "health_check"})
+    assert result["performance"]["tick_overruns"] == 0
+
+
+def test_get_performance_stats_filters_and_resets(mcp):
+    mcp._process_command({"action": "ping"})
+    result = mcp._process_command(
+        {"action": "get_performance_stats", "action_name": "ping", "reset": True}
+    )
+    assert result["ok"] is True
+    assert list(result["actions"]) == ["ping"]
+    assert "ping" not in mcp.profiler.stats()["actions"]
+
+
 def test_connect_script_instances_returns_none(mcp):
     assert mcp.connect_script_instances([]) is None
 
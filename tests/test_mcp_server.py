@@ -165,11 +165,11 @@ def test_call_ableton_malformed_json_response():
 
 
 def test_list_tools_count_matches_tool_defs():
-    """Every entry in TOOL_DEFS appears in the list returned by list_tools."""
+    """Every Remote Script and server-local tool def appears in list_tools."""
     import asyncio
 
     tools = asyncio.run(mcp_server.server._list_tools_handler())
-    assert len(tools) == len(mcp_server.TOOL_DEFS)
+    assert len(tools) == len(mcp_server.TOOL_DEFS) + len(mcp_server.LOCAL_TOOL_DEFS)
 
 
 def test_list_tools_names_match_tool_defs():
@@ -177,7 +177,7 @@ def test_list_tools_names_match_tool_defs():
 
     tools = asyncio.run(mcp_server.server._list_tools_handler())
     returned_names = {t.name for t in tools}
-    expected_names = {name for name, _, _ in mcp_server.TOOL_DEFS}
+    expected_names = {name for name, _, _ in mcp_server.TOOL_DEFS + mcp_server.LOCAL_TOOL_DEFS}
     assert returned_names == expected_names
 
 
@@ -206,3 +206,117 @@ def test_call_tool_propagates_error_response():
     parsed = json.loads(result[0].text)
     assert parsed["ok"] is False
     assert "Ableton offline" in parsed["error"]
+
+
+# ---------------------------------------------------------------------------
+# decode_note_columns
+# ---------------------------------------------------------------------------
+
+
+def test_decode_note_columns_plain_lists():
+    payload = {
+        "ok": True,
+        "notes": {"format": "columnar", "count": 2, "columns": {"pitch": [60, 62]}},
+    }
+    assert ableton_client.decode_note_columns(payload, use_numpy=False) == {"pitch": [60, 62]}
+
+
+def test_decode_note_columns_base64():
+    import base64
+    from array import array
+
+    payload = {
+        "format": "columnar_base64",
+        "count": 2,
+        "byteorder": "little",
+        "dtypes": {"pitch": "B", "start_time": "f"},
+        "columns": {
+            "pitch": base64.b64encode(bytes([60, 62])).decode(),
+            "start_time": base64.b64encode(array("f", [0.0, 0.5]).tobytes()).decode(),
+        },
+    }
+    decoded = ableton_client.decode_note_columns(payload, use_numpy=False)
+    assert decoded == {"pitch": [60, 62], "start_time": [0.0, 0.5]}
+
+
+def test_call_tool_runs_local_tools_through_call_ableton():
+    import asyncio
+
+    responses = {
+        "get_all_notes": {
+            "ok": True,
+            "errors": [],
+            "clips": [
+                {
+                    "length": 4.0,
+                    "count": 1,
+                    "notes": {"format": "columnar", "columns": {"pitch": [60]}},
+                }
+            ],
+        },
+    }
+    args = {
+        "track_index": 0,
+        "clip_index": 0,
+        "transforms": [{"op": "transpose", "semitones": 2}],
+        "dry_run": True,
+    }
+    with patch.object(
+        mcp_server, "_call_ableton", side_effect=lambda action, params: responses[action]
+    ) as mock_ca:
+        result = asyncio.run(mcp_server.server._call_tool_handler("transform_clip_notes", args))
+    parsed = json.loads(result[0].text)
+    assert parsed["ok"] is True
+    assert parsed["notes"]["columns"]["pitch"] == [62]
+    assert mock_ca.call_args[0][0] == "get_all_notes"
+
+
+# ---------------------------------------------------------------------------
+# SongClock
+# ---------------------------------------------------------------------------
+
+
+def _sync_clock(round_trips, playing=True):
+    """A SongClock whose clock_sync calls take the given round-trip times."""
+    now = {"t": 100.0}
+    trips = iter(round_trips)
+
+    def call(action, params):
+        assert action == "clock_sync"
+        rtt = next(trips)
+        now["t"] += rtt / 2.0
+        response = {
+            "ok": True,
+            "remote_time": now["t"] + 1000.0,
+            "current_song_time": 8.0 + (now["t"] - 100.0) * 2.0 * playing,
+            "tempo": 120.0,
+            "is_playing": playing,
+        }
+        now["t"] += rtt / 2.0
+        return response
+
+    clock = ableton_client.SongClock(call=call, clock=lambda: now["t"])
+    return clock, now
+
+
+def test_song_clock_keeps_shortest_round_trip_and_extrapolates():
+    clock, now = _sync_clock([0.04, 0.01, 0.03])
+    result = clock.sync(samples=3)
+    assert result["round_trip_ms"] == 10.0
+    assert abs(clock.offset - 1000.0) < 1e-9
+    assert abs(clock.song_time(now["t"]) - (8.0 + (now["t"] - 100.0) * 2.0)) < 1e-9
+    beat = clock.song_time(now["t"]) + 4.0
+    assert abs(clock.seconds_until(beat, now["t"]) - 2.0) < 1e-9
+
+
+def test_song_clock_holds_position_while_stopped():
+    clock, now = _sync_clock([0.02], playing=False)
+    clock.sync(samples=1)
+    assert clock.song_time(now["t"] + 5.0) == 8.0
+    assert clock.seconds_until(16.0) is None
+
+
+def test_song_clock_propagates_sync_errors():
+    clock = ableton_client.SongClock(call=lambda action, params: {"ok": False, "error": "down"})
+    assert clock.sync() == {"ok": False, "error": "down"}
+    assert clock.state is None
@@ -0,0 +1,85 @@
+"""
+Tests for the main-thread tick profiler.
+"""
+
+from ALiveMCP_Remote.profiler import Profiler, percentile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 51
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) is None
+
+
+def test_action_histogram():
+    profiler = Profiler()
+    for ms in range(1, 101):
+        profiler.record_command("get_clip_notes", ms / 1000.0)
+    stats = profiler.stats()["actions"]["get_clip_notes"]
+    assert stats["count"] == 100
+    assert stats["max_ms"] == 100.0
+    assert stats["p50_ms"] == 51.0
+    assert stats["p95_ms"] == 95.0
+
+
+def test_slow_commands_logged_with_param_names_only():
+    profiler = Profiler()
+    profiler.record_command("ping", 0.0001)
+    profiler.record_command("add_notes", 0.02, 0.004, True, {"notes": [1, 2], "track_index": 0})
+    log = profiler.stats()["slow_command_log"]
+    assert len(log) == 1
+    assert log[0]["action"] == "add_notes"
+    assert log[0]["params"] == ["notes", "track_index"]
+    assert log[0]["queue_wait_ms"] == 4.0
+
+
+def test_queue_wait_from_enqueue_to_dequeue():
+    clock = FakeClock()
+    profiler = Profiler(clock=clock)
+    profiler.mark_enqueued(7)
+    clock.now += 0.012
+    assert round(profiler.mark_dequeued(7), 6) == 0.012
+    assert profiler.mark_dequeued(7) is None
+    assert profiler.summary()["max_queue_wait_ms"] == 12.0
+
+
+def test_tick_overrun_detection():
+    profiler = Profiler()
+    profiler.record_tick(0.0001)
+    profiler.record_tick(0.002, commands=1)
+    profiler.record_tick(0.025, commands=5, task_seconds=0.004)
+    summary = profiler.summary()
+    assert summary["ticks"] == 3
+    assert summary["busy_ticks"] == 2
+    assert summary["tick_overruns"] == 1
+    assert profiler.stats()["tick_overrun_log"][0]["commands"] == 5
+
+
+def test_reset_clears_stats():
+    profiler = Profiler()
+    profiler.record_command("ping", 0.02)
+    profiler.record_tick(0.05, commands=1)
+    profiler.reset()
+    stats = profiler.stats()
+    assert stats["commands"] == 0
+    assert stats["tick_overruns"] == 0
+    assert stats["slow_command_log"] == []
+
+
+def test_unknown_actions_share_one_entry():
+    profiler = Profiler()
+    for n in range(5):
+        profiler.record_command("made_up_" + str(n), 0.0001, ok=False, known=False)
+    stats = profiler.stats()
+    assert list(stats["actions"]) == ["<unknown>"]
+    assert stats["actions"]["<unknown>"]["count"] == 5
+    assert [e["action"] for e in stats["error_command_log"]][-1] == "made_up_4"
@@ -2,6 +2,8 @@ import ast
 import json
 from pathlib import Path
 
+from scripts.registry_lib import load_registry_tools
+
 
 def _extract_literal(file_path: Path, var_name: str):
     src = file_path.read_text()
@@ -65,7 +67,7 @@ def test_tool_manifest_parity():
     defs_file = root / "mcp_server_tool_defs.py"
     manifest_file = root / "docs" / "tool_manifest.json"
 
-    available_tools = _extract_literal(registry_file, "AVAILABLE_TOOLS")
+    available_tools = load_registry_tools(registry_file)
     registry_names = _normalize_registry_items(available_tools)
 
     # Use runtime export from the module (chunked-loader): TOOL_DEFS
@@ -233,6 +233,15 @@ def test_get_track_info_valid(tools, song):
     assert result["track_index"] == 0
 
 
+def test_get_track_info_fields(tools, song):
+    track = song.tracks[0]
+    track.name = "Bass"
+    track.mixer_device.volume.value = 0.7
+    track.clip_slots = MagicMock(side_effect=Exception("should not be read"))
+    result = tools.get_track_info(0, fields=["name", "volume"])
+    assert result == {"ok": True, "track_index": 0, "name": "Bass", "volume": 0.7}
+
+
 def test_get_track_info_invalid(tools):
     result = tools.get_track_info(-1)
     assert result["ok"] is False
@@ -158,3 +158,39 @@ def test_get_track_chain_summary_empty_chain(tools, song):
     assert result["ok"]
     assert result["count"] == 0
     assert result["devices"] == []
+
+
+def test_get_track_chain_summary_fields_without_parameters(tools, song):
+    """Leaving out parameters skips the parameter walk entirely."""
+    device = make_device("Utility", "StereoGain")
+    device.parameters = MagicMock(side_effect=Exception("should not be read"))
+    tools.song = song_with_track_device(0, device)
+
+    result = tools.get_track_chain_summary(0, fields=["name", "class_name"])
+
+    assert result["ok"] is True
+    assert result["devices"] == [{"index": 0, "name": "Utility", "class_name": "StereoGain"}]
+
+
+def test_get_track_chain_summary_nested_parameter_fields(tools, song):
+    """Dotted paths select individual parameter fields."""
+    device = make_device("Utility", "StereoGain", [make_param("Gain", 0.5)])
+    tools.song = song_with_track_device(0, device)
+
+    result = tools.get_track_chain_summary(0, fields="parameters.name")
+
+    assert result["devices"] == [{"index": 0, "parameters": [{"index": 0, "name": "Gain"}]}]
+
+
+def test_get_track_chain_summary_paginated_indices(tools, song):
+    """Pages keep absolute device indices."""
+    song = song_with_track_device(0)
+    song.tracks[0].devices = [make_device("Dev" + str(i)) for i in range(3)]
+    tools.song = song
+
+    first = tools.get_track_chain_summary(0, fields="name", limit=2)
+    second = tools.get_track_chain_summary(0, fields="name", cursor=first["next_cursor"])
+
+    assert [d["index"] for d in first["devices"]] == [0, 1]
+    assert second["devices"] == [{"index": 2, "name": "Dev2"}]
+    assert second["next_cursor"] is None
@@ -1,6 +1,6 @@
 """Tests for get_track_device_params and set_track_device_param."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock
 
 
 def make_param(
@@ -165,3 +165,26 @@ def test_set_track_device_param_invalid_param_index(tools, song):
     result = tools.set_track_device_param(0, 0, 999, 0.5)
     assert not result["ok"]
     assert "Invalid parameter index" in result["error"]
+
+
+def test_get_track_device_params_fields_skips_unselected(tools, song):
+    """Only the requested parameter fields are read and returned."""
+    param = make_param("Volume", 0.5)
+    display = PropertyMock(return_value="-6 dB")
+    type(param).display_value = display
+    tools.song = song_with_track_device(0, make_device(params=[param]))
+
+    result = tools.get_track_device_params(0, 0, fields=["name", "raw_value"])
+
+    assert result["ok"] is True
+    assert result["parameters"] == [{"index": 0, "name": "Volume", "raw_value": 0.5}]
+    display.assert_not_called()
+
+
+def test_get_track_device_params_unknown_field(tools, song):
+    """Unknown field names return an error listing the available fields."""
+    tools.song = song_with_track_device()
+    result = tools.get_track_device_params(0, 0, fields="name,bogus")
+    assert result["ok"] is False
+    assert "bogus" in result["error"]
+    assert "raw_value" in result["error"]